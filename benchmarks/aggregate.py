@@ -0,0 +1,123 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import argparse
+import random
+
+from collections import defaultdict
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from benchmarks.columnar import Reading, time_query
+from core.utils.classes.collection import ColumnarCollection, DictCollection
+from core.utils.classes.collection.collection import Collection
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ ITERATE MEAN BY STATUS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def iterate_mean_by_status(items: Items) -> dict[str, float]:
+    """Returns the mean value by status by iterating over items"""
+
+    # Initialize values by status
+    values_by_status: defaultdict[str, list[float]] = defaultdict(list)
+
+    # Iterate over readings
+    for item in items:
+        # Check if item is not a reading
+        if not isinstance(item, Reading):
+            continue
+
+        # Append value
+        values_by_status[item.status].append(item.value)
+
+    # Return mean value by status
+    return {k: sum(v) / len(v) for k, v in values_by_status.items()}
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RUN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def run(collection: Collection, size: int, repeat: int) -> dict[str, float]:
+    """Returns the durations of iterated and aggregated queries against a collection"""
+
+    # Initialize items
+    items = Items(collection=collection)
+
+    # Seed random number generator
+    random.seed(0)
+
+    # Push readings
+    items.push_many(
+        Reading(
+            sensor=i % 1000,
+            value=random.random() * 100,
+            status=random.choice(["ok", "warn", "fail"]),
+        )
+        for i in range(size)
+    )
+
+    # Initialize filtered items
+    filtered = items.filter(sensor__lt=500)
+
+    # Return durations by query
+    return {
+        "iterate sum": time_query(
+            lambda: sum(x.value for x in filtered if isinstance(x, Reading)), repeat
+        ),
+        "aggregate sum": time_query(lambda: filtered.aggregate(sum="value"), repeat),
+        "iterate group": time_query(lambda: iterate_mean_by_status(filtered), repeat),
+        "group_by": time_query(
+            lambda: filtered.group_by("status").mean("value"), repeat
+        ),
+    }
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main() -> None:
+    """Prints durations of iterated and aggregated queries by collection"""
+
+    # Initialize parser
+    parser = argparse.ArgumentParser(description="Benchmark aggregation")
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    # Get durations by collection
+    results = {
+        "dict": run(DictCollection(), size=args.size, repeat=args.repeat),
+        "columnar": run(ColumnarCollection(), size=args.size, repeat=args.repeat),
+    }
+
+    # Print header
+    print(f"{'query':<14} {'dict ms':>10} {'columnar ms':>12}")
+
+    # Iterate over queries
+    for query in results["dict"]:
+        # Print result
+        print(
+            f"{query:<14} {results['dict'][query] * 1000:>10.1f} "
+            f"{results['columnar'][query] * 1000:>12.1f}"
+        )
+
+
+# Check if module is run as a script
+if __name__ == "__main__":
+    # Run main
+    main()
@@ -0,0 +1,148 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+
+from statistics import quantiles
+from typing import Awaitable, Callable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from benchmarks.order_by import Player
+from core.utils.classes.collection import DictCollection, SqliteCollection
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TICK
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+async def tick(delays: list[float], done: asyncio.Event, interval: float) -> None:
+    """Appends how late a periodic coroutine wakes up until a scan is done"""
+
+    # Iterate until scan is done
+    while not done.is_set():
+        # Get start time
+        start = time.perf_counter()
+
+        # Sleep for an interval
+        await asyncio.sleep(interval)
+
+        # Append delay beyond the interval
+        delays.append(time.perf_counter() - start - interval)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MEASURE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+async def measure(
+    scan: Callable[[], Awaitable[int]], interval: float
+) -> tuple[float, float]:
+    """Returns the p50 and p99 delays of a periodic coroutine during a scan"""
+
+    # Initialize delays and scan event
+    delays: list[float] = []
+    done = asyncio.Event()
+
+    # Start ticking
+    ticker = asyncio.create_task(tick(delays, done, interval))
+
+    # Yield control so that the ticker starts before the scan
+    await asyncio.sleep(0)
+
+    # Run scan
+    await scan()
+
+    # Stop ticking
+    done.set()
+    await ticker
+
+    # Get percentiles, padding delays so that there are at least two
+    percentiles = quantiles(delays + [0.0] * max(2 - len(delays), 0), n=100)
+
+    # Return p50 and p99 delays
+    return percentiles[49], percentiles[98]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RUN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+async def run(size: int, interval: float) -> None:
+    """Prints ticker delays during blocking and async scans of each collection"""
+
+    # Initialize players
+    players = [Player(number) for number in range(size)]
+
+    # Print header
+    print(f"{'collection':<12} {'scan':<10} {'p50 ms':>10} {'p99 ms':>10}")
+
+    # Iterate over collections
+    for label, collection in (
+        ("dict", DictCollection()),
+        ("sqlite", SqliteCollection()),
+    ):
+        # Initialize items
+        items = Items(collection=collection)
+
+        # Push players without blocking the loop
+        await items.apush_many(players)
+
+        # Define a scan that blocks the loop
+        async def scan_blocking() -> int:
+            """Returns the number of items collected in one call"""
+
+            # Return the number of items
+            return len(list(items))
+
+        # Define a scan that yields control between batches
+        async def scan_async() -> int:
+            """Returns the number of items collected in batches"""
+
+            # Return the number of items
+            return len([item async for item in items])
+
+        # Iterate over scans
+        for name, scan in (("blocking", scan_blocking), ("async", scan_async)):
+            # Get delays
+            p50, p99 = await measure(scan, interval)
+
+            # Print result
+            print(f"{label:<12} {name:<10} {p50 * 1000:>10.2f} {p99 * 1000:>10.2f}")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main() -> None:
+    """Prints how much a large scan delays other coroutines"""
+
+    # Initialize parser
+    parser = argparse.ArgumentParser(description="Benchmark async scans")
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--interval", type=float, default=0.001)
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    # Run benchmark
+    asyncio.run(run(size=args.size, interval=args.interval))
+
+
+# Check if module is run as a script
+if __name__ == "__main__":
+    # Run main
+    main()
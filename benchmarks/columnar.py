@@ -0,0 +1,149 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from typing import Any, Callable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import ColumnarCollection, DictCollection
+from core.utils.classes.collection.collection import Collection
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ READING
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Reading(Item):
+    """A benchmark item with numeric analytics-style attributes"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, sensor: int, value: float, status: str) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.sensor = sensor
+        self.value = value
+        self.status = status
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TIME QUERY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def time_query(query: Callable[[], Any], repeat: int) -> float:
+    """Returns the best duration of a query in seconds"""
+
+    # Initialize durations
+    durations = []
+
+    # Iterate over repeats
+    for _ in range(repeat):
+        # Get start time
+        start = time.perf_counter()
+
+        # Run query
+        query()
+
+        # Append duration
+        durations.append(time.perf_counter() - start)
+
+    # Return best duration
+    return min(durations)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RUN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def run(collection: Collection, size: int, repeat: int) -> dict[str, float]:
+    """Returns the durations of analytics-style queries against a collection"""
+
+    # Initialize items
+    items = Items(collection=collection)
+
+    # Seed random number generator
+    random.seed(0)
+
+    # Iterate over readings
+    for i in range(size):
+        # Push reading
+        items.push(
+            Reading(
+                sensor=i % 1000,
+                value=random.random() * 100,
+                status=random.choice(["ok", "warn", "fail"]),
+            )
+        )
+
+    # Initialize filtered items
+    filtered = items.filter(value__gte=99.0, sensor__lt=500)
+
+    # Return durations by query
+    return {
+        "count": time_query(lambda: filtered.count(), repeat),
+        "iterate": time_query(lambda: list(filtered), repeat),
+        "in": time_query(
+            lambda: items.filter(sensor__in=[1, 2, 3], status="fail").count(), repeat
+        ),
+    }
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main() -> None:
+    """Prints query durations of dictionary and columnar collections"""
+
+    # Initialize parser
+    parser = argparse.ArgumentParser(description="Benchmark columnar filtering")
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    # Get durations by collection
+    results = {
+        "dict": run(DictCollection(), size=args.size, repeat=args.repeat),
+        "columnar": run(ColumnarCollection(), size=args.size, repeat=args.repeat),
+    }
+
+    # Print header
+    print(f"{'query':<10} {'dict ms':>12} {'columnar ms':>12} {'speedup':>9}")
+
+    # Iterate over queries
+    for query in results["dict"]:
+        # Get durations
+        dict_seconds = results["dict"][query]
+        columnar_seconds = results["columnar"][query]
+
+        # Print result
+        print(
+            f"{query:<10} {dict_seconds * 1000:>12.1f} {columnar_seconds * 1000:>12.1f} "
+            f"{dict_seconds / columnar_seconds:>8.1f}x"
+        )
+
+
+# Check if module is run as a script
+if __name__ == "__main__":
+    # Run main
+    main()
@@ -0,0 +1,284 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import threading
+import time
+
+from collections import Counter
+from typing import Callable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import DictCollection
+from core.utils.classes.index import Sorted
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ ACCOUNT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Account(Item):
+    """A stress test item with a key, a hash index and a sorted index"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, number: int) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.number = number
+        self.region = random.choice(["North", "South", "East", "West"])
+        self.balance = random.random() * 1000
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Initialize keys
+        KEYS = ("number",)
+
+        # Initialize indexes
+        INDEXES = ("region", Sorted("balance"))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ WORKLOADS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def read_count(items: Items) -> None:
+    """Counts accounts through an index"""
+
+    # Count accounts in a region
+    items.filter(region="North").count()
+
+
+def read_filter(items: Items) -> None:
+    """Filters accounts and checks that every result satisfies the filter"""
+
+    # Iterate over filtered accounts
+    for account in items.filter(region="North", balance__gte=500):
+        # Check if account does not satisfy the filter
+        if (
+            not isinstance(account, Account)
+            or account.region != "North"
+            or account.balance < 500
+        ):
+            # Raise AssertionError
+            raise AssertionError(f"{account!r} does not match filter")
+
+
+def read_iterate(items: Items) -> None:
+    """Iterates over all accounts and checks that no key is yielded twice"""
+
+    # Get the number of times each account number is yielded
+    counts = Counter(
+        account.number for account in items if isinstance(account, Account)
+    )
+
+    # Check if any account number was yielded more than once
+    if counts and max(counts.values()) > 1:
+        # Raise AssertionError
+        raise AssertionError("An account was yielded more than once")
+
+
+def write_push(items: Items, accounts: list[Account], start: int) -> None:
+    """Pushes a batch of new accounts and updates an existing one"""
+
+    # Get next account number of this writer
+    number = accounts[-1].number + 1 if accounts else start
+
+    # Initialize batch of new accounts
+    batch = [Account(number + i) for i in range(10)]
+
+    # Push batch of new accounts
+    items.push_many(batch)
+
+    # Extend accounts
+    accounts.extend(batch)
+
+    # Choose an existing account
+    account = random.choice(accounts)
+
+    # Update account, moving it between index buckets
+    account.region = random.choice(["North", "South", "East", "West"])
+    account.balance = random.random() * 1000
+
+    # Push updated account
+    items.push(account)
+
+
+# Initialize reader workloads by name
+READERS: dict[str, Callable[[Items], None]] = {
+    "count": read_count,
+    "filter": read_filter,
+    "iterate": read_iterate,
+}
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RUN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def run(
+    readers: int, writers: int, seconds: float, threadsafe: bool
+) -> tuple[Counter[str], Counter[str]]:
+    """Returns the operations completed and errors raised by each workload"""
+
+    # Initialize items
+    items = Items(collection=DictCollection(threadsafe=threadsafe))
+
+    # Initialize operations and errors by workload
+    operations: Counter[str] = Counter()
+    errors: Counter[str] = Counter()
+
+    # Initialize counter lock
+    counter_lock = threading.Lock()
+
+    # Initialize stop event
+    stop = threading.Event()
+
+    # Define worker
+    def work(name: str, workload: Callable[[], None]) -> None:
+        """Runs a workload until stopped, recording operations and errors"""
+
+        # Initialize local operations
+        completed = 0
+
+        # Run until stopped
+        while not stop.is_set():
+            # Initialize try-except block
+            try:
+                # Run workload
+                workload()
+
+                # Increment local operations
+                completed += 1
+
+            # Handle any exception raised by the workload
+            except Exception as exception:
+                # Acquire counter lock
+                with counter_lock:
+                    # Record error
+                    errors[f"{name}: {type(exception).__name__}"] += 1
+
+        # Acquire counter lock
+        with counter_lock:
+            # Record operations
+            operations[name] += completed
+
+    # Initialize threads
+    threads = []
+
+    # Iterate over writers
+    for i in range(writers):
+        # Initialize accounts pushed by writer
+        accounts: list[Account] = []
+
+        # Append writer thread, giving each writer its own range of account numbers
+        threads.append(
+            threading.Thread(
+                target=work,
+                args=(
+                    "push",
+                    lambda accounts=accounts, start=i * 10**9: write_push(
+                        items, accounts, start
+                    ),
+                ),
+            )
+        )
+
+    # Iterate over readers
+    for i in range(readers):
+        # Get reader workload name
+        name = list(READERS)[i % len(READERS)]
+
+        # Append reader thread
+        threads.append(
+            threading.Thread(
+                target=work,
+                args=(name, lambda workload=READERS[name]: workload(items)),
+            )
+        )
+
+    # Start threads
+    for thread in threads:
+        thread.start()
+
+    # Wait for the duration of the test
+    time.sleep(seconds)
+
+    # Stop threads
+    stop.set()
+
+    # Wait for threads to finish
+    for thread in threads:
+        thread.join()
+
+    # Return operations and errors
+    return operations, errors
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main() -> None:
+    """Runs concurrent push and filter workloads and reports any errors"""
+
+    # Initialize parser
+    parser = argparse.ArgumentParser(description="Stress test concurrent access")
+    parser.add_argument("--readers", type=int, default=6)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--unsafe", action="store_true")
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    # Shorten the thread switch interval to make races more likely
+    sys.setswitchinterval(1e-6)
+
+    # Run workloads
+    operations, errors = run(
+        readers=args.readers,
+        writers=args.writers,
+        seconds=args.seconds,
+        threadsafe=not args.unsafe,
+    )
+
+    # Print operations
+    print(f"{'workload':<10} {'ops/s':>10}")
+    for name, completed in sorted(operations.items()):
+        print(f"{name:<10} {completed / args.seconds:>10.1f}")
+
+    # Print errors
+    for error, occurrences in errors.most_common():
+        print(f"error: {error} x{occurrences}")
+
+    # Exit with failure if any errors were raised
+    sys.exit(1 if errors else 0)
+
+
+# Check if module is run as a script
+if __name__ == "__main__":
+    # Run main
+    main()
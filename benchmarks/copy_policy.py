@@ -0,0 +1,139 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from typing import Any
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import DictCollection
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PRODUCT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Product(Item):
+    """A benchmark item with a mix of scalar and nested attributes"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, sku: int) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.sku = sku
+        self.name = f"Product {sku}"
+        self.price = sku % 1000 / 10
+        self.tags = ["alpha", "beta", str(sku % 7)]
+        self.dimensions = {"width": sku % 13, "height": sku % 17}
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Initialize keys
+        KEYS = ("sku",)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RUN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def run(policy: str, size: int, read: str = "copy") -> dict[str, Any]:
+    """Returns push and iteration throughput of a copy and read policy"""
+
+    # Initialize items
+    items = Items(collection=DictCollection(copy=policy, read=read))
+
+    # Get push start time
+    start = time.perf_counter()
+
+    # Iterate over SKUs
+    for sku in range(size):
+        # Push product
+        items.push(Product(sku))
+
+    # Get push duration
+    push_seconds = time.perf_counter() - start
+
+    # Get iteration start time
+    start = time.perf_counter()
+
+    # Iterate over items
+    for _ in items:
+        pass
+
+    # Get iteration duration
+    iterate_seconds = time.perf_counter() - start
+
+    # Return results
+    return {
+        "policy": policy,
+        "read": read,
+        "size": size,
+        "push_per_second": size / push_seconds,
+        "iterate_per_second": size / iterate_seconds,
+    }
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main() -> None:
+    """Prints push and iteration throughput for each copy and read policy"""
+
+    # Initialize parser
+    parser = argparse.ArgumentParser(description="Benchmark copy and read policies")
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument(
+        "--policies", nargs="+", default=["deep", "pickle", "shallow", "none"]
+    )
+    parser.add_argument("--reads", nargs="+", default=["copy", "cow", "frozen"])
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    # Print header
+    print(f"{'policy':<10} {'read':<8} {'push/s':>14} {'iterate/s':>14}")
+
+    # Iterate over policies
+    for policy in args.policies:
+        # Iterate over read policies
+        for read in args.reads:
+            # Skip view read policies when the policy already skips copying
+            if read != "copy" and policy in ("none", "trusted"):
+                continue
+
+            # Run benchmark
+            result = run(policy=policy, size=args.size, read=read)
+
+            # Print result
+            print(
+                f"{policy:<10} {read:<8} {result['push_per_second']:>14,.0f} "
+                f"{result['iterate_per_second']:>14,.0f}"
+            )
+
+
+# Check if module is run as a script
+if __name__ == "__main__":
+    # Run main
+    main()
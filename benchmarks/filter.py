@@ -0,0 +1,130 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+from typing import Any, Callable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import DictCollection
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ ORDER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Order(Item):
+    """A benchmark item with attributes for each kind of filter operator"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, number: int) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.number = number
+        self.status = random.choice(["Open", "Closed", "Pending"])
+        self.region = random.choice(["North", "South", "East", "West"])
+        self.total = random.random() * 1000
+        self.tags = random.choice([["Gift"], ["Rush", "Gift"], []])
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ QUERIES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize multi-condition queries by name
+QUERIES: dict[str, Callable[[Items], Items]] = {
+    "equals+gte": lambda items: items.filter(status="Open", total__gte=500),
+    "iin+lt": lambda items: items.filter(region__iin=["north", "EAST"], total__lt=250),
+    "icontains+ieq": lambda items: items.filter(
+        tags__icontains="gift", status__ieq="pending"
+    ),
+}
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RUN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def run(size: int, repeat: int) -> dict[str, Any]:
+    """Returns the best per-item cost of each query in nanoseconds"""
+
+    # Seed random number generator
+    random.seed(0)
+
+    # Initialize items, skipping copies to keep loading fast
+    items = Items(collection=DictCollection(copy="none"))
+
+    # Push orders
+    items.push_many(Order(number) for number in range(size))
+
+    # Initialize results
+    results = {}
+
+    # Iterate over queries
+    for name, query in QUERIES.items():
+        # Initialize durations
+        durations = []
+
+        # Iterate over repeats
+        for _ in range(repeat):
+            # Get start time
+            start = time.perf_counter()
+
+            # Count matching items, which scans every item
+            query(items).count()
+
+            # Append duration
+            durations.append(time.perf_counter() - start)
+
+        # Set per-item cost
+        results[name] = min(durations) / size * 1e9
+
+    # Return results
+    return results
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main() -> None:
+    """Prints the per-item cost of multi-condition filters"""
+
+    # Initialize parser
+    parser = argparse.ArgumentParser(description="Benchmark filter predicates")
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    # Print header
+    print(f"{'query':<16} {'ns/item':>10}")
+
+    # Iterate over results
+    for name, cost in run(size=args.size, repeat=args.repeat).items():
+        # Print result
+        print(f"{name:<16} {cost:>10.1f}")
+
+
+# Check if module is run as a script
+if __name__ == "__main__":
+    # Run main
+    main()
@@ -0,0 +1,98 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from benchmarks.columnar import time_query
+from benchmarks.order_by import Player
+from core.utils.classes.collection import MmapCollection
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main() -> None:
+    """Prints durations of opening and querying a memory-mapped collection"""
+
+    # Initialize parser
+    parser = argparse.ArgumentParser(description="Benchmark memory-mapped collections")
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    # Seed random number generator
+    random.seed(0)
+
+    # Get numbers to look up
+    numbers = [random.randrange(args.size) for _ in range(1000)]
+
+    # Initialize temporary directory
+    with tempfile.TemporaryDirectory() as directory:
+        # Get file path
+        path = os.path.join(directory, "players")
+
+        # Initialize collection
+        collection = MmapCollection(path)
+
+        # Get push duration
+        push = time_query(
+            lambda: Items(collection=collection).push_many(
+                Player(number) for number in range(args.size)
+            ),
+            1,
+        )
+
+        # Close collection, saving its offset index
+        collection.close()
+
+        # Get durations of opening with the offset index and by scanning records
+        opened = time_query(lambda: MmapCollection(path), args.repeat)
+        os.remove(f"{path}.index")
+        scanned = time_query(lambda: MmapCollection(path), 1)
+
+        # Initialize items
+        items = Items(collection=MmapCollection(path))
+
+        # Get durations by operation
+        durations = {
+            "push_many": push,
+            "open": opened,
+            "open scan": scanned,
+            "count": time_query(lambda: items.count(), args.repeat),
+            "key x1000": time_query(
+                lambda: [items.key(number) for number in numbers], args.repeat
+            ),
+            "head 10": time_query(lambda: list(items.head(10)), args.repeat),
+            "filter": time_query(
+                lambda: list(items.filter(score__gte=900_000)), args.repeat
+            ),
+        }
+
+    # Print header
+    print(f"{'operation':<12} {'ms':>10}")
+
+    # Iterate over operations
+    for operation, seconds in durations.items():
+        # Print result
+        print(f"{operation:<12} {seconds * 1000:>10.2f}")
+
+
+# Check if module is run as a script
+if __name__ == "__main__":
+    # Run main
+    main()
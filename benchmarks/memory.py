@@ -0,0 +1,186 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import argparse
+import gc
+import tracemalloc
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import DictCollection
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ POINT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Point(Item):
+    """A benchmark item that stores its attributes in an instance dictionary"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of number
+    number: int
+
+    # Declare type of x
+    x: float
+
+    # Declare type of y
+    y: float
+
+    # Declare type of label
+    label: str
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, number: int) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.number = number
+        self.x = number * 0.5
+        self.y = number * 0.25
+        self.label = "point"
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Initialize keys
+        KEYS = ("number",)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SLOTTED POINT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class SlottedPoint(Item):
+    """A benchmark item that stores its annotated attributes in slots"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of number
+    number: int
+
+    # Declare type of x
+    x: float
+
+    # Declare type of y
+    y: float
+
+    # Declare type of label
+    label: str
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, number: int) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.number = number
+        self.x = number * 0.5
+        self.y = number * 0.25
+        self.label = "point"
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Initialize keys
+        KEYS = ("number",)
+
+        # Initialize slotted mode
+        SLOTS = True
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MEASURE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def measure(
+    item_class: type[Point] | type[SlottedPoint], size: int
+) -> tuple[float, float]:
+    """Returns the bytes per item of created items and of a collection storing them"""
+
+    # Collect garbage and start tracing allocations
+    gc.collect()
+    tracemalloc.start()
+
+    # Create items
+    created = [item_class(number) for number in range(size)]
+
+    # Get the memory of created items
+    created_bytes = tracemalloc.get_traced_memory()[0]
+
+    # Push items to a collection that stores them as is
+    items = Items(collection=DictCollection(copy="none"))
+    items.push_many(created)
+
+    # Release the list of created items, so that only the collection holds them
+    del created
+
+    # Get the memory of the collection
+    stored_bytes = tracemalloc.get_traced_memory()[0]
+
+    # Stop tracing allocations
+    tracemalloc.stop()
+
+    # Return bytes per item
+    return created_bytes / size, stored_bytes / size
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main() -> None:
+    """Prints the memory per item of dictionary and slotted items"""
+
+    # Initialize parser
+    parser = argparse.ArgumentParser(description="Benchmark item memory")
+    parser.add_argument("--size", type=int, default=200_000)
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    # Print header
+    print(f"{'mode':<8} {'created B/item':>15} {'stored B/item':>14}")
+
+    # Iterate over modes
+    for mode, item_class in (("dict", Point), ("slots", SlottedPoint)):
+        # Measure memory
+        created, stored = measure(item_class, args.size)
+
+        # Print result
+        print(f"{mode:<8} {created:>15.0f} {stored:>14.0f}")
+
+
+# Check if module is run as a script
+if __name__ == "__main__":
+    # Run main
+    main()
@@ -0,0 +1,139 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import argparse
+import random
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from benchmarks.columnar import time_query
+from core.utils.classes.collection import DictCollection
+from core.utils.classes.index import Sorted
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PLAYER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Player(Item):
+    """A benchmark item with a leaderboard score"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, number: int) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.number = number
+        self.name = f"player-{number}"
+        self.score = random.randint(0, 1_000_000)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Initialize keys
+        KEYS = ("number",)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ INDEXED PLAYER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class IndexedPlayer(Player):
+    """A benchmark item with a sorted index over its leaderboard score"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Initialize keys
+        KEYS = ("number",)
+
+        # Initialize indexes
+        INDEXES = (Sorted("score"),)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RUN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def run(item_class: type[Player], size: int, repeat: int, k: int) -> dict[str, float]:
+    """Returns the durations of top-k queries by strategy"""
+
+    # Seed random number generator
+    random.seed(0)
+
+    # Initialize items
+    items = Items(collection=DictCollection())
+
+    # Push players
+    items.push_many(item_class(number) for number in range(size))
+
+    # Return durations by strategy
+    return {
+        "sorted": time_query(
+            lambda: sorted(
+                items, key=lambda player: getattr(player, "score"), reverse=True
+            )[:k],
+            repeat,
+        ),
+        "order_by": time_query(
+            lambda: list(items.order_by("-score", "name").head(k)), repeat
+        ),
+    }
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main() -> None:
+    """Prints durations of leaderboard queries with and without a sorted index"""
+
+    # Initialize parser
+    parser = argparse.ArgumentParser(description="Benchmark top-k ordering")
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--k", type=int, default=10)
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    # Print header
+    print(f"{'index':<8} {'strategy':<10} {'ms':>10}")
+
+    # Iterate over item classes
+    for label, item_class in (("none", Player), ("sorted", IndexedPlayer)):
+        # Get durations
+        durations = run(item_class, size=args.size, repeat=args.repeat, k=args.k)
+
+        # Iterate over strategies
+        for strategy, seconds in durations.items():
+            # Print result
+            print(f"{label:<8} {strategy:<10} {seconds * 1000:>10.2f}")
+
+
+# Check if module is run as a script
+if __name__ == "__main__":
+    # Run main
+    main()
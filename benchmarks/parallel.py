@@ -0,0 +1,124 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import argparse
+
+from hashlib import sha256
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from benchmarks.columnar import time_query
+from core.utils.classes.collection import DictCollection
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DOCUMENT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Document(Item):
+    """A benchmark item whose digest is expensive to compute"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, number: int) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.number = number
+        self.body = str(number).encode() * 64
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ DIGEST
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @property
+    def digest(self) -> str:
+        """Returns the first character of a repeatedly hashed body"""
+
+        # Initialize digest
+        digest = self.body
+
+        # Iterate over rounds
+        for _ in range(ROUNDS):
+            # Hash digest
+            digest = sha256(digest).digest()
+
+        # Return first character of hex digest
+        return digest.hex()[0]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Initialize keys
+        KEYS = ("number",)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ ROUNDS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize the number of hashing rounds per digest
+ROUNDS = 200
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main() -> None:
+    """Prints durations of a CPU-heavy filter evaluated serially and in parallel"""
+
+    # Initialize parser
+    parser = argparse.ArgumentParser(description="Benchmark parallel filters")
+    parser.add_argument("--size", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4])
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    # Initialize items
+    items = Items(collection=DictCollection(copy="none"))
+
+    # Push documents
+    items.push_many(Document(number) for number in range(args.size))
+
+    # Print header
+    print(f"{'mode':<12} {'ms':>10}")
+
+    # Print serial duration
+    serial = time_query(lambda: items.filter(digest="a").count(), args.repeat)
+    print(f"{'serial':<12} {serial * 1000:>10.2f}")
+
+    # Iterate over numbers of workers
+    for workers in args.workers:
+        # Get parallel items, which always use the process pool
+        parallel = items.parallel(workers=workers, threshold=0)
+
+        # Warm up process pool, so that starting workers is not timed
+        parallel.filter(number=0).count()
+
+        # Print parallel duration
+        duration = time_query(lambda: parallel.filter(digest="a").count(), args.repeat)
+        print(f"{f'{workers} workers':<12} {duration * 1000:>10.2f}")
+
+
+# Check if module is run as a script
+if __name__ == "__main__":
+    # Run main
+    main()
@@ -0,0 +1,104 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import argparse
+import time
+
+from typing import Callable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from benchmarks.copy_policy import Product
+from core.utils.classes.collection import (
+    ColumnarCollection,
+    DictCollection,
+    SqliteCollection,
+)
+from core.utils.classes.collection.collection import Collection
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RUN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def run(factory: Callable[[], Collection], size: int) -> dict[str, float]:
+    """Returns the throughput of pushing items one at a time and in a batch"""
+
+    # Initialize results
+    results = {}
+
+    # Iterate over push methods
+    for method in ("push", "push_many"):
+        # Initialize items
+        items = Items(collection=factory())
+
+        # Initialize products
+        products = [Product(sku) for sku in range(size)]
+
+        # Get start time
+        start = time.perf_counter()
+
+        # Check if pushing in a batch
+        if method == "push_many":
+            # Push products in a batch
+            items.push_many(products)
+
+        # Otherwise push products one at a time
+        else:
+            # Iterate over products
+            for product in products:
+                # Push product
+                items.push(product)
+
+        # Set throughput
+        results[method] = size / (time.perf_counter() - start)
+
+    # Return results
+    return results
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main() -> None:
+    """Prints the throughput of single and batch pushes for each collection"""
+
+    # Initialize parser
+    parser = argparse.ArgumentParser(description="Benchmark batch pushes")
+    parser.add_argument("--size", type=int, default=50_000)
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    # Initialize collection factories
+    factories: dict[str, Callable[[], Collection]] = {
+        "dict": DictCollection,
+        "columnar": ColumnarCollection,
+        "sqlite": SqliteCollection,
+    }
+
+    # Print header
+    print(f"{'collection':<12} {'push/s':>14} {'push_many/s':>14}")
+
+    # Iterate over collection factories
+    for name, factory in factories.items():
+        # Run benchmark
+        result = run(factory, size=args.size)
+
+        # Print result
+        print(f"{name:<12} {result['push']:>14,.0f} {result['push_many']:>14,.0f}")
+
+
+# Check if module is run as a script
+if __name__ == "__main__":
+    # Run main
+    main()
@@ -0,0 +1,86 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from benchmarks.filter import Order
+from core.utils.classes.collection import DictCollection
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RUN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def run(size: int, repeat: int, cache_size: int) -> tuple[float, dict[str, int]]:
+    """Returns the mean duration of a repeated dashboard query and cache statistics"""
+
+    # Seed random number generator
+    random.seed(0)
+
+    # Initialize collection
+    collection = DictCollection(copy="none", cache_size=cache_size)
+
+    # Initialize items
+    items = Items(collection=collection)
+
+    # Push orders
+    items.push_many(Order(number) for number in range(size))
+
+    # Get start time
+    start = time.perf_counter()
+
+    # Iterate over repeats
+    for _ in range(repeat):
+        # Collect the dashboard query
+        list(items.filter(status="Open", total__gte=900).head(50))
+
+    # Return mean duration and cache statistics
+    return (time.perf_counter() - start) / repeat, collection.cache_info()
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main() -> None:
+    """Prints the cost of a repeated query with and without a result cache"""
+
+    # Initialize parser
+    parser = argparse.ArgumentParser(description="Benchmark the query result cache")
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=100)
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    # Print header
+    print(f"{'cache':<8} {'ms/query':>10} {'hits':>6} {'misses':>7}")
+
+    # Iterate over cache sizes
+    for cache_size in (0, 128):
+        # Run query
+        seconds, info = run(size=args.size, repeat=args.repeat, cache_size=cache_size)
+
+        # Print result
+        print(
+            f"{cache_size:<8} {seconds * 1000:>10.3f} "
+            f"{info['hits']:>6} {info['misses']:>7}"
+        )
+
+
+# Check if module is run as a script
+if __name__ == "__main__":
+    # Run main
+    main()
@@ -0,0 +1,103 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import argparse
+import random
+
+from typing import Callable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from benchmarks.columnar import time_query
+from benchmarks.order_by import Player
+from core.utils.classes.collection import Collection, DictCollection, ShardedCollection
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RUN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def run(
+    get_collection: Callable[[], Collection], size: int, repeat: int
+) -> dict[str, float]:
+    """Returns the durations of pushes, scans and lookups by operation"""
+
+    # Seed random number generator
+    random.seed(0)
+
+    # Initialize players
+    players = [Player(number) for number in range(size)]
+
+    # Initialize items
+    items = Items(collection=get_collection())
+
+    # Get push duration
+    push = time_query(lambda: Items(collection=get_collection()).push_many(players), 1)
+
+    # Push players
+    items.push_many(players)
+
+    # Get numbers to look up
+    numbers = [random.randrange(size) for _ in range(1000)]
+
+    # Return durations by operation
+    return {
+        "push_many": push,
+        "count": time_query(lambda: items.filter(score__gte=900_000).count(), repeat),
+        "filter": time_query(lambda: list(items.filter(score__gte=900_000)), repeat),
+        "top 10": time_query(lambda: list(items.order_by("-score").head(10)), repeat),
+        "key x1000": time_query(
+            lambda: [items.key(number) for number in numbers], repeat
+        ),
+    }
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main() -> None:
+    """Prints durations of a dictionary collection and sharded collections"""
+
+    # Initialize parser
+    parser = argparse.ArgumentParser(description="Benchmark sharded collections")
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--shards", type=int, default=4)
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    # Initialize collection factories by label
+    factories: dict[str, Callable[[], Collection]] = {
+        "dict": lambda: DictCollection(),
+        "sharded": lambda: ShardedCollection(shards=args.shards),
+        "threads": lambda: ShardedCollection(shards=args.shards, workers=args.shards),
+    }
+
+    # Print header
+    print(f"{'collection':<12} {'operation':<10} {'ms':>10}")
+
+    # Iterate over collection factories
+    for label, get_collection in factories.items():
+        # Get durations
+        durations = run(get_collection, size=args.size, repeat=args.repeat)
+
+        # Iterate over operations
+        for operation, seconds in durations.items():
+            # Print result
+            print(f"{label:<12} {operation:<10} {seconds * 1000:>10.2f}")
+
+
+# Check if module is run as a script
+if __name__ == "__main__":
+    # Run main
+    main()
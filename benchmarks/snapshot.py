@@ -0,0 +1,71 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from benchmarks.columnar import time_query
+from benchmarks.order_by import Player
+from core.utils.classes.item.items import Items
+from core.utils.classes.store.store import Store
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main() -> None:
+    """Prints durations of rebuilding a store by pushes and from a snapshot"""
+
+    # Initialize parser
+    parser = argparse.ArgumentParser(description="Benchmark store snapshots")
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=1)
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    # Initialize players
+    players = [Player(number) for number in range(args.size)]
+
+    # Initialize store
+    store = Store()
+
+    # Get push duration
+    push = time_query(
+        lambda: Items(collection=store.create("players")).push_many(players),
+        args.repeat,
+    )
+
+    # Initialize temporary directory
+    with tempfile.TemporaryDirectory() as directory:
+        # Get snapshot path
+        path = os.path.join(directory, "store.snapshot")
+
+        # Get save and load durations
+        save = time_query(lambda: store.save(path), args.repeat)
+        load = time_query(lambda: Store().load(path), args.repeat)
+
+        # Get snapshot size
+        size = os.path.getsize(path)
+
+    # Print results
+    print(f"{'push_many':<12} {push * 1000:>10.2f} ms")
+    print(f"{'save':<12} {save * 1000:>10.2f} ms")
+    print(f"{'load':<12} {load * 1000:>10.2f} ms")
+    print(f"{'file':<12} {size / 1e6:>10.2f} MB")
+
+
+# Check if module is run as a script
+if __name__ == "__main__":
+    # Run main
+    main()
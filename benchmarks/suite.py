@@ -0,0 +1,407 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any, Callable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import DictCollection
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+from core.utils.classes.store.store import Store
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RECORD
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Record(Item):
+    """A benchmark item with a single key and attributes for each filter operator"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, number: int) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.number = number
+        self.region = REGIONS[number % len(REGIONS)]
+        self.status = STATUSES[number % len(STATUSES)]
+        self.total = number % 1000
+        self.tags = ["Gift", "Rush"] if number % 3 == 0 else ["Gift"]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Initialize keys
+        KEYS = ("number",)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PAIR RECORD
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class PairRecord(Record):
+    """A benchmark item with a tuple key"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Initialize keys
+        KEYS = (("region", "number"),)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ FILTERS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize filter arguments by operator
+FILTERS: dict[str, dict[str, Any]] = {
+    "equals": {"status": "Open"},
+    "iequals": {"status__ieq": "open"},
+    "contains": {"tags__contains": "Rush"},
+    "icontains": {"tags__icontains": "rush"},
+    "gt": {"total__gt": 900},
+    "gte": {"total__gte": 900},
+    "lt": {"total__lt": 100},
+    "lte": {"total__lte": 100},
+    "in": {"region__in": ["North", "East"]},
+    "iin": {"region__iin": ["north", "east"]},
+}
+
+# Initialize regions
+REGIONS = ("North", "South", "East", "West")
+
+# Initialize statuses
+STATUSES = ("Open", "Closed", "Pending")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COUNT FILTER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def count_filter(items: Items, kwargs: dict[str, Any]) -> int:
+    """Returns the number of items that match a filter"""
+
+    # Return the number of matching items
+    return items.filter(**kwargs).count()
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET CASES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_cases(size: int) -> dict[str, tuple[Callable[[], Any], int]]:
+    """Returns benchmark cases and the number of operations each call performs"""
+
+    # Seed random number generator
+    random.seed(0)
+
+    # Initialize items
+    items = Items(collection=DictCollection())
+
+    # Get records
+    records = (Record(number) for number in range(size))
+
+    # Check if items support batch pushes, which older revisions lack
+    if hasattr(items, "push_many"):
+        # Push records in a single batch
+        items.push_many(records)
+
+    # Otherwise push records one at a time, so baselines can still be measured
+    else:
+        # Iterate over records
+        for record in records:
+            # Push record
+            items.push(record)
+
+    # Get numbers to look up
+    numbers = [random.randrange(size) for _ in range(1000)]
+
+    # Initialize store
+    store = Store()
+
+    # Initialize cases with pushes, which push fresh records to fresh collections
+    cases: dict[str, tuple[Callable[[], Any], int]] = {
+        "push": (lambda: push(Record, min(size, 10_000)), min(size, 10_000)),
+        "push tuple key": (
+            lambda: push(PairRecord, min(size, 10_000)),
+            min(size, 10_000),
+        ),
+        "key": (lambda: [items.key(number) for number in numbers], len(numbers)),
+    }
+
+    # Iterate over filters
+    for name, kwargs in FILTERS.items():
+        # Add a case counting matches, which scans every item
+        cases[f"filter {name}"] = (partial(count_filter, items, kwargs), size)
+
+    # Add cases of windows, which read few items however large the collection
+    cases.update(
+        {
+            "count": (lambda: items.count(), 1),
+            "head": (lambda: list(items.head(10)), 10),
+            "tail": (lambda: list(items.tail(10)), 10),
+            "slice": (lambda: list(items.slice(size // 2, size // 2 + 10)), 10),
+            "first": (lambda: items.first(), 1),
+            "last": (lambda: items.last(), 1),
+        }
+    )
+
+    # Add cases of full collections, with and without copies
+    cases.update(
+        {
+            "collect deepcopy": (lambda: list(items), size),
+            "collect quick": (lambda: list(items._collect(quick=True)), size),
+            "repr": (lambda: repr(items), 1),
+        }
+    )
+
+    # Add a case of getting or creating collections, half of which already exist
+    cases["store get_or_create"] = (
+        lambda: [store.get_or_create(str(i % 500)) for i in range(1000)],
+        1000,
+    )
+
+    # Return cases
+    return cases
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET COMMIT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_commit() -> str | None:
+    """Returns the hash of the current git commit, if any"""
+
+    # Initialize try-except block
+    try:
+        # Return commit hash
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+
+    # Handle errors raised when git or a repository is unavailable
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MEASURE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def measure(operation: Callable[[], Any], repeat: int, budget: float) -> float:
+    """Returns the best duration of an operation in seconds, within a time budget"""
+
+    # Initialize durations
+    durations: list[float] = []
+
+    # Get deadline
+    deadline = time.perf_counter() + budget
+
+    # Iterate over repeats, stopping early once the budget is spent
+    while len(durations) < repeat and (not durations or time.perf_counter() < deadline):
+        # Get start time
+        start = time.perf_counter()
+
+        # Run operation
+        operation()
+
+        # Append duration
+        durations.append(time.perf_counter() - start)
+
+    # Return best duration
+    return min(durations)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PUSH
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def push(item_class: type[Record], size: int) -> None:
+    """Pushes records one at a time to a fresh collection"""
+
+    # Initialize items
+    items = Items(collection=DictCollection())
+
+    # Iterate over numbers
+    for number in range(size):
+        # Push record
+        items.push(item_class(number))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RUN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def run(sizes: list[int], repeat: int, budget: float) -> dict[str, Any]:
+    """Returns the nanoseconds per operation of each case by collection size"""
+
+    # Initialize results
+    results: dict[str, Any] = {
+        "meta": {
+            "commit": get_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": repeat,
+        },
+        "results": {},
+    }
+
+    # Iterate over sizes
+    for size in sizes:
+        # Initialize results of size
+        results["results"][str(size)] = size_results = {}
+
+        # Iterate over cases
+        for name, (operation, operations) in get_cases(size).items():
+            # Set nanoseconds per operation
+            size_results[name] = measure(operation, repeat, budget) / operations * 1e9
+
+            # Print progress
+            print(f"{size:>9} {name:<24} {size_results[name]:>14.1f}", flush=True)
+
+    # Return results
+    return results
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COMPARE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float
+) -> list[str]:
+    """Prints the ratio of each case to a baseline and returns regressed cases"""
+
+    # Initialize regressions
+    regressions = []
+
+    # Print header
+    print(f"\n{'size':>9} {'case':<24} {'baseline ns':>14} {'ns':>14} {'ratio':>7}")
+
+    # Iterate over sizes
+    for size, size_results in current["results"].items():
+        # Iterate over cases
+        for name, cost in size_results.items():
+            # Get baseline cost
+            baseline_cost = baseline["results"].get(size, {}).get(name)
+
+            # Continue if case is not in baseline
+            if not baseline_cost:
+                continue
+
+            # Get ratio
+            ratio = cost / baseline_cost
+
+            # Check if case regressed
+            if ratio > threshold:
+                # Append regression
+                regressions.append(f"{size} {name}")
+
+            # Print comparison
+            print(
+                f"{size:>9} {name:<24} {baseline_cost:>14.1f} {cost:>14.1f} "
+                f"{ratio:>6.2f}x{' !' if ratio > threshold else ''}"
+            )
+
+    # Return regressions
+    return regressions
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main() -> None:
+    """Runs the benchmark suite, storing results as JSON and comparing a baseline"""
+
+    # Initialize parser
+    parser = argparse.ArgumentParser(description="Run the benchmark suite")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=2.0)
+    parser.add_argument("--output", help="path of a JSON file to write results to")
+    parser.add_argument("--compare", help="path of a JSON file of baseline results")
+    parser.add_argument("--threshold", type=float, default=1.2)
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    # Print header
+    print(f"{'size':>9} {'case':<24} {'ns/op':>14}")
+
+    # Run suite
+    results = run(sizes=args.sizes, repeat=args.repeat, budget=args.budget)
+
+    # Check if there is an output path
+    if args.output:
+        # Open output file
+        with open(args.output, "w") as file:
+            # Write results
+            json.dump(results, file, indent=2)
+
+    # Check if there is a baseline path
+    if args.compare:
+        # Open baseline file
+        with open(args.compare) as file:
+            # Read baseline
+            baseline = json.load(file)
+
+        # Compare results to baseline
+        regressions = compare(baseline, results, args.threshold)
+
+        # Check if any case regressed
+        if regressions:
+            # Print regressions
+            print(f"\n{len(regressions)} regressions over {args.threshold}x")
+
+            # Exit with an error
+            sys.exit(1)
+
+
+# Check if module is run as a script
+if __name__ == "__main__":
+    # Run main
+    main()
@@ -0,0 +1,91 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from benchmarks.columnar import time_query
+from benchmarks.order_by import Player
+from core.utils.classes.collection import DictCollection
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PUSH EACH
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def push_each(items: Items, players: list[Player]) -> None:
+    """Pushes players one at a time, so that each push is logged on its own"""
+
+    # Iterate over players
+    for player in players:
+        # Push player
+        items.push(player)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def main() -> None:
+    """Prints push throughput by sync policy and the duration of replaying the log"""
+
+    # Initialize parser
+    parser = argparse.ArgumentParser(description="Benchmark write-ahead logs")
+    parser.add_argument("--size", type=int, default=20_000)
+
+    # Parse arguments
+    args = parser.parse_args()
+
+    # Initialize players
+    players = [Player(number) for number in range(args.size)]
+
+    # Print header
+    print(f"{'sync':<10} {'pushes/s':>12} {'replay ms':>12}")
+
+    # Iterate over sync policies
+    for sync in (None, "none", "batch", "always"):
+        # Initialize temporary directory
+        with tempfile.TemporaryDirectory() as directory:
+            # Get log path
+            path = os.path.join(directory, "wal") if sync is not None else None
+
+            # Initialize collection
+            collection = DictCollection(wal=path, sync=sync or "batch")
+
+            # Initialize items
+            items = Items(collection=collection)
+
+            # Get push duration, pushing one item at a time
+            push = time_query(lambda: push_each(items, players), 1)
+
+            # Close collection
+            collection.close()
+
+            # Get replay duration
+            replay = (
+                time_query(lambda: DictCollection(wal=path).close(), 1)
+                if path is not None
+                else 0.0
+            )
+
+        # Print result
+        print(
+            f"{sync or 'memory':<10} {args.size / push:>12.0f} {replay * 1000:>12.2f}"
+        )
+
+
+# Check if module is run as a script
+if __name__ == "__main__":
+    # Run main
+    main()
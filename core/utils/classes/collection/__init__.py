@@ -3,4 +3,16 @@
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 from core.utils.classes.collection.collection import Collection  # noqa: F401
+from core.utils.classes.collection.columnar_collection import (  # noqa: F401
+    ColumnarCollection,
+)
 from core.utils.classes.collection.dict_collection import DictCollection  # noqa: F401
+from core.utils.classes.collection.mmap_collection import (  # noqa: F401
+    MmapCollection,
+)
+from core.utils.classes.collection.sharded_collection import (  # noqa: F401
+    ShardedCollection,
+)
+from core.utils.classes.collection.sqlite_collection import (  # noqa: F401
+    SqliteCollection,
+)
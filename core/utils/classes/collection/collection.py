@@ -4,14 +4,49 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+
 from abc import ABC, abstractmethod
-from typing import Any, Generator, Iterable, TYPE_CHECKING
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from collections import deque
+from heapq import nlargest, nsmallest
+from itertools import islice
+from time import perf_counter
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Generator,
+    Iterable,
+    TYPE_CHECKING,
+)
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ PROJECT IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 from core.utils.classes.item.items import Items
+from core.utils.exceptions import DuplicateKeyError
+from core.utils.functions.aggregate import (
+    aggregate_items,
+    group_items,
+    validate_aggregates,
+)
+from core.utils.functions.datetime import get_clock
+from core.utils.functions.order import compile_order_key
+from core.utils.functions.parallel import (
+    apply_parallel,
+    filter_parallel,
+    is_picklable,
+)
+from core.utils.functions.predicate import compile_conditions
+from core.utils.functions.snapshot import (
+    dumps,
+    loads,
+    read_snapshot,
+    write_snapshot,
+)
 
 if TYPE_CHECKING:
     from core.utils.classes.item.item import Item
@@ -25,6 +60,923 @@ if TYPE_CHECKING:
 class Collection(ABC):
     """An abstract class that represents a collection of items"""
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize whether operations block on I/O, so async variants run in an executor
+    _blocking: bool = False
+
+    # Initialize clock policy of items whose class does not declare one
+    _clock: str | Callable[[], Any] = "utc"
+
+    # Initialize observers, which are called with an event after each operation
+    _observers: tuple[Callable[[dict[str, Any]], None], ...] = ()
+
+    # Initialize names of the attributes that snapshots persist, if supported
+    _snapshot_attrs: tuple[str, ...] = ()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _COUNT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _count(self, items: Items | None = None) -> int:
+        """Returns a count of items in the collection, counting collected items"""
+
+        # Return the number of collected items
+        return sum(1 for _ in self.collect(items, quick=True))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _DECODE CURSOR
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _decode_cursor(self, cursor: str, kind: str) -> str:
+        """Returns the value of an opaque pagination cursor of a given kind"""
+
+        # Initialize try-except block
+        try:
+            # Decode cursor
+            cursor_kind, value = (
+                urlsafe_b64decode(cursor.encode()).decode().split(":", 1)
+            )
+
+        # Handle errors raised by malformed cursors
+        except (ValueError, TypeError, AttributeError):
+            # Treat cursor as having no kind
+            cursor_kind = value = ""
+
+        # Check if cursor is not of the expected kind
+        if cursor_kind != kind:
+            # Raise ValueError
+            raise ValueError(
+                f"Invalid cursor {cursor!r} for {self.__class__.__name__}."
+            )
+
+        # Return value
+        return value
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _DESCRIBE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _describe(self, operation: Any) -> str:
+        """Returns a description of an operation"""
+
+        # Check if callable
+        if callable(operation):
+            # Return a description of the callable
+            return f"APPLY {getattr(operation, '__name__', repr(operation))}"
+
+        # Unpack operation
+        name, *args = operation
+
+        # Check if operation is a filter
+        if name == "filter":
+            # Return a description of the conditions
+            return "FILTER " + " AND ".join(
+                f"{attr} {operator} {expected!r}"
+                for attr, operator, expected in args[0]
+            )
+
+        # Check if operation is an order
+        if name == "order":
+            # Return a description of the attributes and limit
+            return (
+                "ORDER "
+                + ", ".join(
+                    f"{attr} {'DESC' if descending else 'ASC'}"
+                    for attr, descending in args[0]
+                )
+                + (f" LIMIT {args[1]}" if args[1] is not None else "")
+            )
+
+        # Check if operation is a parallel execution mode
+        if name == "parallel":
+            # Return a description of the workers and threshold
+            return (
+                f"PARALLEL {args[0] if args[0] is not None else 'all'} workers"
+                f" (serial below {args[1]} items)"
+            )
+
+        # Return a description of the operation and its arguments
+        return " ".join([name.upper(), *(repr(arg) for arg in args)])
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _DUMP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _dump(self) -> bytes:
+        """Returns the persisted attributes of the collection as snapshot bytes"""
+
+        # Check if collection does not support snapshots
+        if not self._snapshot_attrs:
+            # Raise NotImplementedError
+            raise NotImplementedError(
+                f"{self.__class__.__name__} does not support snapshots."
+            )
+
+        # Return persisted attributes
+        return dumps({attr: getattr(self, attr) for attr in self._snapshot_attrs})
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ENCODE CURSOR
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _encode_cursor(self, kind: str, value: Any) -> str:
+        """Returns an opaque pagination cursor of a given kind"""
+
+        # Return encoded cursor
+        return urlsafe_b64encode(f"{kind}:{value}".encode()).decode()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _FILTER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _filter(
+        self,
+        items: Iterable[Item],
+        conditions: tuple[tuple[str, str, Any], ...],
+        predicate: Callable[[Any], bool] | None = None,
+    ) -> Generator[Item, None, None]:
+        """Yields items that satisfy a series of conditions"""
+
+        # Yield items that satisfy the compiled predicate of conditions
+        yield from filter(predicate or compile_conditions(conditions), items)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET CLOCK
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_clock(self, item_class: type[Item]) -> Callable[[], Any] | None:
+        """Returns the clock that timestamps items of a class, or None if disabled"""
+
+        # Get item class clock policy
+        policy = item_class.Meta.CLOCK
+
+        # Return the clock of the item class, deferring to the collection if None
+        return get_clock(policy if policy is not None else self._clock)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET CONDITIONS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_conditions(self, items: Items | None) -> tuple[tuple[str, str], ...]:
+        """Returns the attribute and operator of each condition that filters items"""
+
+        # Return the attribute and operator of each condition of each filter
+        return (
+            tuple(
+                (attr, operator)
+                for operation in items._operations
+                if not callable(operation) and operation[0] == "filter"
+                for attr, operator, _ in operation[1]
+            )
+            if items is not None
+            else ()
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET BATCH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_batch(
+        self,
+        items: Iterable[Item],
+        item_ids_by_key: dict[Any, int],
+        keys_by_item_id: dict[int, list[Any]],
+    ) -> tuple[list[tuple[Item, int]], list[list[Any]]]:
+        """Returns a batch of items with their item IDs and key values, issuing item
+        IDs to new items only once every key is valid"""
+
+        # Get pending batch, with a distinct negative placeholder for each new item
+        pending = [
+            (item, int(item._imeta.id) if item._imeta.id is not None else -1 - i)
+            for i, item in enumerate(items)
+        ]
+
+        # Validate key values before issuing any item ID
+        key_values = self._validate_keys(pending, item_ids_by_key, keys_by_item_id)
+
+        # Issue item IDs to new items
+        batch = [
+            (item, item_id if item._imeta.id is not None else self._issue_item_id())
+            for item, item_id in pending
+        ]
+
+        # Return batch and key values
+        return batch, key_values
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET KEY VALUES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_key_values(self, item: Item) -> list[Any]:
+        """Returns the values of the keys declared by an item's class"""
+
+        # Return key values
+        return [
+            tuple([getattr(item, k, None) for k in key])
+            if isinstance(key, tuple)
+            else getattr(item, key, None)
+            for key in item._cmeta.KEYS
+        ]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _HEAD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _head(self, items: Iterable[Item], n: int) -> Generator[Item, None, None]:
+        """Yields the first n items"""
+
+        # Iterate over items
+        for i, item in enumerate(items):
+            # Check if i is greater than or equal to n
+            if i >= n:
+                # Break
+                break
+            # Yield item
+            yield item
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _IS ORDER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _is_order(self, items: Items, n: int) -> bool:
+        """Returns whether the last operation on items is an order keeping over n"""
+
+        # Get the last operation
+        operation = items._operations[-1] if items._operations else None
+
+        # Return whether operation is an order without a limit or with a larger one
+        return (
+            operation is not None
+            and not callable(operation)
+            and operation[0] == "order"
+            and (operation[2] is None or operation[2] > n)
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ISSUE ITEM ID
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _issue_item_id(self) -> int:
+        """Issues a new item ID"""
+
+        # Raise NotImplementedError, as item IDs are specific to a collection
+        raise NotImplementedError(f"{self.__class__.__name__} does not issue item IDs.")
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _KEY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _key(self, key: Any, items: Items | None = None) -> Item:
+        """Returns an item by key lookup"""
+
+        # Raise NotImplementedError, as key declarations are specific to a collection
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support key lookups."
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LIMIT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _limit(self, items: Items, n: int) -> Items:
+        """Returns items whose trailing order operation keeps only the first n items"""
+
+        # Initialize items
+        items = items._copy()
+
+        # Replace the limit of the trailing order operation
+        items._operations = (*items._operations[:-1], (*items._operations[-1][:2], n))
+
+        # Return items
+        return items
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _NOTIFY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _notify(
+        self, operation: str, items: Items | None, started: float, **metrics: Any
+    ) -> None:
+        """Calls observers with an event describing an operation and its metrics"""
+
+        # Get wall time
+        wall_time = perf_counter() - started
+
+        # Initialize event
+        event = {
+            "operation": operation,
+            "collection": self,
+            "conditions": self._get_conditions(items),
+            "scanned": None,
+            "yielded": None,
+            "copy_time": None,
+            "wall_time": wall_time,
+            **metrics,
+        }
+
+        # Iterate over observers
+        for observer in self._observers:
+            # Call observer
+            observer(event)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _OBSERVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _observe(
+        self,
+        items: Items,
+        collected: Iterable[Item],
+        read: Callable[[Item], Item] | None,
+        started: float,
+        scanned: list[int],
+    ) -> Generator[Item, None, None]:
+        """Yields and optionally reads items, notifying observers once they stop"""
+
+        # Initialize the number of yielded items
+        yielded = 0
+
+        # Initialize copy time
+        copy_time = 0.0
+
+        # Initialize try-finally block
+        try:
+            # Iterate over collected items
+            for item in collected:
+                # Check if items are read
+                if read is not None:
+                    # Get start time
+                    start = perf_counter()
+
+                    # Copy or view item
+                    item = read(item)
+
+                    # Add to copy time
+                    copy_time += perf_counter() - start
+
+                # Increment the number of yielded items
+                yielded += 1
+
+                # Yield item
+                yield item
+
+        # Notify observers whether items were exhausted, closed or raised
+        finally:
+            self._notify(
+                "collect",
+                items,
+                started,
+                scanned=scanned[0],
+                yielded=yielded,
+                copy_time=copy_time if read is not None else None,
+            )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _OPERATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _operate(self, items: Iterable[Item], operation: Any) -> Iterable[Item]:
+        """Applies an operation to an iterable of items"""
+
+        # Check if callable
+        if callable(operation):
+            # Apply operation to items
+            return operation(items)
+
+        # Get operation name
+        name = operation[0]
+
+        # Handle case of filter
+        if name == "filter":
+            return self._filter(items, *operation[1:])
+
+        # Otherwise handle case of head
+        elif name == "head":
+            return self._head(items, operation[1])
+
+        # Otherwise handle case of order
+        elif name == "order":
+            return self._sort(items, operation[1], operation[2])
+
+        # Otherwise handle case of slice
+        elif name == "slice":
+            return self._slice(items, operation[1], operation[2])
+
+        # Otherwise handle case of tail
+        elif name == "tail":
+            return self._tail(items, operation[1])
+
+        # Return items by default
+        return items
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _OPERATE ALL
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _operate_all(
+        self, items: Iterable[Item], operations: tuple[Any, ...]
+    ) -> Iterable[Item]:
+        """Applies a series of operations to an iterable of items"""
+
+        # Initialize index
+        i = 0
+
+        # Iterate over operations
+        while i < len(operations):
+            # Get operation
+            operation = operations[i]
+
+            # Increment index
+            i += 1
+
+            # Check if operation is not a parallel execution mode
+            if callable(operation) or operation[0] != "parallel":
+                # Apply operation to items
+                items = self._operate(items, operation)
+
+                # Continue
+                continue
+
+            # Split the filters and callables that follow into stages and the rest
+            stages, remaining = self._split_stages(operations[i:])
+
+            # Check if there are stages
+            if stages:
+                # Apply stages, in parallel if there are enough items
+                items = self._parallelize(items, stages, *operation[1:])
+
+            # Skip operations that were merged into stages
+            i = len(operations) - len(remaining)
+
+        # Return items
+        return items
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _PAGE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _page(
+        self, size: int, after: str | None = None, items: Items | None = None
+    ) -> tuple[list[Item], str | None]:
+        """Returns a page of items after a cursor and the cursor of the next page"""
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Initialize collected items
+        collected = iter(items)
+
+        # Check if there is a cursor
+        if after is not None:
+            # Get the item ID after which the page starts
+            after_id = self._decode_cursor(after, "id")
+
+            # Iterate over collected items up to and including the cursor item
+            for item in collected:
+                # Break if item is the cursor item
+                if item._imeta.id == after_id:
+                    break
+
+        # Get page
+        page = list(islice(collected, max(size, 0)))
+
+        # Return page and the cursor of its last item, or the same cursor if empty
+        return page, self._encode_cursor("id", page[-1]._imeta.id) if page else after
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _PARALLELIZE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _parallelize(
+        self,
+        items: Iterable[Item],
+        stages: tuple[Any, ...],
+        workers: int | None,
+        threshold: int,
+    ) -> Iterable[Item]:
+        """Applies stages in a process pool, or serially if there are few items"""
+
+        # Get the number of workers
+        workers = workers if workers is not None else os.cpu_count() or 1
+
+        # Check if there are too few workers to benefit from a process pool
+        if workers < 2:
+            # Return items with stages applied serially
+            return self._stage(items, stages)
+
+        # Get an iterator of items
+        iterator = iter(items)
+
+        # Get up to threshold items, leaving the rest of the stream unread
+        candidates = list(islice(iterator, threshold))
+
+        # Check if the stream ended before the threshold
+        if len(candidates) < threshold:
+            # Return items with stages applied serially
+            return self._stage(candidates, stages)
+
+        # Read the rest of the stream, which is split into chunks for workers
+        candidates.extend(iterator)
+
+        # Check if the only stage is a set of conditions
+        if len(stages) == 1 and not callable(stages[0]):
+            # Return items filtered in a process pool
+            return filter_parallel(candidates, stages[0], workers)
+
+        # Return items with stages applied in a process pool
+        return apply_parallel(candidates, stages, workers)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _PUSH MANY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _push_many(self, items: Iterable[Item]) -> None:
+        """Pushes a batch of items to the collection"""
+
+        # Iterate over items
+        for item in items:
+            # Push item
+            self.push(item)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _RESTORE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _restore(self, data: bytes) -> None:
+        """Restores the persisted attributes of the collection from snapshot bytes"""
+
+        # Check if collection does not support snapshots
+        if not self._snapshot_attrs:
+            # Raise NotImplementedError
+            raise NotImplementedError(
+                f"{self.__class__.__name__} does not support snapshots."
+            )
+
+        # Get state
+        state = loads(data)
+
+        # Iterate over persisted attributes
+        for attr in self._snapshot_attrs:
+            # Set attribute
+            setattr(self, attr, state[attr])
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _RUN ASYNC
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    async def _run_async(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Returns the result of a function, run in an executor if it blocks on I/O"""
+
+        # Return the result of the function if the collection does not block
+        if not self._blocking:
+            return function(*args)
+
+        # Return the result of the function run in the default executor
+        return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _SLICE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _slice(
+        self, items: Iterable[Item], start: int, stop: int
+    ) -> Generator[Item, None, None]:
+        """Yields a slice of items"""
+
+        # Check if either start or stop is less than 0
+        if start < 0 or stop < 0:
+            # Convert items to list and yield slice
+            yield from list(items)[start:stop]
+
+            # Return
+            return
+
+        # Iterate over items
+        for i, item in enumerate(items):
+            # Check if i is greater than or equal to stop
+            if i >= stop:
+                # Break
+                break
+
+            # Check if i is greater than or equal to start
+            if i >= start:
+                # Yield item
+                yield item
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _SORT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _sort(
+        self,
+        items: Iterable[Item],
+        keys: tuple[tuple[str, bool], ...],
+        limit: int | None = None,
+    ) -> Generator[Item, None, None]:
+        """Yields items sorted by attributes, keeping only the first limit if any"""
+
+        # Get sort key and direction
+        key, reverse = compile_order_key(keys)
+
+        # Check if there is no limit
+        if limit is None:
+            # Yield sorted items
+            yield from sorted(items, key=key, reverse=reverse)
+
+            # Return
+            return
+
+        # Yield the first limit items from a bounded heap rather than a full sort
+        yield from (nlargest if reverse else nsmallest)(limit, items, key=key)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _SPLIT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _split(
+        self, operations: tuple[Any, ...]
+    ) -> tuple[tuple[tuple[str, str, Any], ...], tuple[Any, ...]]:
+        """Splits operations into merged leading conditions and remaining operations"""
+
+        # Initialize conditions
+        conditions: tuple[tuple[str, str, Any], ...] = ()
+
+        # Iterate over operations
+        for i, operation in enumerate(operations):
+            # Return if operation is not a filter
+            if callable(operation) or operation[0] != "filter":
+                return conditions, operations[i:]
+
+            # Merge conditions
+            conditions += operation[1]
+
+        # Return conditions and no remaining operations
+        return conditions, ()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _SPLIT STAGES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _split_stages(
+        self, operations: tuple[Any, ...]
+    ) -> tuple[tuple[Any, ...], tuple[Any, ...]]:
+        """Splits operations into stages that workers can apply and the rest"""
+
+        # Initialize stages
+        stages: tuple[Any, ...] = ()
+
+        # Iterate until operations cannot be sent to a worker process
+        while operations:
+            # Split leading filters into merged conditions and the rest
+            conditions, remaining = self._split(operations)
+
+            # Check if there are conditions
+            if conditions:
+                # Append conditions as a stage
+                stages, operations = (*stages, conditions), remaining
+
+                # Continue
+                continue
+
+            # Get operation
+            operation = operations[0]
+
+            # Break if operation is not a callable that can be pickled, such as a
+            # module-level function, as lambdas and closures must run in this process
+            if not callable(operation) or not is_picklable(operation):
+                break
+
+            # Append callable as a stage, which workers apply to each chunk of items
+            # separately, so it must treat items independently, as a filter or map does
+            stages, operations = (*stages, operation), operations[1:]
+
+        # Return stages and remaining operations
+        return stages, operations
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _STAGE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _stage(self, items: Iterable[Item], stages: tuple[Any, ...]) -> Iterable[Item]:
+        """Applies stages of conditions and callables to items serially"""
+
+        # Iterate over stages
+        for stage in stages:
+            # Apply callable to items, or filter them by conditions
+            items = stage(items) if callable(stage) else self._filter(items, stage)
+
+        # Return items
+        return items
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _STAMP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _stamp(self, items: Iterable[Item]) -> Generator[Item, None, None]:
+        """Yields items with a pulled at timestamp read once per item class"""
+
+        # Initialize pulled at timestamps by item class
+        pulled_at_by_class: dict[type, Any] = {}
+
+        # Iterate over items
+        for item in items:
+            # Get item class
+            item_class = item.__class__
+
+            # Check if item class has no pulled at timestamp yet
+            if item_class not in pulled_at_by_class:
+                # Get clock
+                clock = self._get_clock(item_class)
+
+                # Set pulled at timestamp of item class, or None if disabled
+                pulled_at_by_class[item_class] = clock() if clock is not None else None
+
+            # Get pulled at
+            pulled_at = pulled_at_by_class[item_class]
+
+            # Check if timestamps are enabled
+            if pulled_at is not None:
+                # Set pulled at
+                item._imeta.pulled_at = pulled_at
+
+            # Yield item
+            yield item
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _TAIL
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _tail(self, items: Iterable[Item], n: int) -> Generator[Item, None, None]:
+        """Yields the last n items"""
+
+        # Initialize window
+        window: deque[Item] = deque(maxlen=n)
+
+        # Iterate over items
+        for item in items:
+            # Append item to window
+            window.append(item)
+
+        # Iterate over window
+        for item in window:
+            # Yield item
+            yield item
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _TALLY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _tally(
+        self, items: Iterable[Item], scanned: list[int]
+    ) -> Generator[Item, None, None]:
+        """Yields items, counting them as scanned"""
+
+        # Iterate over items
+        for item in items:
+            # Increment the number of scanned items
+            scanned[0] += 1
+
+            # Yield item
+            yield item
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _VALIDATE KEYS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _validate_keys(
+        self,
+        batch: list[tuple[Item, int]],
+        item_ids_by_key: dict[Any, int],
+        keys_by_item_id: dict[int, list[Any]],
+    ) -> list[list[Any]]:
+        """Returns the key values of a batch of items, raising if any would collide"""
+
+        # Get key values that items in the batch release by being pushed again
+        released = {
+            value for _, item_id in batch for value in keys_by_item_id.get(item_id, ())
+        }
+
+        # Initialize item IDs by key values claimed within the batch
+        claimed: dict[Any, int] = {}
+
+        # Initialize key values
+        key_values = []
+
+        # Iterate over batch
+        for item, item_id in batch:
+            # Get values
+            values = self._get_key_values(item)
+
+            # Iterate over values
+            for value in values:
+                # Get the item ID that owns value
+                owner = claimed.get(
+                    value, None if value in released else item_ids_by_key.get(value)
+                )
+
+                # Check if value is owned by another item
+                if owner is not None and owner != item_id:
+                    # Raise a duplicate key error
+                    raise DuplicateKeyError(
+                        f"An item with the key '{value}' already exists."
+                    )
+
+                # Claim value
+                claimed[value] = item_id
+
+            # Append values to key values
+            key_values.append(values)
+
+        # Return key values
+        return key_values
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ACOUNT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    async def acount(self, items: Items | None = None) -> int:
+        """Returns a count of items in the collection without blocking the loop"""
+
+        # Return count
+        return await self._run_async(self.count, items)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ AFIRST
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    async def afirst(self, items: Items | None = None) -> Item | None:
+        """Returns the first item in the collection without blocking the loop"""
+
+        # Return first item
+        return await self._run_async(self.first, items)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ AGGREGATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def aggregate(
+        self, aggregates: dict[str, str | None], items: Items | None = None
+    ) -> dict[str, Any]:
+        """Returns aggregates of items, collected once and without copies"""
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Validate aggregates before collecting
+        validate_aggregates(aggregates)
+
+        # Return aggregates of collected items
+        return aggregate_items(self.collect(items, quick=True), aggregates)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ AITERATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    async def aiterate(
+        self, batch_size: int = 1000, items: Items | None = None
+    ) -> AsyncGenerator[Item, None]:
+        """Yields items in batches, handing control back to the loop between them"""
+
+        # Check if batch size is invalid
+        if not isinstance(batch_size, int) or batch_size < 1:
+            # Raise ValueError
+            raise ValueError(
+                f"Invalid batch size {batch_size!r}, expected a positive integer."
+            )
+
+        # Get an iterator of items, which stamps them as they are pulled
+        iterator = iter(self.apply(items))
+
+        # Iterate until there are no items left
+        while True:
+            # Get batch
+            batch = await self._run_async(list, islice(iterator, batch_size))
+
+            # Return if there are no items left
+            if not batch:
+                return
+
+            # Iterate over batch
+            for item in batch:
+                # Yield item
+                yield item
+
+            # Hand control back to the loop
+            await asyncio.sleep(0)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ AKEY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    async def akey(self, key: Any, items: Items | None = None) -> Item:
+        """Returns an item by key lookup without blocking the loop"""
+
+        # Return item
+        return await self._run_async(self.key, key, items)
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ ALL
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -68,54 +1020,254 @@ class Collection(ABC):
     # │ COUNT
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    @abstractmethod
     def count(self, items: Items | None = None) -> int:
         """Returns a count of items in the collection"""
 
+        # Return count if collection is not observed
+        if not self._observers:
+            return self._count(items)
+
+        # Get start time
+        started = perf_counter()
+
+        # Get count
+        count = self._count(items)
+
+        # Notify observers
+        self._notify("count", items, started, yielded=count)
+
+        # Return count
+        return count
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ EXPLAIN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def explain(self, items: Items | None = None) -> str:
+        """Returns a description of the plan used to collect items"""
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Return a full scan followed by each operation
+        return "\n".join(
+            [f"SCAN {self.__class__.__name__}"]
+            + [self._describe(operation) for operation in items._operations]
+        )
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ FILTER
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    @abstractmethod
     def filter(
         self,
         conditions: tuple[tuple[str, str, Any], ...],
         items: Items | None = None,
     ) -> Items:
-        """Filters items in the collection"""
+        """Returns a filtered collection of items"""
+
+        # Return filtered items if collection is not observed
+        if not self._observers:
+            return self.apply(
+                items, ("filter", conditions, compile_conditions(conditions))
+            )
+
+        # Get start time
+        started = perf_counter()
+
+        # Apply filter operation to items, compiling conditions once
+        filtered = self.apply(
+            items, ("filter", conditions, compile_conditions(conditions))
+        )
+
+        # Notify observers
+        self._notify("filter", filtered, started)
+
+        # Return filtered items
+        return filtered
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ FIRST
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    @abstractmethod
     def first(self, items: Items | None = None) -> Item | None:
         """Returns the first item in the collection"""
 
+        # Return the only item of a head of one
+        return next(iter(self.head(1, items)), None)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ GROUP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def group(
+        self,
+        attr: str,
+        aggregates: dict[str, str | None],
+        items: Items | None = None,
+    ) -> dict[Any, dict[str, Any]]:
+        """Returns aggregates of items grouped by the value of an attribute"""
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Validate aggregates before collecting
+        validate_aggregates(aggregates)
+
+        # Return aggregates of collected items by grouping value, folded in one pass
+        return group_items(self.collect(items, quick=True), attr, aggregates)
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ HEAD
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    @abstractmethod
     def head(self, n: int, items: Items | None = None) -> Items:
         """Returns the first n items in the collection"""
 
+        # Check if items are ordered without a limit or with a larger one
+        if items is not None and self._is_order(items, max(n, 0)):
+            # Limit the order operation, so that it keeps only the first n items
+            return self._limit(items, max(n, 0))
+
+        # Apply head operation to items
+        return self.apply(items, ("head", n))
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ KEY
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    @abstractmethod
     def key(self, key: Any, items: Items | None = None) -> Item:
         """Returns an item by key lookup"""
 
+        # Return item if collection is not observed
+        if not self._observers:
+            return self._key(key, items)
+
+        # Get start time
+        started = perf_counter()
+
+        # Initialize the number of items found
+        found = 0
+
+        # Initialize try-finally block
+        try:
+            # Get item
+            item = self._key(key, items)
+
+            # Set the number of items found
+            found = 1
+
+            # Return item
+            return item
+
+        # Notify observers whether or not the key exists
+        finally:
+            self._notify("key", items, started, scanned=found, yielded=found)
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ LAST
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    @abstractmethod
     def last(self, items: Items | None = None) -> Item | None:
         """Returns the last item in the collection"""
 
+        # Initialize items
+        items = self.apply(items)
+
+        # Initialize window
+        window = deque(items, maxlen=1)
+
+        # Return the last item in the collection
+        return window.pop() if window else None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LOAD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def load(self, path: str) -> None:
+        """Replaces the items and indexes of the collection with a snapshot file"""
+
+        # Restore collection from snapshot
+        self._restore(read_snapshot(path, self.__class__.__name__))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ OBSERVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def observe(
+        self, observer: Callable[[dict[str, Any]], None]
+    ) -> Callable[[dict[str, Any]], None]:
+        """Registers an observer to be called with an event after each operation"""
+
+        # Add observer to observers, replacing the tuple so that iteration is safe
+        self._observers = (*self._observers, observer)
+
+        # Return observer
+        return observer
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ORDER BY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def order_by(
+        self, keys: tuple[tuple[str, bool], ...], items: Items | None = None
+    ) -> Items:
+        """Returns items ordered by attributes and whether each is descending"""
+
+        # Apply order operation to items
+        return self.apply(items, ("order", keys, None))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PAGE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def page(
+        self, size: int, after: str | None = None, items: Items | None = None
+    ) -> tuple[list[Item], str | None]:
+        """Returns a page of items after a cursor and the cursor of the next page"""
+
+        # Return page and cursor if collection is not observed
+        if not self._observers:
+            return self._page(size=size, after=after, items=items)
+
+        # Get start time
+        started = perf_counter()
+
+        # Get page and cursor
+        page, cursor = self._page(size=size, after=after, items=items)
+
+        # Notify observers
+        self._notify("page", items, started, yielded=len(page))
+
+        # Return page and cursor
+        return page, cursor
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PARALLEL
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def parallel(
+        self, workers: int | None, threshold: int, items: Items | None = None
+    ) -> Items:
+        """Returns items whose subsequent filters and callables run in a process pool"""
+
+        # Check if workers is invalid
+        if workers is not None and (not isinstance(workers, int) or workers < 1):
+            # Raise ValueError
+            raise ValueError(
+                f"Invalid workers {workers!r}, expected a positive integer or None."
+            )
+
+        # Check if threshold is invalid
+        if not isinstance(threshold, int) or threshold < 0:
+            # Raise ValueError
+            raise ValueError(
+                f"Invalid threshold {threshold!r}, expected a non-negative integer."
+            )
+
+        # Apply parallel operation to items
+        return self.apply(items, ("parallel", workers, threshold))
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ PUSH
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -124,18 +1276,86 @@ class Collection(ABC):
     def push(self, item: Item) -> None:
         """Pushes an item to the collection"""
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PUSH MANY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def push_many(self, items: Iterable[Item]) -> None:
+        """Pushes a batch of items to the collection"""
+
+        # Check if collection is not observed
+        if not self._observers:
+            # Push items
+            self._push_many(items)
+
+            # Return
+            return
+
+        # Get start time
+        started = perf_counter()
+
+        # Materialize items so that they can be counted
+        items = list(items)
+
+        # Push items
+        self._push_many(items)
+
+        # Notify observers
+        self._notify("push", None, started, yielded=len(items))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SAVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def save(self, path: str) -> None:
+        """Writes the items and indexes of the collection to a snapshot file"""
+
+        # Write snapshot of collection
+        write_snapshot(path, self.__class__.__name__, self._dump())
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ SLICE
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    @abstractmethod
     def slice(self, start: int, stop: int, items: Items | None = None) -> Items:
         """Returns a slice of items in the collection"""
 
+        # Check if items are ordered and the slice ends at a smaller positive stop
+        if (
+            items is not None
+            and start >= 0
+            and stop >= 0
+            and self._is_order(items, stop)
+        ):
+            # Limit the order operation, so that it keeps only the first stop items
+            items = self._limit(items, stop)
+
+        # Apply slice operation to items
+        return self.apply(items, ("slice", start, stop))
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ TAIL
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    @abstractmethod
     def tail(self, n: int, items: Items | None = None) -> Items:
         """Returns the last n items in the collection"""
+
+        # Apply tail operation to items
+        return self.apply(items, ("tail", n))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ UNOBSERVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def unobserve(self, observer: Callable[[dict[str, Any]], None]) -> None:
+        """Unregisters an observer"""
+
+        # Check if observer is not registered
+        if observer not in self._observers:
+            # Raise ValueError
+            raise ValueError(
+                f"Invalid observer {observer!r}, expected a registered observer."
+            )
+
+        # Remove observer from observers
+        self._observers = tuple(o for o in self._observers if o is not observer)
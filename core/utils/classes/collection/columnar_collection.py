@@ -0,0 +1,953 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import copy
+
+from time import perf_counter
+from typing import Any, Callable, Generator, Iterable, TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection.collection import Collection
+from core.utils.exceptions import DoesNotExistError
+from core.utils.functions.aggregate import aggregate_values, validate_aggregates
+from core.utils.functions.datetime import get_clock
+from core.utils.functions.predicate import compile_condition
+from core.utils.functions.state import get_state, set_state
+
+if TYPE_CHECKING:
+    from core.utils.classes.item.item import Item
+    from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COLUMN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Column:
+    """A utility class that represents a typed column of item attribute values"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize dtypes by kind
+    DTYPES = {
+        "bool": "bool",
+        "int": "int64",
+        "float": "float64",
+        "str": "object",
+        "object": "object",
+    }
+
+    # Initialize fill values by kind
+    FILLS = {"bool": False, "int": 0, "float": 0.0, "str": None, "object": None}
+
+    # Initialize bounds of int columns
+    INT_MIN = -(2**63)
+    INT_MAX = 2**63 - 1
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of kind
+    kind: str
+
+    # Declare type of values
+    values: Any
+
+    # Declare type of presence mask
+    present: Any
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, kind: str, capacity: int) -> None:
+        """Init Method"""
+
+        # Set kind
+        self.kind = kind
+
+        # Initialize values
+        self.values = np.full(capacity, self.FILLS[kind], dtype=self.DTYPES[kind])
+
+        # Initialize presence mask
+        self.present = np.zeros(capacity, dtype=bool)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ GET KIND
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def get_kind(cls, value: Any) -> str:
+        """Returns the kind of column that can store a value"""
+
+        # Get value type
+        value_type = type(value)
+
+        # Check if value is a bool
+        if value_type is bool:
+            return "bool"
+
+        # Check if value is an int that fits in 64 bits
+        if value_type is int:
+            return "int" if cls.INT_MIN <= value <= cls.INT_MAX else "object"
+
+        # Check if value is a float
+        if value_type is float:
+            return "float"
+
+        # Check if value is a string
+        if value_type is str:
+            return "str"
+
+        # Return object by default
+        return "object"
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ GROW
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def grow(self, capacity: int) -> None:
+        """Grows the column to a new capacity"""
+
+        # Initialize values
+        values = np.full(capacity, self.FILLS[self.kind], dtype=self.DTYPES[self.kind])
+        values[: len(self.values)] = self.values
+
+        # Initialize presence mask
+        present = np.zeros(capacity, dtype=bool)
+        present[: len(self.present)] = self.present
+
+        # Set values and presence mask
+        self.values, self.present = values, present
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SET
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def set(self, position: int, value: Any, kind: str) -> None:
+        """Sets the value at a position, generalizing the column if needed"""
+
+        # Check if column cannot store value kind
+        if kind != self.kind and self.kind != "object":
+            # Generalize column to Python objects
+            self.values = self.values.astype(object)
+            self.kind = "object"
+
+        # Set value
+        self.values[position] = value
+
+        # Mark value as present
+        self.present[position] = True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ UNSET
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def unset(self, position: int) -> None:
+        """Unsets the value at a position"""
+
+        # Reset value
+        self.values[position] = self.FILLS[self.kind]
+
+        # Mark value as missing
+        self.present[position] = False
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COLUMNAR COLLECTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class ColumnarCollection(Collection):
+    """A utility class that represents a columnar collection of items"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize the number of rows materialized at a time
+    CHUNK_SIZE = 1024
+
+    # Initialize operations that are evaluated against columns
+    POSITIONAL = ("filter", "head", "slice", "tail")
+
+    # Initialize names of the attributes that snapshots persist, including columns
+    _snapshot_attrs = (
+        "_item_id",
+        "_size",
+        "_capacity",
+        "_columns",
+        "_classes",
+        "_imetas",
+        "_positions_by_item_id",
+        "_item_ids_by_key",
+        "_keys_by_item_id",
+    )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize item ID
+    _item_id: int
+
+    # Declare type of the number of rows
+    _size: int
+
+    # Declare type of the row capacity
+    _capacity: int
+
+    # Declare type of columns by attribute
+    _columns: dict[str, Column]
+
+    # Declare type of item classes by position
+    _classes: list[type]
+
+    # Declare type of instance metas by position
+    _imetas: list[Any]
+
+    # Declare type of positions by item ID
+    _positions_by_item_id: dict[int, int]
+
+    # Declare type of item IDs by key
+    _item_ids_by_key: dict[Any, int]
+
+    # Declare type of keys by item ID
+    _keys_by_item_id: dict[int, list[Any]]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, clock: str | Callable[[], Any] = "utc") -> None:
+        """Init Method"""
+
+        # Check if NumPy is not installed
+        if np is None:
+            # Raise ImportError
+            raise ImportError(
+                f"{self.__class__.__name__} requires numpy, "
+                "install it with `pip install core-utils[columnar]`."
+            )
+
+        # Initialize item ID
+        self._item_id = 0
+
+        # Initialize the number of rows
+        self._size = 0
+
+        # Initialize the row capacity
+        self._capacity = 0
+
+        # Initialize columns by attribute
+        self._columns = {}
+
+        # Initialize item classes by position
+        self._classes = []
+
+        # Initialize instance metas by position
+        self._imetas = []
+
+        # Initialize positions by item ID
+        self._positions_by_item_id = {}
+
+        # Initialize item IDs by key
+        self._item_ids_by_key = {}
+
+        # Initialize keys by item ID
+        self._keys_by_item_id = {}
+
+        # Validate clock policy
+        get_clock(clock)
+
+        # Initialize clock policy of items whose class does not declare one
+        self._clock = clock
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _COUNT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _count(self, items: Items | None = None) -> int:
+        """Returns a count of items in the collection"""
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Locate positions
+        positions, operations = self._locate(items._operations)
+
+        # Return the number of positions if no operations remain
+        if not operations:
+            return len(positions)
+
+        # Return the number of items in the collection
+        return sum(1 for _ in items._collect(quick=True))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET VALUES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_values(
+        self, positions: Any, attrs: Iterable[str | None]
+    ) -> dict[str, list[Any]] | None:
+        """Returns attribute values at positions, or None if any are not all stored"""
+
+        # Initialize values by attribute
+        values_by_attr = {}
+
+        # Iterate over attributes
+        for attr in set(attrs):
+            # Continue if there is no attribute
+            if attr is None:
+                continue
+
+            # Get column
+            column = self._columns.get(attr)
+
+            # Return None if any position lacks the attribute in columns
+            if column is None or not column.present[positions].all():
+                return None
+
+            # Set values
+            values_by_attr[attr] = column.values[positions].tolist()
+
+        # Return values by attribute
+        return values_by_attr
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _IS NUMBER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _is_number(self, value: Any) -> bool:
+        """Returns whether a value can be compared against numeric columns in NumPy"""
+
+        # Get value type
+        value_type = type(value)
+
+        # Return whether value is a bool, float or an int that fits in 64 bits
+        return (
+            value_type is bool
+            or value_type is float
+            or (value_type is int and Column.INT_MIN <= value <= Column.INT_MAX)
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ISSUE ITEM ID
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _issue_item_id(self) -> int:
+        """Issues a new item ID"""
+
+        # Increment item ID
+        self._item_id += 1
+
+        # Return item ID
+        return self._item_id
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _KEY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _key(self, key: Any, items: Items | None = None) -> Item:
+        """Returns an item by key lookup"""
+
+        # Define does not exist error message
+        does_not_exist_error_message = f"An item with the key '{key}' does not exist"
+
+        # Check if key is not in item IDs by key
+        if key not in self._item_ids_by_key:
+            # Raise DoesNotExistError
+            raise DoesNotExistError(does_not_exist_error_message + ".")
+
+        # Get position
+        position = self._positions_by_item_id[self._item_ids_by_key[key]]
+
+        # Materialize item
+        item = next(self._materialize(np.array([position])))
+
+        # Collect subset
+        subset = list(self.collect(items=items, subset=[item]))
+
+        # Check if subset is null
+        if not subset:
+            # Raise DoesNotExistError
+            raise DoesNotExistError(does_not_exist_error_message + " in this subset.")
+
+        # Unpack subset
+        [item] = subset
+
+        # Return item
+        return item
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LOCATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _locate(self, operations: tuple[Any, ...]) -> tuple[Any, tuple[Any, ...]]:
+        """Returns the positions selected by leading operations and the remainder"""
+
+        # Initialize positions
+        positions = np.arange(self._size)
+
+        # Iterate over operations
+        for i, operation in enumerate(operations):
+            # Return if operation cannot be evaluated against columns
+            if callable(operation) or operation[0] not in self.POSITIONAL:
+                return positions, operations[i:]
+
+            # Get operation name
+            name = operation[0]
+
+            # Handle case of filter
+            if name == "filter":
+                # Iterate over conditions
+                for attr, operator, expected in operation[1]:
+                    # Break if there are no positions left
+                    if not len(positions):
+                        break
+
+                    # Select positions that satisfy condition
+                    positions = positions[
+                        self._mask(positions, attr, operator, expected)
+                    ]
+
+            # Otherwise handle case of head
+            elif name == "head":
+                positions = positions[: max(operation[1], 0)]
+
+            # Otherwise handle case of slice
+            elif name == "slice":
+                positions = positions[operation[1] : operation[2]]
+
+            # Otherwise handle case of tail
+            elif name == "tail":
+                positions = positions[max(len(positions) - operation[1], 0) :]
+
+        # Return positions and no remaining operations
+        return positions, ()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _MASK
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _mask(self, positions: Any, attr: str, operator: str, expected: Any) -> Any:
+        """Returns a boolean mask of the positions that satisfy a condition"""
+
+        # Get column
+        column = self._columns.get(attr)
+
+        # Get presence mask
+        present = (
+            column.present[positions]
+            if column is not None
+            else np.zeros(len(positions), dtype=bool)
+        )
+
+        # Check if any position lacks the attribute
+        if not present.all():
+            # Get item class of the first position lacking the attribute
+            item_class = self._classes[int(positions[~present][0])]
+
+            # Raise AttributeError as a scan would
+            raise AttributeError(
+                f"'{item_class.__name__}' object has no attribute '{attr}'"
+            )
+
+        # Get values
+        values = column.values[positions]  # type: ignore[union-attr]
+
+        # Get kind
+        kind = column.kind  # type: ignore[union-attr]
+
+        # Check if column is numeric
+        if kind in ("bool", "int", "float"):
+            # Handle case of equals
+            if operator in ("equals", "iequals") and self._is_number(expected):
+                return values == expected
+
+            # Otherwise handle case of comparisons
+            elif operator in ("lt", "lte", "gt", "gte") and self._is_number(expected):
+                return self._vectorize(values, expected, operator)
+
+            # Otherwise handle case of in
+            elif (
+                operator in ("in", "iin")
+                and isinstance(expected, (list, tuple, set, frozenset))
+                and all(
+                    self._is_number(value) or value is None or isinstance(value, str)
+                    for value in expected
+                )
+            ):
+                # Get numeric expected values, as others can never match a number
+                numbers = [value for value in expected if self._is_number(value)]
+
+                # Return mask
+                return (
+                    np.isin(values, numbers)
+                    if numbers
+                    else np.zeros(len(values), dtype=bool)
+                )
+
+        # Otherwise check if column is a string column
+        elif kind == "str" and isinstance(expected, str):
+            # Handle case of equals
+            if operator == "equals":
+                return values == expected
+
+            # Otherwise handle case of comparisons
+            elif operator in ("lt", "lte", "gt", "gte"):
+                return self._vectorize(values, expected, operator)
+
+        # Return mask by testing each value as a scan would
+        return np.fromiter(
+            map(compile_condition(operator, expected), values.tolist()),
+            dtype=bool,
+            count=len(values),
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _MATERIALIZE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _materialize(
+        self, positions: Any, quick: bool = False
+    ) -> Generator[Item, None, None]:
+        """Yields items built from the column values at a series of positions"""
+
+        # Get columns
+        columns = list(self._columns.items())
+
+        # Get item classes and instance metas by position
+        classes, imetas = self._classes, self._imetas
+
+        # Iterate over chunks of positions
+        for start in range(0, len(positions), self.CHUNK_SIZE):
+            # Get chunk
+            chunk = positions[start : start + self.CHUNK_SIZE]
+
+            # Get the values of each column in chunk
+            rows = [
+                (
+                    attr,
+                    column.values[chunk].tolist(),
+                    column.present[chunk].tolist(),
+                    column.kind == "object" and not quick,
+                )
+                for attr, column in columns
+            ]
+
+            # Iterate over positions in chunk
+            for i, position in enumerate(chunk.tolist()):
+                # Get item class
+                item_class = classes[position]
+
+                # Initialize item
+                item = item_class.__new__(item_class)
+
+                # Get whether item class stores attributes in slots
+                slotted = bool(item_class._cmeta.slot_names)
+
+                # Get item state, which is set on slotted items once complete
+                state = {} if slotted else item.__dict__
+
+                # Iterate over column values
+                for attr, values, present, mutable in rows:
+                    # Check if value is present
+                    if present[i]:
+                        # Set value, copying mutable values
+                        state[attr] = copy.deepcopy(values[i]) if mutable else values[i]
+
+                # Check if item class stores attributes in slots
+                if slotted:
+                    # Set item state
+                    set_state(item, state)
+
+                # Set instance meta
+                item._imeta = copy.copy(imetas[position])
+
+                # Yield item
+                yield item
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _PUSH MANY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _push_many(self, items: Iterable[Item]) -> None:
+        """Pushes a batch of items to the collection, validating all keys first"""
+
+        # Get keys by item ID
+        keys_by_item_id = self._keys_by_item_id
+
+        # Get item IDs by key
+        item_ids_by_key = self._item_ids_by_key
+
+        # Get batch and key values, validating keys before issuing item IDs
+        batch, key_values = self._get_batch(items, item_ids_by_key, keys_by_item_id)
+
+        # Get original item IDs
+        original_ids = [item._imeta.id for item, _ in batch]
+
+        # Initialize try-except block
+        try:
+            # Initialize rows
+            rows = []
+
+            # Iterate over batch
+            for item, item_id in batch:
+                # Update item ID
+                item._imeta.id = str(item_id)
+
+                # Initialize row
+                row = {}
+
+                # Iterate over item state
+                for attr, value in get_state(item).items():
+                    # Get kind
+                    kind = Column.get_kind(value)
+
+                    # Add value to row, copying mutable values
+                    row[attr] = (
+                        copy.deepcopy(value) if kind == "object" else value,
+                        kind,
+                    )
+
+                # Append row and a copy of the instance meta to rows
+                rows.append((row, copy.copy(item._imeta)))
+
+        # Handle any exception raised while copying
+        except BaseException:
+            # Iterate over batch and original item IDs
+            for (item, _), original_id in zip(batch, original_ids):
+                # Restore item ID
+                item._imeta.id = original_id
+
+            # Re-raise exception
+            raise
+
+        # Get positions by item ID
+        positions_by_item_id = self._positions_by_item_id
+
+        # Reserve rows for items that are not already in the collection
+        self._reserve(
+            len(
+                {item_id for _, item_id in batch if item_id not in positions_by_item_id}
+            )
+        )
+
+        # Get columns
+        columns = self._columns
+
+        # Iterate over batch, key values and rows
+        for (item, item_id), values, (row, imeta) in zip(batch, key_values, rows):
+            # Iterate over values released by item
+            for value in keys_by_item_id.pop(item_id, []):
+                # Check if value is still owned by item
+                if item_ids_by_key.get(value) == item_id:
+                    # Remove item ID from item IDs by key
+                    del item_ids_by_key[value]
+
+            # Iterate over values
+            for value in values:
+                # Add item ID to item IDs by key
+                item_ids_by_key[value] = item_id
+
+            # Set keys by item ID
+            keys_by_item_id[item_id] = values
+
+            # Get position
+            position = positions_by_item_id.get(item_id)
+
+            # Check if item is not already in the collection
+            if position is None:
+                # Get position
+                position = positions_by_item_id[item_id] = self._size
+
+                # Increment the number of rows
+                self._size += 1
+
+                # Append item class and instance meta
+                self._classes.append(item.__class__)
+                self._imetas.append(imeta)
+
+            # Otherwise update item class and instance meta
+            else:
+                self._classes[position] = item.__class__
+                self._imetas[position] = imeta
+
+            # Iterate over columns
+            for attr, column in columns.items():
+                # Check if a previous value is no longer present
+                if attr not in row and column.present[position]:
+                    # Unset value
+                    column.unset(position)
+
+            # Iterate over row
+            for attr, (value, kind) in row.items():
+                # Get column
+                column = columns.get(attr) or columns.setdefault(
+                    attr, Column(kind, self._capacity)
+                )
+
+                # Set value
+                column.set(position, value, kind)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _RESERVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _reserve(self, n: int) -> None:
+        """Ensures that there is capacity for n more rows"""
+
+        # Return if there is enough capacity
+        if self._size + n <= self._capacity:
+            return
+
+        # Get capacity
+        capacity = max(self._capacity * 2, self._size + n, 16)
+
+        # Iterate over columns
+        for column in self._columns.values():
+            # Grow column
+            column.grow(capacity)
+
+        # Set capacity
+        self._capacity = capacity
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _VECTORIZE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _vectorize(self, values: Any, expected: Any, operator: str) -> Any:
+        """Returns a boolean mask comparing an array of values to an expected value"""
+
+        # Handle case of less than
+        if operator == "lt":
+            return values < expected
+
+        # Otherwise handle case of less than or equal to
+        elif operator == "lte":
+            return values <= expected
+
+        # Otherwise handle case of greater than
+        elif operator == "gt":
+            return values > expected
+
+        # Return mask for greater than or equal to by default
+        return values >= expected
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ AGGREGATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def aggregate(
+        self, aggregates: dict[str, str | None], items: Items | None = None
+    ) -> dict[str, Any]:
+        """Returns aggregates of items, read from columns where possible"""
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Validate aggregates
+        validate_aggregates(aggregates)
+
+        # Locate positions
+        positions, operations = self._locate(items._operations)
+
+        # Get attribute values at positions if all operations were evaluated
+        values_by_attr = (
+            self._get_values(positions, aggregates.values()) if not operations else None
+        )
+
+        # Check if values could not be read from columns
+        if values_by_attr is None:
+            # Return aggregates of collected items
+            return super().aggregate(aggregates, items)
+
+        # Return aggregates of column values
+        return aggregate_values(len(positions), values_by_attr, aggregates)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COLLECT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def collect(
+        self,
+        items: Items | None = None,
+        subset: Iterable[Item] | None = None,
+        quick: bool = False,
+    ) -> Generator[Item, None, None]:
+        """Yields items in the collection"""
+
+        # Get whether collection is observed and the start time if so
+        observed = bool(self._observers)
+        started = perf_counter() if observed else 0.0
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Check if collection is a subset
+        if subset is not None:
+            # Initialize collected items
+            collected: Iterable[Item] = subset
+
+            # Initialize operations
+            operations = items._operations
+
+        # Otherwise evaluate leading operations against columns
+        else:
+            # Locate positions
+            positions, operations = self._locate(items._operations)
+
+            # Materialize items at positions
+            collected = self._materialize(positions, quick=quick)
+
+        # Initialize the number of scanned items
+        scanned = [0]
+
+        # Check if collection is observed
+        if observed:
+            # Count collected items as they are scanned
+            collected = self._tally(collected, scanned)
+
+        # Apply operations to collected
+        collected = self._operate_all(collected, operations)
+
+        # Check if collection is observed
+        if observed:
+            # Yield collected items, notifying observers once they stop
+            yield from self._observe(items, collected, None, started, scanned)
+
+            # Return
+            return
+
+        # Yield collected items
+        yield from collected
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ EXPLAIN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def explain(self, items: Items | None = None) -> str:
+        """Returns a description of the plan used to collect items"""
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Initialize lines
+        lines = [f"SCAN {self.__class__.__name__} (~{self._size} rows)"]
+
+        # Initialize vectorized flag
+        vectorized = True
+
+        # Iterate over operations
+        for operation in items._operations:
+            # Update vectorized flag
+            vectorized = vectorized and (
+                not callable(operation) and operation[0] in self.POSITIONAL
+            )
+
+            # Append operation to lines
+            lines.append(
+                ("VECTORIZE " if vectorized else "") + self._describe(operation)
+            )
+
+        # Return plan
+        return "\n".join(lines)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ GROUP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def group(
+        self,
+        attr: str,
+        aggregates: dict[str, str | None],
+        items: Items | None = None,
+    ) -> dict[Any, dict[str, Any]]:
+        """Returns aggregates of items grouped by an attribute, read from columns"""
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Validate aggregates
+        validate_aggregates(aggregates)
+
+        # Locate positions
+        positions, operations = self._locate(items._operations)
+
+        # Get attribute values at positions if all operations were evaluated
+        values_by_attr = (
+            self._get_values(positions, [attr, *aggregates.values()])
+            if not operations
+            else None
+        )
+
+        # Check if values could not be read from columns
+        if values_by_attr is None:
+            # Return aggregates of collected items
+            return super().group(attr, aggregates, items)
+
+        # Initialize indices of members by grouping value
+        indices_by_value: dict[Any, list[int]] = {}
+
+        # Iterate over grouping values
+        for i, value in enumerate(values_by_attr[attr]):
+            # Get indices
+            indices = indices_by_value.get(value)
+
+            # Check if group is new
+            if indices is None:
+                # Initialize group
+                indices_by_value[value] = [i]
+
+            # Otherwise append index to group
+            else:
+                indices.append(i)
+
+        # Get aggregated attributes
+        attrs = {aggregated for aggregated in aggregates.values() if aggregated}
+
+        # Return aggregates by grouping value
+        return {
+            value: aggregate_values(
+                len(indices),
+                {a: [values_by_attr[a][i] for i in indices] for a in attrs},
+                aggregates,
+            )
+            for value, indices in indices_by_value.items()
+        }
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LAST
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def last(self, items: Items | None = None) -> Item | None:
+        """Returns the last item in the collection"""
+
+        # Return the only item of a tail of one
+        return next(iter(self.tail(1, items)), None)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PUSH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def push(self, item: Item) -> None:
+        """Pushes an item to the collection"""
+
+        # Push a batch of one item
+        self.push_many((item,))
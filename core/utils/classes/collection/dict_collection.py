@@ -4,16 +4,33 @@
 
 from __future__ import annotations
 
-from collections import deque
-from copy import deepcopy
-from typing import Any, Generator, Iterable, TYPE_CHECKING
+import os
+import threading
+
+from bisect import bisect_left
+from collections import OrderedDict
+from contextlib import AbstractContextManager, nullcontext
+from functools import partial
+from itertools import chain, islice
+from time import perf_counter
+from typing import Any, Callable, Generator, Iterable, TYPE_CHECKING
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ PROJECT IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 from core.utils.classes.collection.collection import Collection
-from core.utils.exceptions import DoesNotExistError, DuplicateKeyError
+from core.utils.classes.index import HashIndex, Index, Sorted, SortedIndex
+from core.utils.classes.item.item_view import CopyOnWriteItemView, ReadOnlyItemView
+from core.utils.classes.lock import ReadWriteLock
+from core.utils.classes.log import WriteAheadLog
+from core.utils.exceptions import DoesNotExistError
+from core.utils.functions.aggregate import aggregate_items, validate_aggregates
+from core.utils.functions.copy import get_copier
+from core.utils.functions.datetime import get_clock
+from core.utils.functions.order import compile_order_key
+from core.utils.functions.predicate import compile_conditions
+from core.utils.functions.snapshot import read_snapshot, write_snapshot
 
 if TYPE_CHECKING:
     from core.utils.classes.item.item import Item
@@ -28,6 +45,36 @@ if TYPE_CHECKING:
 class DictCollection(Collection):
     """A utility class that represents a dictionary collection of items"""
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize the cost of materializing an indexed item ID relative to a scan
+    PROBE_COST = 0.25
+
+    # Initialize the size in bytes at which a write-ahead log is compacted
+    WAL_COMPACT_SIZE = 64 * 2**20
+
+    # Initialize names of the attributes that snapshots persist, including indexes
+    _snapshot_attrs = (
+        "_item_id",
+        "_items_by_id",
+        "_item_ids",
+        "_positions_by_item_id",
+        "_ordered",
+        "_item_ids_by_key",
+        "_keys_by_item_id",
+        "_indexes",
+        "_key_declarations",
+        "_item_classes",
+    )
+
+    # Initialize view factories by read policy
+    VIEWS: dict[str, Callable[[Any], Any]] = {
+        "cow": CopyOnWriteItemView.of,
+        "frozen": ReadOnlyItemView.of,
+    }
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ INSTANCE ATTRIBUTES
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -38,17 +85,80 @@ class DictCollection(Collection):
     # Declare type of items by ID
     _items_by_id: dict[int, Item]
 
+    # Declare type of item IDs in insertion order
+    _item_ids: list[int]
+
+    # Declare type of insertion positions by item ID
+    _positions_by_item_id: dict[int, int]
+
+    # Declare type of whether insertion order matches item ID order
+    _ordered: bool
+
     # Declare type of item IDs by key
     _item_ids_by_key: dict[Any, int]
 
     # Declare type of keys by item ID
     _keys_by_item_id: dict[int, list[Any]]
 
+    # Declare type of indexes
+    _indexes: dict[Any, Index]
+
+    # Declare type of key declarations
+    _key_declarations: set[str | tuple[str, ...]]
+
+    # Declare type of item classes
+    _item_classes: set[type]
+
+    # Declare type of default copier
+    _copier: Callable[[Any], Any]
+
+    # Declare type of copiers by item class
+    _copiers_by_class: dict[type, Callable[[Any], Any]]
+
+    # Declare type of default read policy
+    _read: str
+
+    # Declare type of readers by item class
+    _readers_by_class: dict[type, Callable[[Any], Any]]
+
+    # Declare type of reader-writer lock
+    _lock: ReadWriteLock | None
+
+    # Declare type of version, which changes whenever items are pushed
+    _version: int
+
+    # Declare type of cached result item IDs by version and operations
+    _cache: OrderedDict[Any, tuple[int, ...]] | None
+
+    # Declare type of the maximum number of cached results
+    _cache_size: int
+
+    # Declare type of cache statistics
+    _cache_stats: dict[str, int]
+
+    # Declare type of cache lock
+    _cache_lock: threading.Lock
+
+    # Declare type of write-ahead log, if the collection is durable
+    _wal: WriteAheadLog | None
+
+    # Declare type of compaction lock
+    _compact_lock: threading.Lock
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ __INIT__
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        copy: str | Callable[[Any], Any] = "deep",
+        read: str = "copy",
+        clock: str | Callable[[], Any] = "utc",
+        threadsafe: bool = False,
+        cache_size: int = 0,
+        wal: str | None = None,
+        sync: str = "batch",
+    ) -> None:
         """Init Method"""
 
         # Initialize item ID
@@ -57,274 +167,536 @@ class DictCollection(Collection):
         # Initialize items by ID
         self._items_by_id = {}
 
+        # Initialize item IDs in insertion order
+        self._item_ids = []
+
+        # Initialize insertion positions by item ID
+        self._positions_by_item_id = {}
+
+        # Initialize whether insertion order matches item ID order
+        self._ordered = True
+
         # Initialize item IDs by key
         self._item_ids_by_key = {}
 
         # Initialize keys by item ID
         self._keys_by_item_id = {}
 
-    # ┌─────────────────────────────────────────────────────────────────────────────────
-    # │ _COMPARE
-    # └─────────────────────────────────────────────────────────────────────────────────
+        # Initialize indexes
+        self._indexes = {}
 
-    def _compare(self, left: Any, right: Any, operator: str) -> bool | None:
-        """Returns a boolean comparison of two values based on an operator"""
+        # Initialize key declarations
+        self._key_declarations = set()
 
-        # Initialize try-except block
-        try:
-            # Handle case of equal to
-            if operator == "equals":
-                return left == right  # type: ignore
+        # Initialize item classes
+        self._item_classes = set()
 
-            # Otherwise, handle case of less than
-            if operator == "lt":
-                return left < right  # type: ignore
+        # Initialize default copier
+        self._copier = get_copier(copy)
 
-            # Otherwise handle case of less than or equal to
-            elif operator == "lte":
-                return left <= right  # type: ignore
+        # Initialize copiers by item class
+        self._copiers_by_class = {}
 
-            # Otherwise handle case of greater than
-            elif operator == "gt":
-                return left > right  # type: ignore
+        # Initialize default read policy
+        self._read = self._validate_read(read)
 
-            # Otherwise handle case of greater than or equal to
-            elif operator == "gte":
-                return left >= right  # type: ignore
+        # Initialize readers by item class
+        self._readers_by_class = {}
 
-        # Handle TypeError
-        except TypeError:
-            pass
+        # Validate clock policy
+        get_clock(clock)
+
+        # Initialize clock policy of items whose class does not declare one
+        self._clock = clock
+
+        # Initialize reader-writer lock if shared between threads or compacted by one
+        self._lock = ReadWriteLock() if threadsafe or wal is not None else None
+
+        # Initialize version
+        self._version = 0
 
-        # Return None by default
-        return None
+        # Initialize result cache if it has a size
+        self._cache = OrderedDict() if cache_size > 0 else None
+
+        # Initialize the maximum number of cached results
+        self._cache_size = cache_size
+
+        # Initialize cache statistics
+        self._cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+        # Initialize cache lock
+        self._cache_lock = threading.Lock()
+
+        # Initialize write-ahead log
+        self._wal = None
+
+        # Initialize compaction lock
+        self._compact_lock = threading.Lock()
+
+        # Check if collection is durable
+        if wal is not None:
+            # Restore items from the last snapshot and log, then open the log
+            self._open_wal(wal, sync)
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
-    # │ _ISSUE ITEM ID
+    # │ _CACHE RESULTS
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    def _issue_item_id(self) -> int:
-        """Issues a new item ID"""
+    def _cache_results(
+        self, key: Any, items: Iterable[Item]
+    ) -> Generator[Item, None, None]:
+        """Yields items, caching their item IDs once all of them have been yielded"""
 
-        # Increment item ID
-        self._item_id += 1
+        # Initialize item IDs
+        item_ids = []
 
-        # Return item ID
-        return self._item_id
+        # Iterate over items
+        for item in items:
+            # Append item ID
+            item_ids.append(int(item._imeta.id))  # type: ignore[arg-type]
+
+            # Yield item
+            yield item
+
+        # Acquire cache lock
+        with self._cache_lock:
+            # Return if cache is disabled or items were pushed since collection began
+            if self._cache is None or key[0] != self._version:
+                return
+
+            # Cache item IDs as most recently used
+            self._cache[key] = tuple(item_ids)
+
+            # Iterate while cache exceeds its size
+            while len(self._cache) > self._cache_size:
+                # Evict least recently used result
+                self._cache.popitem(last=False)
+
+                # Increment evictions
+                self._cache_stats["evictions"] += 1
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
-    # │ COLLECT
+    # │ _COUNT
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    def collect(
-        self,
-        items: Items | None = None,
-        subset: Iterable[Item] | None = None,
-        quick: bool = False,
-    ) -> Generator[Item, None, None]:
-        """Yields items in the collection"""
+    def _count(self, items: Items | None = None) -> int:
+        """Returns a count of items in the collection"""
 
         # Initialize items
         items = self.apply(items)
 
-        # Get operations
-        operations = items._operations
+        # Split operations into leading conditions and remaining operations
+        conditions, operations = self._split(items._operations)
+
+        # Hold the lock for reading
+        with self._lock_read():
+            # Initialize the number of candidates to the size of the collection
+            size = len(self._item_ids)
 
-        # Initialize collected items
-        collected = subset if subset is not None else iter(self._items_by_id.values())
+            # Initialize residual conditions
+            residual = conditions
+
+            # Check if there are leading conditions
+            if conditions:
+                # Plan conditions
+                probes, residual = self._plan(conditions)
+
+                # Check if indexes fully resolve conditions
+                if probes and not residual:
+                    # Set the number of candidates to that of candidate item IDs
+                    size = len(self._execute(probes) or ())
+
+            # Check if there are no residual conditions
+            if not residual:
+                # Get positions selected by leading windows
+                positions, operations = self._window(range(size), operations)
+
+                # Check if windows were the only remaining operations
+                if not operations:
+                    # Return the number of selected positions
+                    return len(positions)
+
+        # Return the number of items in the collection
+        return sum(1 for _ in items._collect(quick=True))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _DUMP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _dump(self) -> bytes:
+        """Returns the persisted attributes of the collection as snapshot bytes"""
+
+        # Hold the lock for reading so that the snapshot never includes a partial batch
+        with self._lock_read():
+            # Return persisted attributes
+            return super()._dump()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ENSURE INDEXES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _ensure_indexes(self, item: Item) -> None:
+        """Ensures that the indexes declared by an item's class exist"""
+
+        # Get item class
+        item_class = item.__class__
+
+        # Return if item class has already been seen
+        if item_class in self._item_classes:
+            return
+
+        # Add item class to item classes
+        self._item_classes.add(item_class)
+
+        # Add key declarations
+        self._key_declarations.update(item._cmeta.KEYS)
+
+        # Get indexes
+        indexes = self._indexes
+
+        # Iterate over index declarations
+        for declaration in item._cmeta.INDEXES:
+            # Continue if index already exists
+            if declaration in indexes:
+                continue
+
+            # Initialize index
+            index: Index = (
+                SortedIndex(declaration.attr)
+                if isinstance(declaration, Sorted)
+                else HashIndex(declaration)
+            )
+
+            # Iterate over existing items
+            for item_id, existing in self._items_by_id.items():
+                # Add existing item to index
+                index.add(item_id, existing)
+
+            # Add index to indexes
+            indexes[declaration] = index
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _EXECUTE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _execute(
+        self, probes: list[tuple[int, str, Callable[[], Iterable[int]]]]
+    ) -> set[int] | None:
+        """Returns the candidate item IDs of a series of index probes"""
+
+        # Initialize item IDs
+        item_ids: set[int] | None = None
+
+        # Iterate over probes
+        for _, _, lookup in probes:
+            # Check if item IDs are not initialized
+            if item_ids is None:
+                # Initialize item IDs
+                item_ids = set(lookup())
+
+            # Otherwise intersect item IDs
+            else:
+                item_ids.intersection_update(lookup())
+
+            # Break if there are no candidates left
+            if not item_ids:
+                break
+
+        # Return item IDs
+        return item_ids
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _FREEZE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _freeze(self, value: Any) -> Any:
+        """Returns a hashable equivalent of an expected value and its container types"""
+
+        # Check if value is a list or tuple
+        if isinstance(value, (list, tuple)):
+            # Return container type and frozen values
+            return (type(value), tuple(self._freeze(x) for x in value))
+
+        # Check if value is a set
+        if isinstance(value, (set, frozenset)):
+            # Return container type and values
+            return (type(value), frozenset(value))
+
+        # Check if value is a dictionary
+        if isinstance(value, dict):
+            # Return container type and frozen items
+            return (type(value), tuple((k, self._freeze(v)) for k, v in value.items()))
+
+        # Return value
+        return value
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET CACHE KEY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_cache_key(self, operations: tuple[Any, ...]) -> Any:
+        """Returns the cache key of a series of operations, or None if not cacheable"""
+
+        # Initialize normalized operations
+        normalized = []
 
         # Iterate over operations
         for operation in operations:
-            # Check if callable
+            # Return None if operation is callable, as its behavior cannot be compared
             if callable(operation):
-                # Apply operation to collected
-                collected = operation(collected)
+                return None
+
+            # Append operation, omitting compiled filter predicates
+            normalized.append(
+                (
+                    "filter",
+                    tuple(
+                        (attr, operator, self._freeze(expected))
+                        for attr, operator, expected in operation[1]
+                    ),
+                )
+                if operation[0] == "filter"
+                else operation
+            )
 
-        # Iterate over collected items
-        for item in collected:
-            # Deepcopy and yield item
-            yield item if quick else deepcopy(item)
+        # Get key
+        key = (self._version, tuple(normalized))
+
+        # Initialize try-except block
+        try:
+            # Hash key
+            hash(key)
+
+        # Handle TypeError
+        except TypeError:
+            # Return None if key is not hashable
+            return None
+
+        # Return key
+        return key
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
-    # │ COUNT
+    # │ _GET KEY PROBES
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    def count(self, items: Items | None = None) -> int:
-        """Returns a count of items in the collection"""
+    def _get_key_probes(
+        self, conditions: tuple[tuple[str, str, Any], ...]
+    ) -> list[tuple[int, str, Callable[[], Iterable[int]]]]:
+        """Returns the probes of item IDs by key that can serve a series of conditions"""
 
-        # Initialize items
-        items = self.apply(items)
+        # Get item IDs by key
+        item_ids_by_key = self._item_ids_by_key
 
-        # Check if there are no operations
-        if not items._operations:
-            # Return the number of items in the collection
-            return len(self._items_by_id)
+        # Initialize probes
+        probes: list[tuple[int, str, Callable[[], Iterable[int]]]] = []
+
+        # Get equality conditions by attribute
+        equalities = {
+            attr: expected
+            for attr, operator, expected in conditions
+            if operator == "equals"
+        }
+
+        # Iterate over key declarations
+        for key in self._key_declarations:
+            # Check if key is composite
+            if isinstance(key, tuple):
+                # Continue if any key attribute lacks an equality condition
+                if any(attr not in equalities for attr in key):
+                    continue
+
+                # Get values
+                values: list[Any] = [tuple(equalities[attr] for attr in key)]
+
+            # Otherwise handle case of a single attribute key
+            else:
+                # Get values
+                values = [
+                    value
+                    for attr, operator, expected in conditions
+                    if attr == key
+                    and (operator == "equals" or operator == "in")
+                    and (
+                        operator == "equals"
+                        or isinstance(expected, (list, tuple, set, frozenset))
+                    )
+                    for value in ([expected] if operator == "equals" else expected)
+                ]
+
+                # Continue if there are no values
+                if not values:
+                    continue
+
+            # Initialize try-except block
+            try:
+                # Get matching item IDs
+                matches = {
+                    item_ids_by_key[value]
+                    for value in values
+                    if value in item_ids_by_key
+                }
+
+            # Handle TypeError
+            except TypeError:
+                # Continue if values are not hashable
+                continue
+
+            # Append probe to probes
+            probes.append(
+                (len(matches), f"KEY {key!r} in {values!r}", partial(iter, matches))
+            )
 
-        # Return the number of items in the collection
-        return sum(1 for _ in items._collect(quick=True))
+        # Return probes
+        return probes
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
-    # │ FILTER
+    # │ _GET COPIER
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    def filter(
-        self,
-        conditions: tuple[tuple[str, str, Any], ...],
-        items: Items | None = None,
-    ) -> Items:
-        """Returns a filtered collection of items"""
+    def _get_copier(self, item: Item) -> Callable[[Any], Any]:
+        """Returns the copier of an item based on its class or the collection"""
 
-        # Initialize items
-        items = self.apply(items)
+        # Get item class
+        item_class = item.__class__
 
-        def operation(
-            items: Generator[Item, None, None]
-        ) -> Generator[Item, None, None]:
-            """Yields items filtered from the collection"""
-
-            # Iterate over items
-            for item in items:
-                # Iterate over kwargs
-                for attr, operator, expected in conditions:
-                    # Get actual value
-                    actual = getattr(item, attr)
-
-                    # Handle case of equals
-                    if operator in ("equals", "iequals"):
-                        # Check if case-insensitive equals
-                        if (
-                            operator == "iequals"
-                            and isinstance(actual, str)
-                            and isinstance(expected, str)
-                        ):
-                            # Set actual and expected to lowercase
-                            actual = actual.lower()
-                            expected = expected.lower()
-
-                        # Break if actual does not equal expected
-                        if actual != expected:
-                            break
-
-                    # Otherwise handle case of less than
-                    elif operator in ("lt", "lte", "gt", "gte"):
-                        # Break if item comparison evaluates to False
-                        if not self._compare(
-                            left=actual, right=expected, operator=operator
-                        ):
-                            break
-
-                    # Otherwise handle case of in
-                    elif operator in ("in", "iin"):
-                        # Check if case-insensitive in
-                        if operator == "iin" and isinstance(actual, str):
-                            # Set actual to lowercase
-                            actual = actual.lower()
-
-                            # Check if expected is a string
-                            if isinstance(expected, str):
-                                # Set expected to lowercase
-                                expected = expected.lower()
-
-                            # Otherwise check if expected is an iterable
-                            elif isinstance(expected, Iterable):
-                                # Lowercase each item in expected
-                                expected = set(
-                                    x.lower() if isinstance(x, str) else x
-                                    for x in expected
-                                )
-
-                        # Break if actual not in expected
-                        if actual not in expected:
-                            break
-
-                    # Otherwise handle case of contains
-                    elif operator in ("contains", "icontains"):
-                        # Check if case-insensitive contains
-                        if operator == "icontains" and isinstance(expected, str):
-                            # Set expected to lowercase
-                            expected = expected.lower()
-
-                            # Check if actual is a string
-                            if isinstance(actual, str):
-                                # Set actual to lowercase
-                                actual = actual.lower()
-
-                            # Otherwise check if actual is an iterable
-                            elif isinstance(actual, Iterable):
-                                # Lowercase each item in actual
-                                actual = set(
-                                    x.lower() if isinstance(x, str) else x
-                                    for x in actual
-                                )
-
-                        # Break if expected not in actual
-                        if expected not in actual:
-                            break
-
-                # Otherwise yield item
-                else:
-                    yield item
-
-        # Apply filter operation to items
-        return self.apply(items, lambda x: operation(x))
-
-    # ┌─────────────────────────────────────────────────────────────────────────────────
-    # │ FIRST
-    # └─────────────────────────────────────────────────────────────────────────────────
-
-    def first(self, items: Items | None = None) -> Item | None:
-        """Returns the first item in the collection"""
+        # Get copier
+        copier = self._copiers_by_class.get(item_class)
 
-        # Initialize items
-        items = self.apply(items)
+        # Check if copier is not cached
+        if copier is None:
+            # Get item class copy policy
+            policy = item_class.Meta.COPY
 
-        # Return the first item in the collection
-        return next(iter(items), None)
+            # Cache copier
+            copier = self._copiers_by_class[item_class] = (
+                get_copier(policy) if policy is not None else self._copier
+            )
+
+        # Return copier
+        return copier
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
-    # │ HEAD
+    # │ _GET ORDER INDEX
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    def head(self, n: int, items: Items | None = None) -> Items:
-        """Returns the first n items in the collection"""
+    def _get_order_index(self, operations: tuple[Any, ...]) -> SortedIndex | None:
+        """Returns the sorted index that a leading order operation can walk, if any"""
+
+        # Return None if the leading operation is not an order
+        if not operations or callable(operations[0]) or operations[0][0] != "order":
+            return None
 
-        def operation(
-            items: Generator[Item, None, None]
-        ) -> Generator[Item, None, None]:
-            """Yields the first n items in the collection"""
+        # Get the leading attribute and direction
+        attr, descending = operations[0][1][0]
 
-            # Iterate over items
-            for i, item in enumerate(items):
-                # Check if i is greater than or equal to n
-                if i >= n:
-                    # Break
-                    break
-                # Yield item
-                yield item
+        # Get index
+        index = self._indexes.get(Sorted(attr))
 
-        # Apply head operation to items
-        return self.apply(items, lambda x: operation(x))
+        # Return None if there is no sorted index of a single family of values
+        if not isinstance(index, SortedIndex) or not index.comparable:
+            return None
+
+        # Get items by ID
+        items_by_id = self._items_by_id
+
+        # Return None unless every unindexed value is None, which is ordered last
+        if any(
+            getattr(items_by_id[item_id], attr, Index.MISSING) is not None
+            for item_id in index.unindexed_ids
+        ):
+            return None
+
+        # Return index
+        return index
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET POSITION
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_position(self, item: Item) -> int:
+        """Returns the insertion position of an item in the collection"""
+
+        # Return insertion position by item ID
+        return self._positions_by_item_id[int(item._imeta.id)]  # type: ignore[arg-type]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET READER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_reader(self, item: Item) -> Callable[[Any], Any]:
+        """Returns the function that prepares an item to be yielded to readers"""
+
+        # Get item class
+        item_class = item.__class__
+
+        # Get reader
+        reader = self._readers_by_class.get(item_class)
+
+        # Check if reader is not cached
+        if reader is None:
+            # Get read policy
+            read = self._validate_read(item_class.Meta.READ or self._read)
+
+            # Cache reader
+            reader = self._readers_by_class[item_class] = (
+                self._get_copier(item) if read == "copy" else self.VIEWS[read]
+            )
+
+        # Return reader
+        return reader
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET SEGMENTS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_segments(self, path: str) -> list[tuple[int, str]]:
+        """Returns the generations and paths of rotated logs in generation order"""
+
+        # Get directory and file name of log
+        directory, name = os.path.split(os.path.abspath(path))
+
+        # Return generations and paths of files named after log and a generation
+        return sorted(
+            (int(entry[len(name) + 1 :]), os.path.join(directory, entry))
+            for entry in os.listdir(directory)
+            if entry.startswith(f"{name}.") and entry[len(name) + 1 :].isdigit()
+        )
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
-    # │ KEY
+    # │ _ISSUE ITEM ID
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    def key(self, key: Any, items: Items | None = None) -> Item:
+    def _issue_item_id(self) -> int:
+        """Issues a new item ID"""
+
+        # Increment item ID
+        self._item_id += 1
+
+        # Return item ID
+        return self._item_id
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _KEY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _key(self, key: Any, items: Items | None = None) -> Item:
         """Returns an item by key lookup"""
 
         # Define does not exist error message
         does_not_exist_error_message = f"An item with the key '{key}' does not exist"
 
-        # Check if key is not in item IDs by key
-        if key not in self._item_ids_by_key:
-            # Raise DoesNotExistError
-            raise DoesNotExistError(does_not_exist_error_message + ".")
+        # Hold the lock for reading
+        with self._lock_read():
+            # Check if key is not in item IDs by key
+            if key not in self._item_ids_by_key:
+                # Raise DoesNotExistError
+                raise DoesNotExistError(does_not_exist_error_message + ".")
 
-        # Get item ID
-        item_id = self._item_ids_by_key[key]
+            # Get item ID
+            item_id = self._item_ids_by_key[key]
 
-        # Get item
-        item = self._items_by_id[item_id]
+            # Get item
+            item = self._items_by_id[item_id]
 
         # Collect subset
         subset = list(self.collect(items=items, subset=[item]))
@@ -341,136 +713,985 @@ class DictCollection(Collection):
         return item
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
-    # │ LAST
+    # │ _LOCK READ
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    def last(self, items: Items | None = None) -> Item | None:
-        """Returns the last item in the collection"""
+    def _lock_read(self) -> AbstractContextManager[Any]:
+        """Returns a context that holds the lock for reading, if there is a lock"""
+
+        # Return read context or a null context
+        return self._lock.read() if self._lock is not None else nullcontext()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LOCK WRITE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _lock_write(self) -> AbstractContextManager[Any]:
+        """Returns a context that holds the lock for writing, if there is a lock"""
+
+        # Return write context or a null context
+        return self._lock.write() if self._lock is not None else nullcontext()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _OPEN WAL
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _open_wal(self, path: str, sync: str) -> None:
+        """Restores items from a snapshot and the logs after it, then opens a log"""
+
+        # Initialize the last generation covered by the snapshot
+        covered = 0
+
+        # Get snapshot path
+        snapshot = f"{path}.snapshot"
+
+        # Check if there is a snapshot
+        if os.path.exists(snapshot):
+            # Read snapshot and the last generation it covers
+            covered, data = read_snapshot(snapshot, "WriteAheadLog")
+
+            # Restore items and indexes from snapshot
+            self._restore(data)
+
+        # Initialize the last generation
+        latest = covered
+
+        # Iterate over rotated logs and then the current log
+        for _, log_path in [*self._get_segments(path), (0, path)]:
+            # Read log
+            generation, batches = WriteAheadLog.read(log_path)
+
+            # Continue if log is missing or already covered by the snapshot
+            if generation is None or generation <= covered:
+                continue
+
+            # Set the last generation
+            latest = max(latest, generation)
+
+            # Iterate over batches
+            for batch in batches:
+                # Push batch, which is not logged again as the log is not yet open
+                self._push_many(batch)
+
+                # Advance item ID past the item IDs of the batch
+                self._item_id = max(
+                    self._item_id, *(int(item._imeta.id) for item in batch)
+                )
+
+        # Open log, continuing the current generation if it exists
+        self._wal = WriteAheadLog(path, generation=latest + 1, sync=sync)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ORDER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _order(self, item_ids: Iterable[int]) -> list[int]:
+        """Returns item IDs sorted by insertion order"""
+
+        # Return item IDs sorted by value if insertion order matches item ID order
+        if self._ordered:
+            return sorted(item_ids)
+
+        # Return item IDs sorted by insertion position
+        return sorted(item_ids, key=self._positions_by_item_id.__getitem__)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _PAGE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _page(
+        self, size: int, after: str | None = None, items: Items | None = None
+    ) -> tuple[list[Item], str | None]:
+        """Returns a page of items after a cursor and the cursor of the next page"""
 
         # Initialize items
         items = self.apply(items)
 
-        # Initialize window
-        window = deque(items, maxlen=1)
+        # Split operations into leading conditions and remaining operations
+        conditions, operations = self._split(items._operations)
+
+        # Check if items are ordered by attributes
+        if any(
+            not callable(operation) and operation[0] == "order"
+            for operation in operations
+        ):
+            # Return a page after the cursor item, as positions do not follow the order
+            return super()._page(size=size, after=after, items=items)
+
+        # Get the insertion position at which the page starts
+        start = (
+            int(self._decode_cursor(after, "position")) + 1 if after is not None else 0
+        )
+
+        # Get insertion positions by item ID
+        positions_by_item_id = self._positions_by_item_id
+
+        # Check if there are operations other than leading conditions
+        if operations:
+            # Collect items after the cursor position from a full collection
+            collected: Iterable[Item] = (
+                item
+                for item in items._collect(quick=True)
+                if self._get_position(item) >= start
+            )
+
+        # Otherwise seek to the cursor position
+        else:
+            # Initialize residual conditions
+            residual = conditions
+
+            # Hold the lock for reading while candidates are gathered
+            with self._lock_read():
+                # Get item IDs in insertion order
+                item_ids = self._item_ids
+
+                # Initialize page item IDs to those at and after the start position
+                page_ids: Iterable[int] = (
+                    item_ids[i] for i in range(start, len(item_ids))
+                )
+
+                # Check if there are leading conditions
+                if conditions:
+                    # Plan conditions
+                    probes, residual = self._plan(conditions)
+
+                    # Get candidate item IDs
+                    candidates = self._execute(probes)
+
+                    # Check if indexes found candidates
+                    if candidates is not None:
+                        # Order candidate item IDs by insertion
+                        ordered = self._order(candidates)
+
+                        # Get candidate item IDs at and after the start position
+                        page_ids = ordered[
+                            bisect_left(
+                                ordered, start, key=positions_by_item_id.__getitem__
+                            ) :
+                        ]
+
+                # Get items by ID
+                items_by_id = self._items_by_id
+
+                # Initialize collected items
+                collected = (items_by_id[item_id] for item_id in page_ids)
+
+                # Check if collection has a lock
+                if self._lock is not None and not residual:
+                    # Snapshot the page so that writers can push while it is read
+                    collected = list(islice(collected, max(size, 0)))
+
+            # Check if there are residual conditions
+            if residual:
+                # Filter collected items
+                collected = self._filter(collected, residual)
+
+        # Get page
+        page = list(islice(collected, max(size, 0)))
 
-        # Return the last item in the collection
-        return window.pop() if window else None
+        # Check if page is empty
+        if not page:
+            # Return empty page and the same cursor
+            return page, after
+
+        # Get cursor of the last item in the page
+        cursor = self._encode_cursor("position", self._get_position(page[-1]))
+
+        # Get copied or viewed items, stamped as if pulled through a collect
+        page = list(self._stamp(self._get_reader(item)(item) for item in page))
+
+        # Return page and cursor
+        return page, cursor
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
-    # │ PUSH
+    # │ _PLAN
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    def push(self, item: Item) -> None:
-        """Pushes an item to the collection"""
+    def _plan(
+        self, conditions: tuple[tuple[str, str, Any], ...]
+    ) -> tuple[
+        list[tuple[int, str, Callable[[], Iterable[int]]]],
+        tuple[tuple[str, str, Any], ...],
+    ]:
+        """Returns the index probes to intersect and the residual conditions to scan"""
+
+        # Initialize options
+        options: list[
+            tuple[int, str, Callable[[], Iterable[int]], tuple[Any, ...], bool]
+        ] = []
+
+        # Iterate over indexes
+        for index in self._indexes.values():
+            # Iterate over probes
+            for operator, expected, covered in index.get_probes(conditions):
+                # Get estimate
+                estimate = index.estimate(operator, expected)
+
+                # Continue if index does not support probe
+                if estimate is None:
+                    continue
+
+                # Append option to options
+                options.append(
+                    (
+                        estimate,
+                        f"{index!r} {operator} {expected!r}",
+                        partial(index.lookup, operator, expected),
+                        covered,
+                        index.exact,
+                    )
+                )
 
-        # Get item ID
-        item_id = (
-            int(item._imeta.id) if item._imeta.id is not None else self._issue_item_id()
+        # Iterate over key probes
+        for estimate, description, lookup in self._get_key_probes(conditions):
+            # Append option to options, which must be rechecked against conditions
+            options.append((estimate, description, lookup, (), False))
+
+        # Sort options by estimate
+        options.sort(key=lambda option: option[0])
+
+        # Initialize probes
+        probes: list[tuple[int, str, Callable[[], Iterable[int]]]] = []
+
+        # Initialize IDs of covered conditions
+        covered_ids: set[int] = set()
+
+        # Initialize estimate to the size of the collection
+        estimate = len(self._items_by_id)
+
+        # Iterate over options
+        for option_estimate, description, lookup, covered, exact in options:
+            # Check if option is cheaper than scanning the current candidates
+            if (
+                option_estimate < estimate
+                if not probes
+                else option_estimate * self.PROBE_COST < estimate
+            ):
+                # Append probe to probes
+                probes.append((option_estimate, description, lookup))
+
+                # Update estimate
+                estimate = min(estimate, option_estimate)
+
+                # Check if option resolves its conditions exactly
+                if exact:
+                    # Add covered condition IDs
+                    covered_ids.update(id(condition) for condition in covered)
+
+        # Get residual conditions
+        residual = tuple(
+            condition for condition in conditions if id(condition) not in covered_ids
         )
 
-        # Get keys by item ID
-        keys_by_item_id = self._keys_by_item_id
+        # Return probes and residual conditions
+        return probes, residual
 
-        # Get item IDs by key
-        item_ids_by_key = self._item_ids_by_key
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _PUSH MANY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _push_many(self, items: Iterable[Item]) -> None:
+        """Pushes a batch of items to the collection, validating all keys first"""
+
+        # Materialize items first, as they may be read from this very collection
+        items = list(items)
+
+        # Hold the lock for writing so that readers never see a partial batch
+        with self._lock_write():
+            # Get keys by item ID
+            keys_by_item_id = self._keys_by_item_id
+
+            # Get item IDs by key
+            item_ids_by_key = self._item_ids_by_key
+
+            # Get batch and key values, validating keys before issuing item IDs
+            batch, key_values = self._get_batch(items, item_ids_by_key, keys_by_item_id)
+
+            # Get original item IDs
+            original_ids = [item._imeta.id for item, _ in batch]
+
+            # Initialize try-except block
+            try:
+                # Initialize stored items
+                stored_items = []
+
+                # Iterate over batch
+                for item, item_id in batch:
+                    # Update item ID
+                    item._imeta.id = str(item_id)
+
+                    # Copy item
+                    stored_items.append(self._get_copier(item)(item))
+
+                # Check if collection is durable and any items were pushed
+                if self._wal is not None and stored_items:
+                    # Append stored items to the log before they are visible
+                    self._wal.append(stored_items)
+
+            # Handle any exception raised while copying
+            except BaseException:
+                # Iterate over batch and original item IDs
+                for (item, _), original_id in zip(batch, original_ids):
+                    # Restore item ID
+                    item._imeta.id = original_id
+
+                # Re-raise exception
+                raise
+
+            # Get items by ID
+            items_by_id = self._items_by_id
+
+            # Iterate over batch, key values and stored items
+            for (item, item_id), values, stored in zip(batch, key_values, stored_items):
+                # Iterate over values released by item
+                for value in keys_by_item_id.pop(item_id, []):
+                    # Check if value is still owned by item
+                    if item_ids_by_key.get(value) == item_id:
+                        # Remove item ID from item IDs by key
+                        del item_ids_by_key[value]
+
+                # Iterate over values
+                for value in values:
+                    # Add item ID to item IDs by key
+                    item_ids_by_key[value] = item_id
+
+                # Set keys by item ID
+                keys_by_item_id[item_id] = values
+
+                # Ensure that declared indexes exist
+                self._ensure_indexes(item)
+
+                # Check if item is already in the collection
+                exists = item_id in items_by_id
+
+                # Check if item is new to the collection
+                if not exists:
+                    # Check if item ID precedes the last inserted item ID
+                    if self._item_ids and item_id < self._item_ids[-1]:
+                        # Note that insertion order no longer matches item ID order
+                        self._ordered = False
+
+                    # Set insertion position of item ID
+                    self._positions_by_item_id[item_id] = len(self._item_ids)
+
+                    # Append item ID to item IDs in insertion order
+                    self._item_ids.append(item_id)
+
+                # Add item to items by ID
+                items_by_id[item_id] = stored
+
+                # Iterate over indexes
+                for index in self._indexes.values():
+                    # Check if item is already in the collection
+                    if exists:
+                        # Remove item from index
+                        index.remove(item_id)
+
+                    # Add item to index
+                    index.add(item_id, stored)
+
+            # Check if any items were pushed
+            if batch:
+                # Increment version
+                self._version += 1
+
+                # Acquire cache lock
+                with self._cache_lock:
+                    # Check if cache is enabled
+                    if self._cache is not None:
+                        # Invalidate cached results
+                        self._cache.clear()
+
+                # Check if log is large enough to compact and is not being compacted
+                if (
+                    self._wal is not None
+                    and self._wal.size >= self.WAL_COMPACT_SIZE
+                    and not self._compact_lock.locked()
+                ):
+                    # Compact log in the background once the batch is released
+                    threading.Thread(target=self.compact, daemon=True).start()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _RESTORE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _restore(self, data: bytes) -> None:
+        """Restores the persisted attributes of the collection from snapshot bytes"""
+
+        # Hold the lock for writing so that readers never see a partial restore
+        with self._lock_write():
+            # Restore persisted attributes, including indexes, without pushing items
+            super()._restore(data)
+
+            # Reset copiers and readers, which are resolved again per item class
+            self._copiers_by_class = {}
+            self._readers_by_class = {}
+
+            # Increment version, as the items have changed
+            self._version += 1
+
+        # Clear cached results
+        self.cache_clear()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _VALIDATE READ
+    # └─────────────────────────────────────────────────────────────────────────────────
 
-        # Iterate over values
-        for value in keys_by_item_id.pop(item_id, []):
-            # Remove item ID from item IDs by key
-            del item_ids_by_key[value]
-
-        # Initialize values
-        values = []
-
-        # Iterate over keys
-        for key in item._cmeta.KEYS:
-            # Get value
-            value = (
-                tuple([getattr(item, k, None) for k in key])
-                if isinstance(key, tuple)
-                else getattr(item, key, None)
+    def _validate_read(self, read: str) -> str:
+        """Returns a read policy if it is valid"""
+
+        # Check if read policy is invalid
+        if read != "copy" and read not in self.VIEWS:
+            # Raise ValueError
+            raise ValueError(
+                f"Invalid read policy {read!r}, expected one of "
+                f"{', '.join(repr(key) for key in ('copy', *self.VIEWS))}."
             )
 
-            # Check if value in item IDs by key
-            if value in item_ids_by_key:
-                # Raise a duplicate key error
-                raise DuplicateKeyError(
-                    f"An item with the key '{value}' already exists."
-                )
+        # Return read policy
+        return read
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _WALK
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _walk(
+        self,
+        index: SortedIndex,
+        operation: tuple[Any, ...],
+        residual: tuple[tuple[str, str, Any], ...],
+    ) -> list[int]:
+        """Returns the item IDs kept by an order operation, walking a sorted index"""
+
+        # Unpack operation
+        _, keys, limit = operation
+
+        # Get whether the leading attribute is descending
+        descending = keys[0][1]
+
+        # Get items by ID
+        items_by_id = self._items_by_id
+
+        # Get sort key and direction that break ties of the leading attribute
+        key, reverse = compile_order_key(keys[1:]) if len(keys) > 1 else (None, False)
+
+        # Get predicate of residual conditions
+        predicate = compile_conditions(residual) if residual else None
 
-            # Append value to values
-            values.append(value)
+        # Get runs of equal indexed values
+        runs = index.runs(descending)
 
-        # Iterate over values
-        for value in values:
-            # Add item ID to item IDs by key
-            item_ids_by_key[value] = item_id
+        # Get the run of unindexed item IDs, whose values are all None
+        nones = [list(index.unindexed_ids)]
 
-            # Add value to keys by item ID
-            keys_by_item_id.setdefault(item_id, []).append(value)
+        # Initialize item IDs
+        item_ids: list[int] = []
 
-        # Update item ID
-        item._imeta.id = str(item_id)
+        # Iterate over runs, with values of None last in ascending order
+        for run in chain(nones, runs) if descending else chain(runs, nones):
+            # Break if enough item IDs have been found
+            if limit is not None and len(item_ids) >= limit:
+                break
 
-        # Deepcopy and add item to items by ID
-        self._items_by_id[item_id] = deepcopy(item)
+            # Order run by insertion
+            run = self._order(run)
+
+            # Check if there is a predicate
+            if predicate is not None:
+                # Keep item IDs of items that satisfy it
+                run = [item_id for item_id in run if predicate(items_by_id[item_id])]
+
+            # Check if ties are broken by further attributes
+            if key is not None:
+                # Sort run, which is stable for items that remain tied
+                run.sort(key=lambda item_id: key(items_by_id[item_id]), reverse=reverse)
+
+            # Extend item IDs
+            item_ids.extend(run)
+
+        # Return item IDs, keeping only the first limit if any
+        return item_ids[:limit] if limit is not None else item_ids
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
-    # │ SLICE
+    # │ _WINDOW
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    def slice(self, start: int, stop: int, items: Items | None = None) -> Items:
-        """Returns a slice of items in the collection"""
+    def _window(
+        self, positions: range, operations: tuple[Any, ...]
+    ) -> tuple[range, tuple[Any, ...]]:
+        """Returns the positions selected by leading head, slice and tail operations"""
+
+        # Iterate over operations
+        for i, operation in enumerate(operations):
+            # Return if operation is not a window over positions
+            if (
+                callable(operation)
+                or operation[0] not in ("head", "slice", "tail")
+                or (operation[0] == "tail" and operation[1] < 0)
+            ):
+                return positions, operations[i:]
 
-        def operation(
-            items: Generator[Item, None, None]
-        ) -> Generator[Item, None, None]:
-            """Yields a slice of items in the collection"""
+            # Get operation name
+            name = operation[0]
 
-            # Check if either start or stop is less than 0
-            if start < 0 or stop < 0:
-                # Convert items to list and yield slice
-                yield from list(items)[start:stop]
+            # Handle case of head
+            if name == "head":
+                positions = positions[: max(operation[1], 0)]
 
-            # Iterate over items
-            for i, item in enumerate(items):
-                # Check if i is greater than or equal to stop
-                if i >= stop:
-                    # Break
-                    break
+            # Otherwise handle case of slice
+            elif name == "slice":
+                positions = positions[operation[1] : operation[2]]
 
-                # Check if i is greater than or equal to start
-                if i >= start:
-                    # Yield item
-                    yield item
+            # Otherwise handle case of tail
+            elif name == "tail":
+                positions = positions[max(len(positions) - operation[1], 0) :]
 
-        # Apply slice operation to items
-        return self.apply(items, lambda x: operation(x))
+        # Return positions and no remaining operations
+        return positions, ()
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
-    # │ TAIL
+    # │ CACHE CLEAR
     # └─────────────────────────────────────────────────────────────────────────────────
 
-    def tail(self, n: int, items: Items | None = None) -> Items:
-        """Returns the last n items in the collection"""
+    def cache_clear(self) -> None:
+        """Clears cached results and cache statistics"""
+
+        # Acquire cache lock
+        with self._cache_lock:
+            # Check if cache is enabled
+            if self._cache is not None:
+                # Clear cache
+                self._cache.clear()
+
+            # Reset cache statistics
+            self._cache_stats = dict.fromkeys(self._cache_stats, 0)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CACHE INFO
+    # └─────────────────────────────────────────────────────────────────────────────────
 
-        def operation(
-            items: Generator[Item, None, None]
-        ) -> Generator[Item, None, None]:
-            """Yields the last n items in the collection"""
+    def cache_info(self) -> dict[str, int]:
+        """Returns the hits, misses, evictions, size and size limit of the cache"""
 
-            # Initialize window
-            window: deque[Item] = deque(maxlen=n)
+        # Acquire cache lock
+        with self._cache_lock:
+            # Return cache statistics
+            return {
+                **self._cache_stats,
+                "size": len(self._cache or ()),
+                "limit": self._cache_size,
+            }
 
-            # Iterate over items
-            for item in items:
-                # Append item to window
-                window.append(item)
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLOSE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        """Syncs and closes the write-ahead log, if any"""
+
+        # Check if collection is durable
+        if self._wal is not None:
+            # Wait for any compaction, then close log
+            with self._compact_lock:
+                self._wal.close()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COLLECT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def collect(
+        self,
+        items: Items | None = None,
+        subset: Iterable[Item] | None = None,
+        quick: bool = False,
+    ) -> Generator[Item, None, None]:
+        """Yields items in the collection"""
+
+        # Get whether collection is observed and the start time if so
+        observed = bool(self._observers)
+        started = perf_counter() if observed else 0.0
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Split operations into leading conditions and remaining operations
+        conditions, operations = self._split(items._operations)
+
+        # Initialize residual conditions
+        residual = conditions
+
+        # Initialize ordered candidate item IDs
+        item_ids: list[int] | None = None
+
+        # Initialize cache key and cached item IDs
+        cache_key = cached = None
+
+        # Hold the lock for reading while candidates are gathered
+        with self._lock_read():
+            # Check if cache is enabled and collection is not a subset
+            if self._cache is not None and subset is None:
+                # Get cache key
+                cache_key = self._get_cache_key(items._operations)
+
+                # Acquire cache lock
+                with self._cache_lock:
+                    # Get cached item IDs
+                    cached = (
+                        self._cache.get(cache_key) if cache_key is not None else None
+                    )
+
+                    # Check if item IDs are cached
+                    if cached is not None:
+                        # Mark cached item IDs as most recently used
+                        self._cache.move_to_end(cache_key)
+
+                        # Increment hits
+                        self._cache_stats["hits"] += 1
+
+                        # Skip residual conditions and operations
+                        residual, operations = (), ()
+
+                    # Otherwise increment misses
+                    else:
+                        self._cache_stats["misses"] += 1
+
+            # Check if items are uncached, not a subset and there are leading conditions
+            if cached is None and subset is None and conditions:
+                # Plan conditions
+                probes, residual = self._plan(conditions)
+
+                # Get candidate item IDs
+                candidates = self._execute(probes)
+
+                # Order candidate item IDs by insertion
+                item_ids = self._order(candidates) if candidates is not None else None
+
+            # Check if items are uncached, not a subset and need no residual scan
+            if cached is None and subset is None and not residual:
+                # Get candidate item IDs, which are all item IDs if unfiltered
+                ordered = self._item_ids if item_ids is None else item_ids
+
+                # Get positions selected by leading windows
+                positions, windowed = self._window(range(len(ordered)), operations)
+
+                # Check if any windows were applied
+                if len(windowed) < len(operations):
+                    # Get item IDs at positions and skip the applied windows
+                    item_ids = ordered[positions.start : positions.stop]
+                    operations = windowed
+
+            # Get the sorted index that a leading order can walk, if any
+            walkable = (
+                self._get_order_index(operations)
+                if cached is None and subset is None and item_ids is None
+                else None
+            )
+
+            # Check if there is a walkable sorted index
+            if walkable is not None:
+                # Walk index, filtering and ordering candidates in one pass
+                item_ids = self._walk(walkable, operations[0], residual)
+
+                # Skip residual conditions and the order operation
+                residual, operations = (), operations[1:]
+
+            # Get items by ID
+            items_by_id = self._items_by_id
+
+            # Initialize collected items
+            collected: Iterable[Item] = (
+                subset
+                if subset is not None
+                else [items_by_id[item_id] for item_id in cached]
+                if cached is not None
+                else iter(items_by_id.values())
+                if item_ids is None
+                else (items_by_id[item_id] for item_id in item_ids)
+            )
+
+            # Check if collection has a lock and collected items are not a subset
+            if self._lock is not None and subset is None:
+                # Snapshot collected items so that writers can push while they are read
+                collected = list(collected)
+
+        # Initialize the number of scanned items
+        scanned = [0]
+
+        # Check if collection is observed
+        if observed:
+            # Count collected items as they are scanned
+            collected = self._tally(collected, scanned)
+
+        # Check if there are residual conditions
+        if residual:
+            # Filter collected items
+            collected = self._filter(collected, residual)
+
+        # Apply operations to collected
+        collected = self._operate_all(collected, operations)
+
+        # Check if collected items are cacheable but not cached
+        if cache_key is not None and cached is None:
+            # Cache collected item IDs once they are all yielded
+            collected = self._cache_results(cache_key, collected)
+
+        # Get readers by item class
+        readers_by_class = self._readers_by_class
+
+        # Check if collection is observed
+        if observed:
+            # Yield and read collected items, notifying observers once they stop
+            yield from self._observe(
+                items,
+                collected,
+                None
+                if quick
+                else lambda item: (
+                    readers_by_class.get(item.__class__) or self._get_reader(item)
+                )(item),
+                started,
+                scanned,
+            )
+
+            # Return
+            return
+
+        # Check if quick
+        if quick:
+            # Yield collected items as is
+            yield from collected
+
+            # Return
+            return
+
+        # Iterate over collected items
+        for item in collected:
+            # Copy or view and yield item
+            yield (readers_by_class.get(item.__class__) or self._get_reader(item))(item)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COMPACT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def compact(self) -> None:
+        """Writes a snapshot of the collection and removes the logs that it covers"""
+
+        # Get write-ahead log
+        wal = self._wal
+
+        # Check if collection is not durable
+        if wal is None:
+            # Raise ValueError
+            raise ValueError(
+                "Invalid compaction, expected a collection with a write-ahead log."
+            )
+
+        # Acquire compaction lock, so that compactions never overlap
+        with self._compact_lock:
+            # Hold the lock for reading so that the snapshot matches the log rotation
+            with self._lock_read():
+                # Get persisted attributes
+                data = super()._dump()
+
+                # Get the generation covered by the snapshot
+                generation = wal.generation
+
+                # Rotate log, so that pushes continue in the next generation
+                wal.rotate()
+
+            # Write snapshot and the last generation it covers, durably, before any
+            # log that it covers is removed
+            write_snapshot(f"{wal.path}.snapshot", "WriteAheadLog", (generation, data))
+
+            # Iterate over rotated logs
+            for segment, segment_path in self._get_segments(wal.path):
+                # Remove rotated log if it is covered by the snapshot
+                if segment <= generation:
+                    os.remove(segment_path)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ EXPLAIN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def explain(self, items: Items | None = None) -> str:
+        """Returns a description of the plan used to collect items"""
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Split operations into leading conditions and remaining operations
+        conditions, operations = self._split(items._operations)
+
+        # Hold the lock for reading
+        with self._lock_read():
+            # Plan conditions
+            probes, residual = self._plan(conditions) if conditions else ([], ())
+
+            # Get the number of leading windows applied to positions rather than a scan
+            windows = (
+                len(operations) - len(self._window(range(0), operations)[1])
+                if not residual
+                else 0
+            )
+
+            # Get the sorted index that a leading order can walk, if any
+            walkable = (
+                self._get_order_index(operations)
+                if not probes and not windows
+                else None
+            )
+
+            # Initialize lines
+            lines = [
+                f"{'INDEX' if i == 0 else 'INTERSECT'} {description} "
+                f"(~{estimate} items)"
+                for i, (estimate, description, _) in enumerate(probes)
+            ] or [
+                (
+                    f"WALK {walkable!r}"
+                    if walkable is not None
+                    else f"{'POSITIONS' if windows else 'SCAN'} {self.__class__.__name__}"
+                )
+                + f" (~{len(self._items_by_id)} items)"
+            ]
+
+        # Check if there are residual conditions
+        if residual:
+            # Append residual conditions to lines
+            lines.append(self._describe(("filter", residual)))
+
+        # Iterate over operations
+        for i, operation in enumerate(operations):
+            # Append operation to lines, marking windows applied to positions
+            lines.append(
+                ("POSITIONAL " if i < windows else "") + self._describe(operation)
+            )
+
+        # Return plan
+        return "\n".join(lines)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ GROUP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def group(
+        self,
+        attr: str,
+        aggregates: dict[str, str | None],
+        items: Items | None = None,
+    ) -> dict[Any, dict[str, Any]]:
+        """Returns aggregates of items grouped by the value of an attribute"""
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Split operations into leading conditions and remaining operations
+        conditions, operations = self._split(items._operations)
+
+        # Get index of grouping attribute
+        index = self._indexes.get(attr)
+
+        # Return scanned groups if groups cannot be read from a hash index
+        if not isinstance(index, HashIndex) or operations:
+            return super().group(attr, aggregates, items)
+
+        # Validate aggregates before reading groups
+        validate_aggregates(aggregates)
+
+        # Initialize whether indexes fully resolve conditions and grouping values
+        resolved = False
+
+        # Initialize members by grouping value
+        members_by_value: list[tuple[Any, Any]] = []
+
+        # Hold the lock for reading
+        with self._lock_read():
+            # Initialize candidate item IDs
+            candidates = None
+
+            # Set whether the index holds the grouping value of every item
+            resolved = index.exact
+
+            # Check if grouping values are resolved and there are leading conditions
+            if resolved and conditions:
+                # Plan conditions
+                probes, residual = self._plan(conditions)
+
+                # Set whether indexes fully resolve conditions
+                resolved = bool(probes) and not residual
+
+                # Get candidate item IDs if indexes fully resolve conditions
+                candidates = (self._execute(probes) or set()) if resolved else None
+
+            # Check if indexes fully resolve conditions
+            if resolved:
+                # Check if only members are counted
+                if all(
+                    function == "count" and aggregated is None
+                    for function, aggregated in aggregates.items()
+                ):
+                    # Get the number of members by grouping value
+                    members_by_value = [
+                        (value, len(ids if candidates is None else ids & candidates))
+                        for value, ids in index.groups()
+                    ]
+
+                    # Return counts by grouping value
+                    return {
+                        value: {function: size for function in aggregates}
+                        for value, size in members_by_value
+                        if size
+                    }
+
+                # Get items by ID
+                items_by_id = self._items_by_id
+
+                # Get member item IDs by grouping value
+                members_by_value = [
+                    (value, ids if candidates is None else ids & candidates)
+                    for value, ids in index.groups()
+                ]
+
+                # Return aggregates by grouping value, folding members in insertion order
+                return {
+                    value: aggregate_items(
+                        (items_by_id[item_id] for item_id in self._order(ids)),
+                        aggregates,
+                    )
+                    for value, ids in members_by_value
+                    if ids
+                }
+
+        # Return scanned groups if indexes do not fully resolve the query
+        return super().group(attr, aggregates, items)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LAST
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def last(self, items: Items | None = None) -> Item | None:
+        """Returns the last item in the collection"""
+
+        # Return the only item of a tail of one
+        return next(iter(self.tail(1, items)), None)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PUSH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def push(self, item: Item) -> None:
+        """Pushes an item to the collection"""
+
+        # Push a batch of one item
+        self.push_many((item,))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ VERSION
+    # └─────────────────────────────────────────────────────────────────────────────────
 
-            # Iterate over window
-            for item in window:
-                # Yield item
-                yield item
+    @property
+    def version(self) -> int:
+        """Returns the version of the collection, which changes when items are pushed"""
 
-        # Apply tail operation to items
-        return self.apply(items, lambda x: operation(x))
+        # Return version
+        return self._version
@@ -0,0 +1,620 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import mmap
+import os
+import pickle
+import struct
+import threading
+
+from time import perf_counter
+from typing import Any, BinaryIO, Callable, Generator, Iterable, TYPE_CHECKING
+from zlib import crc32
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection.collection import Collection
+from core.utils.exceptions import DoesNotExistError
+from core.utils.functions.datetime import get_clock
+from core.utils.functions.snapshot import dumps, read_snapshot, write_snapshot
+
+if TYPE_CHECKING:
+    from core.utils.classes.item.item import Item
+    from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MMAP COLLECTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class MmapCollection(Collection):
+    """A utility class that represents a memory-mapped file collection of items"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize the header of a record, with its item ID, lengths and checksum
+    FRAME = struct.Struct("<QIII")
+
+    # Initialize magic number
+    MAGIC = b"COREMAP1"
+
+    # Initialize operations that are evaluated against offsets, before decoding
+    WINDOWS = ("head", "slice", "tail")
+
+    # Initialize whether operations block on I/O, as they read a mapped file
+    _blocking = True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of file path
+    path: str
+
+    # Declare type of file
+    _file: BinaryIO
+
+    # Declare type of memory map, remapped once the file grows past it
+    _map: mmap.mmap | None
+
+    # Declare type of the size of valid records in bytes
+    _size: int
+
+    # Declare type of item ID
+    _item_id: int
+
+    # Declare type of record offsets by item ID, in insertion order
+    _offsets_by_item_id: dict[int, int]
+
+    # Declare type of item IDs by key
+    _item_ids_by_key: dict[Any, int]
+
+    # Declare type of keys by item ID
+    _keys_by_item_id: dict[int, list[Any]]
+
+    # Declare type of lock
+    _lock: threading.RLock
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, path: str, clock: str | Callable[[], Any] = "utc") -> None:
+        """Init Method"""
+
+        # Set file path
+        self.path = path
+
+        # Initialize lock
+        self._lock = threading.RLock()
+
+        # Initialize memory map
+        self._map = None
+
+        # Validate clock policy
+        get_clock(clock)
+
+        # Initialize clock policy of items whose class does not declare one
+        self._clock = clock
+
+        # Open file for positioned writes, creating it if it does not exist
+        self._file = open(path, "r+b" if os.path.exists(path) else "w+b", buffering=0)
+
+        # Initialize item ID
+        self._item_id = 0
+
+        # Initialize record offsets by item ID
+        self._offsets_by_item_id = {}
+
+        # Initialize item IDs by key
+        self._item_ids_by_key = {}
+
+        # Initialize keys by item ID
+        self._keys_by_item_id = {}
+
+        # Initialize size to the header
+        self._size = len(self.MAGIC)
+
+        # Get the size of the file
+        size = os.fstat(self._file.fileno()).st_size
+
+        # Check if file is empty or its header is torn
+        if size < len(self.MAGIC):
+            # Truncate file
+            self._file.truncate(0)
+
+            # Write header
+            os.pwrite(self._file.fileno(), self.MAGIC, 0)
+
+        # Otherwise check if file is not a collection
+        elif os.pread(self._file.fileno(), len(self.MAGIC), 0) != self.MAGIC:
+            # Close file
+            self._file.close()
+
+            # Raise ValueError
+            raise ValueError(
+                f"Invalid path {path!r}, expected a file of an MmapCollection."
+            )
+
+        # Otherwise restore offsets and keys
+        else:
+            # Load the offset index saved when the collection was last closed
+            self._load_index(size)
+
+            # Index any records appended after it, reading only their keys
+            self._scan(size)
+
+            # Discard a record torn by a crash, if any
+            self._file.truncate(self._size)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _COUNT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _count(self, items: Items | None = None) -> int:
+        """Returns a count of items in the collection"""
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Return the number of records if there are no operations
+        if not items._operations:
+            return len(self._offsets_by_item_id)
+
+        # Locate offsets
+        offsets, operations = self._locate(items._operations)
+
+        # Return the number of offsets if no operations remain, without decoding
+        if not operations:
+            return len(offsets)
+
+        # Return the number of items in the collection
+        return sum(1 for _ in items._collect(quick=True))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET MAP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_map(self) -> mmap.mmap:
+        """Returns a memory map of the valid records in the file"""
+
+        # Acquire lock
+        with self._lock:
+            # Check if file has grown past the memory map
+            if self._map is None or len(self._map) < self._size:
+                # Map file, leaving any previous map to readers that still hold it
+                self._map = mmap.mmap(
+                    self._file.fileno(), self._size, access=mmap.ACCESS_READ
+                )
+
+            # Return memory map
+            return self._map
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _HYDRATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _hydrate(self, buffer: mmap.mmap, offset: int) -> Item:
+        """Returns the item decoded from the record at an offset"""
+
+        # Unpack record header
+        _, keys_length, length, _ = self.FRAME.unpack_from(buffer, offset)
+
+        # Get the start of the payload, after the record header and keys
+        start = offset + self.FRAME.size + keys_length
+
+        # Return unpickled item
+        return pickle.loads(buffer[start : start + length])
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _INDEX
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _index(self, item_id: int, offset: int, values: list[Any]) -> None:
+        """Points an item ID at a record and its key values at the item ID"""
+
+        # Get item IDs by key
+        item_ids_by_key = self._item_ids_by_key
+
+        # Iterate over values released by item
+        for value in self._keys_by_item_id.pop(item_id, []):
+            # Check if value is still owned by item
+            if item_ids_by_key.get(value) == item_id:
+                # Remove item ID from item IDs by key
+                del item_ids_by_key[value]
+
+        # Iterate over values
+        for value in values:
+            # Add item ID to item IDs by key
+            item_ids_by_key[value] = item_id
+
+        # Set keys by item ID
+        self._keys_by_item_id[item_id] = values
+
+        # Set offset, keeping the insertion position of a pushed again item
+        self._offsets_by_item_id[item_id] = offset
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ISSUE ITEM ID
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _issue_item_id(self) -> int:
+        """Issues a new item ID"""
+
+        # Increment item ID
+        self._item_id += 1
+
+        # Return item ID
+        return self._item_id
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _KEY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _key(self, key: Any, items: Items | None = None) -> Item:
+        """Returns an item by key lookup"""
+
+        # Define does not exist error message
+        does_not_exist_error_message = f"An item with the key '{key}' does not exist"
+
+        # Acquire lock
+        with self._lock:
+            # Get item ID
+            item_id = self._item_ids_by_key.get(key)
+
+            # Check if key does not exist
+            if item_id is None:
+                # Raise DoesNotExistError
+                raise DoesNotExistError(does_not_exist_error_message + ".")
+
+            # Get offset
+            offset = self._offsets_by_item_id[item_id]
+
+        # Decode item
+        item = self._hydrate(self._get_map(), offset)
+
+        # Collect subset
+        subset = list(self.collect(items=items, subset=[item]))
+
+        # Check if subset is null
+        if not subset:
+            # Raise DoesNotExistError
+            raise DoesNotExistError(does_not_exist_error_message + " in this subset.")
+
+        # Unpack subset
+        [item] = subset
+
+        # Return item
+        return item
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LOAD INDEX
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _load_index(self, size: int) -> None:
+        """Restores offsets and keys from the index file, if it matches the file"""
+
+        # Get index path
+        path = f"{self.path}.index"
+
+        # Return if there is no index
+        if not os.path.exists(path):
+            return
+
+        # Read index
+        index = read_snapshot(path, self.__class__.__name__)
+
+        # Return if index covers records that the file does not have
+        if index["size"] > size:
+            return
+
+        # Restore size, item ID, offsets and keys
+        self._size = index["size"]
+        self._item_id = index["item_id"]
+        self._offsets_by_item_id = index["offsets_by_item_id"]
+        self._item_ids_by_key = index["item_ids_by_key"]
+        self._keys_by_item_id = index["keys_by_item_id"]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LOCATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _locate(self, operations: tuple[Any, ...]) -> tuple[list[int], tuple[Any, ...]]:
+        """Returns the offsets selected by leading windows and the remainder"""
+
+        # Get offsets
+        with self._lock:
+            offsets = list(self._offsets_by_item_id.values())
+
+        # Iterate over operations
+        for i, operation in enumerate(operations):
+            # Return if operation cannot be evaluated against offsets
+            if callable(operation) or operation[0] not in self.WINDOWS:
+                return offsets, operations[i:]
+
+            # Get operation name
+            name = operation[0]
+
+            # Handle case of head
+            if name == "head":
+                offsets = offsets[: max(operation[1], 0)]
+
+            # Otherwise handle case of slice
+            elif name == "slice":
+                offsets = offsets[operation[1] : operation[2]]
+
+            # Otherwise handle case of tail
+            elif name == "tail":
+                offsets = offsets[max(len(offsets) - operation[1], 0) :]
+
+        # Return offsets and no remaining operations
+        return offsets, ()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _PUSH MANY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _push_many(self, items: Iterable[Item]) -> None:
+        """Pushes a batch of items to the collection in a single write"""
+
+        # Acquire lock
+        with self._lock:
+            # Get batch and key values, validating keys before issuing item IDs
+            batch, key_values = self._get_batch(
+                items, self._item_ids_by_key, self._keys_by_item_id
+            )
+
+            # Get original item IDs
+            original_ids = [item._imeta.id for item, _ in batch]
+
+            # Initialize records
+            records = []
+
+            # Initialize try-except block
+            try:
+                # Iterate over batch and key values
+                for (item, item_id), values in zip(batch, key_values):
+                    # Update item ID
+                    item._imeta.id = str(item_id)
+
+                    # Pickle key values and item, which copies the item
+                    keys, payload = dumps(values), dumps(item)
+
+                    # Append record
+                    records.append(
+                        self.FRAME.pack(
+                            item_id,
+                            len(keys),
+                            len(payload),
+                            crc32(payload, crc32(keys)),
+                        )
+                        + keys
+                        + payload
+                    )
+
+                # Write records after the last valid record, in a single call
+                os.pwrite(self._file.fileno(), b"".join(records), self._size)
+
+            # Handle any exception raised while pickling or writing
+            except BaseException:
+                # Iterate over batch and original item IDs
+                for (item, _), original_id in zip(batch, original_ids):
+                    # Restore item ID
+                    item._imeta.id = original_id
+
+                # Re-raise exception
+                raise
+
+            # Initialize offset
+            offset = self._size
+
+            # Iterate over batch, key values and records
+            for (_, item_id), values, record in zip(batch, key_values, records):
+                # Index record
+                self._index(item_id, offset, values)
+
+                # Increment offset
+                offset += len(record)
+
+            # Set size
+            self._size = offset
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _SCAN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _scan(self, size: int) -> None:
+        """Indexes the records after the valid size, reading only their keys"""
+
+        # Return if there are no records to scan
+        if size <= self._size:
+            return
+
+        # Map file
+        buffer = mmap.mmap(self._file.fileno(), size, access=mmap.ACCESS_READ)
+
+        # Initialize offset
+        offset = self._size
+
+        # Iterate over complete record headers
+        while offset + self.FRAME.size <= size:
+            # Unpack record header
+            item_id, keys_length, length, checksum = self.FRAME.unpack_from(
+                buffer, offset
+            )
+
+            # Get the start of the keys and the end of the record
+            start = offset + self.FRAME.size
+            end = start + keys_length + length
+
+            # Break if record is torn or corrupt
+            if end > size or crc32(buffer[start:end]) != checksum:
+                break
+
+            # Index record, decoding only its key values
+            self._index(
+                item_id, offset, pickle.loads(buffer[start : start + keys_length])
+            )
+
+            # Advance item ID past the item ID of the record
+            self._item_id = max(self._item_id, item_id)
+
+            # Advance offset
+            offset = end
+
+        # Set size
+        self._size = offset
+
+        # Close map
+        buffer.close()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLOSE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        """Saves the offset index and closes the file"""
+
+        # Acquire lock
+        with self._lock:
+            # Sync file
+            os.fsync(self._file.fileno())
+
+            # Save offset index, so that the next open does not scan records
+            write_snapshot(
+                f"{self.path}.index",
+                self.__class__.__name__,
+                {
+                    "size": self._size,
+                    "item_id": self._item_id,
+                    "offsets_by_item_id": self._offsets_by_item_id,
+                    "item_ids_by_key": self._item_ids_by_key,
+                    "keys_by_item_id": self._keys_by_item_id,
+                },
+            )
+
+            # Close file, leaving memory maps to readers that still hold them
+            self._file.close()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COLLECT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def collect(
+        self,
+        items: Items | None = None,
+        subset: Iterable[Item] | None = None,
+        quick: bool = False,
+    ) -> Generator[Item, None, None]:
+        """Yields items in the collection"""
+
+        # Get whether collection is observed and the start time if so
+        observed = bool(self._observers)
+        started = perf_counter() if observed else 0.0
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Check if collection is a subset
+        if subset is not None:
+            # Initialize collected items
+            collected: Iterable[Item] = subset
+
+            # Initialize operations
+            operations = items._operations
+
+        # Otherwise evaluate leading windows against offsets
+        else:
+            # Locate offsets
+            offsets, operations = self._locate(items._operations)
+
+            # Get memory map
+            buffer = self._get_map()
+
+            # Decode items lazily, only as they are read
+            collected = (self._hydrate(buffer, offset) for offset in offsets)
+
+        # Initialize the number of scanned items
+        scanned = [0]
+
+        # Check if collection is observed
+        if observed:
+            # Count decoded items as they are scanned
+            collected = self._tally(collected, scanned)
+
+        # Apply operations to collected
+        collected = self._operate_all(collected, operations)
+
+        # Check if collection is observed
+        if observed:
+            # Yield collected items, notifying observers once they stop
+            yield from self._observe(items, collected, None, started, scanned)
+
+            # Return
+            return
+
+        # Yield collected items
+        yield from collected
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ EXPLAIN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def explain(self, items: Items | None = None) -> str:
+        """Returns a description of the plan used to collect items"""
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Locate offsets
+        offsets, operations = self._locate(items._operations)
+
+        # Initialize lines
+        lines = [
+            f"SCAN {self.__class__.__name__} "
+            f"(~{len(self._offsets_by_item_id)} items, {self._size} bytes)"
+        ]
+
+        # Iterate over operations evaluated against offsets
+        for operation in items._operations[: len(items._operations) - len(operations)]:
+            # Append operation to lines
+            lines.append("OFFSETS " + self._describe(operation))
+
+        # Append decoding to lines
+        lines.append(f"DECODE ~{len(offsets)} items")
+
+        # Iterate over remaining operations
+        for operation in operations:
+            # Append operation to lines
+            lines.append(self._describe(operation))
+
+        # Return plan
+        return "\n".join(lines)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LAST
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def last(self, items: Items | None = None) -> Item | None:
+        """Returns the last item in the collection"""
+
+        # Return the only item of a tail of one
+        return next(iter(self.tail(1, items)), None)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PUSH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def push(self, item: Item) -> None:
+        """Pushes an item to the collection"""
+
+        # Push a batch of one item
+        self.push_many((item,))
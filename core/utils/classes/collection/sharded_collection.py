@@ -0,0 +1,651 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from heapq import merge
+from itertools import chain, islice
+from time import perf_counter
+from typing import Any, Callable, Generator, Iterable, TYPE_CHECKING
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection.collection import Collection
+from core.utils.classes.collection.dict_collection import DictCollection
+from core.utils.classes.item.items import Items
+from core.utils.classes.lock import ReadWriteLock
+from core.utils.exceptions import DoesNotExistError
+from core.utils.functions.datetime import get_clock
+from core.utils.functions.order import compile_order_key
+from core.utils.functions.snapshot import dumps, loads
+
+if TYPE_CHECKING:
+    from core.utils.classes.item.item import Item
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SHARDED COLLECTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class ShardedCollection(Collection):
+    """A utility class that represents a collection of items hashed across shards"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize operations that stop reading once enough items are yielded
+    WINDOWS = ("head", "slice")
+
+    # Initialize names of the attributes that snapshots persist, besides shards
+    _snapshot_attrs = (
+        "_item_id",
+        "_item_ids_by_key",
+        "_keys_by_item_id",
+        "_positions_by_item_id",
+    )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of shards
+    _shards: list[DictCollection]
+
+    # Declare type of item ID
+    _item_id: int
+
+    # Declare type of item IDs by key
+    _item_ids_by_key: dict[Any, int]
+
+    # Declare type of keys by item ID
+    _keys_by_item_id: dict[int, list[Any]]
+
+    # Declare type of insertion positions by item ID
+    _positions_by_item_id: dict[int, int]
+
+    # Declare type of whether items are merged back into insertion order
+    _ordered: bool
+
+    # Declare type of the number of workers that fan out scans, if any
+    _workers: int | None
+
+    # Declare type of thread pool that fans out scans, if any
+    _executor: ThreadPoolExecutor | None
+
+    # Declare type of reader-writer lock
+    _lock: ReadWriteLock | None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(
+        self,
+        shards: int = 4,
+        copy: str | Callable[[Any], Any] = "deep",
+        read: str = "copy",
+        clock: str | Callable[[], Any] = "utc",
+        threadsafe: bool = False,
+        workers: int | None = None,
+        ordered: bool = True,
+    ) -> None:
+        """Init Method"""
+
+        # Check if the number of shards is invalid
+        if not isinstance(shards, int) or shards < 1:
+            # Raise ValueError
+            raise ValueError(f"Invalid shards {shards!r}, expected a positive integer.")
+
+        # Check if the number of workers is invalid
+        if workers is not None and (not isinstance(workers, int) or workers < 1):
+            # Raise ValueError
+            raise ValueError(
+                f"Invalid workers {workers!r}, expected a positive integer or None."
+            )
+
+        # Initialize shards
+        self._shards = [
+            DictCollection(copy=copy, read=read, clock=clock, threadsafe=threadsafe)
+            for _ in range(shards)
+        ]
+
+        # Validate clock policy
+        get_clock(clock)
+
+        # Initialize clock policy of items whose class does not declare one
+        self._clock = clock
+
+        # Initialize item ID
+        self._item_id = 0
+
+        # Initialize item IDs by key
+        self._item_ids_by_key = {}
+
+        # Initialize keys by item ID
+        self._keys_by_item_id = {}
+
+        # Initialize insertion positions by item ID
+        self._positions_by_item_id = {}
+
+        # Initialize whether items are merged back into insertion order
+        self._ordered = ordered
+
+        # Initialize the number of workers that fan out scans
+        self._workers = workers
+
+        # Initialize thread pool if scans fan out to workers
+        self._executor = (
+            ThreadPoolExecutor(max_workers=workers) if workers is not None else None
+        )
+
+        # Initialize reader-writer lock if the collection is shared between threads
+        self._lock = ReadWriteLock() if threadsafe else None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _COUNT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _count(self, items: Items | None = None) -> int:
+        """Returns a count of items in the collection"""
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Split operations into leading conditions and remaining operations
+        _, operations = self._split(items._operations)
+
+        # Check if every operation is a filter that shards can count on their own
+        if not operations:
+            # Return the sum of the counts of each shard
+            return sum(
+                self._map(
+                    lambda shard: shard.count(
+                        Items(collection=shard, operations=items._operations)
+                    )
+                )
+            )
+
+        # Return the number of items in the collection
+        return sum(1 for _ in items._collect(quick=True))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _DUMP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _dump(self) -> bytes:
+        """Returns the persisted attributes of the collection and its shards"""
+
+        # Hold the lock for reading so that no batch is pushed between shards
+        with self._lock_read():
+            # Return persisted attributes and the snapshot bytes of each shard
+            return dumps(
+                {
+                    "state": super()._dump(),
+                    "shards": [shard._dump() for shard in self._shards],
+                }
+            )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _FAN OUT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _fan_out(
+        self, operations: tuple[Any, ...], quick: bool, lazy: bool
+    ) -> list[Iterable[Item]]:
+        """Returns the items that each shard yields for operations pushed down to it"""
+
+        # Define collection of a shard
+        def collect(shard: DictCollection) -> Iterable[Item]:
+            """Returns the items that a shard yields"""
+
+            # Return the items that shard yields
+            return shard.collect(
+                Items(collection=shard, operations=operations), quick=quick
+            )
+
+        # Return lazy iterators if items are read on demand or there are no workers
+        if lazy or self._executor is None:
+            return [collect(shard) for shard in self._shards]
+
+        # Return items that each shard yields, collected by workers in parallel
+        return self._map(lambda shard: list(collect(shard)))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET POSITION
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_position(self, item: Item) -> int:
+        """Returns the insertion position of an item in the collection"""
+
+        # Return insertion position by item ID
+        return self._positions_by_item_id[int(item._imeta.id)]  # type: ignore[arg-type]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET SHARD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_shard(self, item_id: int) -> DictCollection:
+        """Returns the shard that an item ID hashes to"""
+
+        # Return shard
+        return self._shards[item_id % len(self._shards)]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ISSUE ITEM ID
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _issue_item_id(self) -> int:
+        """Issues a new item ID"""
+
+        # Increment item ID
+        self._item_id += 1
+
+        # Return item ID
+        return self._item_id
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _KEY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _key(self, key: Any, items: Items | None = None) -> Item:
+        """Returns an item by key lookup, routed to the shard that holds it"""
+
+        # Hold the lock for reading
+        with self._lock_read():
+            # Get item ID
+            item_id = self._item_ids_by_key.get(key)
+
+        # Check if key does not exist
+        if item_id is None:
+            # Raise DoesNotExistError
+            raise DoesNotExistError(f"An item with the key '{key}' does not exist.")
+
+        # Return item from its shard
+        return self._get_shard(item_id).key(key, items)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LOCK READ
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _lock_read(self) -> AbstractContextManager[Any]:
+        """Returns a context that holds the lock for reading, if there is a lock"""
+
+        # Return read context or a null context
+        return self._lock.read() if self._lock is not None else nullcontext()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LOCK WRITE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _lock_write(self) -> AbstractContextManager[Any]:
+        """Returns a context that holds the lock for writing, if there is a lock"""
+
+        # Return write context or a null context
+        return self._lock.write() if self._lock is not None else nullcontext()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _MAP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _map(self, function: Callable[[DictCollection], Any]) -> list[Any]:
+        """Returns the result of a function of each shard, in parallel if pooled"""
+
+        # Return results in sequence if there are no workers
+        if self._executor is None:
+            return [function(shard) for shard in self._shards]
+
+        # Return results computed by workers
+        return list(self._executor.map(function, self._shards))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _MERGE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _merge(
+        self, streams: list[Iterable[Item]], operations: tuple[Any, ...]
+    ) -> Iterable[Item]:
+        """Returns the items of each shard merged into one stream"""
+
+        # Get insertion position getter
+        position = self._get_position
+
+        # Get the last operation pushed down to shards, if any
+        last = operations[-1] if operations else None
+
+        # Check if shards ordered their items
+        if last is not None and not callable(last) and last[0] == "order":
+            # Unpack order operation
+            _, keys, limit = last
+
+            # Compile sort key
+            key, reverse = compile_order_key(keys)
+
+            # Merge streams by sort key, breaking ties by insertion position
+            merged: Iterable[Item] = merge(
+                *streams,
+                key=(
+                    (lambda item: (key(item), -position(item)))
+                    if reverse
+                    else (lambda item: (key(item), position(item)))
+                ),
+                reverse=reverse,
+            )
+
+            # Return merged items up to the limit, if any
+            return islice(merged, limit) if limit is not None else merged
+
+        # Check if items are merged back into insertion order
+        if self._ordered:
+            # Return streams merged by insertion position
+            return merge(*streams, key=position)
+
+        # Return streams one shard after another
+        return chain.from_iterable(streams)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _PUSH MANY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _push_many(self, items: Iterable[Item]) -> None:
+        """Pushes a batch of items to their shards, validating all keys first"""
+
+        # Materialize items first, as they may be read from this very collection
+        items = list(items)
+
+        # Hold the lock for writing so that key lookups never see a partial batch
+        with self._lock_write():
+            # Get keys by item ID
+            keys_by_item_id = self._keys_by_item_id
+
+            # Get item IDs by key
+            item_ids_by_key = self._item_ids_by_key
+
+            # Get insertion positions by item ID
+            positions = self._positions_by_item_id
+
+            # Get batch and key values, validating keys across every shard first
+            batch, key_values = self._get_batch(items, item_ids_by_key, keys_by_item_id)
+
+            # Initialize batches of items, item IDs and key values by shard
+            batches: dict[int, list[tuple[Item, int, list[Any]]]] = {}
+
+            # Iterate over batch and key values
+            for (item, item_id), values in zip(batch, key_values):
+                # Add item to the batch of its shard
+                batches.setdefault(item_id % len(self._shards), []).append(
+                    (item, item_id, values)
+                )
+
+            # Get item IDs new to the collection, in the order of the batch
+            new_ids = list(
+                dict.fromkeys(
+                    item_id for _, item_id in batch if item_id not in positions
+                )
+            )
+
+            # Iterate over new item IDs
+            for item_id in new_ids:
+                # Set insertion position before readers can see the item
+                positions[item_id] = len(positions)
+
+            # Initialize shards that have stored their batch
+            stored: set[int] = set()
+
+            # Iterate over batches by shard
+            for index, shard_batch in batches.items():
+                # Get original item IDs
+                original_ids = [item._imeta.id for item, _, _ in shard_batch]
+
+                # Initialize try-except block
+                try:
+                    # Iterate over shard batch
+                    for item, item_id, _ in shard_batch:
+                        # Update item ID
+                        item._imeta.id = str(item_id)
+
+                    # Push shard batch to shard
+                    self._shards[index].push_many([item for item, _, _ in shard_batch])
+
+                # Handle any exception raised while pushing
+                except BaseException:
+                    # Iterate over shard batch and original item IDs
+                    for (item, _, _), original_id in zip(shard_batch, original_ids):
+                        # Restore item ID
+                        item._imeta.id = original_id
+
+                    # Iterate over new item IDs
+                    for item_id in new_ids:
+                        # Check if item was not stored by a shard
+                        if item_id % len(self._shards) not in stored:
+                            # Remove insertion position
+                            del positions[item_id]
+
+                    # Re-raise exception
+                    raise
+
+                # Add shard to stored shards
+                stored.add(index)
+
+                # Iterate over shard batch
+                for _, item_id, values in shard_batch:
+                    # Iterate over values released by item
+                    for value in keys_by_item_id.pop(item_id, []):
+                        # Check if value is still owned by item
+                        if item_ids_by_key.get(value) == item_id:
+                            # Remove item ID from item IDs by key
+                            del item_ids_by_key[value]
+
+                    # Iterate over values
+                    for value in values:
+                        # Add item ID to item IDs by key
+                        item_ids_by_key[value] = item_id
+
+                    # Set keys by item ID
+                    keys_by_item_id[item_id] = values
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _PUSHDOWN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _pushdown(
+        self, operations: tuple[Any, ...]
+    ) -> tuple[tuple[Any, ...], tuple[Any, ...]]:
+        """Splits operations into those each shard applies and those applied after"""
+
+        # Get the number of leading filters
+        n = next(
+            (
+                i
+                for i, operation in enumerate(operations)
+                if callable(operation) or operation[0] != "filter"
+            ),
+            len(operations),
+        )
+
+        # Check if filters are followed by an order, which shards sort on their own
+        if (
+            n < len(operations)
+            and not callable(operations[n])
+            and operations[n][0] == "order"
+        ):
+            # Include order in the pushed down operations
+            n += 1
+
+        # Return pushed down and remaining operations
+        return operations[:n], operations[n:]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _RESTORE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _restore(self, data: bytes) -> None:
+        """Restores the persisted attributes of the collection and its shards"""
+
+        # Get state
+        state = loads(data)
+
+        # Check if the snapshot has a different number of shards
+        if len(state["shards"]) != len(self._shards):
+            # Raise ValueError, as item IDs are hashed across a fixed number of shards
+            raise ValueError(
+                f"Invalid snapshot of {len(state['shards'])} shards, "
+                f"expected {len(self._shards)} shards."
+            )
+
+        # Hold the lock for writing so that readers never see a partial restore
+        with self._lock_write():
+            # Restore persisted attributes
+            super()._restore(state["state"])
+
+            # Iterate over shards and their snapshot bytes
+            for shard, shard_data in zip(self._shards, state["shards"]):
+                # Restore shard
+                shard._restore(shard_data)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLOSE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        """Shuts down the workers of the collection, if any"""
+
+        # Check if there is a thread pool
+        if self._executor is not None:
+            # Shut down thread pool
+            self._executor.shutdown()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COLLECT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def collect(
+        self,
+        items: Items | None = None,
+        subset: Iterable[Item] | None = None,
+        quick: bool = False,
+    ) -> Generator[Item, None, None]:
+        """Yields items in the collection, fanning out to shards and merging them"""
+
+        # Get whether collection is observed and the start time if so
+        observed = bool(self._observers)
+        started = perf_counter() if observed else 0.0
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Check if collection is a subset
+        if subset is not None:
+            # Yield subset items as read by a shard, as every shard reads alike
+            yield from self._shards[0].collect(items, subset=subset, quick=quick)
+
+            # Return
+            return
+
+        # Split operations into those pushed down to shards and those applied after
+        pushed, operations = self._pushdown(items._operations)
+
+        # Get whether items are read on demand, so that shards must not be drained
+        lazy = any(
+            not callable(operation) and operation[0] in self.WINDOWS
+            for operation in operations
+        )
+
+        # Merge the items that each shard yields
+        collected = self._merge(self._fan_out(pushed, quick, lazy), pushed)
+
+        # Initialize the number of scanned items
+        scanned = [0]
+
+        # Check if collection is observed
+        if observed:
+            # Count merged items as they are scanned
+            collected = self._tally(collected, scanned)
+
+        # Apply operations to collected
+        collected = self._operate_all(collected, operations)
+
+        # Check if collection is observed
+        if observed:
+            # Yield collected items, notifying observers once they stop
+            yield from self._observe(items, collected, None, started, scanned)
+
+            # Return
+            return
+
+        # Yield collected items
+        yield from collected
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ EXPLAIN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def explain(self, items: Items | None = None) -> str:
+        """Returns a description of the plan used to collect items"""
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Split operations into those pushed down to shards and those applied after
+        pushed, operations = self._pushdown(items._operations)
+
+        # Get first shard
+        shard = self._shards[0]
+
+        # Initialize lines with the plan of a shard
+        lines = [
+            f"FAN OUT {len(self._shards)} shards"
+            + (f" ({self._workers} workers)" if self._workers is not None else "")
+        ] + [
+            f"  {line}"
+            for line in shard.explain(
+                Items(collection=shard, operations=pushed)
+            ).splitlines()
+        ]
+
+        # Get the last operation pushed down to shards, if any
+        last = pushed[-1] if pushed else None
+
+        # Append the way shards are merged to lines
+        lines.append(
+            "MERGE BY ORDER"
+            if last is not None and not callable(last) and last[0] == "order"
+            else "MERGE BY INSERTION"
+            if self._ordered
+            else "CONCATENATE"
+        )
+
+        # Iterate over operations
+        for operation in operations:
+            # Append operation to lines
+            lines.append(self._describe(operation))
+
+        # Return plan
+        return "\n".join(lines)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PUSH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def push(self, item: Item) -> None:
+        """Pushes an item to the collection"""
+
+        # Push a batch of one item
+        self.push_many((item,))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SHARDS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @property
+    def shards(self) -> tuple[DictCollection, ...]:
+        """Returns the shards of the collection"""
+
+        # Return shards
+        return tuple(self._shards)
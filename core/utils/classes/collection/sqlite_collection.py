@@ -0,0 +1,847 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import pickle
+import sqlite3
+import threading
+
+from time import perf_counter
+from typing import Any, Callable, Generator, Iterable, TYPE_CHECKING
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection.collection import Collection
+from core.utils.classes.index import Sorted
+from core.utils.exceptions import DoesNotExistError, DuplicateKeyError
+from core.utils.functions.datetime import get_clock
+from core.utils.functions.state import get_state
+
+if TYPE_CHECKING:
+    from core.utils.classes.item.item import Item
+    from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SQLITE COLLECTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class SqliteCollection(Collection):
+    """A utility class that represents a SQLite collection of items"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize the number of rows fetched at a time
+    CHUNK_SIZE = 1024
+
+    # Initialize the maximum number of parameters in an IN clause
+    MAX_IN = 500
+
+    # Initialize SQL comparison operators by operator
+    COMPARISONS = {"lt": "<", "lte": "<=", "gt": ">", "gte": ">="}
+
+    # Initialize schema statements
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS items ("
+        "seq INTEGER PRIMARY KEY, item_id INTEGER NOT NULL UNIQUE, data BLOB NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS keys ("
+        "kind TEXT NOT NULL, value NOT NULL, item_id INTEGER NOT NULL, "
+        "UNIQUE (kind, value))",
+        'CREATE INDEX IF NOT EXISTS "keys.item_id" ON keys (item_id)',
+        "CREATE TABLE IF NOT EXISTS attrs (name TEXT PRIMARY KEY, pure INTEGER NOT NULL)",
+    )
+
+    # Initialize whether operations block on I/O, as they query a database file
+    _blocking = True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of database path
+    path: str
+
+    # Declare type of connection
+    _connection: sqlite3.Connection
+
+    # Declare type of lock
+    _lock: threading.RLock
+
+    # Initialize item ID
+    _item_id: int
+
+    # Declare type of whether attribute columns can be pushed down, by attribute
+    _pure: dict[str, bool]
+
+    # Declare type of item classes
+    _item_classes: set[type]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(
+        self, path: str = ":memory:", clock: str | Callable[[], Any] = "utc"
+    ) -> None:
+        """Init Method"""
+
+        # Set database path
+        self.path = path
+
+        # Initialize connection, serializing access across threads with a lock
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+
+        # Register a Unicode-aware lowercase function
+        self._connection.create_function("py_lower", 1, self._lower, deterministic=True)
+
+        # Initialize lock
+        self._lock = threading.RLock()
+
+        # Initialize item classes
+        self._item_classes = set()
+
+        # Validate clock policy
+        get_clock(clock)
+
+        # Initialize clock policy of items whose class does not declare one
+        self._clock = clock
+
+        # Initialize schema
+        with self._lock, self._connection as connection:
+            # Iterate over schema statements
+            for statement in self.SCHEMA:
+                # Execute statement
+                connection.execute(statement)
+
+            # Initialize item ID
+            self._item_id = connection.execute(
+                "SELECT COALESCE(MAX(item_id), 0) FROM items"
+            ).fetchone()[0]
+
+            # Initialize whether attribute columns can be pushed down
+            self._pure = {
+                name: bool(pure)
+                for name, pure in connection.execute("SELECT name, pure FROM attrs")
+            }
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ADD COLUMN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _add_column(self, connection: sqlite3.Connection, attr: str) -> None:
+        """Adds an attribute column, which is pure only if there are no rows yet"""
+
+        # Get whether there are rows, which lack the attribute
+        (has_rows,) = connection.execute(
+            "SELECT EXISTS (SELECT 1 FROM items)"
+        ).fetchone()
+
+        # Get whether column is pure
+        pure = not has_rows
+
+        # Add column without a declared type so that values keep their SQLite type
+        connection.execute(f"ALTER TABLE items ADD COLUMN {self._column(attr)}")
+
+        # Record column
+        connection.execute("INSERT INTO attrs (name, pure) VALUES (?, ?)", (attr, pure))
+        self._pure[attr] = pure
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _COLUMN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _column(self, attr: str) -> str:
+        """Returns the quoted column name of an attribute"""
+
+        # Return quoted column name
+        return self._quote(f"attr.{attr}")
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _COMPILE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _compile(
+        self, conditions: tuple[tuple[str, str, Any], ...]
+    ) -> tuple[str, list[Any], tuple[tuple[str, str, Any], ...]]:
+        """Returns a WHERE clause, its parameters and the residual conditions"""
+
+        # Initialize clauses, parameters and residual conditions
+        clauses: list[str] = []
+        params: list[Any] = []
+        residual: list[tuple[str, str, Any]] = []
+
+        # Iterate over conditions
+        for condition in conditions:
+            # Translate condition
+            translated = self._translate(*condition)
+
+            # Check if condition cannot be translated
+            if translated is None:
+                # Append condition to residual conditions
+                residual.append(condition)
+
+                # Continue
+                continue
+
+            # Append clause and parameters
+            clauses.append(translated[0])
+            params.extend(translated[1])
+
+        # Get WHERE clause
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+
+        # Return WHERE clause, parameters and residual conditions
+        return where, params, tuple(residual)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _COUNT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _count(self, items: Items | None = None) -> int:
+        """Returns a count of items in the collection"""
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Plan operations
+        sql, params, residual, operations = self._plan(items._operations)
+
+        # Check if operations are fully pushed down
+        if not residual and not operations:
+            # Return the number of rows
+            with self._lock:
+                return int(
+                    self._connection.execute(
+                        f"SELECT COUNT(*) FROM ({sql})", params
+                    ).fetchone()[0]
+                )
+
+        # Return the number of items in the collection
+        return sum(1 for _ in items._collect(quick=True))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ENCODE KEY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _encode_key(self, value: Any) -> tuple[str, Any]:
+        """Returns the kind and stored value of a key"""
+
+        # Return scalar keys as is so that SQLite compares them like Python
+        if value is not None and self._is_pure(value):
+            return "scalar", value
+
+        # Return other keys pickled
+        return "pickle", pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ENSURE INDEXES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _ensure_indexes(self, connection: sqlite3.Connection, item: Item) -> None:
+        """Ensures that the indexes declared by an item's class exist"""
+
+        # Get item class
+        item_class = item.__class__
+
+        # Return if item class has already been seen
+        if item_class in self._item_classes:
+            return
+
+        # Iterate over index declarations
+        for declaration in item._cmeta.INDEXES:
+            # Get indexed attributes
+            attrs = (
+                (declaration.attr,)
+                if isinstance(declaration, Sorted)
+                else (declaration,)
+                if isinstance(declaration, str)
+                else tuple(declaration)
+            )
+
+            # Iterate over indexed attributes
+            for attr in attrs:
+                # Check if attribute has no column
+                if attr not in self._pure:
+                    # Add column
+                    self._add_column(connection, attr)
+
+            # Create index
+            connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {self._quote('index.' + '.'.join(attrs))} "
+                f"ON items ({', '.join(self._column(attr) for attr in attrs)})"
+            )
+
+        # Add item class to item classes
+        self._item_classes.add(item_class)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _FETCH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _fetch(self, sql: str, params: list[Any]) -> Generator[Item, None, None]:
+        """Yields items unpickled from the rows of a query"""
+
+        # Execute query
+        with self._lock:
+            cursor = self._connection.execute(sql, params)
+
+        # Iterate until there are no rows left
+        while True:
+            # Fetch rows
+            with self._lock:
+                rows = cursor.fetchmany(self.CHUNK_SIZE)
+
+            # Return if there are no rows left
+            if not rows:
+                return
+
+            # Iterate over rows
+            for (data,) in rows:
+                # Yield item
+                yield pickle.loads(data)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _IS PURE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _is_pure(self, value: Any) -> bool:
+        """Returns whether a value is stored and compared by SQLite as in Python"""
+
+        # Get value type
+        value_type = type(value)
+
+        # Return whether value is a scalar that round-trips through SQLite
+        return (
+            value is None
+            or value_type is bool
+            or value_type is str
+            or value_type is bytes
+            or (value_type is float and value == value)
+            or (value_type is int and -(2**63) <= value < 2**63)
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ISSUE ITEM ID
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _issue_item_id(self) -> int:
+        """Issues a new item ID"""
+
+        # Increment item ID
+        self._item_id += 1
+
+        # Return item ID
+        return self._item_id
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _KEY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _key(self, key: Any, items: Items | None = None) -> Item:
+        """Returns an item by key lookup"""
+
+        # Define does not exist error message
+        does_not_exist_error_message = f"An item with the key '{key}' does not exist"
+
+        # Get row
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM items JOIN keys USING (item_id) "
+                "WHERE keys.kind = ? AND keys.value = ?",
+                self._encode_key(key),
+            ).fetchone()
+
+        # Check if key does not exist
+        if row is None:
+            # Raise DoesNotExistError
+            raise DoesNotExistError(does_not_exist_error_message + ".")
+
+        # Collect subset
+        subset = list(self.collect(items=items, subset=[pickle.loads(row[0])]))
+
+        # Check if subset is null
+        if not subset:
+            # Raise DoesNotExistError
+            raise DoesNotExistError(does_not_exist_error_message + " in this subset.")
+
+        # Unpack subset
+        [item] = subset
+
+        # Return item
+        return item
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _LOWER
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _lower(value: Any) -> Any:
+        """Returns a lowercase string, or any other value as is"""
+
+        # Return lowercase value
+        return value.lower() if isinstance(value, str) else value
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _PLAN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _plan(
+        self, operations: tuple[Any, ...]
+    ) -> tuple[str, list[Any], tuple[tuple[str, str, Any], ...], tuple[Any, ...]]:
+        """Returns a query, its parameters, residual conditions and the remainder"""
+
+        # Split operations into leading conditions and remaining operations
+        conditions, operations = self._split(operations)
+
+        # Compile conditions
+        where, params, residual = self._compile(conditions)
+
+        # Initialize window
+        tail: int | None = None
+        offset, limit = 0, -1
+
+        # Initialize the number of operations pushed down
+        pushed = 0
+
+        # Iterate over operations if all conditions were pushed down
+        for operation in operations if not residual else ():
+            # Break if operation cannot be pushed down
+            if callable(operation) or operation[0] not in ("head", "slice", "tail"):
+                break
+
+            # Unpack operation
+            name, *args = operation
+
+            # Handle case of head
+            if name == "head":
+                limit = max(args[0], 0) if limit < 0 else min(limit, max(args[0], 0))
+
+            # Otherwise handle case of a non-negative slice
+            elif name == "slice" and args[0] >= 0 and args[1] >= 0:
+                # Get slice size
+                size = max(args[1] - args[0], 0)
+
+                # Update window
+                limit = size if limit < 0 else min(size, max(limit - args[0], 0))
+                offset += args[0]
+
+            # Otherwise handle case of a leading, non-negative tail
+            elif name == "tail" and pushed == 0 and args[0] >= 0:
+                tail = args[0]
+
+            # Otherwise break
+            else:
+                break
+
+            # Increment the number of operations pushed down
+            pushed += 1
+
+        # Initialize query
+        sql = f"SELECT seq, data FROM items{where}"
+
+        # Check if there is a tail
+        if tail is not None:
+            # Select the last rows
+            sql = f"SELECT * FROM ({sql} ORDER BY seq DESC LIMIT {tail})"
+
+        # Order rows
+        sql = f"SELECT data FROM ({sql}) ORDER BY seq"
+
+        # Check if there is a window
+        if limit >= 0 or offset:
+            # Limit rows
+            sql += f" LIMIT {limit} OFFSET {offset}"
+
+        # Return query, parameters, residual conditions and remaining operations
+        return sql, params, residual, operations[pushed:]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _PUSH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _push(self, connection: sqlite3.Connection, item: Item, item_id: int) -> None:
+        """Inserts or updates the row of an item within an open transaction"""
+
+        # Get item state
+        state = get_state(item)
+
+        # Ensure that declared indexes exist
+        self._ensure_indexes(connection, item)
+
+        # Iterate over item state
+        for attr in state:
+            # Check if attribute has no column
+            if attr not in self._pure:
+                # Add column
+                self._add_column(connection, attr)
+
+        # Get attribute columns that can no longer be pushed down
+        impure = [
+            attr
+            for attr, is_pure in self._pure.items()
+            if is_pure and (attr not in state or not self._is_pure(state[attr]))
+        ]
+
+        # Iterate over impure attributes
+        for attr in impure:
+            # Record column as impure
+            connection.execute("UPDATE attrs SET pure = 0 WHERE name = ?", (attr,))
+            self._pure[attr] = False
+
+        # Update item ID
+        item._imeta.id = str(item_id)
+
+        # Get columns
+        columns = list(self._pure)
+
+        # Insert or update item
+        connection.execute(
+            f"INSERT INTO items (item_id, data"
+            f"{''.join(', ' + self._column(attr) for attr in columns)}) "
+            f"VALUES (?, ?{', ?' * len(columns)}) "
+            f"ON CONFLICT (item_id) DO UPDATE SET data = excluded.data"
+            + "".join(
+                f", {self._column(attr)} = excluded.{self._column(attr)}"
+                for attr in columns
+            ),
+            [
+                item_id,
+                pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL),
+                *(
+                    state.get(attr) if self._is_pure(state.get(attr)) else None
+                    for attr in columns
+                ),
+            ],
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _PUSH MANY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _push_many(self, items: Iterable[Item]) -> None:
+        """Pushes a batch of items to the collection in a single transaction"""
+
+        # Materialize items first, as they may be read from this very collection
+        items = list(items)
+
+        # Acquire lock so that no other item IDs are issued alongside the batch
+        with self._lock:
+            # Get last item ID issued
+            last_item_id = self._item_id
+
+            # Get batch of items and their item IDs
+            batch = [
+                (
+                    item,
+                    int(item._imeta.id)
+                    if item._imeta.id is not None
+                    else self._issue_item_id(),
+                )
+                for item in items
+            ]
+
+            # Get original item IDs
+            original_ids = [item._imeta.id for item, _ in batch]
+
+            # Get a copy of whether attribute columns can be pushed down
+            pure = dict(self._pure)
+
+            # Initialize item classes seen
+            item_classes = set(self._item_classes)
+
+            # Initialize try-except block
+            try:
+                # Open a transaction
+                with self._connection as connection:
+                    # Delete existing keys of items in the batch
+                    connection.executemany(
+                        "DELETE FROM keys WHERE item_id = ?",
+                        [(item_id,) for _, item_id in batch],
+                    )
+
+                    # Iterate over batch
+                    for item, item_id in batch:
+                        # Iterate over key values
+                        for value in self._get_key_values(item):
+                            # Get kind and stored value of key
+                            key = self._encode_key(value)
+
+                            # Insert key unless it already exists
+                            inserted = connection.execute(
+                                "INSERT INTO keys (kind, value, item_id) VALUES (?, ?, ?) "
+                                "ON CONFLICT DO NOTHING",
+                                (*key, item_id),
+                            ).rowcount
+
+                            # Check if key already exists for another item
+                            if not inserted and connection.execute(
+                                "SELECT item_id FROM keys WHERE kind = ? AND value = ?",
+                                key,
+                            ).fetchone() != (item_id,):
+                                # Raise a duplicate key error
+                                raise DuplicateKeyError(
+                                    f"An item with the key '{value}' already exists."
+                                )
+
+                    # Iterate over batch
+                    for item, item_id in batch:
+                        # Push item
+                        self._push(connection, item, item_id)
+
+            # Handle any exception raised within the transaction
+            except BaseException:
+                # Restore whether attribute columns can be pushed down
+                self._pure = pure
+
+                # Restore item classes seen
+                self._item_classes = item_classes
+
+                # Iterate over batch and original item IDs
+                for (item, _), original_id in zip(batch, original_ids):
+                    # Restore item ID
+                    item._imeta.id = original_id
+
+                # Release item IDs issued to the rejected batch
+                self._item_id = last_item_id
+
+                # Re-raise exception
+                raise
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _QUOTE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _quote(self, name: str) -> str:
+        """Returns a quoted SQL identifier"""
+
+        # Return quoted identifier
+        return '"' + name.replace('"', '""') + '"'
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _TRANSLATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _translate(
+        self, attr: str, operator: str, expected: Any
+    ) -> tuple[str, list[Any]] | None:
+        """Returns a SQL clause and parameters equivalent to a condition, if any"""
+
+        # Return None if attribute column cannot be pushed down
+        if not self._pure.get(attr):
+            return None
+
+        # Get column
+        column = self._column(attr)
+
+        # Check if case-insensitive equals against a string
+        if operator == "iequals" and isinstance(expected, str):
+            # Return clause comparing lowercase strings
+            return (
+                f"(typeof({column}) = 'text' AND py_lower({column}) = ?)",
+                [expected.lower()],
+            )
+
+        # Handle case of equals
+        if operator in ("equals", "iequals"):
+            # Return clause for None
+            if expected is None:
+                return f"{column} IS NULL", []
+
+            # Return clause for scalars
+            if self._is_pure(expected):
+                return f"{column} = ?", [expected]
+
+        # Otherwise handle case of comparisons
+        elif operator in self.COMPARISONS:
+            # Get SQLite storage classes comparable to expected in Python
+            storage = (
+                "'integer', 'real'"
+                if type(expected) in (bool, int, float)
+                else "'text'"
+                if type(expected) is str
+                else "'blob'"
+                if type(expected) is bytes
+                else None
+            )
+
+            # Return clause if expected is a pure scalar
+            if storage is not None and self._is_pure(expected):
+                return (
+                    f"(typeof({column}) IN ({storage}) "
+                    f"AND {column} {self.COMPARISONS[operator]} ?)",
+                    [expected],
+                )
+
+        # Otherwise handle case of in against a collection of scalars
+        elif (
+            operator in ("in", "iin")
+            and isinstance(expected, (list, tuple, set, frozenset))
+            and len(expected) <= self.MAX_IN
+            and all(self._is_pure(value) or type(value) is float for value in expected)
+        ):
+            # Get values, dropping NaN which is never stored in pure columns
+            values = [value for value in expected if value == value]
+
+            # Check if case-sensitive in
+            if operator == "in":
+                # Return clause matching values or None
+                return (
+                    f"({column} IN ({', '.join('?' * len(values))})"
+                    f"{f' OR {column} IS NULL' if None in values else ''})",
+                    values,
+                )
+
+            # Get lowercase strings
+            strings = [value.lower() for value in values if isinstance(value, str)]
+
+            # Get values other than strings
+            others = [value for value in values if not isinstance(value, str)]
+
+            # Return clause matching lowercase strings or other values
+            return (
+                f"((typeof({column}) = 'text' AND py_lower({column}) IN "
+                f"({', '.join('?' * len(strings))})) OR "
+                f"(typeof({column}) != 'text' AND ({column} IN "
+                f"({', '.join('?' * len(others))})"
+                f"{f' OR {column} IS NULL' if None in others else ''})))",
+                [*strings, *others],
+            )
+
+        # Return None by default
+        return None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLOSE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        """Closes the database connection"""
+
+        # Close connection
+        with self._lock:
+            self._connection.close()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COLLECT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def collect(
+        self,
+        items: Items | None = None,
+        subset: Iterable[Item] | None = None,
+        quick: bool = False,
+    ) -> Generator[Item, None, None]:
+        """Yields items in the collection"""
+
+        # Get whether collection is observed and the start time if so
+        observed = bool(self._observers)
+        started = perf_counter() if observed else 0.0
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Initialize the number of scanned items
+        scanned = [0]
+
+        # Check if collection is a subset
+        if subset is not None:
+            # Initialize collected items
+            collected: Iterable[Item] = subset
+
+            # Initialize operations
+            operations = items._operations
+
+        # Otherwise push operations down to SQLite
+        else:
+            # Plan operations
+            sql, params, residual, operations = self._plan(items._operations)
+
+            # Fetch items
+            collected = self._fetch(sql, params)
+
+            # Check if collection is observed
+            if observed:
+                # Count fetched items as they are scanned
+                collected = self._tally(collected, scanned)
+
+            # Check if there are residual conditions
+            if residual:
+                # Filter collected items
+                collected = self._filter(collected, residual)
+
+        # Apply operations to collected
+        collected = self._operate_all(collected, operations)
+
+        # Check if collection is observed
+        if observed:
+            # Yield collected items, notifying observers once they stop
+            yield from self._observe(items, collected, None, started, scanned)
+
+            # Return
+            return
+
+        # Yield collected items
+        yield from collected
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ EXPLAIN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def explain(self, items: Items | None = None) -> str:
+        """Returns a description of the plan used to collect items"""
+
+        # Initialize items
+        items = self.apply(items)
+
+        # Plan operations
+        sql, params, residual, operations = self._plan(items._operations)
+
+        # Get SQLite query plan
+        with self._lock:
+            details = [
+                row[-1]
+                for row in self._connection.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            ]
+
+        # Initialize lines
+        lines = [f"SQL {sql}"] + [f"PLAN {detail}" for detail in details]
+
+        # Check if there are residual conditions
+        if residual:
+            # Append residual conditions to lines
+            lines.append(self._describe(("filter", residual)))
+
+        # Iterate over operations
+        for operation in operations:
+            # Append operation to lines
+            lines.append(self._describe(operation))
+
+        # Return plan
+        return "\n".join(lines)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LAST
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def last(self, items: Items | None = None) -> Item | None:
+        """Returns the last item in the collection"""
+
+        # Return the only item of a tail of one
+        return next(iter(self.tail(1, items)), None)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PUSH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def push(self, item: Item) -> None:
+        """Pushes an item to the collection"""
+
+        # Push a batch of one item
+        self.push_many((item,))
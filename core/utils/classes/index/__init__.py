@@ -0,0 +1,8 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.index.index import Index  # noqa: F401
+from core.utils.classes.index.hash_index import HashIndex  # noqa: F401
+from core.utils.classes.index.sorted_list import SortedList  # noqa: F401
+from core.utils.classes.index.sorted_index import Sorted, SortedIndex  # noqa: F401
@@ -0,0 +1,350 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from typing import Any, ItemsView, TYPE_CHECKING
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.index.index import Index
+
+if TYPE_CHECKING:
+    from core.utils.classes.item.item import Item
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ HASH INDEX
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class HashIndex(Index):
+    """A utility class that represents a hash index over one or more item attributes"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize supported operators
+    OPERATORS = ("equals", "iequals", "in", "iin")
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of item IDs by value
+    _ids_by_value: dict[Any, set[int]]
+
+    # Declare type of item IDs by case-folded value
+    _ids_by_folded_value: dict[Any, set[int]] | None
+
+    # Declare type of values by item ID
+    _values_by_item_id: dict[int, Any]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, attrs: str | tuple[str, ...]) -> None:
+        """Init Method"""
+
+        # Call super method
+        super().__init__(attrs)
+
+        # Initialize item IDs by value
+        self._ids_by_value = {}
+
+        # Initialize item IDs by case-folded value (built on first use)
+        self._ids_by_folded_value = None
+
+        # Initialize values by item ID
+        self._values_by_item_id = {}
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __LEN__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        """Returns the number of item IDs in the index"""
+
+        # Return the number of indexed and unindexed item IDs
+        return len(self._values_by_item_id) + len(self._unindexed_ids)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _DISCARD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _discard(
+        self, ids_by_value: dict[Any, set[int]], value: Any, item_id: int
+    ) -> None:
+        """Discards an item ID from a value bucket"""
+
+        # Get item IDs
+        ids = ids_by_value.get(value)
+
+        # Return if there is no bucket for value
+        if ids is None:
+            return
+
+        # Discard item ID
+        ids.discard(item_id)
+
+        # Check if bucket is empty
+        if not ids:
+            # Delete bucket
+            del ids_by_value[value]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _FOLD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _fold(self, value: Any) -> Any:
+        """Returns a case-folded value for case-insensitive lookups"""
+
+        # Check if value is a string
+        if isinstance(value, str):
+            # Return lowercase value
+            return value.lower()
+
+        # Check if index is composite
+        if self.composite and isinstance(value, tuple):
+            # Return lowercase values
+            return tuple(v.lower() if isinstance(v, str) else v for v in value)
+
+        # Return value
+        return value
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET_FOLDED
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_folded(self) -> dict[Any, set[int]]:
+        """Returns item IDs by case-folded value, building them if needed"""
+
+        # Get item IDs by case-folded value
+        ids_by_folded_value = self._ids_by_folded_value
+
+        # Check if item IDs by case-folded value are not built
+        if ids_by_folded_value is None:
+            # Initialize item IDs by case-folded value
+            ids_by_folded_value = {}
+
+            # Iterate over values by item ID
+            for item_id, value in self._values_by_item_id.items():
+                # Add item ID to case-folded bucket
+                ids_by_folded_value.setdefault(self._fold(value), set()).add(item_id)
+
+            # Publish item IDs by case-folded value only once they are complete
+            self._ids_by_folded_value = ids_by_folded_value
+
+        # Return item IDs by case-folded value
+        return ids_by_folded_value
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET_LOOKUP_VALUES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_lookup_values(self, operator: str, expected: Any) -> list[Any] | None:
+        """Returns the values to look up for a condition, or None if unsupported"""
+
+        # Check if operator is an equality operator
+        if operator in ("equals", "iequals"):
+            # Initialize values
+            values = [expected]
+
+        # Otherwise check if operator is a membership operator over a collection
+        elif operator in ("in", "iin") and isinstance(
+            expected, (list, tuple, set, frozenset)
+        ):
+            # Initialize values
+            values = list(expected)
+
+        # Otherwise return None
+        else:
+            return None
+
+        # Check if operator is case-insensitive
+        if operator in ("iequals", "iin"):
+            # Case-fold values
+            values = [self._fold(value) for value in values]
+
+        # Initialize try-except block
+        try:
+            # Ensure that values are hashable
+            for value in values:
+                hash(value)
+
+        # Handle TypeError
+        except TypeError:
+            # Return None
+            return None
+
+        # Return values
+        return values
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add(self, item_id: int, item: Item) -> None:
+        """Adds an item to the index"""
+
+        # Get value
+        value = self._get_value(item)
+
+        # Initialize try-except block
+        try:
+            # Check if value is missing or not equal to itself
+            if value is self.MISSING or value != value:
+                # Raise TypeError
+                raise TypeError
+
+            # Get item IDs by value
+            ids = self._ids_by_value.setdefault(value, set())
+
+        # Handle TypeError and ValueError
+        except (TypeError, ValueError):
+            # Add item ID to unindexed item IDs
+            self._unindexed_ids.add(item_id)
+
+            # Return
+            return
+
+        # Add item ID to item IDs by value
+        ids.add(item_id)
+
+        # Add value to values by item ID
+        self._values_by_item_id[item_id] = value
+
+        # Check if item IDs by case-folded value are built
+        if self._ids_by_folded_value is not None:
+            # Add item ID to case-folded bucket
+            self._ids_by_folded_value.setdefault(self._fold(value), set()).add(item_id)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ESTIMATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def estimate(self, operator: str, expected: Any) -> int | None:
+        """Returns an estimated number of item IDs matching a condition"""
+
+        # Get lookup values
+        values = self._get_lookup_values(operator, expected)
+
+        # Return None if condition is not supported
+        if values is None:
+            return None
+
+        # Get item IDs by value
+        ids_by_value = (
+            self._get_folded() if operator in ("iequals", "iin") else self._ids_by_value
+        )
+
+        # Return the number of matching and unindexed item IDs
+        return sum(len(ids_by_value.get(value, ())) for value in values) + len(
+            self._unindexed_ids
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ GET PROBES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def get_probes(
+        self, conditions: tuple[tuple[str, str, Any], ...]
+    ) -> list[tuple[str, Any, tuple[tuple[str, str, Any], ...]]]:
+        """Returns the lookups that the index can serve and the conditions they cover"""
+
+        # Check if index is not composite
+        if not self.composite:
+            # Return probes for conditions on the indexed attribute
+            return super().get_probes(conditions)
+
+        # Get equality conditions by attribute
+        equalities = {
+            condition[0]: condition
+            for condition in conditions
+            if condition[1] in ("equals", "iequals")
+        }
+
+        # Return no probes if any indexed attribute lacks an equality condition
+        if any(attr not in equalities for attr in self.attrs):
+            return []
+
+        # Get covered conditions
+        covered = tuple(equalities[attr] for attr in self.attrs)
+
+        # Get operators
+        operators = {condition[1] for condition in covered}
+
+        # Return no probes if equality operators are mixed
+        if len(operators) != 1:
+            return []
+
+        # Return composite probe
+        return [
+            (operators.pop(), tuple(condition[2] for condition in covered), covered)
+        ]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ GROUPS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def groups(self) -> ItemsView[Any, set[int]]:
+        """Returns the indexed values and their item IDs"""
+
+        # Return item IDs by value
+        return self._ids_by_value.items()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LOOKUP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def lookup(self, operator: str, expected: Any) -> set[int]:
+        """Returns the item IDs matching a condition"""
+
+        # Get lookup values
+        values = self._get_lookup_values(operator, expected) or []
+
+        # Get item IDs by value
+        ids_by_value = (
+            self._get_folded() if operator in ("iequals", "iin") else self._ids_by_value
+        )
+
+        # Initialize item IDs with unindexed item IDs
+        ids = set(self._unindexed_ids)
+
+        # Iterate over values
+        for value in values:
+            # Add matching item IDs
+            ids.update(ids_by_value.get(value, ()))
+
+        # Return item IDs
+        return ids
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ REMOVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def remove(self, item_id: int) -> None:
+        """Removes an item from the index"""
+
+        # Discard item ID from unindexed item IDs
+        self._unindexed_ids.discard(item_id)
+
+        # Pop value
+        value = self._values_by_item_id.pop(item_id, self.MISSING)
+
+        # Return if item ID was not indexed
+        if value is self.MISSING:
+            return
+
+        # Discard item ID from item IDs by value
+        self._discard(self._ids_by_value, value, item_id)
+
+        # Check if item IDs by case-folded value are built
+        if self._ids_by_folded_value is not None:
+            # Discard item ID from item IDs by case-folded value
+            self._discard(self._ids_by_folded_value, self._fold(value), item_id)
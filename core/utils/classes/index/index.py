@@ -0,0 +1,178 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from core.utils.classes.item.item import Item
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ INDEX
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Index(ABC):
+    """An abstract class that represents a secondary index over a collection of items"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize missing sentinel
+    MISSING = object()
+
+    # Initialize supported operators
+    OPERATORS: tuple[str, ...] = ()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of attributes
+    attrs: tuple[str, ...]
+
+    # Declare type of composite
+    composite: bool
+
+    # Declare type of unindexed item IDs
+    _unindexed_ids: set[int]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, attrs: str | tuple[str, ...]) -> None:
+        """Init Method"""
+
+        # Set composite
+        self.composite = isinstance(attrs, tuple)
+
+        # Set attributes
+        self.attrs = attrs if isinstance(attrs, tuple) else (attrs,)
+
+        # Initialize unindexed item IDs
+        self._unindexed_ids = set()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __LEN__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Returns the number of item IDs in the index"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REPR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __repr__(self) -> str:
+        """Representation Method"""
+
+        # Get attributes
+        attrs = self.attrs if self.composite else self.attrs[0]
+
+        # Return representation
+        return f"{self.__class__.__name__}({attrs!r})"
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET_VALUE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_value(self, item: Item) -> Any:
+        """Returns the indexed value of an item"""
+
+        # Initialize missing
+        missing = self.MISSING
+
+        # Check if index is not composite
+        if not self.composite:
+            # Return value
+            return getattr(item, self.attrs[0], missing)
+
+        # Get values
+        values = tuple(getattr(item, attr, missing) for attr in self.attrs)
+
+        # Return values or missing if any value is missing
+        return missing if any(value is missing for value in values) else values
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @abstractmethod
+    def add(self, item_id: int, item: Item) -> None:
+        """Adds an item to the index"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ESTIMATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @abstractmethod
+    def estimate(self, operator: str, expected: Any) -> int | None:
+        """Returns an estimated number of item IDs matching a condition"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ EXACT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @property
+    def exact(self) -> bool:
+        """Returns whether lookups match conditions without a residual check"""
+
+        # Return whether all item IDs are indexed
+        return not self._unindexed_ids
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ GET PROBES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def get_probes(
+        self, conditions: tuple[tuple[str, str, Any], ...]
+    ) -> list[tuple[str, Any, tuple[tuple[str, str, Any], ...]]]:
+        """Returns the lookups that the index can serve and the conditions they cover"""
+
+        # Return no probes for composite indexes
+        if self.composite:
+            return []
+
+        # Get attribute
+        attr = self.attrs[0]
+
+        # Return probes for conditions on the indexed attribute
+        return [
+            (condition[1], condition[2], (condition,))
+            for condition in conditions
+            if condition[0] == attr and condition[1] in self.OPERATORS
+        ]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LOOKUP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @abstractmethod
+    def lookup(self, operator: str, expected: Any) -> Iterable[int]:
+        """Returns the item IDs matching a condition"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ REMOVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @abstractmethod
+    def remove(self, item_id: int) -> None:
+        """Removes an item from the index"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ UNINDEXED IDS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @property
+    def unindexed_ids(self) -> set[int]:
+        """Returns the IDs of items whose values the index cannot serve"""
+
+        # Return unindexed item IDs
+        return self._unindexed_ids
@@ -0,0 +1,467 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from numbers import Real
+from typing import Any, Iterator, TYPE_CHECKING
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.index.index import Index
+from core.utils.classes.index.sorted_list import SortedList
+
+if TYPE_CHECKING:
+    from core.utils.classes.item.item import Item
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SORTED
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Sorted:
+    """A utility class that declares a sorted index over an item attribute"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of attribute
+    attr: str
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, attr: str) -> None:
+        """Init Method"""
+
+        # Set attribute
+        self.attr = attr
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __EQ__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __eq__(self, other: object) -> bool:
+        """Equality Method"""
+
+        # Return whether other declares the same sorted index
+        return isinstance(other, Sorted) and other.attr == self.attr
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __HASH__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __hash__(self) -> int:
+        """Hash Method"""
+
+        # Return the hash of the declaration
+        return hash((Sorted, self.attr))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REPR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __repr__(self) -> str:
+        """Representation Method"""
+
+        # Return representation
+        return f"{self.__class__.__name__}({self.attr!r})"
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SORTED INDEX
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class SortedIndex(Index):
+    """A utility class that represents a sorted index over an item attribute"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize supported operators
+    OPERATORS = ("equals", "lt", "lte", "gt", "gte")
+
+    # Initialize item IDs that sort before and after any other with an equal value
+    FIRST, LAST = float("-inf"), float("inf")
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of sorted values and item IDs by family
+    _partitions: dict[Any, SortedList]
+
+    # Declare type of families and values by item ID
+    _entries_by_item_id: dict[int, tuple[Any, Any]]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, attrs: str) -> None:
+        """Init Method"""
+
+        # Call super method
+        super().__init__(attrs)
+
+        # Initialize sorted values and item IDs by family
+        self._partitions = {}
+
+        # Initialize families and values by item ID
+        self._entries_by_item_id = {}
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __LEN__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        """Returns the number of item IDs in the index"""
+
+        # Return the number of indexed and unindexed item IDs
+        return len(self._entries_by_item_id) + len(self._unindexed_ids)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET_FAMILY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_family(self, value: Any) -> Any:
+        """Returns the family of mutually comparable values that a value belongs to"""
+
+        # Return None if value is not equal to itself
+        if self._is_nan(value):
+            return None
+
+        # Check if value is a real number or decimal
+        if isinstance(value, (Real, Decimal)):
+            return "number"
+
+        # Check if value is a string
+        if isinstance(value, str):
+            return "str"
+
+        # Check if value is bytes
+        if isinstance(value, bytes):
+            return "bytes"
+
+        # Check if value is a datetime, distinguishing naive from aware
+        if isinstance(value, datetime):
+            return ("datetime", value.utcoffset() is None)
+
+        # Check if value is a date
+        if isinstance(value, date):
+            return "date"
+
+        # Check if value is a time, distinguishing naive from aware
+        if isinstance(value, time):
+            return ("time", value.utcoffset() is None)
+
+        # Check if value is a timedelta
+        if isinstance(value, timedelta):
+            return "timedelta"
+
+        # Return None by default
+        return None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET_SPAN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_span(
+        self, bounds: tuple[tuple[str, Any], ...]
+    ) -> tuple[SortedList | None, int, int] | None:
+        """Returns the partition and the span of positions satisfying bounds"""
+
+        # Initialize family
+        family = None
+
+        # Iterate over bounds
+        for _, expected in bounds:
+            # Get expected family
+            expected_family = self._get_family(expected)
+
+            # Check if expected value does not belong to a known family
+            if expected_family is None:
+                # Return an empty span if no indexed value can compare to it
+                if expected is None or self._is_nan(expected):
+                    return None, 0, 0
+
+                # Otherwise return None
+                return None
+
+            # Return an empty span if bounds belong to different families
+            if family is not None and expected_family != family:
+                return None, 0, 0
+
+            # Set family
+            family = expected_family
+
+        # Get partition
+        partition = self._partitions.get(family)
+
+        # Return an empty span if there is no partition for family
+        if partition is None:
+            return None, 0, 0
+
+        # Initialize span
+        lo, hi = 0, len(partition)
+
+        # Iterate over bounds
+        for operator, expected in bounds:
+            # Get the positions before and after values equal to expected
+            first = (expected, self.FIRST)
+            last = (expected, self.LAST)
+
+            # Handle case of equals
+            if operator == "equals":
+                lo = max(lo, partition.bisect_left(first))
+                hi = min(hi, partition.bisect_right(last))
+
+            # Otherwise handle case of less than
+            elif operator == "lt":
+                hi = min(hi, partition.bisect_left(first))
+
+            # Otherwise handle case of less than or equal to
+            elif operator == "lte":
+                hi = min(hi, partition.bisect_right(last))
+
+            # Otherwise handle case of greater than
+            elif operator == "gt":
+                lo = max(lo, partition.bisect_right(last))
+
+            # Otherwise handle case of greater than or equal to
+            elif operator == "gte":
+                lo = max(lo, partition.bisect_left(first))
+
+        # Return partition and span
+        return partition, lo, max(lo, hi)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _IS_NAN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _is_nan(self, value: Any) -> bool:
+        """Returns whether a value is not equal to itself, such as NaN"""
+
+        # Initialize try-except block
+        try:
+            # Return whether value is not equal to itself
+            return bool(value != value)
+
+        # Handle any exception raised by the comparison
+        except Exception:
+            return True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _ITERATE_RUNS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _iterate_runs(
+        self, partition: SortedList, descending: bool
+    ) -> Iterator[list[int]]:
+        """Yields runs of item IDs with equal values in ascending or descending order"""
+
+        # Initialize run and its value
+        run: list[int] = []
+        previous: Any = None
+
+        # Iterate over values and item IDs in order
+        for value, item_id in partition.iterate(descending=descending):
+            # Check if value ends the run
+            if run and value != previous:
+                # Yield run, ordering item IDs ascending in either direction
+                yield run[::-1] if descending else run
+
+                # Initialize the next run
+                run = []
+
+            # Append item ID to run
+            run.append(item_id)
+
+            # Set the value of the run
+            previous = value
+
+        # Yield the last run
+        if run:
+            yield run[::-1] if descending else run
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add(self, item_id: int, item: Item) -> None:
+        """Adds an item to the index"""
+
+        # Get value
+        value = self._get_value(item)
+
+        # Get family
+        family = None if value is self.MISSING else self._get_family(value)
+
+        # Check if value does not belong to a known family
+        if family is None:
+            # Add item ID to unindexed item IDs
+            self._unindexed_ids.add(item_id)
+
+            # Return
+            return
+
+        # Get partition
+        partition = self._partitions.get(family)
+
+        # Check if partition is new
+        if partition is None:
+            # Initialize partition
+            partition = self._partitions[family] = SortedList()
+
+        # Add value and item ID, ordering equal values by item ID
+        partition.add((value, item_id))
+
+        # Add entry to entries by item ID
+        self._entries_by_item_id[item_id] = (family, value)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COMPARABLE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @property
+    def comparable(self) -> bool:
+        """Returns whether indexed values belong to at most one family"""
+
+        # Return whether there is at most one partition
+        return len(self._partitions) <= 1
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ESTIMATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def estimate(self, operator: str, expected: Any) -> int | None:
+        """Returns an estimated number of item IDs matching a condition"""
+
+        # Get span
+        span = self._get_span(
+            expected if operator == "range" else ((operator, expected),)
+        )
+
+        # Return None if condition is not supported
+        if span is None:
+            return None
+
+        # Unpack span
+        _, lo, hi = span
+
+        # Return the number of matching and unindexed item IDs
+        return hi - lo + len(self._unindexed_ids)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ GET PROBES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def get_probes(
+        self, conditions: tuple[tuple[str, str, Any], ...]
+    ) -> list[tuple[str, Any, tuple[tuple[str, str, Any], ...]]]:
+        """Returns the lookups that the index can serve and the conditions they cover"""
+
+        # Get probes for conditions on the indexed attribute
+        probes = super().get_probes(conditions)
+
+        # Get range probes
+        ranges = [probe for probe in probes if probe[0] != "equals"]
+
+        # Return equality probes followed by a single merged range probe
+        return [probe for probe in probes if probe[0] == "equals"] + (
+            [
+                (
+                    "range",
+                    tuple((operator, expected) for operator, expected, _ in ranges),
+                    tuple(probe[2][0] for probe in ranges),
+                )
+            ]
+            if ranges
+            else []
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LOOKUP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def lookup(self, operator: str, expected: Any) -> set[int]:
+        """Returns the item IDs matching a condition"""
+
+        # Initialize item IDs with unindexed item IDs
+        item_ids = set(self._unindexed_ids)
+
+        # Get span
+        span = self._get_span(
+            expected if operator == "range" else ((operator, expected),)
+        )
+
+        # Check if condition is supported
+        if span is not None:
+            # Unpack span
+            partition, lo, hi = span
+
+            # Add item IDs within span
+            if partition is not None:
+                item_ids.update(item_id for _, item_id in partition.iterate(lo, hi))
+
+        # Return item IDs
+        return item_ids
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ REMOVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def remove(self, item_id: int) -> None:
+        """Removes an item from the index"""
+
+        # Discard item ID from unindexed item IDs
+        self._unindexed_ids.discard(item_id)
+
+        # Pop entry
+        entry = self._entries_by_item_id.pop(item_id, None)
+
+        # Return if item ID was not indexed
+        if entry is None:
+            return
+
+        # Unpack entry
+        family, value = entry
+
+        # Get partition
+        partition = self._partitions[family]
+
+        # Remove value and item ID
+        partition.remove((value, item_id))
+
+        # Check if partition is empty
+        if not partition:
+            # Delete partition
+            del self._partitions[family]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ RUNS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def runs(self, descending: bool = False) -> Iterator[list[int]]:
+        """Returns runs of item IDs with equal values in order, if comparable"""
+
+        # Check if indexed values are not mutually comparable
+        if not self.comparable:
+            # Raise TypeError
+            raise TypeError(f"Values of {self!r} are not mutually comparable.")
+
+        # Get the only partition
+        partition = next(iter(self._partitions.values()), SortedList())
+
+        # Return runs
+        return self._iterate_runs(partition, descending)
@@ -0,0 +1,222 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from typing import Any, Iterator
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SORTED LIST
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class SortedList:
+    """A utility class that represents a list kept sorted in blocks of bounded size"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize the size at which a block is split, bounding the cost of an insert
+    BLOCK_SIZE = 1000
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of sorted blocks
+    _blocks: list[list[Any]]
+
+    # Declare type of the largest key of each block
+    _maxes: list[Any]
+
+    # Declare type of size
+    _size: int
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self) -> None:
+        """Init Method"""
+
+        # Initialize sorted blocks
+        self._blocks = []
+
+        # Initialize the largest key of each block
+        self._maxes = []
+
+        # Initialize size
+        self._size = 0
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __LEN__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        """Returns the number of keys in the list"""
+
+        # Return size
+        return self._size
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET OFFSET
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _get_offset(self, block: int) -> int:
+        """Returns the position of the first key of a block"""
+
+        # Return the number of keys in preceding blocks
+        return sum(map(len, islice(self._blocks, block)))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add(self, key: Any) -> None:
+        """Adds a key to the list, keeping it sorted"""
+
+        # Increment size
+        self._size += 1
+
+        # Check if there are no blocks
+        if not self._blocks:
+            # Initialize a block with key
+            self._blocks.append([key])
+            self._maxes.append(key)
+
+            # Return
+            return
+
+        # Get the first block whose largest key is not smaller, or the last block
+        i = min(bisect_left(self._maxes, key), len(self._maxes) - 1)
+
+        # Get block
+        block = self._blocks[i]
+
+        # Insert key into block
+        insort(block, key)
+
+        # Check if block is full
+        if len(block) > self.BLOCK_SIZE:
+            # Move the upper half of block to a new block
+            half = len(block) // 2
+            self._blocks.insert(i + 1, block[half:])
+            self._maxes.insert(i + 1, block[-1])
+            del block[half:]
+
+        # Update the largest key of block
+        self._maxes[i] = block[-1]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ BISECT LEFT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def bisect_left(self, key: Any) -> int:
+        """Returns the position of the first key that is not smaller than a key"""
+
+        # Get the first block whose largest key is not smaller
+        i = bisect_left(self._maxes, key)
+
+        # Return size if every key is smaller
+        if i == len(self._maxes):
+            return self._size
+
+        # Return position within list
+        return self._get_offset(i) + bisect_left(self._blocks[i], key)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ BISECT RIGHT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def bisect_right(self, key: Any) -> int:
+        """Returns the position of the first key that is larger than a key"""
+
+        # Get the first block whose largest key is larger
+        i = bisect_right(self._maxes, key)
+
+        # Return size if no key is larger
+        if i == len(self._maxes):
+            return self._size
+
+        # Return position within list
+        return self._get_offset(i) + bisect_right(self._blocks[i], key)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ITERATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def iterate(
+        self, lo: int = 0, hi: int | None = None, descending: bool = False
+    ) -> Iterator[Any]:
+        """Yields the keys between two positions in ascending or descending order"""
+
+        # Initialize upper position
+        hi = self._size if hi is None else hi
+
+        # Initialize blocks and bounds that overlap positions
+        spans = []
+
+        # Initialize the position of the first key of the next block
+        start = 0
+
+        # Iterate over blocks
+        for block in self._blocks:
+            # Get the position after the last key of block
+            end = start + len(block)
+
+            # Check if block overlaps positions
+            if start < hi and end > lo:
+                # Append block and bounds within it
+                spans.append((block, max(lo - start, 0), min(hi, end) - start))
+
+            # Move to the next block
+            start = end
+
+        # Check if descending
+        if descending:
+            # Iterate over spans from the end
+            for block, a, b in reversed(spans):
+                # Yield keys from the end
+                yield from (block[k] for k in range(b - 1, a - 1, -1))
+
+            # Return
+            return
+
+        # Iterate over spans
+        for block, a, b in spans:
+            # Yield keys
+            yield from islice(block, a, b)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ REMOVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def remove(self, key: Any) -> None:
+        """Removes a key from the list"""
+
+        # Get the first block whose largest key is not smaller
+        i = bisect_left(self._maxes, key)
+
+        # Get block
+        block = self._blocks[i]
+
+        # Delete key from block
+        del block[bisect_left(block, key)]
+
+        # Decrement size
+        self._size -= 1
+
+        # Check if block is empty
+        if not block:
+            # Delete block
+            del self._blocks[i]
+            del self._maxes[i]
+
+        # Otherwise update the largest key of block
+        else:
+            self._maxes[i] = block[-1]
@@ -0,0 +1,127 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GROUPS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Groups:
+    """A utility class that represents Item instances grouped by an attribute"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of items
+    _items: Items
+
+    # Declare type of grouping attribute
+    _attr: str
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, items: Items, attr: str) -> None:
+        """Init Method"""
+
+        # Set items
+        self._items = items
+
+        # Set grouping attribute
+        self._attr = attr
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REPR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __repr__(self) -> str:
+        """Representation Method"""
+
+        # Return representation
+        return f"<{self.__class__.__name__}: {self._attr!r}>"
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _REDUCE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _reduce(self, function: str, attr: str | None) -> dict[Any, Any]:
+        """Returns a single aggregate of each group by grouping value"""
+
+        # Return aggregate by grouping value
+        return {
+            value: results[function]
+            for value, results in self.aggregate(**{function: attr}).items()
+        }
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ AGGREGATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def aggregate(self, **aggregates: str | None) -> dict[Any, dict[str, Any]]:
+        """Returns aggregates of each group by grouping value"""
+
+        # Return aggregates by grouping value
+        return self._items._collection.group(
+            attr=self._attr, aggregates=aggregates, items=self._items
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COUNT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def count(self) -> dict[Any, int]:
+        """Returns the number of items in each group"""
+
+        # Return count by grouping value
+        return self._reduce("count", None)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MAX
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def max(self, attr: str) -> dict[Any, Any]:
+        """Returns the largest value of an attribute in each group"""
+
+        # Return maximum by grouping value
+        return self._reduce("max", attr)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MEAN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def mean(self, attr: str) -> dict[Any, Any]:
+        """Returns the mean value of an attribute in each group"""
+
+        # Return mean by grouping value
+        return self._reduce("mean", attr)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ MIN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def min(self, attr: str) -> dict[Any, Any]:
+        """Returns the smallest value of an attribute in each group"""
+
+        # Return minimum by grouping value
+        return self._reduce("min", attr)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SUM
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def sum(self, attr: str) -> dict[Any, Any]:
+        """Returns the sum of an attribute in each group"""
+
+        # Return sum by grouping value
+        return self._reduce("sum", attr)
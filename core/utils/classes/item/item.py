@@ -5,15 +5,17 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable, ClassVar, get_origin
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ PROJECT IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
 from core.utils.classes.collection.collection import Collection
+from core.utils.classes.index import Sorted
 from core.utils.classes.item.items import Items
 from core.utils.exceptions import UndefinedError
+from core.utils.functions.state import set_state
 
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
@@ -51,11 +53,26 @@ class ItemMetaclass(type):
     def __call__(cls, *args: Any, **kwargs: Any) -> Item:
         """Call Method"""
 
-        # Create instance
-        instance: Item = super().__call__(*args, **kwargs)
+        # Get default values of slotted attributes
+        defaults = cls._cmeta.slot_defaults
+
+        # Check if there are default values of slotted attributes
+        if defaults:
+            # Create instance with the new method of the class rather than the metaclass
+            instance: Item = getattr(cls, "__new__")(cls)
+
+            # Set default values before initializing, as a class attribute would
+            set_state(instance, defaults)
+
+            # Initialize instance
+            instance.__init__(*args, **kwargs)  # type: ignore[misc]
+
+        # Otherwise create and initialize instance
+        else:
+            instance = super().__call__(*args, **kwargs)
 
         # Initialize meta
-        instance._imeta = cls.InstanceMeta()
+        instance._imeta = cls.InstanceMeta()  # type: ignore[misc]
 
         # Return instance
         return instance
@@ -84,6 +101,117 @@ class ItemMetaclass(type):
         # Initialize meta
         cls._cmeta = Meta()
 
+        # Set the names of slots declared by the class and its bases
+        cls._cmeta.slot_names = tuple(
+            name
+            for klass in reversed(cls.__mro__)
+            for name in ItemMetaclass._get_slots(klass)
+            if name not in ("__dict__", "__weakref__")
+        )
+
+        # Set default values of slotted attributes declared by the class and its bases
+        cls._cmeta.slot_defaults = {
+            **{
+                name: value
+                for base in reversed(bases)
+                if isinstance(base, ItemMetaclass)
+                for name, value in base._cmeta.slot_defaults.items()
+            },
+            **(
+                {
+                    name: attrs[name]
+                    for name in cls.__dict__["__slots__"]
+                    if name in attrs
+                }
+                if Meta.SLOTS and "__slots__" in cls.__dict__
+                else {}
+            ),
+        }
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __NEW__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __new__(
+        mcs, name: str, bases: tuple[type, ...], attrs: dict[str, Any]
+    ) -> ItemMetaclass:
+        """New Method"""
+
+        # Get Meta, which may be inherited
+        Meta = attrs.get("Meta") or next(
+            (base.Meta for base in bases if hasattr(base, "Meta")), None
+        )
+
+        # Check if Meta declares slotted attributes and slots are not defined
+        if (
+            Meta is not None
+            and getattr(Meta, "SLOTS", False)
+            and "__slots__" not in attrs
+        ):
+            # Get the names of slots defined by bases
+            existing = {
+                slot
+                for base in bases
+                for klass in base.__mro__
+                for slot in ItemMetaclass._get_slots(klass)
+            }
+
+            # Get annotated attribute names, excluding class variables and metas
+            names = [
+                attr
+                for attr, annotation in attrs.get("__annotations__", {}).items()
+                if not ItemMetaclass._is_class_var(annotation)
+                and attr not in ("_cmeta", "_imeta")
+            ]
+
+            # Generate slots, moving default values out of the class namespace
+            attrs = {
+                **{attr: value for attr, value in attrs.items() if attr not in names},
+                "__slots__": tuple(
+                    attr for attr in ("_imeta", *names) if attr not in existing
+                ),
+            }
+
+        # Create and return class
+        return super().__new__(mcs, name, bases, attrs)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET SLOTS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _get_slots(klass: type) -> tuple[str, ...]:
+        """Returns the names of slots defined by a class itself"""
+
+        # Get slots
+        slots = klass.__dict__.get("__slots__", ())
+
+        # Return slots as a tuple, as a single slot may be defined as a string
+        return (slots,) if isinstance(slots, str) else tuple(slots)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _IS CLASS VAR
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _is_class_var(annotation: Any) -> bool:
+        """Returns whether an annotation declares a class variable"""
+
+        # Check if annotation is a string, as with postponed evaluation
+        if isinstance(annotation, str):
+            # Get annotation without surrounding whitespace
+            annotation = annotation.strip()
+
+            # Check if annotation is a bare ClassVar
+            if annotation in ("ClassVar", "typing.ClassVar"):
+                return True
+
+            # Return whether annotation is a subscripted ClassVar
+            return annotation.startswith(("ClassVar[", "typing.ClassVar["))
+
+        # Return whether annotation is a bare or subscripted ClassVar
+        return annotation is ClassVar or get_origin(annotation) is ClassVar
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ ITEMS
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -104,6 +232,13 @@ class ItemMetaclass(type):
 class Item(metaclass=ItemMetaclass):
     """A utility class that represents an arbitrary Python object"""
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize slots, so that subclasses in slotted mode have no instance dictionary
+    __slots__ = ()
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ INSTANCE ATTRIBUTES
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -194,7 +329,19 @@ class Item(metaclass=ItemMetaclass):
         KEYS: tuple[str | tuple[str, ...], ...] = ()
 
         # Initialize indexes
-        INDEXES: tuple[str | tuple[str, ...], ...] = ()
+        INDEXES: tuple[str | tuple[str, ...] | Sorted, ...] = ()
+
+        # Initialize copy policy, deferring to the collection if None
+        COPY: str | Callable[[Any], Any] | None = None
+
+        # Initialize read policy, deferring to the collection if None
+        READ: str | None = None
+
+        # Initialize whether annotated attributes are stored in slots, not a dictionary
+        SLOTS: bool = False
+
+        # Initialize clock policy of timestamps, deferring to the collection if None
+        CLOCK: str | Callable[[], Any] | None = None
 
         # ┌─────────────────────────────────────────────────────────────────────────────
         # │ INSTANCE ATTRIBUTES
@@ -203,6 +350,12 @@ class Item(metaclass=ItemMetaclass):
         # Declare type of _items
         _items: Items | None = None
 
+        # Declare type of the names of slots declared by the item class and its bases
+        slot_names: tuple[str, ...] = ()
+
+        # Declare type of default values of slotted attributes
+        slot_defaults: dict[str, Any] = {}
+
         # ┌─────────────────────────────────────────────────────────────────────────────
         # │ __INIT__
         # └─────────────────────────────────────────────────────────────────────────────
@@ -243,6 +396,13 @@ class Item(metaclass=ItemMetaclass):
     class InstanceMeta:
         """Instance Meta Class"""
 
+        # ┌─────────────────────────────────────────────────────────────────────────────
+        # │ CLASS ATTRIBUTES
+        # └─────────────────────────────────────────────────────────────────────────────
+
+        # Initialize slots
+        __slots__ = ("id", "pushed_at", "pulled_at")
+
         # ┌─────────────────────────────────────────────────────────────────────────────
         # │ INSTANCE ATTRIBUTES
         # └─────────────────────────────────────────────────────────────────────────────
@@ -250,11 +410,11 @@ class Item(metaclass=ItemMetaclass):
         # Declare type of ID
         id: str | None
 
-        # Declare type of pushed at
-        pushed_at: datetime | None
+        # Declare type of pushed at, a datetime unless a clock returns otherwise
+        pushed_at: datetime | float | None
 
-        # Declare type of pulled at
-        pulled_at: datetime | None
+        # Declare type of pulled at, a datetime unless a clock returns otherwise
+        pulled_at: datetime | float | None
 
         # ┌─────────────────────────────────────────────────────────────────────────────
         # │ __INIT__
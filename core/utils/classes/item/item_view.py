@@ -0,0 +1,294 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import copy
+
+from typing import Any, TYPE_CHECKING
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.item.nested_view import NESTED_VIEW_CLASSES, NestedView
+from core.utils.exceptions import ReadOnlyError
+from core.utils.functions.state import get_slot_state, get_state, set_state
+
+if TYPE_CHECKING:
+    from core.utils.classes.item.item import Item
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ ITEM VIEW
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class ItemView:
+    """A mixin class for lightweight views that share the state of a stored item"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize slots
+    __slots__ = ()
+
+    # Initialize slots of generated view classes
+    VIEW_SLOTS: tuple[str, ...] = ("_imeta",)
+
+    # Initialize view classes by mixin and item class
+    _view_classes: dict[tuple[type, type], type] = {}
+
+    # Declare type of item class
+    _item_class: type[Item]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GETATTRIBUTE__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __getattribute__(self, name: str) -> Any:
+        """Get Attribute Method"""
+
+        # Get value
+        value = object.__getattribute__(self, name)
+
+        # Return value if it is private or not a list, dict or set
+        if name[0] == "_" or type(value) not in NESTED_VIEW_CLASSES:
+            return value
+
+        # Return value wrapped in a view, so that nested writes are also intercepted
+        return NestedView.of(self, (name,), value)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REDUCE_EX__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __reduce_ex__(self, protocol: Any) -> tuple[Any, ...]:
+        """Reduce Method"""
+
+        # Get instance meta
+        imeta = self._imeta  # type: ignore[attr-defined]
+
+        # Get the state of the instance dictionary, if any
+        state = getattr(self, "__dict__", None)
+
+        # Check if the item class stores its instance meta in a slot
+        if "_imeta" in self._item_class._cmeta.slot_names:
+            # Reduce to an instance of the item class with dictionary and slot state
+            return (
+                self._item_class.__new__,
+                (self._item_class,),
+                (state, {**get_slot_state(self), "_imeta": imeta}),
+            )
+
+        # Reduce to an instance of the item class so copies are not views
+        return (
+            self._item_class.__new__,
+            (self._item_class,),
+            {**(state or {}), "_imeta": imeta},
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _GET VIEW CLASS
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def _get_view_class(cls, item_class: type[Item]) -> type:
+        """Returns the view class of an item class, generating it if needed"""
+
+        # Get view class
+        view_class = cls._view_classes.get((cls, item_class))
+
+        # Check if view class is not generated
+        if view_class is None:
+            # Generate view class
+            view_class = type(
+                item_class.__name__,
+                (cls, item_class),
+                {
+                    "__slots__": cls.VIEW_SLOTS,
+                    "__module__": item_class.__module__,
+                    "__qualname__": item_class.__qualname__,
+                    "_item_class": item_class,
+                },
+            )
+
+            # Share the class meta of the item class
+            view_class._cmeta = item_class._cmeta  # type: ignore[attr-defined]
+
+            # Cache view class
+            cls._view_classes[(cls, item_class)] = view_class
+
+        # Return view class
+        return view_class
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ OF
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def of(cls, item: Item) -> Item:
+        """Returns a view of an item"""
+
+        # Initialize view
+        view: Any = object.__new__(cls._get_view_class(item.__class__))
+
+        # Check if item has an instance dictionary
+        if hasattr(item, "__dict__"):
+            # Share the state of the item
+            object.__setattr__(view, "__dict__", item.__dict__)
+
+        # Check if item has slotted attributes
+        if item._cmeta.slot_names:
+            # Share the values of slotted attributes
+            set_state(view, get_slot_state(item))
+
+        # Give the view its own instance meta
+        object.__setattr__(view, "_imeta", copy.copy(item._imeta))
+
+        # Return view
+        return view
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COPY ON WRITE ITEM VIEW
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class CopyOnWriteItemView(ItemView):
+    """A view that takes a private copy of the item state on its first write"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize slots
+    __slots__ = ()
+
+    # Initialize slots of generated view classes
+    VIEW_SLOTS = ("_imeta", "_view_detached")
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __DELATTR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __delattr__(self, name: str) -> None:
+        """Delete Attribute Method"""
+
+        # Detach view
+        self._detach()
+
+        # Call super method
+        super().__delattr__(name)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __SETATTR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set Attribute Method"""
+
+        # Detach view
+        self._detach()
+
+        # Check if value is a nested view, such as after an augmented assignment
+        if isinstance(value, NestedView):
+            # Unwrap value, copying it if it is nested in another item view
+            value = (
+                value._resolve()
+                if value._view_item is self
+                else copy.deepcopy(value._resolve())
+            )
+
+        # Call super method
+        super().__setattr__(name, value)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _DETACH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _detach(self) -> None:
+        """Replaces the shared item state with a private deep copy"""
+
+        # Return if view is already detached
+        if getattr(self, "_view_detached", False):
+            return
+
+        # Copy the shared state, excluding the stored instance meta
+        state = copy.deepcopy(get_state(self))
+
+        # Check if item class has no slotted attributes
+        if not self._cmeta.slot_names:  # type: ignore[attr-defined]
+            # Set private state
+            object.__setattr__(self, "__dict__", state)
+
+        # Otherwise set private dictionary and slot state
+        else:
+            # Check if view has an instance dictionary
+            if hasattr(self, "__dict__"):
+                # Replace the shared dictionary with a private one
+                object.__setattr__(self, "__dict__", {})
+
+            # Set private state
+            set_state(self, state)
+
+        # Mark view as detached
+        object.__setattr__(self, "_view_detached", True)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _WRITE NESTED
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _write_nested(self, path: tuple[Any, ...]) -> None:
+        """Prepares the view for a write to a nested value by detaching it"""
+
+        # Detach view
+        self._detach()
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ READ ONLY ITEM VIEW
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class ReadOnlyItemView(ItemView):
+    """A view that raises on any attribute write"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize slots
+    __slots__ = ()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __DELATTR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __delattr__(self, name: str) -> None:
+        """Delete Attribute Method"""
+
+        # Raise ReadOnlyError
+        raise ReadOnlyError(f"Cannot delete '{name}' of a read-only item view.")
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __SETATTR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set Attribute Method"""
+
+        # Raise ReadOnlyError
+        raise ReadOnlyError(f"Cannot set '{name}' of a read-only item view.")
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _WRITE NESTED
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _write_nested(self, path: tuple[Any, ...]) -> None:
+        """Raises on any write to a nested value"""
+
+        # Raise ReadOnlyError
+        raise ReadOnlyError(f"Cannot modify '{path[0]}' of a read-only item view.")
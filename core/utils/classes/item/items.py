@@ -4,13 +4,17 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterator, TYPE_CHECKING
+import asyncio
+
+from itertools import islice
+from typing import Any, AsyncIterator, Iterable, Iterator, TYPE_CHECKING
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ PROJECT IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
-from core.utils.functions.datetime import utc_now
+from core.utils.classes.item.groups import Groups
+from core.utils.functions.order import parse_order
 
 if TYPE_CHECKING:
     from core.utils.classes.collection.collection import Collection
@@ -48,6 +52,16 @@ class Items:
         # Set operations
         self._operations = operations
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __AITER__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __aiter__(self) -> AsyncIterator[Item]:
+        """Async Iter Method"""
+
+        # Return an async iterator of items in batches
+        return self.aiterate()
+
     # ┌────────────────────────────────────────────────────────────────────────────────
     # │ __ITER__
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -104,16 +118,11 @@ class Items:
     def _collect(self, quick: bool = False) -> Iterator[Item]:
         """Returns an iterator of items"""
 
-        # Get pulled at
-        pulled_at = utc_now()
+        # Get collection
+        collection = self._collection
 
-        # Iterate over collection
-        for item in self._collection.collect(items=self, quick=quick):
-            # Set pulled at
-            item._imeta.pulled_at = pulled_at
-
-            # Yield item
-            yield item
+        # Yield collected items with a pulled at timestamp per item class
+        yield from collection._stamp(collection.collect(items=self, quick=quick))
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ _COPY
@@ -125,6 +134,89 @@ class Items:
         # Initialize and return a copy of the current collection
         return Items(collection=self._collection, operations=self._operations)
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ACOUNT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    async def acount(self) -> int:
+        """Returns a count of items in the collection without blocking the loop"""
+
+        # Return the number of items in the collection
+        return await self._collection.acount(items=self)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ AFIRST
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    async def afirst(self) -> Item | None:
+        """Returns the first item in the collection without blocking the loop"""
+
+        # Return the first item in the collection
+        return await self._collection.afirst(items=self)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ AGGREGATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def aggregate(self, **aggregates: str | None) -> dict[str, Any]:
+        """Returns aggregates of attributes by function name"""
+
+        # Return aggregates
+        return self._collection.aggregate(aggregates=aggregates, items=self)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ AITERATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def aiterate(self, batch_size: int = 1000) -> AsyncIterator[Item]:
+        """Returns an async iterator of items that yields control between batches"""
+
+        # Return an async iterator of items
+        return self._collection.aiterate(batch_size=batch_size, items=self)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ AKEY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    async def akey(self, key: Any) -> Item:
+        """Returns an item by key lookup without blocking the loop"""
+
+        # Return item
+        return await self._collection.akey(key=key, items=self)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ APUSH MANY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    async def apush_many(self, items: Iterable[Item], batch_size: int = 1000) -> None:
+        """Pushes items to the collection in batches without blocking the loop"""
+
+        # Check if collection blocks on I/O
+        if self._collection._blocking:
+            # Push items atomically in an executor
+            await self._collection._run_async(self.push_many, list(items))
+
+            # Return
+            return
+
+        # Get an iterator of items
+        iterator = iter(items)
+
+        # Iterate until there are no items left
+        while True:
+            # Get batch
+            batch = list(islice(iterator, batch_size))
+
+            # Return if there are no items left
+            if not batch:
+                return
+
+            # Push batch atomically
+            self.push_many(batch)
+
+            # Hand control back to the loop
+            await asyncio.sleep(0)
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ COUNT
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -135,6 +227,16 @@ class Items:
         # Return the number of items in the collection
         return self._collection.count(items=self)
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ EXPLAIN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def explain(self) -> str:
+        """Returns a description of the plan used to collect items"""
+
+        # Return the plan of the collection
+        return self._collection.explain(items=self)
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ FILTER
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -176,9 +278,8 @@ class Items:
                 # Remove operator suffix from key
                 key = key.removesuffix(f"__{operator}")
 
-                # Append condition to conditions and break
+                # Append condition to conditions
                 conditions.append((key, operators[operator], value))
-                break
 
             # Otherwise set default operator
             else:
@@ -198,6 +299,16 @@ class Items:
         # Return the first item in the collection
         return self._collection.first(items=self)
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ GROUP BY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def group_by(self, attr: str) -> Groups:
+        """Returns items grouped by the value of an attribute"""
+
+        # Initialize and return groups
+        return Groups(items=self, attr=attr)
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ HEAD
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -228,6 +339,40 @@ class Items:
         # Return the last item in the collection
         return self._collection.last(items=self)
 
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ORDER BY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def order_by(self, *attrs: str) -> Items:
+        """Returns items ordered by attributes, descending if prefixed with -"""
+
+        # Initialize and return ordered items
+        return self._collection.order_by(parse_order(attrs), items=self)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PAGE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def page(
+        self, size: int = 10, after: str | None = None
+    ) -> tuple[list[Item], str | None]:
+        """Returns a page of items after a cursor and the cursor of the next page"""
+
+        # Return page and cursor
+        return self._collection.page(size=size, after=after, items=self)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PARALLEL
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def parallel(self, workers: int | None = None, threshold: int = 10_000) -> Items:
+        """Returns items whose subsequent filters and callables run in a process pool"""
+
+        # Initialize and return items in parallel execution mode
+        return self._collection.parallel(
+            workers=workers, threshold=threshold, items=self
+        )
+
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ PUSH
     # └─────────────────────────────────────────────────────────────────────────────────
@@ -238,8 +383,50 @@ class Items:
         # Push item to collection
         self._collection.push(item=item)
 
-        # Update pushed at timestamp
-        item._imeta.pushed_at = utc_now()
+        # Get clock
+        clock = self._collection._get_clock(item.__class__)
+
+        # Check if timestamps are enabled
+        if clock is not None:
+            # Update pushed at timestamp
+            item._imeta.pushed_at = clock()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PUSH MANY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def push_many(self, items: Iterable[Item]) -> None:
+        """Pushes a batch of items to the collection atomically"""
+
+        # Convert items to a list
+        batch = list(items)
+
+        # Push batch to collection
+        self._collection.push_many(batch)
+
+        # Initialize pushed at timestamps by item class, read once per batch
+        pushed_at_by_class: dict[type, Any] = {}
+
+        # Iterate over batch
+        for item in batch:
+            # Get item class
+            item_class = item.__class__
+
+            # Check if item class has no pushed at timestamp yet
+            if item_class not in pushed_at_by_class:
+                # Get clock
+                clock = self._collection._get_clock(item_class)
+
+                # Set pushed at timestamp of item class, or None if disabled
+                pushed_at_by_class[item_class] = clock() if clock is not None else None
+
+            # Get pushed at
+            pushed_at = pushed_at_by_class[item_class]
+
+            # Check if timestamps are enabled
+            if pushed_at is not None:
+                # Update pushed at timestamp
+                item._imeta.pushed_at = pushed_at
 
     # ┌─────────────────────────────────────────────────────────────────────────────────
     # │ SLICE
@@ -0,0 +1,421 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import copy
+
+from collections.abc import MutableMapping, MutableSequence, MutableSet
+from typing import Any, Iterable, Iterator
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ NESTED VIEW
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class NestedView:
+    """A base class for views of lists, dicts and sets nested in an item view"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize slots
+    __slots__ = ("_view_item", "_view_path")
+
+    # Initialize hash, as nested values are mutable
+    __hash__ = None  # type: ignore[assignment]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of the item view that holds the nested value
+    _view_item: Any
+
+    # Declare type of the attribute name and keys that lead to the nested value
+    _view_path: tuple[Any, ...]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, item: Any, path: tuple[Any, ...]) -> None:
+        """Init Method"""
+
+        # Set item view
+        self._view_item = item
+
+        # Set path
+        self._view_path = path
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __CONTAINS__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __contains__(self, value: Any) -> bool:
+        """Contains Method"""
+
+        # Return whether nested value contains value
+        return value in self._resolve()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __COPY__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __copy__(self) -> Any:
+        """Copy Method"""
+
+        # Return a private deep copy
+        return self.copy()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __DEEPCOPY__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Any:
+        """Deep Copy Method"""
+
+        # Return a deep copy of the nested value
+        return copy.deepcopy(self._resolve(), memo)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __EQ__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __eq__(self, other: object) -> bool:
+        """Equality Method"""
+
+        # Return whether nested values are equal
+        return bool(
+            self._resolve()
+            == (other._resolve() if isinstance(other, NestedView) else other)
+        )
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __LEN__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        """Returns the length of the nested value"""
+
+        # Return length
+        return len(self._resolve())
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __NE__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __ne__(self, other: object) -> bool:
+        """Inequality Method"""
+
+        # Return whether nested values are not equal
+        return not self == other
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REDUCE_EX__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __reduce_ex__(self, protocol: Any) -> tuple[Any, ...]:
+        """Reduce Method"""
+
+        # Reduce to a copy of the nested value, so that pickles are not views
+        return copy.deepcopy, (self._resolve(),)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __REPR__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __repr__(self) -> str:
+        """Representation Method"""
+
+        # Return the representation of the nested value
+        return repr(self._resolve())
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _RESOLVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _resolve(self) -> Any:
+        """Returns the nested value, following the path from the current item state"""
+
+        # Get attribute value
+        value = object.__getattribute__(self._view_item, self._view_path[0])
+
+        # Iterate over keys
+        for key in self._view_path[1:]:
+            # Get nested value
+            value = value[key]
+
+        # Return nested value
+        return value
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _WRAP
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _wrap(self, key: Any, value: Any) -> Any:
+        """Returns a value nested under a key, wrapped in a view if it is mutable"""
+
+        # Return value, wrapped in a view if it is mutable
+        return NestedView.of(self._view_item, (*self._view_path, key), value)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _WRITE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _write(self) -> Any:
+        """Returns the nested value once the item view allows it to be written"""
+
+        # Prepare item view for a nested write, which detaches or raises
+        self._view_item._write_nested(self._view_path)
+
+        # Return the nested value, which may now be a private copy
+        return self._resolve()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COPY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def copy(self) -> Any:
+        """Returns a private deep copy of the nested value"""
+
+        # Return a deep copy, as a shallow one would share values with the item
+        return copy.deepcopy(self._resolve())
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ OF
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def of(item: Any, path: tuple[Any, ...], value: Any) -> Any:
+        """Returns a value of an item view, wrapped in a view if it is mutable"""
+
+        # Get nested view class
+        view_class = NESTED_VIEW_CLASSES.get(type(value))
+
+        # Return value, wrapped in a view if it is a list, dict or set
+        return value if view_class is None else view_class(item, path)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ NESTED DICT VIEW
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class NestedDictView(NestedView, MutableMapping):
+    """A view of a dict nested in the state of an item view"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize slots
+    __slots__ = ()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __DELITEM__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __delitem__(self, key: Any) -> None:
+        """Delete Item Method"""
+
+        # Delete key
+        del self._write()[key]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GETITEM__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __getitem__(self, key: Any) -> Any:
+        """Get Item Method"""
+
+        # Return value, wrapped in a view if it is mutable
+        return self._wrap(key, self._resolve()[key])
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __ITER__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate Method"""
+
+        # Iterate over keys
+        return iter(self._resolve())
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __SETITEM__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        """Set Item Method"""
+
+        # Set value
+        self._write()[key] = value
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ NESTED LIST VIEW
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class NestedListView(NestedView, MutableSequence):
+    """A view of a list nested in the state of an item view"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize slots
+    __slots__ = ()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __ADD__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __add__(self, other: Any) -> Any:
+        """Addition Method"""
+
+        # Return a private copy of the nested list concatenated with other
+        return copy.deepcopy(self._resolve()) + list(other)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __DELITEM__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __delitem__(self, index: Any) -> None:
+        """Delete Item Method"""
+
+        # Delete index
+        del self._write()[index]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __GETITEM__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __getitem__(self, index: Any) -> Any:
+        """Get Item Method"""
+
+        # Get nested list
+        values = self._resolve()
+
+        # Return a private copy of a slice, whose values are otherwise shared
+        if isinstance(index, slice):
+            return copy.deepcopy(values[index])
+
+        # Get value
+        value = values[index]
+
+        # Return value, wrapped in a view under its non-negative index
+        return self._wrap(index % len(values) if index < 0 else index, value)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __ITER__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate Method"""
+
+        # Iterate over values, wrapped in views if they are mutable
+        return (self._wrap(i, value) for i, value in enumerate(self._resolve()))
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __SETITEM__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        """Set Item Method"""
+
+        # Set value
+        self._write()[index] = value
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSERT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def insert(self, index: int, value: Any) -> None:
+        """Inserts a value before an index"""
+
+        # Insert value
+        self._write().insert(index, value)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SORT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        """Sorts the nested list in place"""
+
+        # Sort nested list
+        self._write().sort(*args, **kwargs)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ NESTED SET VIEW
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class NestedSetView(NestedView, MutableSet):
+    """A view of a set nested in the state of an item view"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize slots
+    __slots__ = ()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __ITER__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate Method"""
+
+        # Iterate over values, which are hashable and so not wrapped
+        return iter(self._resolve())
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _FROM ITERABLE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def _from_iterable(cls, values: Iterable[Any]) -> set[Any]:
+        """Returns a plain set of values, as results of set operations are not views"""
+
+        # Return set
+        return set(values)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ADD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def add(self, value: Any) -> None:
+        """Adds a value to the nested set"""
+
+        # Add value
+        self._write().add(value)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ DISCARD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def discard(self, value: Any) -> None:
+        """Discards a value from the nested set"""
+
+        # Discard value
+        self._write().discard(value)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ NESTED VIEW CLASSES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize nested view classes by the type of value that they wrap
+NESTED_VIEW_CLASSES: dict[type, type[NestedView]] = {
+    dict: NestedDictView,
+    list: NestedListView,
+    set: NestedSetView,
+}
@@ -0,0 +1,167 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import threading
+
+from contextlib import contextmanager
+from typing import Generator
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ READ WRITE LOCK
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class ReadWriteLock:
+    """A utility class that represents a writer-preferring reader-writer lock"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of condition
+    _condition: threading.Condition
+
+    # Declare type of the number of active readers
+    _readers: int
+
+    # Declare type of the number of waiting writers
+    _waiting: int
+
+    # Declare type of whether a writer is active
+    _writing: bool
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self) -> None:
+        """Init Method"""
+
+        # Initialize condition
+        self._condition = threading.Condition(threading.Lock())
+
+        # Initialize the number of active readers
+        self._readers = 0
+
+        # Initialize the number of waiting writers
+        self._waiting = 0
+
+        # Initialize whether a writer is active
+        self._writing = False
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ACQUIRE READ
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def acquire_read(self) -> None:
+        """Acquires the lock for reading, sharing it with other readers"""
+
+        # Acquire condition
+        with self._condition:
+            # Wait while a writer is active or waiting so that writers are not starved
+            while self._writing or self._waiting:
+                self._condition.wait()
+
+            # Increment the number of active readers
+            self._readers += 1
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ACQUIRE WRITE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def acquire_write(self) -> None:
+        """Acquires the lock for writing, excluding readers and other writers"""
+
+        # Acquire condition
+        with self._condition:
+            # Increment the number of waiting writers
+            self._waiting += 1
+
+            # Initialize try-finally block
+            try:
+                # Wait while a writer or any readers are active
+                while self._writing or self._readers:
+                    self._condition.wait()
+
+            # Decrement the number of waiting writers
+            finally:
+                self._waiting -= 1
+
+            # Set writer active
+            self._writing = True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ READ
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @contextmanager
+    def read(self) -> Generator[None, None, None]:
+        """Holds the lock for reading within a context"""
+
+        # Acquire lock for reading
+        self.acquire_read()
+
+        # Initialize try-finally block
+        try:
+            # Yield to context
+            yield
+
+        # Release lock for reading
+        finally:
+            self.release_read()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ RELEASE READ
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def release_read(self) -> None:
+        """Releases the lock for reading"""
+
+        # Acquire condition
+        with self._condition:
+            # Decrement the number of active readers
+            self._readers -= 1
+
+            # Check if this was the last active reader
+            if not self._readers:
+                # Wake waiting writers
+                self._condition.notify_all()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ RELEASE WRITE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def release_write(self) -> None:
+        """Releases the lock for writing"""
+
+        # Acquire condition
+        with self._condition:
+            # Set writer inactive
+            self._writing = False
+
+            # Wake waiting readers and writers
+            self._condition.notify_all()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ WRITE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @contextmanager
+    def write(self) -> Generator[None, None, None]:
+        """Holds the lock for writing within a context"""
+
+        # Acquire lock for writing
+        self.acquire_write()
+
+        # Initialize try-finally block
+        try:
+            # Yield to context
+            yield
+
+        # Release lock for writing
+        finally:
+            self.release_write()
@@ -0,0 +1,354 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import os
+import struct
+import threading
+
+from typing import Any, BinaryIO
+from zlib import crc32
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.functions.snapshot import dumps, loads, sync_directory
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ WRITE AHEAD LOG
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class WriteAheadLog:
+    """A utility class that represents an append-only log of length-prefixed records"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLASS ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Initialize the header of a log, with a magic number and a generation
+    HEADER = struct.Struct("<8sQ")
+
+    # Initialize the header of a record, with its length and checksum
+    FRAME = struct.Struct("<II")
+
+    # Initialize magic number
+    MAGIC = b"COREWAL1"
+
+    # Initialize the number of seconds between syncs of the batch policy
+    SYNC_INTERVAL = 0.01
+
+    # Initialize sync policies
+    SYNCS = ("always", "batch", "none")
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ INSTANCE ATTRIBUTES
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    # Declare type of path
+    path: str
+
+    # Declare type of generation
+    generation: int
+
+    # Declare type of sync policy
+    sync: str
+
+    # Declare type of file
+    _file: BinaryIO
+
+    # Declare type of size
+    _size: int
+
+    # Declare type of whether records were appended since the last sync
+    _dirty: bool
+
+    # Declare type of lock
+    _lock: threading.Lock
+
+    # Declare type of closed event
+    _closed: threading.Event
+
+    # Declare type of sync thread
+    _thread: threading.Thread | None
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, path: str, generation: int = 1, sync: str = "batch") -> None:
+        """Init Method"""
+
+        # Check if sync policy is invalid
+        if sync not in self.SYNCS:
+            # Raise ValueError
+            raise ValueError(
+                f"Invalid sync policy {sync!r}, expected one of "
+                f"{', '.join(repr(key) for key in self.SYNCS)}."
+            )
+
+        # Set path
+        self.path = path
+
+        # Set sync policy
+        self.sync = sync
+
+        # Initialize lock
+        self._lock = threading.Lock()
+
+        # Initialize closed event
+        self._closed = threading.Event()
+
+        # Initialize whether records were appended since the last sync
+        self._dirty = False
+
+        # Open file, creating it if it does not exist, without buffering
+        self._file = open(path, "a+b", buffering=0)
+
+        # Get the generation and valid size of an existing log
+        existing, size = self._scan(self._file)
+
+        # Check if log is empty or its header is torn
+        if existing is None:
+            # Truncate file
+            self._file.truncate(0)
+
+            # Write header
+            self._file.write(self.HEADER.pack(self.MAGIC, generation))
+
+            # Set generation and size
+            self.generation, self._size = generation, self.HEADER.size
+
+            # Sync file and directory so that the header and the log are durable
+            os.fsync(self._file.fileno())
+            sync_directory(path)
+
+        # Otherwise keep existing records
+        else:
+            # Discard a record torn by a crash, if any
+            self._file.truncate(size)
+
+            # Set generation and size
+            self.generation, self._size = existing, size
+
+        # Initialize sync thread if syncs are batched
+        self._thread = (
+            threading.Thread(target=self._run, daemon=True) if sync == "batch" else None
+        )
+
+        # Check if there is a sync thread
+        if self._thread is not None:
+            # Start sync thread
+            self._thread.start()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _RUN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def _run(self) -> None:
+        """Syncs appended records at an interval until the log is closed"""
+
+        # Iterate until log is closed
+        while not self._closed.wait(self.SYNC_INTERVAL):
+            # Sync appended records, committing every append of the interval at once
+            self.flush()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ _SCAN
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def _scan(
+        cls, file: BinaryIO, records: list[Any] | None = None
+    ) -> tuple[int | None, int]:
+        """Returns the generation and valid size of a log, appending its records"""
+
+        # Seek start of file
+        file.seek(0)
+
+        # Read header
+        header = file.read(cls.HEADER.size)
+
+        # Return no generation if header is torn or not a log header
+        if len(header) < cls.HEADER.size or header[:8] != cls.MAGIC:
+            return None, 0
+
+        # Get generation
+        generation = cls.HEADER.unpack(header)[1]
+
+        # Initialize size
+        size = cls.HEADER.size
+
+        # Iterate over records
+        while True:
+            # Read record header
+            frame = file.read(cls.FRAME.size)
+
+            # Break if record header is torn
+            if len(frame) < cls.FRAME.size:
+                break
+
+            # Unpack length and checksum
+            length, checksum = cls.FRAME.unpack(frame)
+
+            # Read record
+            data = file.read(length)
+
+            # Break if record is torn or corrupt
+            if len(data) < length or crc32(data) != checksum:
+                break
+
+            # Check if records are collected
+            if records is not None:
+                # Append record
+                records.append(loads(data))
+
+            # Increment size
+            size += cls.FRAME.size + length
+
+        # Return generation and valid size
+        return generation, size
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ APPEND
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def append(self, record: Any) -> None:
+        """Appends a record to the log"""
+
+        # Pickle record
+        data = dumps(record)
+
+        # Acquire lock
+        with self._lock:
+            # Write record header and record in one call
+            self._file.write(self.FRAME.pack(len(data), crc32(data)) + data)
+
+            # Increment size
+            self._size += self.FRAME.size + len(data)
+
+            # Check if every append is synced
+            if self.sync == "always":
+                # Sync file
+                os.fsync(self._file.fileno())
+
+            # Otherwise note that the file is not synced
+            else:
+                self._dirty = True
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ CLOSE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        """Syncs and closes the log"""
+
+        # Stop sync thread
+        self._closed.set()
+        if self._thread is not None:
+            self._thread.join()
+
+        # Sync appended records
+        self.flush()
+
+        # Close file
+        with self._lock:
+            self._file.close()
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ FLUSH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def flush(self) -> None:
+        """Syncs records appended since the last sync to disk"""
+
+        # Acquire lock
+        with self._lock:
+            # Return if there is nothing to sync or the file is closed
+            if not self._dirty or self._file.closed:
+                return
+
+            # Sync file
+            os.fsync(self._file.fileno())
+
+            # Note that the file is synced
+            self._dirty = False
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ READ
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @classmethod
+    def read(cls, path: str) -> tuple[int | None, list[Any]]:
+        """Returns the generation and records of a log file, stopping at a torn one"""
+
+        # Initialize records
+        records: list[Any] = []
+
+        # Return no generation if there is no log file
+        if not os.path.exists(path):
+            return None, records
+
+        # Open file
+        with open(path, "rb") as file:
+            # Scan records
+            generation, _ = cls._scan(file, records)
+
+        # Return generation and records
+        return generation, records
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ ROTATE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def rotate(self) -> str:
+        """Moves the log aside under its generation, starting the next generation"""
+
+        # Acquire lock
+        with self._lock:
+            # Sync and close file
+            os.fsync(self._file.fileno())
+            self._file.close()
+
+            # Get the path of the rotated log
+            rotated = f"{self.path}.{self.generation}"
+
+            # Move log aside
+            os.replace(self.path, rotated)
+
+            # Sync directory, so that the move survives a crash
+            sync_directory(self.path)
+
+            # Increment generation
+            self.generation += 1
+
+            # Open a new file
+            self._file = open(self.path, "a+b", buffering=0)
+
+            # Write header
+            self._file.write(self.HEADER.pack(self.MAGIC, self.generation))
+
+            # Sync file and directory so that the new log is durable
+            os.fsync(self._file.fileno())
+            sync_directory(self.path)
+
+            # Reset size and whether records were appended since the last sync
+            self._size, self._dirty = self.HEADER.size, False
+
+        # Return the path of the rotated log
+        return rotated
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SIZE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    @property
+    def size(self) -> int:
+        """Returns the size of the log in bytes"""
+
+        # Return size
+        return self._size
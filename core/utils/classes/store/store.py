@@ -11,6 +11,7 @@ from abc import ABC, abstractmethod
 from core.utils.classes.collection.collection import Collection
 from core.utils.classes.collection.dict_collection import DictCollection
 from core.utils.exceptions import DoesNotExistError
+from core.utils.functions.snapshot import read_snapshot, write_snapshot
 
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
@@ -109,3 +110,49 @@ class Store(ABC):
         except DoesNotExistError:
             # Create collection
             return self.create(key=key, CollectionClass=CollectionClass)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ LOAD
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def load(self, path: str) -> None:
+        """Replaces the collections of the store with those of a snapshot file"""
+
+        # Initialize collections by key
+        collections_by_key: dict[str, Collection] = {}
+
+        # Iterate over collection classes and snapshot bytes by key
+        for key, (CollectionClass, data) in read_snapshot(path, "Store").items():
+            # Get existing collection
+            collection = self._collections_by_key.get(key)
+
+            # Check if there is no existing collection of the same class
+            if collection is None or collection.__class__ is not CollectionClass:
+                # Initialize collection
+                collection = CollectionClass()
+
+            # Restore collection, keeping the configuration of an existing one
+            collection._restore(data)
+
+            # Set collection
+            collections_by_key[key] = collection
+
+        # Set collections by key
+        self._collections_by_key = collections_by_key
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ SAVE
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def save(self, path: str) -> None:
+        """Writes the collections of the store to a snapshot file"""
+
+        # Write snapshot of collection classes and snapshot bytes by key
+        write_snapshot(
+            path,
+            "Store",
+            {
+                key: (collection.__class__, collection._dump())
+                for key, collection in self._collections_by_key.items()
+            },
+        )
@@ -37,6 +37,15 @@ class DuplicateKeyError(Error):
     """Raised when a duplicate key is found"""
 
 
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ READ ONLY ERROR
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class ReadOnlyError(Error):
+    """Raised when a read-only resource is modified"""
+
+
 # ┌─────────────────────────────────────────────────────────────────────────────────────
 # │ UNDEFINED ERROR
 # └─────────────────────────────────────────────────────────────────────────────────────
@@ -0,0 +1,303 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import copy
+
+from operator import attrgetter
+from typing import Any, Callable, Iterable
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ AGGREGATE ITEMS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def aggregate_items(
+    items: Iterable[Any], aggregates: dict[str, str | None]
+) -> dict[str, Any]:
+    """Returns the aggregates of items by function name, folded in a single pass"""
+
+    # Get running states
+    states = get_states(aggregates)
+
+    # Iterate over items
+    for item in items:
+        # Fold item into running states
+        fold_item(states, item)
+
+    # Return aggregates of running states
+    return get_results(states, aggregates)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ AGGREGATE VALUES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def aggregate_values(
+    size: int, values_by_attr: dict[str, list[Any]], aggregates: dict[str, str | None]
+) -> dict[str, Any]:
+    """Returns the aggregates of the attribute values of a number of items"""
+
+    # Initialize values that are not None by attribute
+    present_by_attr: dict[str, list[Any]] = {}
+
+    # Initialize results
+    results = {}
+
+    # Iterate over aggregates
+    for function, attr in aggregates.items():
+        # Check if aggregate is a count of items rather than of values
+        if attr is None:
+            # Set result
+            results[function] = size
+
+            # Continue
+            continue
+
+        # Get values that are not None
+        present = present_by_attr.get(attr)
+
+        # Check if values that are not None are not gathered
+        if present is None:
+            # Gather values, ignoring None as SQL aggregates ignore NULL
+            present = present_by_attr[attr] = [
+                value for value in values_by_attr[attr] if value is not None
+            ]
+
+        # Set result, copied so that stored values are never shared with callers
+        results[function] = copy.deepcopy(AGGREGATORS[function](present))
+
+    # Return results
+    return results
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ FOLD ITEM
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def fold_item(states: dict[str | None, dict[str, Any]], item: Any) -> None:
+    """Folds the attribute values of an item into running aggregate states"""
+
+    # Iterate over running states by attribute
+    for attr, state in states.items():
+        # Check if state counts items rather than values
+        if attr is None:
+            # Increment count
+            state["count"] += 1
+
+            # Continue
+            continue
+
+        # Get value
+        value = state["get"](item)
+
+        # Continue if value is None, as SQL aggregates ignore NULL
+        if value is None:
+            continue
+
+        # Increment count
+        state["count"] += 1
+
+        # Check if a sum is kept
+        if "sum" in state:
+            # Increment sum
+            state["sum"] += value
+
+        # Check if a minimum is kept and value is the first or a smaller one
+        if "min" in state and (state["count"] == 1 or value < state["min"]):
+            # Set minimum
+            state["min"] = value
+
+        # Check if a maximum is kept and value is the first or a larger one
+        if "max" in state and (state["count"] == 1 or value > state["max"]):
+            # Set maximum
+            state["max"] = value
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET RESULTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_results(
+    states: dict[str | None, dict[str, Any]], aggregates: dict[str, str | None]
+) -> dict[str, Any]:
+    """Returns the aggregates of running states by function name"""
+
+    # Initialize results
+    results = {}
+
+    # Iterate over aggregates
+    for function, attr in aggregates.items():
+        # Get running state
+        state = states[attr]
+
+        # Get count
+        count = state["count"]
+
+        # Get result, where mean is derived from the sum and count of values
+        result = (
+            count
+            if function == "count"
+            else (state["sum"] / count if count else None)
+            if function == "mean"
+            else state.get(function)
+        )
+
+        # Set result, copied so that stored values are never shared with callers
+        results[function] = copy.deepcopy(result)
+
+    # Return results
+    return results
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET STATES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_states(aggregates: dict[str, str | None]) -> dict[str | None, dict[str, Any]]:
+    """Returns empty running states by attribute, keeping only what is aggregated"""
+
+    # Initialize running states, with a count of items under None
+    states: dict[str | None, dict[str, Any]] = {None: {"count": 0}}
+
+    # Iterate over aggregates
+    for function, attr in aggregates.items():
+        # Get running state, with a getter of values unless items are counted
+        state = states.setdefault(
+            attr,
+            {"count": 0} if attr is None else {"count": 0, "get": attrgetter(attr)},
+        )
+
+        # Check if function needs a sum
+        if function in ("sum", "mean"):
+            # Initialize sum
+            state["sum"] = 0
+
+        # Otherwise check if function needs a minimum or maximum
+        elif function in ("min", "max"):
+            # Initialize minimum or maximum
+            state[function] = None
+
+    # Return running states
+    return states
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GROUP ITEMS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def group_items(
+    items: Iterable[Any], attr: str, aggregates: dict[str, str | None]
+) -> dict[Any, dict[str, Any]]:
+    """Returns the aggregates of items grouped by an attribute, in a single pass"""
+
+    # Initialize getter of grouping values
+    get = attrgetter(attr)
+
+    # Initialize running states by grouping value
+    states_by_value: dict[Any, dict[str | None, dict[str, Any]]] = {}
+
+    # Iterate over items
+    for item in items:
+        # Get grouping value
+        value = get(item)
+
+        # Get running states
+        states = states_by_value.get(value)
+
+        # Check if group is new
+        if states is None:
+            # Initialize running states
+            states = states_by_value[value] = get_states(aggregates)
+
+        # Fold item into running states
+        fold_item(states, item)
+
+    # Return aggregates by grouping value
+    return {
+        value: get_results(states, aggregates)
+        for value, states in states_by_value.items()
+    }
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MAXIMUM
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def maximum(values: list[Any]) -> Any:
+    """Returns the largest value, or None if there are no values"""
+
+    # Return largest value
+    return max(values, default=None)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MEAN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def mean(values: list[Any]) -> Any:
+    """Returns the arithmetic mean of values, or None if there are no values"""
+
+    # Return arithmetic mean
+    return sum(values) / len(values) if values else None
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MINIMUM
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def minimum(values: list[Any]) -> Any:
+    """Returns the smallest value, or None if there are no values"""
+
+    # Return smallest value
+    return min(values, default=None)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ VALIDATE AGGREGATES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def validate_aggregates(aggregates: dict[str, str | None]) -> dict[str, str | None]:
+    """Returns aggregates if their function names and attributes are valid"""
+
+    # Iterate over aggregates
+    for function, attr in aggregates.items():
+        # Check if function is not defined
+        if function not in AGGREGATORS:
+            # Raise ValueError
+            raise ValueError(
+                f"Invalid aggregate function {function!r}, expected one of "
+                f"{', '.join(repr(key) for key in AGGREGATORS)}."
+            )
+
+        # Check if function other than count lacks an attribute
+        if attr is None and function != "count":
+            # Raise ValueError
+            raise ValueError(f"Aggregate function {function!r} needs an attribute.")
+
+    # Return aggregates
+    return aggregates
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ AGGREGATORS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize aggregate functions by name
+AGGREGATORS: dict[str, Callable[[list[Any]], Any]] = {
+    "count": len,
+    "sum": sum,
+    "min": minimum,
+    "max": maximum,
+    "mean": mean,
+}
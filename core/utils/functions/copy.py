@@ -0,0 +1,91 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import copy
+import pickle
+
+from typing import Any, Callable
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET COPIER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_copier(policy: str | Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """Returns the copy function of a copy policy"""
+
+    # Check if policy is a custom copier
+    if callable(policy):
+        # Return policy
+        return policy
+
+    # Check if policy is defined
+    if policy in COPIERS:
+        # Return copier
+        return COPIERS[policy]
+
+    # Raise ValueError
+    raise ValueError(
+        f"Invalid copy policy {policy!r}, expected one of "
+        f"{', '.join(repr(key) for key in COPIERS)} or a callable."
+    )
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ NO COPY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def no_copy(item: Any) -> Any:
+    """Returns an item as is, trusting callers not to mutate it"""
+
+    # Return item
+    return item
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PICKLE COPY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def pickle_copy(item: Any) -> Any:
+    """Returns a deep copy of an item by way of a pickle round trip"""
+
+    # Return unpickled item
+    return pickle.loads(pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SHALLOW COPY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def shallow_copy(item: Any) -> Any:
+    """Returns a shallow copy of an item with its own instance meta"""
+
+    # Initialize copied item
+    copied = copy.copy(item)
+
+    # Check if item has an instance meta
+    if hasattr(item, "_imeta"):
+        # Copy instance meta so that timestamps are not shared
+        copied._imeta = copy.copy(item._imeta)
+
+    # Return copied item
+    return copied
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COPIERS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize copiers by policy
+COPIERS: dict[str, Callable[[Any], Any]] = {
+    "deep": copy.deepcopy,
+    "shallow": shallow_copy,
+    "pickle": pickle_copy,
+    "none": no_copy,
+    "trusted": no_copy,
+}
@@ -2,9 +2,60 @@
 # │ GENERAL IMPORTS
 # └─────────────────────────────────────────────────────────────────────────────────────
 
-import pytz
+from datetime import datetime, timezone
+from time import monotonic
+from typing import Any, Callable
 
-from datetime import datetime
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COARSE UTC NOW
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def coarse_utc_now() -> datetime:
+    """Returns the current datetime in UTC, refreshed at most once per resolution"""
+
+    # Get cached monotonic time and datetime
+    cached_at, now = _coarse
+
+    # Get monotonic time
+    current = monotonic()
+
+    # Check if cached datetime is older than the resolution
+    if now is None or current - cached_at >= COARSE_RESOLUTION:
+        # Get now in UTC
+        now = utc_now()
+
+        # Cache monotonic time and datetime, replacing both at once
+        _coarse[:] = (current, now)
+
+    # Return now in UTC
+    return now
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET CLOCK
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_clock(policy: str | Callable[[], Any]) -> Callable[[], Any] | None:
+    """Returns the clock function of a clock policy, or None if timestamps are off"""
+
+    # Check if policy is a custom clock
+    if callable(policy):
+        # Return policy
+        return policy
+
+    # Check if policy is defined
+    if policy in CLOCKS:
+        # Return clock
+        return CLOCKS[policy]
+
+    # Raise ValueError
+    raise ValueError(
+        f"Invalid clock policy {policy!r}, expected one of "
+        f"{', '.join(repr(key) for key in CLOCKS)} or a callable."
+    )
 
 
 # ┌─────────────────────────────────────────────────────────────────────────────────────
@@ -16,4 +67,23 @@ def utc_now() -> datetime:
     """Returns the current datetime in the UTC timezone"""
 
     # Return now in UTC
-    return datetime.now(pytz.timezone("UTC"))
+    return datetime.now(timezone.utc)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CLOCKS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize clocks by policy, where None disables timestamps
+CLOCKS: dict[str, Callable[[], Any] | None] = {
+    "utc": utc_now,
+    "coarse": coarse_utc_now,
+    "monotonic": monotonic,
+    "none": None,
+}
+
+# Initialize the number of seconds for which the coarse clock reuses a datetime
+COARSE_RESOLUTION = 0.01
+
+# Initialize the monotonic time and datetime cached by the coarse clock
+_coarse: list[Any] = [0.0, None]
@@ -0,0 +1,106 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from functools import cmp_to_key
+from operator import attrgetter
+from typing import Any, Callable
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COMPILE ORDER KEY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def compile_order_key(
+    keys: tuple[tuple[str, bool], ...]
+) -> tuple[Callable[[Any], Any], bool]:
+    """Returns a sort key of items and whether to reverse it, ordering None last"""
+
+    # Get attribute getters
+    getters = [attrgetter(attr) for attr, _ in keys]
+
+    # Get directions
+    directions = [descending for _, descending in keys]
+
+    # Get whether every attribute is descending, so that the whole sort is reversed
+    reverse = all(directions)
+
+    # Check if there is a single attribute
+    if len(getters) == 1:
+        # Get getter
+        get = getters[0]
+
+        # Return a key that orders None after every other value
+        return lambda item: ((value := get(item)) is None, value), reverse
+
+    # Define a key that orders None after every other value of each attribute
+    def key(item: Any) -> tuple[tuple[bool, Any], ...]:
+        """Returns the sort key of an item"""
+
+        # Return the sort key of each attribute
+        return tuple(((value := get(item)) is None, value) for get in getters)
+
+    # Return key if every attribute is sorted in the same direction
+    if reverse or not any(directions):
+        return key, reverse
+
+    # Define comparison of keys whose attributes are sorted in mixed directions
+    def compare(a: tuple[Any, ...], b: tuple[Any, ...]) -> int:
+        """Returns the order of two sort keys"""
+
+        # Iterate over the sort keys of each attribute
+        for x, y, descending in zip(a, b, directions):
+            # Continue if values are equal
+            if x == y:
+                continue
+
+            # Return the order of values in the direction of the attribute
+            return (1 if x < y else -1) if descending else (-1 if x < y else 1)
+
+        # Return equal
+        return 0
+
+    # Get wrapper of comparable keys
+    wrap = cmp_to_key(compare)
+
+    # Return a key that compares attributes in mixed directions
+    return lambda item: wrap(key(item)), False
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PARSE ORDER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def parse_order(attrs: tuple[str, ...]) -> tuple[tuple[str, bool], ...]:
+    """Returns attributes and whether each is descending, from names like -score"""
+
+    # Initialize keys
+    keys = []
+
+    # Iterate over attributes
+    for attr in attrs:
+        # Get whether attribute is descending
+        descending = attr.startswith("-")
+
+        # Remove direction prefix
+        name = attr[1:] if descending else attr
+
+        # Check if name is empty
+        if not name:
+            # Raise ValueError
+            raise ValueError(
+                f"Invalid order {attr!r}, expected an attribute name or -name."
+            )
+
+        # Append key
+        keys.append((name, descending))
+
+    # Check if there are no keys
+    if not keys:
+        # Raise ValueError
+        raise ValueError("Invalid order (), expected at least one attribute.")
+
+    # Return keys
+    return tuple(keys)
@@ -0,0 +1,170 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import pickle
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Iterable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.functions.predicate import compile_conditions
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ APPLY CHUNK
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def apply_chunk(stages: tuple[Any, ...], chunk: list[Any]) -> list[tuple[int, Any]]:
+    """Returns the results of stages on a chunk, by position for chunk items"""
+
+    # Get positions by identity, which stays unique while the chunk is referenced
+    positions = {id(item): i for i, item in enumerate(chunk)}
+
+    # Initialize results
+    results: Iterable[Any] = chunk
+
+    # Iterate over stages
+    for stage in stages:
+        # Apply callable to results, or filter them by conditions
+        results = (
+            stage(results)
+            if callable(stage)
+            else list(filter(compile_conditions(stage), results))
+        )
+
+    # Return positions of chunk items, or new items themselves
+    return [
+        (positions[id(item)], None) if id(item) in positions else (-1, item)
+        for item in results
+    ]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ APPLY PARALLEL
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def apply_parallel(
+    items: list[Any], stages: tuple[Any, ...], workers: int
+) -> list[Any]:
+    """Returns the results of conditions and callables applied in a process pool"""
+
+    # Split items into chunks
+    chunks = get_chunks(items, workers)
+
+    # Map chunks to their results, in order
+    results = get_pool(workers).map(partial(apply_chunk, stages), chunks)
+
+    # Return original items at returned positions, preserving their identity
+    return [
+        chunk[i] if i >= 0 else item
+        for chunk, entries in zip(chunks, results)
+        for i, item in entries
+    ]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ FILTER CHUNK
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def filter_chunk(
+    conditions: tuple[tuple[str, str, Any], ...], chunk: list[Any]
+) -> list[int]:
+    """Returns the positions of the items in a chunk that satisfy conditions"""
+
+    # Compile conditions, as compiled predicates cannot be sent to a worker process
+    predicate = compile_conditions(conditions)
+
+    # Return positions of satisfying items
+    return [i for i, item in enumerate(chunk) if predicate(item)]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ FILTER PARALLEL
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def filter_parallel(
+    items: list[Any], conditions: tuple[tuple[str, str, Any], ...], workers: int
+) -> list[Any]:
+    """Returns the items that satisfy conditions, evaluated in a process pool"""
+
+    # Split items into chunks
+    chunks = get_chunks(items, workers)
+
+    # Map chunks to the positions of their satisfying items, in order
+    results = get_pool(workers).map(partial(filter_chunk, conditions), chunks)
+
+    # Return the original items at those positions, preserving their identity
+    return [chunk[i] for chunk, positions in zip(chunks, results) for i in positions]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET CHUNKS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_chunks(items: list[Any], workers: int) -> list[list[Any]]:
+    """Returns items split into chunks for a number of workers"""
+
+    # Get chunk size, so that each worker receives several chunks to balance load
+    size = max(-(-len(items) // (workers * CHUNKS_PER_WORKER)), 1)
+
+    # Return chunks
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET POOL
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_pool(workers: int) -> ProcessPoolExecutor:
+    """Returns a shared process pool with a number of workers"""
+
+    # Check if pool is not yet started
+    if workers not in _pools:
+        # Start pool
+        _pools[workers] = ProcessPoolExecutor(max_workers=workers)
+
+    # Return pool
+    return _pools[workers]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ IS PICKLABLE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def is_picklable(value: Any) -> bool:
+    """Returns whether a value can be sent to a worker process"""
+
+    # Initialize try-except block
+    try:
+        # Pickle value
+        pickle.dumps(value)
+
+    # Handle any exception raised by pickling, such as for lambdas and closures
+    except Exception:
+        return False
+
+    # Return True
+    return True
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CHUNKS PER WORKER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize the number of chunks that each worker receives per filter
+CHUNKS_PER_WORKER = 4
+
+# Initialize shared process pools by number of workers
+_pools: dict[int, ProcessPoolExecutor] = {}
@@ -0,0 +1,378 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from keyword import iskeyword
+from operator import ge, gt, le, lt
+from typing import Any, Callable, Iterable
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COMPILE COMPARISON
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def compile_comparison(
+    comparator: Callable[[Any, Any], Any], expected: Any
+) -> Callable[[Any], bool]:
+    """Returns a predicate that compares values, treating incomparable ones as False"""
+
+    # Define predicate
+    def predicate(actual: Any) -> bool:
+        """Returns whether a value compares as expected"""
+
+        # Initialize try-except block
+        try:
+            # Return comparison
+            return bool(comparator(actual, expected))
+
+        # Handle TypeError
+        except TypeError:
+            return False
+
+    # Return predicate
+    return predicate
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COMPILE CONDITION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def compile_condition(operator: str, expected: Any) -> Callable[[Any], bool]:
+    """Returns a predicate that tests an actual value against a condition"""
+
+    # Freeze expected
+    expected = freeze(expected)
+
+    # Handle case of equals
+    if operator == "equals":
+        return lambda actual: not actual != expected
+
+    # Otherwise handle case of case-insensitive equals
+    elif operator == "iequals":
+        return compile_iequals(expected)
+
+    # Otherwise handle case of comparisons
+    elif operator in COMPARATORS:
+        return compile_comparison(COMPARATORS[operator], expected)
+
+    # Otherwise handle case of in
+    elif operator == "in":
+        return compile_in(expected)
+
+    # Otherwise handle case of case-insensitive in
+    elif operator == "iin":
+        return compile_iin(expected)
+
+    # Otherwise handle case of contains
+    elif operator == "contains":
+        return lambda actual: expected in actual
+
+    # Otherwise handle case of case-insensitive contains
+    elif operator == "icontains":
+        return compile_icontains(expected)
+
+    # Return a predicate that accepts any value for unknown operators
+    return lambda actual: True
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COMPILE CONDITIONS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def compile_conditions(
+    conditions: tuple[tuple[str, str, Any], ...]
+) -> Callable[[Any], bool]:
+    """Returns a generated predicate that tests an item against a series of conditions"""
+
+    # Initialize namespace of the generated function
+    namespace: dict[str, Any] = {}
+
+    # Initialize source lines
+    lines = ["def predicate(item):"]
+
+    # Iterate over conditions
+    for i, (attr, operator, expected) in enumerate(conditions):
+        # Freeze expected
+        expected = freeze(expected)
+
+        # Add attribute and expected value to namespace
+        namespace[f"a{i}"], namespace[f"e{i}"] = attr, expected
+
+        # Append line getting the actual value, using attribute syntax when possible
+        lines.append(
+            f"    v = item.{attr}"
+            if attr.isidentifier() and not iskeyword(attr)
+            else f"    v = getattr(item, a{i})"
+        )
+
+        # Append lines testing the actual value
+        lines.extend(
+            "    " + line for line in compile_test(i, operator, expected, namespace)
+        )
+
+    # Append line accepting items that satisfy every condition
+    lines.append("    return True")
+
+    # Execute source in namespace
+    exec("\n".join(lines), namespace)
+
+    # Return predicate
+    return namespace["predicate"]  # type: ignore[no-any-return]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COMPILE ICONTAINS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def compile_icontains(expected: Any) -> Callable[[Any], bool]:
+    """Returns a predicate that tests case-insensitive containment"""
+
+    # Check if expected is not a string
+    if not isinstance(expected, str):
+        # Return a case-sensitive predicate
+        return lambda actual: expected in actual
+
+    # Lowercase expected
+    lowered = expected.lower()
+
+    # Define predicate
+    def predicate(actual: Any) -> bool:
+        """Returns whether a value contains expected, ignoring case"""
+
+        # Check if actual is a string
+        if isinstance(actual, str):
+            return lowered in actual.lower()
+
+        # Check if actual is an iterable
+        if isinstance(actual, Iterable):
+            return lowered in {x.lower() if isinstance(x, str) else x for x in actual}
+
+        # Return containment
+        return lowered in actual
+
+    # Return predicate
+    return predicate
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COMPILE IEQUALS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def compile_iequals(expected: Any) -> Callable[[Any], bool]:
+    """Returns a predicate that tests case-insensitive equality"""
+
+    # Check if expected is not a string
+    if not isinstance(expected, str):
+        # Return a case-sensitive predicate
+        return lambda actual: not actual != expected
+
+    # Lowercase expected
+    lowered = expected.lower()
+
+    # Return predicate
+    return lambda actual: (
+        actual.lower() == lowered if isinstance(actual, str) else not actual != expected
+    )
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COMPILE IIN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def compile_iin(expected: Any) -> Callable[[Any], bool]:
+    """Returns a predicate that tests case-insensitive membership"""
+
+    # Get predicate for values that are not strings
+    contains = compile_in(expected)
+
+    # Check if expected is a string
+    if isinstance(expected, str):
+        # Lowercase expected
+        lowered_string = expected.lower()
+
+        # Return predicate
+        return lambda actual: (
+            actual.lower() in lowered_string
+            if isinstance(actual, str)
+            else contains(actual)
+        )
+
+    # Check if expected is not an iterable
+    if not isinstance(expected, Iterable):
+        # Return predicate
+        return lambda actual: (
+            actual.lower() in expected if isinstance(actual, str) else contains(actual)
+        )
+
+    # Initialize try-except block
+    try:
+        # Lowercase each item in expected
+        lowered = frozenset(x.lower() if isinstance(x, str) else x for x in expected)
+
+    # Handle TypeError
+    except TypeError:
+        # Return a predicate that raises for strings as a per-item set would
+        return lambda actual: (
+            actual.lower() in set(expected)
+            if isinstance(actual, str)
+            else contains(actual)
+        )
+
+    # Return predicate
+    return lambda actual: (
+        actual.lower() in lowered if isinstance(actual, str) else contains(actual)
+    )
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COMPILE IN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def compile_in(expected: Any) -> Callable[[Any], bool]:
+    """Returns a predicate that tests membership, hashing expected when possible"""
+
+    # Check if expected is not a list, tuple or set
+    if not isinstance(expected, (list, tuple, set, frozenset)):
+        # Return membership predicate
+        return lambda actual: actual in expected
+
+    # Initialize try-except block
+    try:
+        # Freeze expected
+        frozen = frozenset(expected)
+
+    # Handle TypeError
+    except TypeError:
+        # Return membership predicate
+        return lambda actual: actual in expected
+
+    # Define predicate
+    def predicate(actual: Any) -> bool:
+        """Returns whether a value is in expected"""
+
+        # Initialize try-except block
+        try:
+            # Return hashed membership
+            return actual in frozen
+
+        # Handle TypeError
+        except TypeError:
+            # Return membership for values that are not hashable
+            return actual in expected
+
+    # Return predicate
+    return predicate
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COMPILE TEST
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def compile_test(
+    i: int, operator: str, expected: Any, namespace: dict[str, Any]
+) -> list[str]:
+    """Returns source lines that return False if a value v fails the condition i"""
+
+    # Handle case of equals
+    if operator == "equals" or (
+        operator == "iequals" and not isinstance(expected, str)
+    ):
+        return [f"if v != e{i}:", "    return False"]
+
+    # Otherwise handle case of case-insensitive equals
+    elif operator == "iequals":
+        # Add lowercase expected to namespace
+        namespace[f"l{i}"] = expected.lower()
+
+        # Return lines comparing lowercase strings or other values as is
+        return [
+            "if isinstance(v, str):",
+            f"    if v.lower() != l{i}:",
+            "        return False",
+            f"elif v != e{i}:",
+            "    return False",
+        ]
+
+    # Otherwise handle case of comparisons
+    elif operator in SYMBOLS:
+        # Return lines treating incomparable values as False
+        return [
+            "try:",
+            f"    if not v {SYMBOLS[operator]} e{i}:",
+            "        return False",
+            "except TypeError:",
+            "    return False",
+        ]
+
+    # Otherwise handle case of in against a list, tuple or set
+    elif operator == "in" and isinstance(expected, (list, tuple, set, frozenset)):
+        # Initialize try-except block
+        try:
+            # Add frozen expected to namespace
+            namespace[f"f{i}"] = frozenset(expected)
+
+        # Handle TypeError
+        except TypeError:
+            # Return lines testing membership as is
+            return [f"if v not in e{i}:", "    return False"]
+
+        # Return lines testing hashed membership, falling back for unhashable values
+        return [
+            "try:",
+            f"    found = v in f{i}",
+            "except TypeError:",
+            f"    found = v in e{i}",
+            "if not found:",
+            "    return False",
+        ]
+
+    # Add compiled condition to namespace
+    namespace[f"t{i}"] = compile_condition(operator, expected)
+
+    # Return lines calling compiled condition
+    return [f"if not t{i}(v):", "    return False"]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ FREEZE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def freeze(expected: Any) -> Any:
+    """Returns expected as is, or as a tuple if it is a one-shot iterator"""
+
+    # Check if expected is a one-shot iterator
+    if (
+        not isinstance(expected, (str, bytes, list, tuple, set, frozenset, dict))
+        and isinstance(expected, Iterable)
+        and iter(expected) is expected
+    ):
+        # Return a tuple so that every value is tested against all of expected
+        return tuple(expected)
+
+    # Return expected
+    return expected
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COMPARATORS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize comparison functions by operator
+COMPARATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "lt": lt,
+    "lte": le,
+    "gt": gt,
+    "gte": ge,
+}
+
+# Initialize comparison symbols by operator
+SYMBOLS = {"lt": "<", "lte": "<=", "gt": ">", "gte": ">="}
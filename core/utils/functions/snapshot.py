@@ -0,0 +1,138 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+import gc
+import os
+import pickle
+
+from typing import Any
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DUMPS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def dumps(state: Any) -> bytes:
+    """Returns the state of an object pickled in the snapshot protocol"""
+
+    # Return pickled state
+    return pickle.dumps(state, protocol=SNAPSHOT_PROTOCOL)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ LOADS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def loads(data: bytes) -> Any:
+    """Returns state unpickled from bytes, pausing garbage collection meanwhile"""
+
+    # Get whether garbage collection is enabled
+    enabled = gc.isenabled()
+
+    # Disable garbage collection, which would otherwise rescan the many new objects
+    gc.disable()
+
+    # Initialize try-finally block
+    try:
+        # Return unpickled state
+        return pickle.loads(data)
+
+    # Re-enable garbage collection if it was enabled
+    finally:
+        if enabled:
+            gc.enable()
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ READ SNAPSHOT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def read_snapshot(path: str, kind: str) -> Any:
+    """Returns the payload of a snapshot file of a kind"""
+
+    # Open snapshot file
+    with open(path, "rb") as file:
+        # Read snapshot
+        snapshot = loads(file.read())
+
+    # Check if snapshot is invalid
+    if (
+        not isinstance(snapshot, dict)
+        or snapshot.get("format") != SNAPSHOT_FORMAT
+        or snapshot.get("kind") != kind
+    ):
+        # Raise ValueError
+        raise ValueError(
+            f"Invalid snapshot {path!r}, expected a {kind} snapshot "
+            f"of format {SNAPSHOT_FORMAT}."
+        )
+
+    # Return payload
+    return snapshot["payload"]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SYNC DIRECTORY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def sync_directory(path: str) -> None:
+    """Syncs the directory containing a path, so that renames within it are durable"""
+
+    # Open directory
+    descriptor = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+
+    # Initialize try-finally block
+    try:
+        # Sync directory
+        os.fsync(descriptor)
+
+    # Close directory
+    finally:
+        os.close(descriptor)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ WRITE SNAPSHOT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def write_snapshot(path: str, kind: str, payload: Any) -> None:
+    """Writes a payload to a snapshot file, replacing any previous one atomically"""
+
+    # Get temporary path
+    temporary = f"{path}.tmp"
+
+    # Open temporary file
+    with open(temporary, "wb") as file:
+        # Write snapshot
+        pickle.dump(
+            {"format": SNAPSHOT_FORMAT, "kind": kind, "payload": payload},
+            file,
+            protocol=SNAPSHOT_PROTOCOL,
+        )
+
+        # Flush and sync snapshot, so that it is durable before it replaces another
+        file.flush()
+        os.fsync(file.fileno())
+
+    # Replace snapshot file, so that readers never see a partial snapshot
+    os.replace(temporary, path)
+
+    # Sync directory, so that the replacement itself survives a crash
+    sync_directory(path)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SNAPSHOT FORMAT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize the version of the snapshot format
+SNAPSHOT_FORMAT = 1
+
+# Initialize the pickle protocol of snapshots, fixed so that files outlive upgrades
+SNAPSHOT_PROTOCOL = 5
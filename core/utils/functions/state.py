@@ -0,0 +1,80 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from typing import Any
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET SLOT STATE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_slot_state(item: Any) -> dict[str, Any]:
+    """Returns the slotted attributes of an item that are set, excluding its meta"""
+
+    # Initialize state
+    state = {}
+
+    # Iterate over slot names
+    for name in item._cmeta.slot_names:
+        # Continue if slot is the instance meta
+        if name == "_imeta":
+            continue
+
+        # Get value
+        value = getattr(item, name, MISSING)
+
+        # Check if value is set
+        if value is not MISSING:
+            # Add value to state
+            state[name] = value
+
+    # Return state
+    return state
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET STATE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_state(item: Any) -> dict[str, Any]:
+    """Returns the attributes of an item, whether slotted or not, excluding its meta"""
+
+    # Get state of the instance dictionary, if any
+    state = {
+        attr: value
+        for attr, value in getattr(item, "__dict__", {}).items()
+        if attr != "_imeta"
+    }
+
+    # Check if item has slotted attributes
+    if item._cmeta.slot_names:
+        # Add slotted attributes
+        state.update(get_slot_state(item))
+
+    # Return state
+    return state
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SET STATE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def set_state(item: Any, state: dict[str, Any]) -> None:
+    """Sets the attributes of an item, whether slotted or not, bypassing setters"""
+
+    # Iterate over state
+    for attr, value in state.items():
+        # Set attribute
+        object.__setattr__(item, attr, value)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MISSING
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize missing sentinel
+MISSING = object()
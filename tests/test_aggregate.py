@@ -0,0 +1,303 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import math
+import random
+
+from types import SimpleNamespace
+from typing import Any, Callable
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import (
+    ColumnarCollection,
+    DictCollection,
+    SqliteCollection,
+)
+from core.utils.classes.index import Sorted
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+from core.utils.functions.aggregate import aggregate_items, group_items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PRODUCT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Product(Item):
+    """A test item with a key, indexes and attributes that may be None"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, n: int, c: str | None, v: Any, t: list[int]) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.n = n
+        self.c = c
+        self.v = v
+        self.t = t
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("n",)
+
+        # Define indexes
+        INDEXES = ("c", Sorted("v"))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ FACTORIES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize collection factories
+FACTORIES: list[Callable[[], Any]] = [
+    DictCollection,
+    lambda: DictCollection(threadsafe=True),
+    ColumnarCollection,
+    SqliteCollection,
+]
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ AGGREGATE SETS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize sets of aggregates
+AGGREGATE_SETS: list[dict[str, Any]] = [
+    {"count": None},
+    {"sum": "v", "max": "v", "min": "n", "mean": "v", "count": "v"},
+    {"max": "t"},
+    {"count": "c"},
+]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET ITEMS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_items(factory: Callable[[], Any]) -> Items:
+    """Returns items of random products, some of which were updated"""
+
+    # Initialize random number generator
+    generator = random.Random(7)
+
+    # Initialize items
+    items = Items(collection=factory())
+
+    # Push products
+    items.push_many(
+        Product(
+            n,
+            generator.choice(["a", "b", "c", None]),
+            generator.choice([generator.randint(0, 50), generator.random() * 10, None]),
+            generator.choice([[1], [2, 3]]),
+        )
+        for n in range(400)
+    )
+
+    # Iterate over updates
+    for _ in range(20):
+        # Change the category and value of a random product and push it
+        product = items.key(generator.randrange(400))
+        product.c = generator.choice(["a", "d"])
+        product.v = 3
+        items.push(product)
+
+    # Return items
+    return items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET REFERENCE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_reference(items: list[Any], aggregates: dict[str, Any]) -> dict[str, Any]:
+    """Returns aggregates computed over a list of items"""
+
+    # Initialize results
+    results: dict[str, Any] = {}
+
+    # Iterate over aggregates
+    for function, attr in aggregates.items():
+        # Check if items are counted
+        if attr is None:
+            results[function] = len(items)
+            continue
+
+        # Get values that are not None
+        values = [getattr(i, attr) for i in items if getattr(i, attr) is not None]
+
+        # Get result
+        results[function] = {
+            "count": lambda: len(values),
+            "sum": lambda: sum(values),
+            "min": lambda: min(values, default=None),
+            "max": lambda: max(values, default=None),
+            "mean": lambda: sum(values) / len(values) if values else None,
+        }[function]()
+
+    # Return results
+    return results
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ IS CLOSE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def is_close(a: Any, b: Any) -> bool:
+    """Returns whether two results are equal, allowing for float rounding"""
+
+    # Compare dictionaries recursively
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(is_close(a[k], b[k]) for k in a)
+
+    # Compare floats approximately
+    if isinstance(a, float) and isinstance(b, float):
+        return math.isclose(a, b, rel_tol=1e-12)
+
+    # Compare other values exactly, including their types
+    return bool(a == b) and type(a) is type(b)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST AGGREGATES MATCH A REFERENCE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("factory", FACTORIES)
+def test_aggregates_match_a_reference(factory: Callable[[], Any]) -> None:
+    """Tests aggregates and grouped aggregates against a reference"""
+
+    # Get items
+    items = get_items(factory)
+
+    # Iterate over queries
+    for query in (
+        items,
+        items.filter(c="a"),
+        items.filter(v__gte=5),
+        items.filter(c__in=["a", "b"], n__lt=200),
+        items.head(50),
+        items.filter(n__gte=10).tail(30),
+    ):
+        # Get queried products
+        products = list(query)
+
+        # Group products by category
+        groups: dict[Any, list[Any]] = {}
+        for product in products:
+            groups.setdefault(product.c, []).append(product)
+
+        # Iterate over sets of aggregates
+        for aggregates in AGGREGATE_SETS:
+            # Assert that aggregates match the reference
+            assert is_close(
+                query.aggregate(**aggregates), get_reference(products, aggregates)
+            )
+
+            # Assert that grouped aggregates match the reference
+            assert is_close(
+                query.group_by("c").aggregate(**aggregates),
+                {c: get_reference(group, aggregates) for c, group in groups.items()},
+            )
+
+        # Assert that grouped shortcuts match the reference
+        assert query.group_by("c").count() == {c: len(g) for c, g in groups.items()}
+        assert is_close(
+            query.group_by("c").sum("n"),
+            {c: sum(p.n for p in group) for c, group in groups.items()},
+        )
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST AGGREGATE ERRORS AND COPIES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("factory", FACTORIES)
+def test_aggregate_errors_and_copies(factory: Callable[[], Any]) -> None:
+    """Tests that invalid aggregates raise and that results are copies"""
+
+    # Get items
+    items = get_items(factory)
+
+    # Mutate an aggregated value
+    items.aggregate(max="t")["max"].append(99)
+
+    # Assert that stored products are unchanged
+    assert all(99 not in product.t for product in items)
+
+    # Assert that unknown functions and uncounted attributes raise ValueError
+    for aggregates in ({"median": "v"}, {"sum": None}):
+        with pytest.raises(ValueError):
+            items.aggregate(**aggregates)
+
+    # Assert that an unknown attribute raises AttributeError
+    with pytest.raises(AttributeError):
+        items.aggregate(sum="zzz")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST STREAMING AGGREGATES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_streaming_aggregates() -> None:
+    """Tests that aggregates and groups fold a one-shot iterator of items"""
+
+    # Initialize items
+    items = [
+        SimpleNamespace(g=i % 3, v=None if i % 5 == 0 else i * 1.5, s=str(i))
+        for i in range(50)
+    ]
+
+    # Get values that are not None
+    values = [item.v for item in items if item.v is not None]
+
+    # Assert that aggregates of an iterator match
+    assert aggregate_items(
+        iter(items),
+        {"count": None, "sum": "v", "min": "s", "max": "v", "mean": "v"},
+    ) == {
+        "count": 50,
+        "sum": sum(values),
+        "min": min(item.s for item in items),
+        "max": max(values),
+        "mean": sum(values) / len(values),
+    }
+
+    # Assert that aggregates of nothing are empty
+    assert aggregate_items(
+        iter([]), {"count": "v", "sum": "v", "min": "v", "mean": "v"}
+    ) == {"count": 0, "sum": 0, "min": None, "mean": None}
+
+    # Get groups of an iterator
+    groups = group_items(iter(items), "g", {"count": None, "sum": "v"})
+
+    # Assert that groups match
+    assert groups == {
+        g: {
+            "count": sum(1 for item in items if item.g == g),
+            "sum": sum(item.v for item in items if item.g == g and item.v is not None),
+        }
+        for g in range(3)
+    }
@@ -0,0 +1,156 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import asyncio
+
+from typing import Any, Callable
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import (
+    ColumnarCollection,
+    DictCollection,
+    ShardedCollection,
+    SqliteCollection,
+)
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+from core.utils.exceptions import DoesNotExistError
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ NUMBER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Number(Item):
+    """A test item with a key"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, n: int) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.n = n
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("n",)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST ASYNC API
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        DictCollection,
+        SqliteCollection,
+        ColumnarCollection,
+        lambda: ShardedCollection(shards=2),
+    ],
+)
+def test_async_api(factory: Callable[[], Any]) -> None:
+    """Tests that asynchronous methods match their synchronous counterparts"""
+
+    # Define main
+    async def main() -> None:
+        """Pushes, counts, looks up and iterates numbers asynchronously"""
+
+        # Initialize items and push numbers in batches
+        items = Items(collection=factory())
+        await items.apush_many((Number(i) for i in range(2500)), batch_size=300)
+
+        # Assert that counts, ends and keys match
+        assert await items.acount() == 2500
+        assert (await items.afirst()).n == 0
+        assert (await items.akey(7)).n == 7
+        assert await items.head(3).acount() == 3
+
+        # Assert that asynchronous iteration yields every number in order
+        assert [n.n async for n in items.filter(n__gte=10)] == list(range(10, 2500))
+        assert [n.n async for n in items.aiterate(batch_size=7)] == list(range(2500))
+
+        # Assert that iterated numbers are timestamped
+        assert [n async for n in items.head(1)][0]._imeta.pulled_at is not None
+
+        # Assert that a missing key raises DoesNotExistError
+        with pytest.raises(DoesNotExistError):
+            await items.akey(99999)
+
+        # Assert that an invalid batch size raises ValueError
+        with pytest.raises(ValueError):
+            [n async for n in items.aiterate(batch_size=0)]
+
+    # Run main
+    asyncio.run(main())
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST ITERATION YIELDS TO THE EVENT LOOP
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_iteration_yields_to_the_event_loop() -> None:
+    """Tests that other tasks run while a large collection is iterated"""
+
+    # Initialize items and push numbers
+    items = Items(collection=DictCollection(copy="none"))
+    items.push_many(Number(i) for i in range(50000))
+
+    # Initialize events
+    events: list[str] = []
+
+    # Define ticker
+    async def ticker() -> None:
+        """Records ticks, yielding to the event loop between them"""
+
+        # Iterate over ticks
+        for _ in range(20):
+            # Record tick and yield to the event loop
+            events.append("tick")
+            await asyncio.sleep(0)
+
+    # Define scan
+    async def scan() -> int:
+        """Returns the number of numbers iterated asynchronously"""
+
+        # Count numbers
+        count = len([1 async for _ in items.aiterate(batch_size=500)])
+
+        # Record the end of the scan
+        events.append("scanned")
+
+        # Return count
+        return count
+
+    # Define main
+    async def main() -> Any:
+        """Runs the scan and ticker concurrently"""
+
+        # Return results
+        return await asyncio.gather(scan(), ticker())
+
+    # Assert that every number was iterated
+    assert asyncio.run(main())[0] == 50000
+
+    # Assert that every tick ran before the scan ended
+    assert events.index("scanned") == 20
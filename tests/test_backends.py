@@ -0,0 +1,360 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import random
+
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import (
+    ColumnarCollection,
+    DictCollection,
+    MmapCollection,
+    ShardedCollection,
+    SqliteCollection,
+)
+from core.utils.classes.index import Sorted
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RECORD
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Record(Item):
+    """A test item with a key, a category, an optional value and arbitrary attributes"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, n: int, c: str, v: int | None, **kwargs: Any) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.n = n
+        self.c = c
+        self.v = v
+
+        # Iterate over arbitrary attributes
+        for attr, value in kwargs.items():
+            # Set attribute
+            setattr(self, attr, value)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("n",)
+
+        # Define indexes
+        INDEXES = ("c", Sorted("v"))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ FACTORIES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize collection factories, each given a directory for file collections
+FACTORIES: dict[str, Callable[[Path], Any]] = {
+    "columnar": lambda path: ColumnarCollection(),
+    "sqlite": lambda path: SqliteCollection(),
+    "mmap": lambda path: MmapCollection(str(path / "data")),
+    "sharded": lambda path: ShardedCollection(shards=3),
+    "sharded single": lambda path: ShardedCollection(shards=1),
+    "sharded workers": lambda path: ShardedCollection(workers=3),
+    "sharded threadsafe": lambda path: ShardedCollection(
+        shards=7, workers=2, threadsafe=True
+    ),
+}
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DESCRIBE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def describe(record: Item) -> str:
+    """Returns the attributes and ID of a record"""
+
+    # Return attributes and ID
+    return repr(
+        ({k: v for k, v in vars(record).items() if k != "_imeta"}, record._imeta.id)
+    )
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET ITEMS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_items(collection: Any) -> Items:
+    """Returns items of the same random records, pushed in a batch, one by one and as
+    updates that change the type of an attribute"""
+
+    # Initialize random number generator
+    generator = random.Random(7)
+
+    # Initialize records
+    records = []
+
+    # Iterate over numbers
+    for n in range(400):
+        # Initialize attributes
+        attrs: dict[str, Any] = {
+            "qty": generator.randint(-5, 5),
+            "name": generator.choice(["apple", "Banana", "cherry", "date", "APPLE"]),
+            "tags": generator.choice([["a", "b"], ["c"], [], ("A",), "ab"]),
+            "flag": generator.choice([True, False]),
+        }
+
+        # Set a price of mixed types on some records and none on others
+        if n % 3:
+            attrs["price"] = (
+                generator.choice(
+                    [
+                        generator.randint(0, 100),
+                        generator.random() * 100,
+                        float("nan"),
+                        True,
+                        None,
+                        2**70,
+                        Decimal("5.5"),
+                    ]
+                )
+                if n > 200
+                else generator.randint(0, 100)
+            )
+
+        # Append record
+        records.append(
+            Record(
+                n,
+                generator.choice("abcd"),
+                generator.choice([None, 1, 2, 3, 5, 8]),
+                **attrs,
+            )
+        )
+
+    # Initialize items
+    items = Items(collection=collection)
+
+    # Push the first half of records in a batch
+    items.push_many(records[:200])
+
+    # Iterate over the second half of records
+    for record in records[200:]:
+        # Push record
+        items.push(record)
+
+    # Change a record and push it
+    record = items.key(10)
+    record.v = 99
+    items.push(record)
+
+    # Iterate over some numbers
+    for n in range(0, 400, 17):
+        # Change the type of an attribute and push record
+        record = items.key(n)
+        record.qty = "x"
+        items.push(record)
+
+    # Return items
+    return items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET PAGES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_pages(items: Items) -> list[list[int]]:
+    """Returns the records of every page of items"""
+
+    # Initialize the records of every page and cursor
+    pages: list[list[int]] = []
+    after: str | None = None
+
+    # Iterate over pages
+    while True:
+        # Get page and the cursor of the next page
+        page, after = items.page(size=17, after=after)
+
+        # Break after the last page, which keeps the cursor for later pushes
+        if not page:
+            break
+
+        # Add the records of page
+        pages.append([r.n for r in page])
+
+    # Return pages
+    return pages
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET RESULT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_result(query: Callable[[Items], Any], items: Items) -> Any:
+    """Returns the records and count of a query, its value, or its exception type"""
+
+    # Attempt to evaluate query
+    try:
+        # Get result
+        result = query(items)
+
+        # Check if result is a single record
+        if isinstance(result, Item):
+            # Return attributes and ID
+            return describe(result)
+
+        # Check if result is not a collection of items
+        if not isinstance(result, Items):
+            # Return result
+            return repr(result)
+
+        # Return attributes, IDs and count
+        return repr([describe(record) for record in result]), result.count()
+
+    # Handle any exception raised by query
+    except Exception as e:
+        # Return exception type
+        return type(e).__name__
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ QUERIES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize the numbers of records with a price
+PRICED = [n for n in range(400) if n % 3]
+
+# Initialize queries of filters, mixed types, windows, orders, reads and pages
+QUERIES: list[Callable[[Items], Any]] = [
+    lambda items: items,
+    lambda items: items.filter(c="a"),
+    lambda items: items.filter(v__gte=3),
+    lambda items: items.filter(c="b", v__in=[1, 2]),
+    lambda items: items.filter(v=None),
+    lambda items: items.filter(qty=3),
+    lambda items: items.filter(qty__gte=2),
+    lambda items: items.filter(qty__lt=0, flag=True),
+    lambda items: items.filter(qty__in=[1, 2, "x"]),
+    lambda items: items.filter(qty__in={1.0, None}),
+    lambda items: items.filter(qty__iin=["X", 1]),
+    lambda items: items.filter(qty="x"),
+    lambda items: items.filter(qty__lt="a"),
+    lambda items: items.filter(name="apple"),
+    lambda items: items.filter(name__ieq="apple"),
+    lambda items: items.filter(name__gt="b"),
+    lambda items: items.filter(name__gt=3),
+    lambda items: items.filter(name__iin=["APPLE", "date", 3, None]),
+    lambda items: items.filter(name__contains="pp"),
+    lambda items: items.filter(name__icontains="AN"),
+    lambda items: items.filter(tags__contains="a"),
+    lambda items: items.filter(tags__icontains="a"),
+    lambda items: items.filter(flag=1),
+    lambda items: items.filter(flag__in=[1]),
+    lambda items: items.filter(n__lt=200, qty__gt=0).filter(price__gte=50),
+    lambda items: items.filter(n__gte=201).filter(price__gte=50),
+    lambda items: items.filter(n__gte=201).filter(price=float("nan")),
+    lambda items: items.filter(price__gt=Decimal("50")).filter(n__lt=10),
+    lambda items: items.filter(n__in=PRICED).filter(n__lte=200, price__gte=50),
+    lambda items: items.filter(n__in=PRICED).filter(price__gte=50),
+    lambda items: items.filter(n__in=PRICED).filter(price=float("nan")),
+    lambda items: items.filter(n__in=PRICED).filter(price__in=[True, 2**70, None]),
+    lambda items: items.filter(n__in=PRICED).filter(price=Decimal("5.5")),
+    lambda items: items.filter(nope=1),
+    lambda items: items.filter(n=-1, nope=1),
+    lambda items: items.head(7),
+    lambda items: items.tail(5),
+    lambda items: items.tail(0),
+    lambda items: items.slice(100, 120),
+    lambda items: items.slice(3, 1),
+    lambda items: items.filter(c="c").head(4),
+    lambda items: items.head(50).filter(c="d"),
+    lambda items: items.filter(flag=False).slice(3, 9),
+    lambda items: items.filter(qty=1).tail(100),
+    lambda items: items.filter(qty__gt=2).slice(1, 4).head(2),
+    lambda items: items.filter(qty__gt=2).tail(10).slice(2, 5),
+    lambda items: items.filter(qty__gt=2).head(10).tail(3),
+    lambda items: items.order_by("v"),
+    lambda items: items.order_by("-v", "n"),
+    lambda items: items.order_by("c", "-n").head(13),
+    lambda items: items.filter(c="a").order_by("v").slice(3, 20),
+    lambda items: items.order_by("-v").tail(6),
+    lambda items: items.filter(c="c").order_by("v", "-n").head(20),
+    lambda items: items.first(),
+    lambda items: items.last(),
+    lambda items: items.filter(c="b").first(),
+    lambda items: items.order_by("-v").last(),
+    lambda items: items.aggregate(count=None, sum="v", min="v", max="v"),
+    lambda items: items.filter(c="a").aggregate(count=None, sum="n", max="v"),
+    lambda items: items.group_by("c").count(),
+    lambda items: items.filter(v__gte=3).group_by("c").sum("n"),
+    lambda items: get_pages(items),
+    lambda items: get_pages(items.filter(c="a")),
+    lambda items: get_pages(items.order_by("-v", "n")),
+]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DICT ITEMS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture(scope="module")
+def dict_items() -> Items:
+    """Returns the records in a dict collection"""
+
+    # Return items
+    return get_items(DictCollection())
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ BACKEND ITEMS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.fixture(scope="module", params=list(FACTORIES))
+def backend_items(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> Items:
+    """Returns the records in each backend collection"""
+
+    # Return items
+    return get_items(
+        FACTORIES[request.param](tmp_path_factory.mktemp("backend", numbered=True))
+    )
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST BACKENDS MATCH A DICT COLLECTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_backends_match_a_dict_collection(
+    query: Callable[[Items], Any], backend_items: Items, dict_items: Items
+) -> None:
+    """Tests that every backend yields the records and results of a dict one"""
+
+    # Assert that results match
+    assert get_result(query, backend_items) == get_result(query, dict_items)
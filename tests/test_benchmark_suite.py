@@ -0,0 +1,96 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from benchmarks.suite import compare, measure, run
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST COMPARE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_compare() -> None:
+    """Tests that cases slower than the threshold ratio are returned as regressions"""
+
+    # Initialize baseline and current results
+    baseline = {"results": {"100": {"key": 100.0, "head": 10.0, "tail": 10.0}}}
+    current = {
+        "results": {
+            "100": {"key": 130.0, "head": 12.0, "tail": 5.0, "new": 1.0},
+            "1000": {"key": 1000.0},
+        }
+    }
+
+    # Assert that only cases above the threshold and in the baseline regress
+    assert compare(baseline, current, threshold=1.25) == ["100 key"]
+    assert compare(baseline, current, threshold=1.1) == ["100 key", "100 head"]
+    assert compare(baseline, baseline, threshold=1.0) == []
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST MEASURE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_measure() -> None:
+    """Tests that an operation is repeated within its budget and timed at its best"""
+
+    # Initialize calls
+    calls: list[None] = []
+
+    # Assert that an operation is repeated up to the number of repeats
+    assert measure(lambda: calls.append(None), repeat=5, budget=60) >= 0
+    assert len(calls) == 5
+
+    # Assert that an operation runs once when the budget is spent
+    calls.clear()
+    measure(lambda: calls.append(None), repeat=5, budget=0)
+    assert len(calls) == 1
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST RUN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_run() -> None:
+    """Tests that a run records metadata and a cost per case and size"""
+
+    # Run the suite on a small collection
+    results = run([50], repeat=1, budget=0)
+
+    # Assert that metadata and results are recorded
+    assert results["meta"]["repeat"] == 1
+    assert {"push", "key", "count", "last", "collect quick"} <= set(
+        results["results"]["50"]
+    )
+    assert all(cost >= 0 for cost in results["results"]["50"].values())
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST RUN WITHOUT PUSH MANY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_run_without_push_many(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that the suite runs against revisions without batch pushes"""
+
+    # Remove batch pushes, as in revisions that predate them
+    monkeypatch.delattr(Items, "push_many")
+
+    # Run the suite on a small collection
+    results = run([50], repeat=1, budget=0)
+
+    # Assert that cases ran, key lookups included, on records pushed one at a time
+    assert results["results"]["50"]["count"] >= 0
+    assert "key" in results["results"]["50"]
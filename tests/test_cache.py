@@ -0,0 +1,184 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import copy
+import random
+
+from typing import Any, Callable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import DictCollection
+from core.utils.classes.index import Sorted
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+from core.utils.exceptions import DuplicateKeyError
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PRODUCT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Product(Item):
+    """A test item with a key, a hash index and a sorted index"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, n: int, c: str = "a", v: int = 0, t: Any = None) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.n = n
+        self.c = c
+        self.v = v
+        self.t = t
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("n",)
+
+        # Define indexes
+        INDEXES = ("c", Sorted("v"))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ UNHASHABLE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Unhashable:
+    """A test value that cannot be hashed and equals nothing"""
+
+    # Disable hashing
+    __hash__ = None  # type: ignore[assignment]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __EQ__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __eq__(self, other: object) -> bool:
+        """Equality Method"""
+
+        # Return False
+        return False
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ QUERIES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize queries
+QUERIES: list[Callable[[Items], Items]] = [
+    lambda items: items.filter(c="a"),
+    lambda items: items.filter(c="a").head(3),
+    lambda items: items.filter(v__gte=25, c__in=["a", "b"]).tail(4),
+    lambda items: items.filter(t__contains=[1]),
+    lambda items: items.filter(t__contains=(1,)),
+    lambda items: items.slice(2, 9),
+    lambda items: items,
+    lambda items: items.filter(v__in=[1, 2, 3, 4, 5]).filter(c="b"),
+    lambda items: items.filter(v__lt=10).head(100).filter(c="c"),
+]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST CACHED QUERIES MATCH UNCACHED QUERIES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_cached_queries_match_uncached_queries() -> None:
+    """Tests that interleaved queries and pushes agree with and without a cache"""
+
+    # Initialize random number generator
+    generator = random.Random(1)
+
+    # Initialize items with and without a cache
+    plain = Items(collection=DictCollection())
+    cached = Items(collection=DictCollection(cache_size=8))
+
+    # Iterate over steps
+    for _ in range(3000):
+        # Check if a product is pushed
+        if generator.random() < 0.05:
+            # Initialize product
+            product = Product(
+                generator.randint(0, 300),
+                generator.choice("abc"),
+                generator.randint(0, 50),
+                generator.choice([[1], [(1,)], []]),
+            )
+
+            # Push product, skipping duplicates
+            try:
+                plain.push(copy.deepcopy(product))
+            except DuplicateKeyError:
+                continue
+            cached.push(product)
+
+            # Continue
+            continue
+
+        # Get a random query
+        query = generator.choice(QUERIES)
+
+        # Assert that results and counts match
+        assert [(p.n, p.v) for p in query(cached)] == [(p.n, p.v) for p in query(plain)]
+        assert query(cached).count() == query(plain).count()
+
+    # Get cache info
+    info = cached._collection.cache_info()
+
+    # Assert that the cache was hit and stayed bounded
+    assert info["hits"] > 1000 and info["size"] <= 8
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST CACHE ENTRIES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_cache_entries() -> None:
+    """Tests when results are cached, hit and invalidated"""
+
+    # Initialize collection and items
+    collection = DictCollection(cache_size=4)
+    items = Items(collection=collection)
+    items.push_many(Product(i, "ab"[i % 2]) for i in range(10))
+
+    # Assert that a partially consumed result is not cached
+    items.filter(c="a").first()
+    assert collection.cache_info()["size"] == 0
+
+    # Assert that a fully consumed result is cached and then hit
+    list(items.filter(c="a"))
+    assert collection.cache_info()["size"] == 1
+    list(items.filter(c="a"))
+    assert collection.cache_info()["hits"] == 1
+
+    # Assert that a push invalidates the cache
+    items.push(Product(100))
+    assert collection.cache_info()["size"] == 0
+
+    # Assert that a query with an unhashable value is not cached
+    list(items.filter(n=Unhashable()))
+    list(items.filter(n=Unhashable()))
+    assert collection.cache_info()["size"] == 0
+
+    # Assert that clearing the cache resets it
+    list(items.filter(c="b"))
+    collection.cache_clear()
+    assert collection.cache_info()["size"] == 0
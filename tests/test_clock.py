@@ -0,0 +1,195 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import (
+    ColumnarCollection,
+    DictCollection,
+    SqliteCollection,
+)
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+from core.utils.functions.datetime import coarse_utc_now, get_clock, utc_now
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RECORD
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Record(Item):
+    """A test item timestamped by the clock of its collection"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, n: int) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.n = n
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MONOTONIC RECORD
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class MonotonicRecord(Record):
+    """A test item timestamped by a monotonic clock"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define clock
+        CLOCK = "monotonic"
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ UNTIMED RECORD
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class UntimedRecord(Record):
+    """A test item that is not timestamped"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define clock
+        CLOCK = "none"
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COLLECTION CLASSES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize collection classes
+COLLECTION_CLASSES = [DictCollection, ColumnarCollection, SqliteCollection]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST CLOCKS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_clocks() -> None:
+    """Tests the standard library and coarse clocks and invalid clock policies"""
+
+    # Assert that the default clock is aware of UTC
+    assert utc_now().tzinfo is timezone.utc
+
+    # Assert that the coarse clock is cached briefly
+    now = coarse_utc_now()
+    assert coarse_utc_now() is now
+    time.sleep(0.02)
+    assert coarse_utc_now() is not now
+
+    # Assert that an unknown clock policy raises ValueError
+    with pytest.raises(ValueError):
+        get_clock("bad")
+    with pytest.raises(ValueError):
+        DictCollection(clock="bad")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST DATETIME DOES NOT IMPORT PYTZ
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_datetime_does_not_import_pytz() -> None:
+    """Tests that importing the datetime functions does not import pytz"""
+
+    # Import the datetime functions in a fresh interpreter
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, core.utils.functions.datetime; "
+            "assert 'pytz' not in sys.modules",
+        ],
+        capture_output=True,
+    )
+
+    # Assert that pytz was not imported
+    assert result.returncode == 0, result.stderr
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST ITEM CLASS CLOCKS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("collection_class", COLLECTION_CLASSES)
+def test_item_class_clocks(collection_class: Any) -> None:
+    """Tests that Meta.CLOCK selects the clock of pushed and pulled timestamps"""
+
+    # Initialize items
+    items = Items(collection=collection_class())
+
+    # Push records
+    record, monotonic, untimed = Record(1), MonotonicRecord(2), UntimedRecord(3)
+    items.push(record)
+    items.push_many([monotonic, untimed])
+
+    # Assert that pushed timestamps follow the clock of each class
+    assert isinstance(record._imeta.pushed_at, datetime)
+    assert isinstance(monotonic._imeta.pushed_at, float)
+    assert untimed._imeta.pushed_at is None
+
+    # Get pulled records
+    pulled = {record.n: record for record in items}
+
+    # Assert that pulled timestamps follow the clock of each class
+    assert isinstance(pulled[1]._imeta.pulled_at, datetime)
+    assert isinstance(pulled[2]._imeta.pulled_at, float)
+    assert pulled[3]._imeta.pulled_at is None
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST COLLECTION CLOCKS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("collection_class", COLLECTION_CLASSES)
+@pytest.mark.parametrize(
+    "clock, is_expected",
+    [
+        ("none", lambda pulled_at: pulled_at is None),
+        ("coarse", lambda pulled_at: isinstance(pulled_at, datetime)),
+        (lambda: 42, lambda pulled_at: pulled_at == 42),
+    ],
+)
+def test_collection_clocks(collection_class: Any, clock: Any, is_expected: Any) -> None:
+    """Tests that the clock of a collection timestamps pulled items"""
+
+    # Initialize items and push record
+    items = Items(collection=collection_class(clock=clock))
+    items.push(Record(1))
+
+    # Assert that pulled timestamps follow the clock of the collection
+    assert all(is_expected(record._imeta.pulled_at) for record in items)
@@ -0,0 +1,139 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import ColumnarCollection
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+from core.utils.exceptions import DuplicateKeyError
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PRODUCT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Product(Item):
+    """A test item with a key and arbitrary attributes"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, sku: int, **kwargs: Any) -> None:
+        """Init Method"""
+
+        # Set SKU
+        self.sku = sku
+
+        # Iterate over attributes
+        for attr, value in kwargs.items():
+            # Set attribute
+            setattr(self, attr, value)
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("sku",)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST DTYPES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_dtypes() -> None:
+    """Tests that columns use numpy dtypes per kind and generalize to objects"""
+
+    # Initialize collection and items
+    collection = ColumnarCollection()
+    items = Items(collection=collection)
+
+    # Push products of native kinds
+    items.push_many(
+        Product(sku, qty=sku - 5, price=sku * 1.5, flag=bool(sku % 2), name=str(sku))
+        for sku in range(10)
+    )
+
+    # Get columns
+    columns = collection._columns
+
+    # Assert that each kind is stored in its numpy dtype
+    assert {attr: str(column.values.dtype) for attr, column in columns.items()} == {
+        "sku": "int64",
+        "qty": "int64",
+        "price": "float64",
+        "flag": "bool",
+        "name": "object",
+    }
+
+    # Assert that collected values are Python values rather than numpy scalars
+    product = items.key(3)
+    assert type(product.qty) is int and product.qty == -2
+    assert type(product.price) is float and type(product.flag) is bool
+
+    # Push products that do not fit the kind of their columns
+    items.push(Product(10, qty="x", price=2**70, flag=1))
+    items.push(Product(11, qty=2**63, price=Decimal("5.5")))
+
+    # Assert that mismatched and unbounded values generalize columns to objects
+    assert (
+        columns["qty"].kind == columns["price"].kind == columns["flag"].kind == "object"
+    )
+    assert columns["qty"].values.dtype == object
+
+    # Assert that values before and after generalizing are kept exactly
+    assert items.key(3).qty == -2 and type(items.key(3).qty) is int
+    assert items.key(10).qty == "x" and items.key(10).price == 2**70
+    assert items.key(11).qty == 2**63 and items.key(11).price == Decimal("5.5")
+    assert items.key(10).flag == 1 and type(items.key(10).flag) is int
+
+    # Assert that filters match generalized columns as Python values would
+    assert [p.sku for p in items.filter(qty__gte=3)] == [8, 9, 11]
+    flagged = items.filter(sku__lte=10).filter(flag=True)
+    assert [p.sku for p in flagged] == [1, 3, 5, 7, 9, 10]
+
+    # Assert that missing attributes stay missing rather than filled
+    assert not hasattr(items.key(11), "flag") and not hasattr(items.key(11), "name")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST KEYS AND ISOLATION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_keys_and_isolation() -> None:
+    """Tests key lookups, duplicate keys and isolation of collected products"""
+
+    # Initialize items and push products
+    items = Items(collection=ColumnarCollection())
+    items.push_many(Product(sku, tags=["a", "b"]) for sku in range(10))
+
+    # Assert that keys are looked up
+    assert items.key(5).sku == 5
+
+    # Assert that a duplicate key is rejected
+    with pytest.raises(DuplicateKeyError):
+        items.push(Product(5))
+
+    # Mutate a collected product
+    items.filter(sku=2).first().tags.append("zzz")
+
+    # Assert that the stored product is unchanged
+    assert "zzz" not in items.filter(sku=2).first().tags
@@ -0,0 +1,232 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import random
+import threading
+
+from typing import Callable
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import DictCollection
+from core.utils.classes.index import Sorted
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PRODUCT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Product(Item):
+    """A test item with a key, a hash index and a sorted index"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, sku: int, category: str, price: int) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.sku = sku
+        self.category = category
+        self.price = price
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("sku",)
+
+        # Define indexes
+        INDEXES = ("category", Sorted("price"))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ CONSTANTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize the number of pushing and filtering threads
+PUSHERS, FILTERERS = 4, 4
+
+# Initialize the number of products pushed by each pusher
+SIZE = 300
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RUN THREADS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def run_threads(targets: list[Callable[[], None]]) -> list[BaseException]:
+    """Runs targets in threads started together and returns any exceptions raised"""
+
+    # Initialize exceptions
+    exceptions: list[BaseException] = []
+
+    # Initialize a barrier so that threads start together
+    barrier = threading.Barrier(len(targets))
+
+    # Define run
+    def run(target: Callable[[], None]) -> None:
+        """Runs a target once every thread is ready, recording any exception"""
+
+        # Wait for every thread
+        barrier.wait()
+
+        # Initialize try-except block
+        try:
+            # Run target
+            target()
+
+        # Handle any exception
+        except BaseException as e:
+            # Record exception
+            exceptions.append(e)
+
+    # Initialize threads
+    threads = [threading.Thread(target=run, args=(target,)) for target in targets]
+
+    # Iterate over threads
+    for thread in threads:
+        # Start thread
+        thread.start()
+
+    # Iterate over threads
+    for thread in threads:
+        # Wait for thread
+        thread.join()
+
+    # Return exceptions
+    return exceptions
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST CONCURRENT PUSHES AND FILTERS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_concurrent_pushes_and_filters() -> None:
+    """Tests that concurrent pushes and filters leave keys and indexes consistent"""
+
+    # Initialize collection and items
+    collection = DictCollection(threadsafe=True)
+    items = Items(collection=collection)
+
+    # Initialize an event set once every pusher is done
+    done = threading.Event()
+
+    # Initialize the number of running pushers and its lock
+    running, running_lock = [PUSHERS], threading.Lock()
+
+    # Define push
+    def push(k: int) -> Callable[[], None]:
+        """Returns a pusher of products with SKUs unique to a thread"""
+
+        # Define pusher
+        def pusher() -> None:
+            """Pushes products singly and in batches, then updates some of them"""
+
+            # Initialize random number generator
+            generator = random.Random(k)
+
+            # Initialize try-finally block
+            try:
+                # Get products
+                products = [
+                    Product(k * SIZE + i, generator.choice("abc"), i)
+                    for i in range(SIZE)
+                ]
+
+                # Push the first half of products one by one
+                for product in products[: SIZE // 2]:
+                    items.push(product)
+
+                # Push the second half of products in batches
+                for i in range(SIZE // 2, SIZE, 25):
+                    items.push_many(products[i : i + 25])
+
+                # Iterate over some SKUs
+                for sku in range(k * SIZE, (k + 1) * SIZE, 7):
+                    # Change category and price and push product
+                    product = collection.key(sku)
+                    product.category = generator.choice("abc")
+                    product.price = generator.randint(0, SIZE)
+                    items.push(product)
+
+            # Mark pusher as done
+            finally:
+                # Decrement the number of running pushers
+                with running_lock:
+                    running[0] -= 1
+
+                    # Set event once every pusher is done
+                    if not running[0]:
+                        done.set()
+
+        # Return pusher
+        return pusher
+
+    # Define filterer
+    def filterer() -> None:
+        """Filters products while pushers run, checking each result"""
+
+        # Iterate until every pusher is done
+        while not done.is_set():
+            # Assert that filtered products satisfy their conditions
+            assert all(p.category == "a" for p in items.filter(category="a"))
+            assert all(p.price >= 150 for p in items.filter(price__gte=150))
+
+            # Assert that counts stay within bounds
+            assert 0 <= items.filter(category="b").count() <= PUSHERS * SIZE
+
+            # Assert that ordered products are in order
+            prices = [p.price for p in items.order_by("price").head(20)]
+            assert prices == sorted(prices)
+
+    # Run pushers and filterers
+    exceptions = run_threads([push(k) for k in range(PUSHERS)] + [filterer] * FILTERERS)
+
+    # Assert that no thread raised an exception
+    assert exceptions == []
+
+    # Get SKUs
+    skus = [product.sku for product in items]
+
+    # Assert that every product is stored once
+    assert sorted(skus) == list(range(PUSHERS * SIZE))
+    assert items.count() == PUSHERS * SIZE
+
+    # Assert that each key refers to the stored product with that SKU
+    assert len(collection._item_ids_by_key) == PUSHERS * SIZE
+    assert all(
+        collection._items_by_id[item_id].sku == sku
+        for sku, item_id in collection._item_ids_by_key.items()
+    )
+
+    # Iterate over filters
+    for conditions in ({"category": "a"}, {"category": "c"}, {"price__lt": 100}):
+        # Get filtered items
+        filtered = items.filter(**conditions)
+
+        # Get the SKUs of a full scan
+        expected = [
+            product.sku
+            for product in collection._filter(
+                collection._items_by_id.values(), filtered._operations[0][1]
+            )
+        ]
+
+        # Assert that the indexed filter matches the scan
+        assert [product.sku for product in filtered] == expected
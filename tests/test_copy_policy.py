@@ -0,0 +1,161 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import copy
+
+from typing import Any
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import DictCollection
+from core.utils.classes.item.item import Item
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PRODUCT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Product(Item):
+    """A test item with a scalar and a nested attribute"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, sku: int, tags: list[str]) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.sku = sku
+        self.tags = tags
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TRUSTED PRODUCT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class TrustedProduct(Product):
+    """A test item whose class declares a copy policy"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define copy policy
+        COPY = "none"
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST COPY POLICIES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "policy, copied, deep",
+    [
+        ("deep", True, True),
+        ("pickle", True, True),
+        (copy.deepcopy, True, True),
+        ("shallow", True, False),
+        ("none", False, False),
+        ("trusted", False, False),
+    ],
+)
+def test_copy_policies(policy: Any, copied: bool, deep: bool) -> None:
+    """Tests how far each copy policy isolates stored items from callers"""
+
+    # Initialize collection
+    collection = DictCollection(copy=policy)
+
+    # Push product
+    product = Product(1, ["a"])
+    collection.push(product)
+
+    # Mutate the pushed product
+    product.sku = 2
+    product.tags.append("b")
+
+    # Get stored product
+    stored = collection.first()
+
+    # Assert that scalar attributes are isolated by any copy
+    assert (stored is not product) == copied
+    assert stored.sku == (1 if copied else 2)
+
+    # Assert that nested attributes are isolated by deep copies only
+    assert stored.tags == (["a"] if deep else ["a", "b"])
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST CUSTOM COPIER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_custom_copier() -> None:
+    """Tests that a callable policy is used to copy items"""
+
+    # Initialize copied items
+    copied = []
+
+    # Define copier
+    def copier(item: Any) -> Any:
+        """Records and returns a deep copy of an item"""
+
+        # Record item
+        copied.append(item.sku)
+
+        # Return deep copy
+        return copy.deepcopy(item)
+
+    # Initialize collection and push product
+    collection = DictCollection(copy=copier)
+    collection.push(Product(1, []))
+
+    # Assert that the stored product is returned through the copier
+    assert collection.first().sku == 1
+    assert copied and set(copied) == {1}
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST ITEM CLASS POLICY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_item_class_policy() -> None:
+    """Tests that Meta.COPY overrides the collection copy policy"""
+
+    # Initialize collection
+    collection = DictCollection(copy="deep")
+
+    # Push products
+    trusted, product = TrustedProduct(1, []), Product(2, [])
+    collection.push_many([trusted, product])
+
+    # Assert that only the trusted product is stored as is
+    assert next(iter(collection.all().filter(sku=1))) is trusted
+    assert next(iter(collection.all().filter(sku=2))) is not product
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST INVALID POLICY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_invalid_policy() -> None:
+    """Tests that an unknown copy policy is rejected"""
+
+    # Assert that an unknown policy raises ValueError
+    with pytest.raises(ValueError, match="Invalid copy policy"):
+        DictCollection(copy="bogus")
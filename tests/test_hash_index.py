@@ -0,0 +1,178 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import random
+
+from typing import Any
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import DictCollection
+from core.utils.classes.index import HashIndex
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PRODUCT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Product(Item):
+    """A test item with a key, a single hash index and a composite hash index"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, sku: int, category: Any, color: str, name: str) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.sku = sku
+        self.category = category
+        self.color = color
+        self.name = name
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("sku",)
+
+        # Define indexes
+        INDEXES = ("category", ("category", "color"), "name")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET ITEMS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_items(size: int = 500) -> Items:
+    """Returns items of products with random, partly unhashable attribute values"""
+
+    # Initialize random number generator
+    generator = random.Random(1)
+
+    # Initialize items
+    items = Items(collection=DictCollection())
+
+    # Push products
+    items.push_many(
+        Product(
+            sku,
+            generator.choice(["a", "b", "c", None, [1]]),
+            generator.choice(["Red", "red", "BLUE"]),
+            generator.choice(["X", "x", "Y"]),
+        )
+        for sku in range(size)
+    )
+
+    # Return items
+    return items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SCAN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def scan(items: Items, **conditions: Any) -> list[int]:
+    """Returns the SKUs of a filter evaluated by a full scan without indexes"""
+
+    # Get filtered items
+    filtered = items.filter(**conditions)
+
+    # Get collection
+    collection = filtered._collection
+
+    # Return SKUs of stored items that satisfy the filter conditions
+    return [
+        product.sku
+        for product in collection._filter(
+            collection._items_by_id.values(), filtered._operations[0][1]
+        )
+    ]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST INDEXES ARE DECLARED
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_indexes_are_declared() -> None:
+    """Tests that Meta.INDEXES declares a hash index per attribute or attribute tuple"""
+
+    # Get collection
+    collection = get_items()._collection
+
+    # Assert that each declaration is a hash index
+    assert all(
+        isinstance(collection._indexes[declaration], HashIndex)
+        for declaration in ("category", ("category", "color"), "name")
+    )
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST INDEXED FILTERS MATCH A SCAN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_indexed_filters_match_a_scan() -> None:
+    """Tests that indexed filters yield the same items in order as a full scan"""
+
+    # Get items
+    items = get_items()
+
+    # Iterate over filters, including unhashable and case-insensitive values
+    for conditions in (
+        {"category": "a"},
+        {"category__in": ["a", "b"]},
+        {"category": "a", "color": "red"},
+        {"category__iequals": "A", "color__iequals": "RED"},
+        {"name__iin": ["x"]},
+        {"category": None},
+        {"category": [1]},
+    ):
+        # Get the SKUs of a scan
+        expected = scan(items, **conditions)
+
+        # Assert that the indexed filter matches a scan
+        assert [product.sku for product in items.filter(**conditions)] == expected
+
+        # Assert that the count matches a scan
+        assert items.filter(**conditions).count() == len(expected)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST INDEXES FOLLOW UPDATES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_indexes_follow_updates() -> None:
+    """Tests that pushing a changed item moves it between index entries"""
+
+    # Get items
+    items = get_items()
+
+    # Get a product and its previous category
+    product = items.key(3)
+    previous = product.category
+
+    # Change category and push product
+    product.category = "z"
+    items.push(product)
+
+    # Assert that the product is found under its new category only
+    assert [product.sku for product in items.filter(category="z")] == [3]
+    assert 3 not in [product.sku for product in items.filter(category=previous)]
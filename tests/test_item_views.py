@@ -0,0 +1,253 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import copy
+import pickle
+
+from typing import Any, Callable
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import DictCollection
+from core.utils.classes.item.item import Item
+from core.utils.exceptions import ReadOnlyError
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PRODUCT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Product(Item):
+    """A test item with nested list, dict and set attributes"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(
+        self, sku: int, tags: list[Any], meta: dict[str, Any], ids: set[int]
+    ) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.sku = sku
+        self.tags = tags
+        self.meta = meta
+        self.ids = ids
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("sku",)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ FROZEN PRODUCT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class FrozenProduct(Product):
+    """A test item whose class declares a read-only read mode"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Product.Meta):
+        """Meta Class"""
+
+        # Define read mode
+        READ = "frozen"
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET COLLECTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_collection(read: str) -> DictCollection:
+    """Returns a collection of a product with nested attributes in a read mode"""
+
+    # Initialize collection
+    collection = DictCollection(read=read)
+
+    # Push product
+    collection.push(Product(1, ["a", ["x"]], {"k": {"n": 1}}, {1}))
+
+    # Return collection
+    return collection
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ ASSERT UNCHANGED
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def assert_unchanged(collection: DictCollection) -> None:
+    """Asserts that the stored product still has its pushed attributes"""
+
+    # Get stored product
+    product = collection.first()
+
+    # Assert that attributes are unchanged
+    assert product.sku == 1
+    assert product.tags == ["a", ["x"]]
+    assert product.meta == {"k": {"n": 1}}
+    assert product.ids == {1}
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MUTATIONS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize mutations of a read item, including mutations of nested values
+MUTATIONS: list[Callable[[Any], Any]] = [
+    lambda product: setattr(product, "sku", 5),
+    lambda product: product.tags.append("b"),
+    lambda product: product.tags[1].append("y"),
+    lambda product: product.meta.__setitem__("z", 1),
+    lambda product: product.meta["k"].update(n=2),
+    lambda product: product.meta.get("k").pop("n"),
+    lambda product: product.ids.add(2),
+]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST MUTATIONS DO NOT REACH THE STORE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("read", ["copy", "cow"])
+@pytest.mark.parametrize("mutate", MUTATIONS)
+def test_mutations_do_not_reach_the_store(
+    read: str, mutate: Callable[[Any], Any]
+) -> None:
+    """Tests that mutating a read item, even deep down, leaves the store unchanged"""
+
+    # Get collection
+    collection = get_collection(read)
+
+    # Mutate a read product
+    mutate(collection.first())
+
+    # Assert that the stored product is unchanged
+    assert_unchanged(collection)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST FROZEN MUTATIONS RAISE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("mutate", MUTATIONS)
+def test_frozen_mutations_raise(mutate: Callable[[Any], Any]) -> None:
+    """Tests that mutating a read-only item, even deep down, raises ReadOnlyError"""
+
+    # Get collection
+    collection = get_collection("frozen")
+
+    # Assert that the mutation raises ReadOnlyError
+    with pytest.raises(ReadOnlyError):
+        mutate(collection.first())
+
+    # Assert that the stored product is unchanged
+    assert_unchanged(collection)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST COPY ON WRITE VIEWS SEE THEIR WRITES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_copy_on_write_views_see_their_writes() -> None:
+    """Tests that a copy-on-write view reads back its own nested writes"""
+
+    # Get collection
+    collection = get_collection("cow")
+
+    # Append to a nested list of a view
+    product = collection.first()
+    product.tags.append("b")
+    assert product.tags == ["a", ["x"], "b"]
+
+    # Extend a nested list of a view in place
+    product = collection.first()
+    product.tags += ["c"]
+    assert product.tags == ["a", ["x"], "c"]
+
+    # Set a deeply nested value of a view
+    product = collection.first()
+    product.meta["k"]["n"] = 5
+    assert product.meta["k"]["n"] == 5
+
+    # Assert that the stored product is unchanged
+    assert_unchanged(collection)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST VIEWS BEHAVE AS THEIR ITEMS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("read", ["cow", "frozen"])
+def test_views_behave_as_their_items(read: str) -> None:
+    """Tests that views pass as, copy to and pickle to plain items and values"""
+
+    # Get a read product
+    product = get_collection(read).first()
+
+    # Assert that the view passes as its item class
+    assert isinstance(product, Product)
+
+    # Assert that copies and pickles are plain items
+    assert type(copy.deepcopy(product)) is Product
+    assert type(pickle.loads(pickle.dumps(product))) is Product
+
+    # Assert that nested values copy, pickle and compare as plain values
+    assert copy.deepcopy(product.tags) == ["a", ["x"]]
+    assert pickle.loads(pickle.dumps(product.meta)) == {"k": {"n": 1}}
+    assert product.tags + ["q"] == ["a", ["x"], "q"]
+    assert "a" in product.tags and 1 in product.ids and len(product.meta) == 1
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST ITEM CLASS READ MODE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_item_class_read_mode() -> None:
+    """Tests that Meta.READ overrides the collection read mode"""
+
+    # Initialize collection and push product
+    collection = DictCollection()
+    collection.push(FrozenProduct(1, [], {}, set()))
+
+    # Assert that the read product is read-only
+    with pytest.raises(ReadOnlyError):
+        collection.first().sku = 3
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST INVALID READ MODE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_invalid_read_mode() -> None:
+    """Tests that an unknown read mode is rejected"""
+
+    # Assert that an unknown read mode raises ValueError
+    with pytest.raises(ValueError):
+        DictCollection(read="bogus")
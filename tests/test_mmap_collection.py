@@ -0,0 +1,186 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import asyncio
+import os
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import MmapCollection
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+from core.utils.exceptions import DoesNotExistError, DuplicateKeyError
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ NUMBER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Number(Item):
+    """A test item with a key and its remainder modulo four"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, n: int) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.n = n
+        self.m = n % 4
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("n",)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST QUERIES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_queries(tmp_path: Path) -> None:
+    """Tests filters, windows, keys and key changes of a memory-mapped collection"""
+
+    # Initialize items and push numbers
+    items = Items(collection=MmapCollection(str(tmp_path / "data")))
+    items.push_many(Number(i) for i in range(1000))
+
+    # Assert that counts, keys, filters and windows match the pushed numbers
+    assert items.count() == 1000 and items.key(7).n == 7
+    assert [n.n for n in items.filter(m=1).head(3)] == [1, 5, 9]
+    assert [n.n for n in items.tail(2)] == [998, 999] and items.last().n == 999
+    assert [n.n for n in items.slice(10, 12)] == [10, 11]
+    assert items.head(5).count() == 5 and items.filter(m=2).count() == 250
+
+    # Change the key of a number and push it
+    number = items.key(3)
+    number.n = 5000
+    items.push(number)
+
+    # Assert that the number keeps its position under its new key
+    assert items.key(5000).n == 5000
+    assert [n.n for n in items.head(4)] == [0, 1, 2, 5000]
+    assert items.order_by("-n").first().n == 5000
+
+    # Assert that the old key no longer exists
+    with pytest.raises(DoesNotExistError):
+        items.key(3)
+
+    # Assert that a duplicate key raises DuplicateKeyError
+    with pytest.raises(DuplicateKeyError):
+        items.push(Number(5))
+
+    # Assert that a new number is given an item ID
+    number = Number(1001)
+    items.push(number)
+    assert items.key(1001)._imeta.id == number._imeta.id is not None
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST WINDOWS DO NOT DECODE ITEMS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_windows_do_not_decode_items(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Tests that counts and windows are evaluated against offsets"""
+
+    # Initialize items and push numbers
+    items = Items(collection=MmapCollection(str(tmp_path / "data")))
+    items.push_many(Number(i) for i in range(100))
+
+    # Initialize the number of decoded items
+    calls = [0]
+
+    # Get hydrate method
+    hydrate = MmapCollection._hydrate
+
+    # Define counting hydrate method
+    def counting_hydrate(self: MmapCollection, buffer: Any, offset: int) -> Item:
+        """Counts and decodes an item"""
+
+        # Count and decode item
+        calls[0] += 1
+        return hydrate(self, buffer, offset)
+
+    # Count decoded items
+    monkeypatch.setattr(MmapCollection, "_hydrate", counting_hydrate)
+
+    # Assert that counts of windows decode no items
+    items.count()
+    items.head(3).count()
+    items.tail(1).count()
+    assert calls[0] == 0
+
+    # Assert that iterating a window decodes only its items
+    list(items.head(3))
+    assert calls[0] == 3
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST RECOVERY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_recovery(tmp_path: Path) -> None:
+    """Tests recovery after a crash, a torn record and a lost index"""
+
+    # Get file path
+    path = str(tmp_path / "data")
+
+    # Push numbers and close collection
+    collection = MmapCollection(path)
+    Items(collection=collection).push_many(Number(i) for i in range(100))
+    collection.close()
+
+    # Push a number without closing, as if the process crashed
+    Items(collection=MmapCollection(path)).push(Number(100))
+
+    # Assert that the number pushed before the crash is recovered
+    items = Items(collection=MmapCollection(path))
+    assert items.count() == 101 and items.key(100).n == 100
+
+    # Push numbers and tear the last one
+    items.push(Number(101))
+    items.push(Number(102))
+    with open(path, "r+b") as file:
+        file.truncate(os.path.getsize(path) - 3)
+
+    # Assert that the torn number is discarded
+    items = Items(collection=MmapCollection(path))
+    assert items.count() == 102 and items.last().n == 101
+
+    # Assert that the key of the torn number can be pushed again
+    items.push(Number(102))
+    assert items.key(102).n == 102
+    assert asyncio.run(items.acount()) == 103
+
+    # Assert that a lost index is rebuilt from records
+    os.remove(f"{path}.index")
+    assert Items(collection=MmapCollection(path)).count() == 103
+
+    # Assert that a file that is not a collection raises ValueError
+    with open(tmp_path / "bad", "wb") as file:
+        file.write(b"notacollection")
+    with pytest.raises(ValueError):
+        MmapCollection(str(tmp_path / "bad"))
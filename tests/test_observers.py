@@ -0,0 +1,263 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from typing import Any, Generator
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import (
+    ColumnarCollection,
+    DictCollection,
+    SqliteCollection,
+)
+from core.utils.classes.collection.collection import Collection
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+from core.utils.exceptions import DoesNotExistError
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RECORD
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Record(Item):
+    """A test item with a key and a parity string"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, n: int) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.n = n
+        self.s = "a" if n % 2 else "b"
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("n",)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ LEGACY COLLECTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class LegacyCollection(Collection):
+    """A test collection written before count and key had default implementations"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self) -> None:
+        """Init Method"""
+
+        # Initialize stored items
+        self.data: list[Any] = []
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COLLECT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def collect(
+        self, items: Items | None = None, subset: Any = None, quick: bool = False
+    ) -> Generator[Any, None, None]:
+        """Yields stored items"""
+
+        # Yield stored items
+        yield from self.data
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COUNT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def count(self, items: Items | None = None) -> int:
+        """Returns a fixed count"""
+
+        # Return count
+        return 42
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ KEY
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def key(self, key: Any, items: Items | None = None) -> Any:
+        """Returns a fixed item"""
+
+        # Return item
+        return "k"
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PUSH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def push(self, item: Any) -> None:
+        """Pushes an item"""
+
+        # Append item
+        self.data.append(item)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ BARE COLLECTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class BareCollection(Collection):
+    """A test collection that implements only collect and push"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self) -> None:
+        """Init Method"""
+
+        # Initialize stored items
+        self.data: list[Any] = [1, 2]
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ COLLECT
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def collect(
+        self, items: Items | None = None, subset: Any = None, quick: bool = False
+    ) -> Generator[Any, None, None]:
+        """Yields stored items"""
+
+        # Yield stored items
+        yield from self.data
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ PUSH
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def push(self, item: Any) -> None:
+        """Pushes an item"""
+
+        # Append item
+        self.data.append(item)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST OBSERVERS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "collection_class", [DictCollection, ColumnarCollection, SqliteCollection]
+)
+def test_observers(collection_class: Any) -> None:
+    """Tests the events observers receive for pushes, filters, reads and keys"""
+
+    # Initialize collection and items and push records
+    collection = collection_class()
+    items = Items(collection=collection)
+    items.push_many(Record(i) for i in range(100))
+
+    # Observe collection
+    events: list[dict[str, Any]] = []
+    observer = collection.observe(events.append)
+
+    # Assert that a push is observed
+    items.push(Record(100))
+    assert events[-1]["operation"] == "push" and events[-1]["yielded"] == 1
+
+    # Assert that a filter is observed with its conditions
+    filtered = items.filter(s="a")
+    assert events[-1]["operation"] == "filter"
+    assert events[-1]["conditions"] == (("s", "equals"),)
+
+    # Assert that a collection is observed with its counts
+    list(filtered)
+    assert events[-1]["operation"] == "collect"
+    assert events[-1]["yielded"] == 50 and events[-1]["scanned"] >= 50
+
+    # Assert that a count is observed
+    assert filtered.count() == 50
+    assert any(event["operation"] == "count" for event in events)
+
+    # Assert that found and missing keys are observed
+    items.key(5)
+    assert events[-1]["operation"] == "key" and events[-1]["yielded"] == 1
+    with pytest.raises(DoesNotExistError):
+        items.key(999)
+    assert events[-1]["operation"] == "key" and events[-1]["yielded"] == 0
+
+    # Assert that a partially consumed collection is observed once closed
+    records = iter(items.filter(s="b"))
+    next(records)
+    records.close()
+    assert events[-1]["operation"] == "collect" and events[-1]["yielded"] == 1
+
+    # Assert that an unobserved collection emits no events
+    collection.unobserve(observer)
+    size = len(events)
+    list(items)
+    items.count()
+    assert len(events) == size
+
+    # Assert that unobserving an unknown observer raises ValueError
+    with pytest.raises(ValueError):
+        collection.unobserve(observer)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST DICT COLLECTION EVENTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_dict_collection_events() -> None:
+    """Tests that a dict collection reports scanned items and copy time"""
+
+    # Initialize collection and items and push records
+    collection = DictCollection()
+    items = Items(collection=collection)
+    items.push_many(Record(i) for i in range(101))
+
+    # Observe collection
+    events: list[dict[str, Any]] = []
+    collection.observe(events.append)
+
+    # Collect filtered records
+    list(items.filter(s="a"))
+
+    # Assert that every record was scanned and copies were timed
+    assert events[-1]["scanned"] == 101 and events[-1]["copy_time"] > 0
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST SUBCLASSES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_subclasses() -> None:
+    """Tests that subclasses need not implement count and key"""
+
+    # Assert that a subclass overriding count and key keeps its methods
+    legacy = LegacyCollection()
+    assert legacy.count() == 42 and legacy.key(1) == "k"
+
+    # Assert that a subclass without count counts collected items
+    bare = BareCollection()
+    assert bare.count() == 2
+
+    # Assert that a subclass without key does not support key lookups
+    with pytest.raises(NotImplementedError, match="does not support key lookups"):
+        bare.key(1)
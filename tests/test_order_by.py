@@ -0,0 +1,260 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import random
+
+from typing import Any, Callable
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import (
+    ColumnarCollection,
+    DictCollection,
+    SqliteCollection,
+)
+from core.utils.classes.index import Sorted
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PRODUCT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Product(Item):
+    """A test item with a key, a hash index and sorted indexes"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, n: int, c: str, s: Any, name: str) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.n = n
+        self.c = c
+        self.s = s
+        self.name = name
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("n",)
+
+        # Define indexes
+        INDEXES = ("c", Sorted("s"), Sorted("name"))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ FACTORIES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize collection factories
+FACTORIES: list[Callable[[], Any]] = [
+    DictCollection,
+    lambda: DictCollection(threadsafe=True, cache_size=16),
+    ColumnarCollection,
+    SqliteCollection,
+]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET ITEMS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_items(factory: Callable[[], Any]) -> Items:
+    """Returns items of products pushed out of order, some of which were updated"""
+
+    # Initialize random number generator
+    generator = random.Random(3)
+
+    # Initialize and shuffle numbers
+    numbers = list(range(300))
+    generator.shuffle(numbers)
+
+    # Initialize items
+    items = Items(collection=factory())
+
+    # Push products
+    items.push_many(
+        Product(
+            n,
+            generator.choice("abc"),
+            generator.choice([generator.randint(0, 20), None, generator.random() * 20]),
+            generator.choice("xyz"),
+        )
+        for n in numbers
+    )
+
+    # Iterate over updates
+    for _ in range(30):
+        # Change the score of a random product and push it
+        product = items.key(generator.randrange(300))
+        product.s = generator.choice([None, 5, 7.5])
+        items.push(product)
+
+    # Return items
+    return items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET REFERENCE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_reference(items: Items, attrs: tuple[str, ...]) -> list[int]:
+    """Returns the numbers of products sorted by a stable sort per attribute"""
+
+    # Initialize products
+    products = list(items)
+
+    # Iterate over attributes from the last
+    for attr in reversed(attrs):
+        # Get attribute name
+        name = attr.lstrip("-")
+
+        # Sort products by attribute, with None last in ascending order
+        products.sort(
+            key=lambda p: (getattr(p, name) is None, getattr(p, name)),
+            reverse=attr.startswith("-"),
+        )
+
+    # Return numbers
+    return [product.n for product in products]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST ORDERS MATCH A REFERENCE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("factory", FACTORIES)
+@pytest.mark.parametrize(
+    "attrs",
+    [("s",), ("-s",), ("-s", "name"), ("s", "-name"), ("name", "-s", "n"), ("c", "s")],
+)
+def test_orders_match_a_reference(
+    factory: Callable[[], Any], attrs: tuple[str, ...]
+) -> None:
+    """Tests ordered items, windows, ends and pages against a reference sort"""
+
+    # Get items
+    items = get_items(factory)
+
+    # Iterate over bases
+    for base in (
+        items,
+        items.filter(c="a"),
+        items.filter(c__in=["a", "b"], name="x"),
+        items.head(100),
+        items.filter(s__gte=5),
+    ):
+        # Get reference numbers and ordered items
+        expected = get_reference(base, attrs)
+        ordered = base.order_by(*attrs)
+
+        # Assert that ordered items match the reference
+        assert [p.n for p in ordered] == expected
+
+        # Iterate over top-k sizes
+        for k in (0, 1, 7, 1000):
+            # Assert that top-k items match the reference
+            assert [p.n for p in ordered.head(k)] == expected[:k]
+            assert [p.n for p in ordered.head(k + 3).head(k)] == expected[:k]
+
+        # Assert that windows match the reference
+        assert [p.n for p in ordered.slice(3, 12)] == expected[3:12]
+        assert [p.n for p in ordered.slice(-5, -1)] == expected[-5:-1]
+        assert [p.n for p in ordered.tail(4)] == expected[-4:]
+        assert ordered.head(9).count() == len(expected[:9])
+
+        # Assert that a filter after a window keeps the order
+        assert [p.n for p in ordered.head(20).filter(c="b")] == [
+            n for n in expected[:20] if items.key(n).c == "b"
+        ]
+
+        # Get first and last products
+        first, last = ordered.first(), ordered.last()
+
+        # Assert that ends match the reference
+        assert (first.n if first else None) == (expected[0] if expected else None)
+        assert (last.n if last else None) == (expected[-1] if expected else None)
+
+        # Initialize paged numbers and cursor
+        paged: list[int] = []
+        cursor = None
+
+        # Iterate over pages
+        while True:
+            # Get page
+            page, cursor = ordered.page(size=13, after=cursor)
+
+            # Break after the last page
+            if not page:
+                break
+
+            # Add page numbers
+            paged += [p.n for p in page]
+
+        # Assert that pages match the reference
+        assert paged == expected
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST ORDER ERRORS AND COPIES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("factory", FACTORIES)
+def test_order_errors_and_copies(factory: Callable[[], Any]) -> None:
+    """Tests that ordered products are copies and that invalid orders raise"""
+
+    # Get items
+    items = get_items(factory)
+
+    # Assert that ordered products are copies
+    top = items.order_by("-n").first()
+    top.s = "zzz"
+    assert items.key(top.n).s != "zzz"
+
+    # Assert that invalid attributes raise ValueError
+    for attrs in (("",), ("-",), ()):
+        with pytest.raises(ValueError):
+            items.order_by(*attrs)
+
+    # Assert that values that cannot be compared raise TypeError
+    product = items.key(0)
+    product.s = "str"
+    items.push(product)
+    with pytest.raises(TypeError):
+        list(items.order_by("s").head(3))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST ORDER USES A SORTED INDEX
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_order_uses_a_sorted_index() -> None:
+    """Tests that a leading order walks a sorted index"""
+
+    # Get items
+    items = get_items(DictCollection)
+
+    # Assert that the order is planned over the sorted index
+    assert "SortedIndex('s')" in items.order_by("-s").head(5).explain()
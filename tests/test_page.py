@@ -0,0 +1,187 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from itertools import count
+from typing import Any
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import (
+    ColumnarCollection,
+    DictCollection,
+    SqliteCollection,
+)
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RECORD
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Record(Item):
+    """A test item with an indexed parity string"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, n: int) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.n = n
+        self.s = "a" if n % 2 else "b"
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define indexes
+        INDEXES = ("s",)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MONOTONIC RECORD
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class MonotonicRecord(Record):
+    """A test item timestamped by a monotonic clock"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define clock
+        CLOCK = "monotonic"
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ UNTIMED RECORD
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class UntimedRecord(Record):
+    """A test item that is not timestamped"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define clock
+        CLOCK = "none"
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ QUERIES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize queries that seek by position, filter by index, scan, and order
+QUERIES = [
+    lambda items: items,
+    lambda items: items.filter(s="a"),
+    lambda items: items.filter(n__gte=0),
+    lambda items: items.order_by("-n"),
+]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST PAGE CLOCKS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("query", QUERIES)
+@pytest.mark.parametrize(
+    "collection_class", [DictCollection, ColumnarCollection, SqliteCollection]
+)
+def test_page_clocks(collection_class: Any, query: Any) -> None:
+    """Tests that a page stamps pulled timestamps once per item class"""
+
+    # Initialize items with a counting clock
+    ticks = count()
+    items = Items(collection=collection_class(clock=lambda: next(ticks)))
+
+    # Push records of every clock
+    items.push_many(
+        [Record(1), MonotonicRecord(3), UntimedRecord(5), Record(7), Record(8)]
+    )
+
+    # Get page
+    page, _ = query(items).page(size=10)
+
+    # Get pulled timestamps by class
+    pulled: dict[type, set[Any]] = {}
+    for record in page:
+        pulled.setdefault(record.__class__, set()).add(record._imeta.pulled_at)
+
+    # Assert that pulled timestamps follow the clock of each class, read once
+    assert len(pulled[Record]) == 1 and isinstance(next(iter(pulled[Record])), int)
+    assert isinstance(next(iter(pulled[MonotonicRecord])), float)
+    assert pulled[UntimedRecord] == {None}
+
+    # Assert that a later page is stamped anew
+    later, _ = query(items).page(size=10)
+    stamps = {record._imeta.pulled_at for record in later if type(record) is Record}
+    assert min(stamps) > max(pulled[Record])
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST PAGE EVENTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("query", QUERIES)
+@pytest.mark.parametrize(
+    "collection_class", [DictCollection, ColumnarCollection, SqliteCollection]
+)
+def test_page_events(collection_class: Any, query: Any) -> None:
+    """Tests that observers receive an event for every page"""
+
+    # Initialize collection and items and push records
+    collection = collection_class()
+    items = Items(collection=collection)
+    items.push_many(Record(i) for i in range(25))
+
+    # Observe collection
+    events: list[dict[str, Any]] = []
+    observer = collection.observe(events.append)
+
+    # Walk pages
+    after, sizes = None, []
+    while True:
+        page, after = query(items).page(size=10, after=after)
+        sizes.append(len(page))
+        if not page:
+            break
+
+    # Get page events
+    pages = [event for event in events if event["operation"] == "page"]
+
+    # Assert that every page was observed with its size and conditions
+    assert [event["yielded"] for event in pages] == sizes
+    assert all(event["collection"] is collection for event in pages)
+    assert pages[0]["conditions"] == collection._get_conditions(query(items))
+
+    # Assert that an unobserved collection emits no page events
+    collection.unobserve(observer)
+    size = len(events)
+    items.page(size=10)
+    assert len(events) == size
@@ -0,0 +1,223 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import random
+import re
+
+from typing import Any, Callable
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import (
+    ColumnarCollection,
+    DictCollection,
+    SqliteCollection,
+)
+from core.utils.classes.index import Sorted
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PRODUCT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Product(Item):
+    """A test item with a key, a hash index and a sorted index"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, n: int, c: str = "a", v: int = 0) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.n = n
+        self.c = c
+        self.v = v
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("n",)
+
+        # Define indexes
+        INDEXES = ("c", Sorted("v"))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ FACTORIES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize collection factories
+FACTORIES: list[Callable[[], Any]] = [
+    DictCollection,
+    lambda: DictCollection(threadsafe=True),
+    ColumnarCollection,
+    SqliteCollection,
+]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET ITEMS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_items(factory: Callable[[], Any]) -> Items:
+    """Returns items of random products, some of which were updated"""
+
+    # Initialize random number generator
+    generator = random.Random(5)
+
+    # Initialize items
+    items = Items(collection=factory())
+
+    # Push products
+    items.push_many(
+        Product(n, generator.choice("abc"), generator.randint(0, 50))
+        for n in range(500)
+    )
+
+    # Iterate over updates
+    for _ in range(5):
+        # Change the value of a random product and push it
+        product = items.key(generator.randrange(500))
+        product.v = 99
+        items.push(product)
+
+    # Return items
+    return items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ WALK
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def walk(items: Items, size: int) -> list[int]:
+    """Returns the numbers of products collected page by page"""
+
+    # Initialize numbers and cursor
+    numbers: list[int] = []
+    cursor = None
+
+    # Iterate over pages
+    while True:
+        # Get page
+        page, cursor = items.page(size=size, after=cursor)
+        numbers += [product.n for product in page]
+
+        # Return numbers after the last page
+        if len(page) < size:
+            return numbers
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST PAGES MATCH ITERATION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("factory", FACTORIES)
+def test_pages_match_iteration(factory: Callable[[], Any]) -> None:
+    """Tests that walking pages of any size yields the products of iteration"""
+
+    # Get items
+    items = get_items(factory)
+
+    # Iterate over queries
+    for query in (
+        items,
+        items.filter(c="a"),
+        items.filter(v__gte=20, c__in=["a", "b"]),
+        items.filter(n__gte=10),
+        items.filter(c="b").head(40),
+        items.slice(-50, -3),
+    ):
+        # Iterate over page sizes
+        for size in (1, 7, 100, 1000):
+            # Assert that pages match iteration
+            assert walk(query, size) == [product.n for product in query]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST PAGES ARE STABLE ACROSS PUSHES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("factory", FACTORIES)
+def test_pages_are_stable_across_pushes(factory: Callable[[], Any]) -> None:
+    """Tests that pushes between pages neither repeat nor skip products"""
+
+    # Get filtered items
+    items = get_items(factory)
+    filtered = items.filter(c="a")
+
+    # Get first page
+    page, cursor = filtered.page(size=10)
+    seen = [product.n for product in page]
+
+    # Iterate over numbers of pushed products
+    for n in range(500, 10**6, 3):
+        # Push products between pages
+        items.push_many(Product(n + i) for i in range(3))
+
+        # Get next page
+        page, cursor = filtered.page(size=10, after=cursor)
+        seen += [product.n for product in page]
+
+        # Break after the last page
+        if len(page) < 10:
+            break
+
+    # Assert that every product was seen once in order
+    assert seen == [product.n for product in filtered]
+
+    # Assert that a page past the end is empty and keeps its cursor
+    assert filtered.page(size=10, after=cursor) == ([], cursor)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST CURSORS ARE OPAQUE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("factory", FACTORIES)
+def test_cursors_are_opaque(factory: Callable[[], Any]) -> None:
+    """Tests that cursors are URL-safe strings and that invalid ones are rejected"""
+
+    # Get items
+    items = get_items(factory)
+
+    # Get cursor
+    _, cursor = items.page(size=3)
+
+    # Assert that the cursor is URL-safe
+    assert isinstance(cursor, str) and re.fullmatch(r"[A-Za-z0-9_=-]+", cursor)
+
+    # Get a well-formed cursor of a kind that the collection does not use
+    unknown = items._collection._encode_cursor("unknown", "1")
+
+    # Iterate over invalid cursors
+    for invalid in ("garbage!", "", "Zm9v", unknown):
+        # Assert that the invalid cursor raises ValueError
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            items.page(size=3, after=invalid)
+
+    # Assert that pages are copies
+    page, _ = items.page(size=1)
+    page[0].v = -1
+    assert items.first().v != -1
@@ -0,0 +1,220 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import (
+    ColumnarCollection,
+    DictCollection,
+    ShardedCollection,
+    SqliteCollection,
+)
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ NUMBER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Number(Item):
+    """A test item with a key and its remainder modulo seven"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, n: int) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.n = n
+        self.m = n % 7
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("n",)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ MULTIPLES OF THREE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def multiples_of_three(items: Iterable[Number]) -> Iterator[Number]:
+    """Yields numbers that are multiples of three, importable by pool workers"""
+
+    # Return multiples of three
+    return (item for item in items if item.n % 3 == 0)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TIMES TEN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def times_ten(items: Iterable[Number]) -> Iterator[Number]:
+    """Yields new numbers ten times as large, importable by pool workers"""
+
+    # Iterate over items
+    for item in items:
+        # Yield a new number
+        yield Number(item.n * 10)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST PARALLEL FILTERS MATCH SERIAL FILTERS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        DictCollection,
+        ColumnarCollection,
+        SqliteCollection,
+        lambda: ShardedCollection(shards=3),
+    ],
+)
+def test_parallel_filters_match_serial_filters(factory: Callable[[], Any]) -> None:
+    """Tests that filters run in a pool yield the numbers of serial filters"""
+
+    # Initialize items and push numbers
+    items = Items(collection=factory())
+    items.push_many(Number(i) for i in range(5000))
+
+    # Get numbers filtered serially
+    expected = [number.n for number in items.filter(m=3)]
+
+    # Iterate over thresholds above and below the number of items
+    for threshold in (0, 10, 10**6):
+        # Get parallel items
+        parallel = items.parallel(workers=2, threshold=threshold)
+
+        # Assert that parallel filters match serial filters
+        assert [number.n for number in parallel.filter(m=3)] == expected
+        assert [number.n for number in parallel.filter(m=3).filter(n__gte=100)] == [
+            n for n in expected if n >= 100
+        ]
+        assert parallel.filter(m=3).count() == len(expected)
+
+    # Assert that later operations apply to parallel results
+    parallel = items.parallel(workers=2, threshold=0)
+    assert [number.n for number in parallel.filter(m=3).order_by("-n").head(3)] == [
+        4994,
+        4987,
+        4980,
+    ]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST PARALLEL CALLABLES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_parallel_callables() -> None:
+    """Tests that picklable callables run in a pool and others run serially"""
+
+    # Initialize collection and push numbers
+    collection = DictCollection()
+    collection.push_many(Number(i) for i in range(200))
+
+    # Get parallel items
+    parallel = collection.all().parallel(workers=2, threshold=0)
+
+    # Assert that a filter and a picklable callable run in the pool
+    assert [
+        number.n
+        for number in collection.apply(parallel.filter(n__gte=10), multiples_of_three)
+    ] == [i for i in range(10, 200) if i % 3 == 0]
+
+    # Assert that a callable yielding new items runs in the pool
+    assert [number.n for number in collection.apply(parallel, times_ten)] == [
+        i * 10 for i in range(200)
+    ]
+
+    # Assert that a lambda, which cannot be pickled, runs serially
+    assert [
+        number.n
+        for number in collection.apply(
+            parallel, lambda items: (i for i in items if i.n < 5)
+        )
+    ] == list(range(5))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST THRESHOLD IS PEEKED
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_threshold_is_peeked() -> None:
+    """Tests that fewer items than the threshold are filtered serially"""
+
+    # Initialize collection
+    collection = DictCollection()
+
+    # Initialize the number of items read
+    read = [0]
+
+    # Define numbers
+    def numbers() -> Iterator[Number]:
+        """Yields numbers, counting how many were read"""
+
+        # Iterate over numbers
+        for i in range(50):
+            # Count and yield number
+            read[0] += 1
+            yield Number(i)
+
+    # Filter numbers below the threshold
+    filtered = collection._parallelize(numbers(), ((("n", "lt", 3),),), 4, 100)
+
+    # Assert that numbers below the threshold are filtered serially
+    assert [number.n for number in islice(filtered, 3)] == [0, 1, 2]
+    assert read[0] == 50
+
+    # Filter numbers without a pool
+    read[0] = 0
+    filtered = collection._parallelize(numbers(), ((("n", "lt", 3),),), 1, 100)
+
+    # Assert that numbers are filtered lazily
+    assert [number.n for number in islice(filtered, 3)] == [0, 1, 2]
+    assert read[0] == 3
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST INVALID ARGUMENTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_invalid_arguments() -> None:
+    """Tests that invalid numbers of workers and thresholds are rejected"""
+
+    # Initialize items
+    items = Items(collection=DictCollection())
+
+    # Assert that invalid numbers of workers raise ValueError
+    for workers in (0, -1, "x"):
+        with pytest.raises(ValueError):
+            items.parallel(workers=workers)  # type: ignore[arg-type]
+
+    # Assert that a negative threshold raises ValueError
+    with pytest.raises(ValueError):
+        items.parallel(threshold=-1)
@@ -0,0 +1,180 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import random
+
+from collections import deque
+from typing import Callable
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import DictCollection
+from core.utils.classes.index import Sorted
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PRODUCT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Product(Item):
+    """A test item with a key, a composite key, hash indexes and a sorted index"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, sku: int, category: str, n: int, color: str, price: int) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.sku = sku
+        self.category = category
+        self.n = n
+        self.color = color
+        self.price = price
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("sku", ("category", "n"))
+
+        # Define indexes
+        INDEXES = (Sorted("price"), "category", "color")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET ITEMS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_items(size: int = 3000) -> Items:
+    """Returns items of products with random categories, colors and prices"""
+
+    # Initialize random number generator
+    generator = random.Random(3)
+
+    # Initialize items
+    items = Items(collection=DictCollection())
+
+    # Push products
+    items.push_many(
+        Product(
+            sku,
+            generator.choice("abcdefghij"),
+            sku,
+            generator.choice(["red", "blue", "Green"]),
+            generator.randint(0, 1000),
+        )
+        for sku in range(size)
+    )
+
+    # Return items
+    return items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SCAN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def scan(items: Items) -> list[int]:
+    """Returns the SKUs of items evaluated operation by operation over all items"""
+
+    # Get collection
+    collection = items._collection
+
+    # Initialize products
+    products = list(collection._items_by_id.values())
+
+    # Iterate over operations
+    for operation in items._operations:
+        # Get operation name
+        name = operation[0]
+
+        # Apply operation
+        if name == "filter":
+            products = list(collection._filter(products, operation[1]))
+        elif name == "head":
+            products = products[: operation[1]]
+        elif name == "tail":
+            products = list(deque(products, maxlen=operation[1]))
+        elif name == "slice":
+            products = products[operation[1] : operation[2]]
+
+    # Return SKUs
+    return [product.sku for product in products]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST PLANS MATCH A SCAN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "query, plan",
+    [
+        (lambda items: items.filter(category="a").filter(color="red"), "INTERSECT"),
+        (
+            lambda items: items.filter(category="a", price__gte=100, price__lt=120),
+            "FILTER",
+        ),
+        (lambda items: items.filter(sku=5), "INDEX KEY 'sku'"),
+        (lambda items: items.filter(sku__in=[5, 7, 99999]), "INDEX KEY 'sku'"),
+        (lambda items: items.filter(category="b", n=5), "INDEX KEY ('category'"),
+        (lambda items: items.filter(color__ieq="GREEN").head(5), "HashIndex('color')"),
+        (lambda items: items.filter(price__gt=990).tail(3), "SortedIndex('price')"),
+        (lambda items: items.filter(category="c").slice(2, 6), "POSITIONAL SLICE"),
+        (lambda items: items.head(10).filter(category="a"), "POSITIONS"),
+        (lambda items: items.filter(price__lt=5, color__in=["red"]), "SortedIndex"),
+        (lambda items: items.filter(n__gte=2990), "SCAN"),
+    ],
+)
+def test_plans_match_a_scan(query: Callable[[Items], Items], plan: str) -> None:
+    """Tests that each planned query yields the items and count of a full scan"""
+
+    # Get queried items
+    items = query(get_items())
+
+    # Get the SKUs of a scan
+    expected = scan(items)
+
+    # Assert that the plan is described
+    assert plan in items.explain()
+
+    # Assert that the planned query matches a scan
+    assert [product.sku for product in items] == expected
+    assert items.count() == len(expected)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST INDEX NARROWS A FILTER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_index_narrows_a_filter() -> None:
+    """Tests that the most selective index is chosen and the rest is filtered"""
+
+    # Get filtered items
+    items = get_items().filter(category="a", price__gte=100, price__lt=120)
+
+    # Get plan lines
+    lines = items.explain().splitlines()
+
+    # Assert that the sorted range drives the plan and the category is filtered
+    assert lines[0].startswith("INDEX SortedIndex('price')")
+    assert lines[1] == "FILTER category equals 'a'"
@@ -0,0 +1,195 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import random
+
+from typing import Any
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import DictCollection
+from core.utils.classes.collection.collection import Collection
+from core.utils.classes.index import Sorted
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PRODUCT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Product(Item):
+    """A test item with a key, a hash index and a sorted index"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, n: int, c: str, v: int) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.n = n
+        self.c = c
+        self.v = v
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("n",)
+
+        # Define indexes
+        INDEXES = ("c", Sorted("v"))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET ITEMS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_items(generator: random.Random) -> Items:
+    """Returns items of products with some explicit IDs out of order and updates"""
+
+    # Initialize items
+    items = Items(collection=DictCollection())
+
+    # Iterate over numbers
+    for n in range(200):
+        # Initialize product
+        product = Product(n, generator.choice("abc"), generator.randint(0, 50))
+
+        # Set an explicit ID that is out of order on some products
+        if n % 17 == 5:
+            product._imeta.id = str(100000 - n)
+
+        # Push product
+        items.push(product)
+
+    # Iterate over updates
+    for _ in range(30):
+        # Change the value of a random product and push it
+        product = items.key(generator.randrange(200))
+        product.v = generator.randint(0, 50)
+        items.push(product)
+
+    # Return items
+    return items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST WINDOWS MATCH A LIST
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_windows_match_a_list() -> None:
+    """Tests random heads, slices and tails against slices of a materialized list"""
+
+    # Initialize random number generator
+    generator = random.Random(3)
+
+    # Get items
+    items = get_items(generator)
+
+    # Assert that positions are kept in push order despite out of order IDs
+    assert not items._collection._ordered
+
+    # Initialize bases
+    bases = [
+        items,
+        items.filter(c="a"),
+        items.filter(v__gte=25),
+        items.filter(c="b", v__lt=10),
+        items.filter(n__gte=100),
+    ]
+
+    # Iterate over trials
+    for _ in range(1000):
+        # Get a random base and its numbers
+        windowed = base = generator.choice(bases)
+        expected = [product.n for product in base]
+
+        # Iterate over random windows
+        for _ in range(generator.randint(1, 3)):
+            # Get a random window
+            window: Any = generator.choice(
+                [
+                    ("head", generator.randint(-2, 30)),
+                    ("slice", generator.randint(-40, 40), generator.randint(-40, 40)),
+                    ("tail", generator.randint(0, 30)),
+                ]
+            )
+
+            # Apply window
+            windowed = getattr(windowed, window[0])(*window[1:])
+
+            # Apply window to expected numbers
+            if window[0] == "head":
+                expected = expected[: max(window[1], 0)]
+            elif window[0] == "slice":
+                expected = expected[window[1] : window[2]]
+            else:
+                expected = expected[max(len(expected) - window[1], 0) :]
+
+        # Assert that the window matches expected numbers
+        assert [product.n for product in windowed] == expected
+        assert windowed.count() == len(expected)
+
+        # Get last product
+        last = windowed.last()
+
+        # Assert that the last product matches
+        assert (last.n if last else None) == (expected[-1] if expected else None)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST INDEXED ORDER MATCHES A SCAN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_indexed_order_matches_a_scan() -> None:
+    """Tests that an indexed filter yields products in push order"""
+
+    # Get items
+    items = get_items(random.Random(1))
+
+    # Assert that indexed products are in the order of a scan
+    assert [p.n for p in items.filter(c="a")] == [p.n for p in items if p.c == "a"]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST WINDOWS USE POSITIONS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_windows_use_positions() -> None:
+    """Tests that unfiltered windows are served by positions"""
+
+    # Get items
+    items = get_items(random.Random(1))
+
+    # Assert that windows are planned over positions
+    assert items.slice(-5, -1).explain().startswith("POSITIONS")
+    assert items.tail(3).explain().startswith("POSITIONS")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST SLICES YIELD ONCE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_slices_yield_once() -> None:
+    """Tests that a negative slice of an iterable yields its items once"""
+
+    # Assert that a negative slice is not yielded twice
+    assert list(Collection._slice(DictCollection(), [1, 2, 3, 4], -2, 4)) == [3, 4]
@@ -0,0 +1,118 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.functions.predicate import compile_conditions
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST CONDITIONS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "actual, operator, expected, result",
+    [
+        ("a", "equals", "a", True),
+        (1, "equals", 1.0, True),
+        (1, "equals", True, True),
+        ("A", "iequals", "a", True),
+        (["a", "B"], "iequals", ["A", "b"], False),
+        (b"a", "iequals", b"A", False),
+        (1, "lt", 2, True),
+        ("a", "lt", 1, False),
+        (None, "lt", 1, False),
+        (float("nan"), "gte", 0, False),
+        (Decimal("1"), "lte", 1, True),
+        (2**70, "gt", 1.0, True),
+        ("a", "in", ["a", "b"], True),
+        ("a", "in", "ab", True),
+        (["a"], "in", [["a"]], True),
+        ({"a": 1}, "in", [{"a": 1}], True),
+        (None, "in", [None], True),
+        ("c", "in", {"a", "b"}, False),
+        ("A", "iin", ["a"], True),
+        ("A", "iin", "xab", True),
+        (["a", "B"], "contains", "a", True),
+        ("ab", "contains", "b", True),
+        ({"a": 1}, "contains", "a", True),
+        (["a", "B"], "icontains", "b", True),
+        ("AB", "icontains", "b", True),
+        ("AB", "icontains", "c", False),
+    ],
+)
+def test_conditions(actual: Any, operator: str, expected: Any, result: bool) -> None:
+    """Tests that a compiled condition matches the semantics of each operator"""
+
+    # Compile predicate
+    predicate = compile_conditions((("x", operator, expected),))
+
+    # Assert that the predicate returns the expected result
+    assert predicate(SimpleNamespace(x=actual)) is result
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST UNSUPPORTED CONTAINMENT RAISES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("actual", [5, None])
+def test_unsupported_containment_raises(actual: Any) -> None:
+    """Tests that containment in a value that is not a container raises TypeError"""
+
+    # Compile predicate
+    predicate = compile_conditions((("x", "contains", "a"),))
+
+    # Assert that the predicate raises TypeError
+    with pytest.raises(TypeError):
+        predicate(SimpleNamespace(x=actual))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST SEVERAL CONDITIONS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_several_conditions() -> None:
+    """Tests that conditions are combined and evaluated in order"""
+
+    # Initialize item
+    item = SimpleNamespace(x="a", y=3)
+
+    # Assert that every condition must hold
+    assert compile_conditions((("x", "equals", "a"), ("y", "gt", 2)))(item)
+    assert not compile_conditions((("x", "equals", "a"), ("y", "gt", 3)))(item)
+
+    # Assert that a failed condition short-circuits a missing attribute
+    assert not compile_conditions((("x", "equals", "b"), ("z", "gt", 2)))(item)
+
+    # Assert that a missing attribute raises once it is evaluated
+    with pytest.raises(AttributeError):
+        compile_conditions((("x", "equals", "a"), ("z", "gt", 2)))(item)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST ONE-SHOT ITERATORS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_one_shot_iterators() -> None:
+    """Tests that an expected iterator is consumed once and reused across items"""
+
+    # Compile predicate
+    predicate = compile_conditions((("x", "in", (c for c in "ab")),))
+
+    # Assert that every item is tested against the whole iterator
+    assert [predicate(SimpleNamespace(x=x)) for x in "abc"] == [True, True, False]
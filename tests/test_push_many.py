@@ -0,0 +1,244 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import (
+    ColumnarCollection,
+    DictCollection,
+    MmapCollection,
+    ShardedCollection,
+    SqliteCollection,
+)
+from core.utils.classes.index import Sorted
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+from core.utils.exceptions import DuplicateKeyError
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PRODUCT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Product(Item):
+    """A test item with a key, a composite key and indexes"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, sku: int, code: str, v: int = 0) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.sku = sku
+        self.code = code
+        self.v = v
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("sku", ("code", "v"))
+
+        # Define indexes
+        INDEXES = ("code", Sorted("v"))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PAIR
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Pair(Item):
+    """A test item with two keys that may share a value"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, a: int, b: int) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.a = a
+        self.b = b
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("a", "b")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET STATE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_state(items: Items) -> list[tuple[Any, ...]]:
+    """Returns the attributes and IDs of stored products"""
+
+    # Return sorted attributes and IDs
+    return sorted((p.sku, p.code, p.v, p._imeta.id) for p in items)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ COLLECTION CLASSES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+# Initialize collection classes that support batch pushes
+COLLECTION_CLASSES = [DictCollection, ColumnarCollection, SqliteCollection]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST BATCH PUSH
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("collection_class", COLLECTION_CLASSES)
+def test_batch_push(collection_class: Any) -> None:
+    """Tests that a batch is pushed with a single timestamp and indexed"""
+
+    # Initialize items
+    items = Items(collection=collection_class())
+
+    # Push batch
+    batch = [Product(i, f"c{i}") for i in range(100)]
+    items.push_many(batch)
+
+    # Assert that every product shares the same push timestamp
+    assert batch[0]._imeta.pushed_at is not None
+    assert len({product._imeta.pushed_at for product in batch}) == 1
+
+    # Assert that products are stored and indexed
+    assert items.count() == 100
+    assert items.filter(code="c5").count() == 1
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST DUPLICATES ROLL BACK
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("collection_class", COLLECTION_CLASSES)
+def test_duplicates_roll_back(collection_class: Any) -> None:
+    """Tests that a batch with a duplicate key stores none of its products"""
+
+    # Initialize items and push products
+    items = Items(collection=collection_class())
+    items.push_many(Product(i, f"c{i}") for i in range(100))
+
+    # Get state
+    state = get_state(items)
+
+    # Assert that a duplicate within the batch is rejected
+    with pytest.raises(DuplicateKeyError):
+        items.push_many([Product(1000, "x"), Product(1000, "y")])
+
+    # Assert that a duplicate of a stored product is rejected after a valid one
+    product = Product(2000, "z")
+    with pytest.raises(DuplicateKeyError):
+        items.push_many([product, Product(5, "q")])
+
+    # Assert that the valid product was not assigned an ID or stored
+    assert product._imeta.id is None
+    assert get_state(items) == state
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST KEY CHANGES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("collection_class", COLLECTION_CLASSES)
+def test_key_changes(collection_class: Any) -> None:
+    """Tests key swaps within a batch, failed updates and repeated products"""
+
+    # Initialize collection and items and push products
+    collection = collection_class()
+    items = Items(collection=collection)
+    items.push_many(Product(i, f"c{i}") for i in range(100))
+
+    # Swap the keys of two products in one batch
+    a, b = collection.key(1), collection.key(2)
+    a.sku, b.sku = 2, 1
+    items.push_many([a, b])
+
+    # Assert that the keys were swapped
+    assert collection.key(1).code == "c2" and collection.key(2).code == "c1"
+    assert items.count() == 100
+
+    # Assert that a failed update keeps the previous key and index entries
+    product = collection.key(3)
+    product.sku = 4
+    with pytest.raises(DuplicateKeyError):
+        items.push(product)
+    assert collection.key(3).code == "c3"
+    assert items.filter(code="c3").count() == 1
+    assert items.filter(v__gte=0).count() == 100
+
+    # Assert that a product repeated in a batch is stored once
+    product = collection.key(10)
+    items.push_many([product, product])
+    assert items.count() == 100
+
+    # Assert that a product whose keys share a value is stored once
+    pairs = Items(collection=collection_class())
+    pair = Pair(7, 7)
+    pairs.push(pair)
+    pairs.push(pair)
+    assert pairs.count() == 1
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST REJECTED BATCH IDS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        lambda path: DictCollection(),
+        lambda path: ColumnarCollection(),
+        lambda path: SqliteCollection(),
+        lambda path: ShardedCollection(shards=3),
+        lambda path: MmapCollection(str(path / "data")),
+    ],
+)
+def test_rejected_batch_ids(factory: Callable[[Path], Any], tmp_path: Path) -> None:
+    """Tests that a rejected batch burns no item IDs"""
+
+    # Initialize items and push products
+    items = Items(collection=factory(tmp_path))
+    items.push_many(Product(i, f"c{i}") for i in range(10))
+
+    # Assert that a batch clashing with a stored product is rejected
+    with pytest.raises(DuplicateKeyError):
+        items.push_many([Product(100, "x"), Product(101, "y"), Product(5, "z")])
+
+    # Push a valid batch
+    batch = [Product(200 + i, f"d{i}") for i in range(3)]
+    items.push_many(batch)
+
+    # Assert that the valid products follow the stored ones consecutively
+    assert [int(product._imeta.id) for product in batch] == [11, 12, 13]
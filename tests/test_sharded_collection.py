@@ -0,0 +1,234 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import random
+import threading
+
+from typing import Any
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import DictCollection, ShardedCollection
+from core.utils.classes.index import Sorted
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+from core.utils.exceptions import DoesNotExistError, DuplicateKeyError
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ RECORD
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Record(Item):
+    """A test item with a key, a composite key and indexes"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, n: int, s: str, v: int | None) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.n = n
+        self.s = s
+        self.v = v
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("n", ("s", "n"))
+
+        # Define indexes
+        INDEXES = ("s", Sorted("v"))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET RECORDS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_records() -> list[Record]:
+    """Returns the same random records on every call"""
+
+    # Initialize random number generator
+    generator = random.Random(1)
+
+    # Return records
+    return [
+        Record(n, generator.choice("abcd"), generator.choice([None, 1, 2, 3, 5, 8]))
+        for n in range(500)
+    ]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET ITEMS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_items(collection: Any) -> Items:
+    """Returns items of records pushed in a batch, one by one and as an update"""
+
+    # Initialize items
+    items = Items(collection=collection)
+
+    # Get records
+    records = get_records()
+
+    # Push the first half of records in a batch
+    items.push_many(records[:250])
+
+    # Push the second half of records one by one
+    for record in records[250:]:
+        items.push(record)
+
+    # Change a record and push it
+    record = items.key(10)
+    record.v = 99
+    items.push(record)
+
+    # Return items
+    return items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST ROUTING
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_routing() -> None:
+    """Tests that records are routed to the shard of their item ID and stay there"""
+
+    # Initialize collection and get items
+    collection = ShardedCollection(shards=4)
+    get_items(collection)
+
+    # Iterate over shards
+    for index, shard in enumerate(collection.shards):
+        # Get the records of shard
+        records = list(Items(collection=shard))
+
+        # Assert that shard holds only the records whose item IDs map to it
+        assert records and all(int(r._imeta.id) % 4 == index for r in records)
+
+    # Assert that an updated record is held by exactly one shard
+    assert sum(shard.count() for shard in collection.shards) == 500
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST UNORDERED SHARDS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_unordered_shards() -> None:
+    """Tests that unordered shards yield the same records, in order only if asked"""
+
+    # Get items
+    dict_items = get_items(DictCollection())
+    sharded_items = get_items(ShardedCollection(ordered=False))
+
+    # Iterate over explicitly ordered queries
+    for query in (
+        lambda items: items.order_by("v"),
+        lambda items: items.order_by("-v").head(13),
+        lambda items: items.filter(s="c").order_by("v", "-n").head(20),
+        lambda items: items.order_by("s", "-v").slice(3, 40),
+    ):
+        # Assert that records match in order
+        assert [r.n for r in query(sharded_items)] == [r.n for r in query(dict_items)]
+
+    # Iterate over unwindowed filters
+    for query in (
+        lambda items: items.filter(s="a"),
+        lambda items: items.filter(v__gte=3),
+    ):
+        # Assert that records match in any order
+        assert sorted(r.n for r in query(sharded_items)) == sorted(
+            r.n for r in query(dict_items)
+        )
+
+    # Assert that counts match
+    assert sharded_items.count() == dict_items.count() == 500
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST KEYS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_keys() -> None:
+    """Tests key lookups and duplicate keys across shards"""
+
+    # Get items
+    items = get_items(ShardedCollection(shards=4))
+
+    # Get a record
+    record = items.key(42)
+
+    # Assert that records are found by key and composite key
+    assert record.n == 42
+    assert items.key((record.s, 42)).n == 42
+
+    # Assert that missing keys raise DoesNotExistError
+    with pytest.raises(DoesNotExistError):
+        items.key(1000)
+    with pytest.raises(DoesNotExistError):
+        items.filter(s="zz").key(42)
+
+    # Assert that a key held by a record in another shard is rejected
+    with pytest.raises(DuplicateKeyError):
+        items.push(Record(1, "q", 0))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST CONCURRENT PUSHES
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_concurrent_pushes() -> None:
+    """Tests that records pushed from several threads are all stored"""
+
+    # Initialize collection and items
+    collection = ShardedCollection(shards=4, threadsafe=True, workers=4)
+    items = Items(collection=collection)
+
+    # Define work
+    def work(base: int) -> None:
+        """Pushes records"""
+
+        # Iterate over numbers
+        for i in range(200):
+            # Push record
+            items.push(Record(base + i, "a", i))
+
+    # Initialize threads
+    threads = [threading.Thread(target=work, args=(k * 1000,)) for k in range(4)]
+
+    # Iterate over threads
+    for thread in threads:
+        # Start thread
+        thread.start()
+
+    # Iterate over threads
+    for thread in threads:
+        # Wait for thread
+        thread.join()
+
+    # Assert that every record is stored
+    assert items.count() == 800 and len(list(items)) == 800
+
+    # Close collection
+    collection.close()
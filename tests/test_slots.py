@@ -0,0 +1,277 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import copy
+import pickle
+
+from typing import Any, Callable, ClassVar, ClassVar as CV
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import (
+    ColumnarCollection,
+    DictCollection,
+    SqliteCollection,
+)
+from core.utils.classes.index import Sorted
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ SLOTTED PRODUCT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class SlottedProduct(Item):
+    """A test item whose annotated attributes are stored in slots"""
+
+    # Declare attributes
+    number: int
+    score: int
+    tags: list[int]
+    label: str = "none"
+    kind: ClassVar[str] = "slotted"
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, number: int, score: int, tags: list[int] | None = None) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.number = number
+        self.score = score
+
+        # Set tags if any
+        if tags is not None:
+            self.tags = tags
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("number",)
+
+        # Define indexes
+        INDEXES = ("label", Sorted("score"))
+
+        # Store attributes in slots
+        SLOTS = True
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ EXTENDED PRODUCT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class ExtendedProduct(SlottedProduct):
+    """A test item that inherits slots and declares another slotted attribute"""
+
+    # Declare attributes
+    extra: int = 7
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(SlottedProduct.Meta):
+        """Meta Class"""
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ DICT PRODUCT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class DictProduct(SlottedProduct):
+    """A test item that inherits slots but stores new attributes in a dict"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("number",)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST SLOTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_slots() -> None:
+    """Tests that slots are derived from annotations and that defaults still apply"""
+
+    # Initialize products
+    product = SlottedProduct(1, 5, [1])
+    extended = ExtendedProduct(2, 3)
+    unslotted = DictProduct(3, 1)
+
+    # Assert that annotated attributes are slots and class variables are not
+    assert SlottedProduct.__slots__ == ("_imeta", "number", "score", "tags", "label")
+    assert not hasattr(product, "__dict__") and not hasattr(product._imeta, "__dict__")
+    assert product.label == "none" and SlottedProduct.kind == "slotted"
+
+    # Assert that a slotted subclass inherits slots and defaults
+    assert not hasattr(extended, "__dict__")
+    assert extended.extra == 7 and extended.label == "none"
+
+    # Assert that an unslotted subclass stores new attributes in a dict
+    unslotted.other = 5  # type: ignore[attr-defined]
+    assert unslotted.__dict__ == {"other": 5}
+
+    # Assert that undeclared attributes cannot be set on slotted products
+    with pytest.raises(AttributeError):
+        product.foo = 1  # type: ignore[attr-defined]
+
+    # Iterate over products
+    for item in (product, extended, unslotted):
+        # Iterate over copies
+        for copied in (
+            copy.copy(item),
+            copy.deepcopy(item),
+            pickle.loads(pickle.dumps(item)),
+        ):
+            # Assert that the copy is of the same class and state
+            assert type(copied) is type(item)
+            assert copied.number == item.number
+            assert copied._imeta.id == item._imeta.id
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST SLOTTED ITEMS IN COLLECTIONS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [
+        DictCollection,
+        lambda: DictCollection(copy="shallow"),
+        lambda: DictCollection(copy="pickle"),
+        lambda: DictCollection(read="cow"),
+        lambda: DictCollection(read="frozen"),
+        lambda: DictCollection(copy="none", threadsafe=True),
+        ColumnarCollection,
+        SqliteCollection,
+    ],
+)
+def test_slotted_items_in_collections(factory: Callable[[], Any]) -> None:
+    """Tests that slotted products are stored, indexed, ordered and aggregated"""
+
+    # Initialize items
+    items = Items(collection=factory())
+
+    # Push slotted, extended and unslotted products
+    items.push_many(
+        [SlottedProduct(i, i % 7, [i]) for i in range(50)]
+        + [ExtendedProduct(100 + i, i) for i in range(5)]
+        + [DictProduct(200 + i, i) for i in range(5)]
+    )
+
+    # Assert that keys, indexes, orders and aggregates see slotted attributes
+    product = items.key(3)
+    assert product.tags == [3] and product._imeta.id is not None
+    assert [p.number for p in items.filter(score=2, label="none")] == [
+        i for i in range(50) if i % 7 == 2
+    ] + [102, 202]
+    assert items.filter(number__gte=100).count() == 10
+    assert [p.number for p in items.order_by("-score", "number").head(3)] == [6, 13, 20]
+    assert items.aggregate(sum="score")["sum"] == sum(i % 7 for i in range(50)) + 20
+
+    # Assert that returned products copy and pickle as their classes
+    pickled = pickle.loads(pickle.dumps(items.key(5)))
+    assert type(pickled) is SlottedProduct and not hasattr(pickled, "__dict__")
+    assert type(copy.deepcopy(items.key(201))) is DictProduct
+
+    # Assert that an update is indexed
+    product = copy.deepcopy(items.key(6))
+    product.label = "x"
+    items.push(product)
+    assert items.filter(label="x").count() == 1
+
+    # Assert that an unset slot stays unset
+    items.push(SlottedProduct(300, 1))
+    assert not hasattr(items.key(300), "tags")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST SLOTTED ITEMS ARE ISOLATED
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "factory", [DictCollection, ColumnarCollection, SqliteCollection]
+)
+def test_slotted_items_are_isolated(factory: Callable[[], Any]) -> None:
+    """Tests that mutating a returned slotted product leaves the store unchanged"""
+
+    # Initialize items and push product
+    items = Items(collection=factory())
+    items.push(SlottedProduct(4, 4, [4]))
+
+    # Mutate a returned product
+    product = items.key(4)
+    product.tags.append(99)
+    product.score = 9
+
+    # Assert that the stored product is unchanged
+    assert items.key(4).tags == [4] and items.key(4).score == 4
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST CLASS VARIABLE ANNOTATIONS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_class_variable_annotations() -> None:
+    """Tests that only class variable annotations are excluded from slots"""
+
+    # Define a class whose name merely contains ClassVar
+    class MyClassVar:
+        """A test class named like a class variable annotation"""
+
+    # Define a meta that stores attributes in slots
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Store attributes in slots
+        SLOTS = True
+
+    # Create an item class from runtime and postponed annotations
+    AnnotatedProduct = type(Item)(
+        "AnnotatedProduct",
+        (Item,),
+        {
+            "__annotations__": {
+                "a": ClassVar[int],
+                "b": CV[int],
+                "c": ClassVar,
+                "d": "ClassVar[int]",
+                "e": "typing.ClassVar[int]",
+                "f": "MyClassVar",
+                "g": MyClassVar,
+                "h": "list[ClassVar]",
+            },
+            "Meta": Meta,
+        },
+    )
+
+    # Assert that class variables are excluded from slots and other names are kept
+    assert AnnotatedProduct.__slots__ == ("_imeta", "f", "g", "h")
@@ -0,0 +1,190 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import (
+    ColumnarCollection,
+    DictCollection,
+    ShardedCollection,
+    SqliteCollection,
+)
+from core.utils.classes.index import Sorted
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+from core.utils.classes.store.store import Store
+from core.utils.exceptions import DoesNotExistError, DuplicateKeyError
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ NUMBER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Number(Item):
+    """A test item with a key, a hash index and a sorted index"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, n: int) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.n = n
+        self.m = n % 5
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("n",)
+
+        # Define indexes
+        INDEXES = ("m", Sorted("n"))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST SAVE AND LOAD
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "factory",
+    [DictCollection, ColumnarCollection, lambda: ShardedCollection(shards=3)],
+)
+def test_save_and_load(factory: Callable[[], Any], tmp_path: Path) -> None:
+    """Tests that a loaded snapshot restores items, keys, indexes and IDs"""
+
+    # Get snapshot path
+    path = str(tmp_path / "numbers.snap")
+
+    # Initialize collection, push numbers and save snapshot
+    collection = factory()
+    items = Items(collection=collection)
+    items.push_many(Number(i) for i in range(1000))
+    collection.save(path)
+
+    # Load snapshot into a new collection
+    loaded = factory()
+    loaded.load(path)
+    loaded_items = Items(collection=loaded)
+
+    # Assert that items, keys, indexes and orders are restored
+    assert [n.n for n in loaded_items.filter(m=2)] == [n.n for n in items.filter(m=2)]
+    assert loaded_items.key(5).n == 5 and loaded_items.count() == 1000
+    assert [n.n for n in loaded_items.order_by("-n").head(2)] == [999, 998]
+
+    # Assert that new pushes continue after restored items
+    loaded_items.push(Number(1000))
+    assert loaded_items.count() == 1001 and loaded_items.key(1000).n == 1000
+
+    # Assert that restored keys are enforced
+    with pytest.raises(DuplicateKeyError):
+        loaded_items.push(Number(3))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST INDEXES ARE RESTORED
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_indexes_are_restored(tmp_path: Path) -> None:
+    """Tests that a loaded dict collection plans filters over restored indexes"""
+
+    # Get snapshot path
+    path = str(tmp_path / "numbers.snap")
+
+    # Initialize collection, push numbers and save snapshot
+    collection = DictCollection()
+    Items(collection=collection).push_many(Number(i) for i in range(100))
+    collection.save(path)
+
+    # Load snapshot into a new collection
+    loaded = DictCollection()
+    loaded.load(path)
+
+    # Assert that filters are planned over the restored index
+    assert Items(collection=loaded).filter(m=2).explain().startswith("INDEX")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST WRONG KINDS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_wrong_kinds(tmp_path: Path) -> None:
+    """Tests that snapshots of another kind are rejected"""
+
+    # Get snapshot path
+    path = str(tmp_path / "numbers.snap")
+
+    # Save a snapshot of a columnar collection
+    collection = ColumnarCollection()
+    Items(collection=collection).push_many(Number(i) for i in range(10))
+    collection.save(path)
+
+    # Assert that other kinds of collection reject the snapshot
+    with pytest.raises(ValueError):
+        DictCollection().load(path)
+    with pytest.raises(ValueError):
+        ShardedCollection(shards=2).load(path)
+
+    # Assert that a SQLite collection does not support snapshots
+    with pytest.raises(NotImplementedError):
+        SqliteCollection().save(str(tmp_path / "sqlite.snap"))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST STORE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_store(tmp_path: Path) -> None:
+    """Tests that a loaded store restores its collections in place"""
+
+    # Get snapshot path
+    path = str(tmp_path / "store.snap")
+
+    # Initialize a store of a dict and a columnar collection
+    store = Store()
+    Items(collection=store.create("a")).push_many(Number(i) for i in range(10))
+    store.create("b", ColumnarCollection)
+    Items(collection=store.get("b")).push(Number(1))
+
+    # Save store
+    store.save(path)
+
+    # Initialize another store with an existing collection and an extra one
+    loaded = Store()
+    existing = loaded.create("a", DictCollection(copy="none"))
+    loaded.create("z")
+
+    # Load store
+    loaded.load(path)
+
+    # Assert that an existing collection of the same class is loaded in place
+    assert loaded.get("a") is existing
+    assert Items(collection=existing).count() == 10
+
+    # Assert that other collections are restored
+    assert Items(collection=loaded.get("b")).count() == 1
+
+    # Assert that collections not in the snapshot are removed
+    with pytest.raises(DoesNotExistError):
+        loaded.get("z")
@@ -0,0 +1,284 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import random
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import DictCollection
+from core.utils.classes.index import Sorted, SortedIndex, SortedList
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ READING
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Reading(Item):
+    """A test item with sorted indexes over values of mixed types"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, number: int, value: Any, taken: Any) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.number = number
+        self.value = value
+        self.taken = taken
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define indexes
+        INDEXES = (Sorted("value"), Sorted("taken"))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GET ITEMS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def get_items(size: int = 2000) -> Items:
+    """Returns items of readings whose values belong to several families"""
+
+    # Initialize random number generator
+    generator = random.Random(2)
+
+    # Define value factories
+    def get_value() -> Any:
+        """Returns a random value that may not be comparable to others"""
+
+        # Return value
+        return generator.choice(
+            [
+                generator.randint(0, 20),
+                generator.random() * 20,
+                Decimal("3.5"),
+                float("nan"),
+                True,
+                None,
+                "abc",
+                b"q",
+                [1],
+            ]
+        )
+
+    def get_taken() -> Any:
+        """Returns a random naive or aware datetime, a date or None"""
+
+        # Return value
+        return generator.choice(
+            [
+                datetime(2020, 1, generator.randint(1, 28)),
+                datetime(2020, 1, generator.randint(1, 28), tzinfo=timezone.utc),
+                date(2020, 1, 5),
+                None,
+            ]
+        )
+
+    # Initialize items
+    items = Items(collection=DictCollection())
+
+    # Push readings
+    items.push_many(Reading(i, get_value(), get_taken()) for i in range(size))
+
+    # Iterate over some readings
+    for reading in list(items.head(300)):
+        # Change value and push reading
+        reading.value = get_value()
+        items.push(reading)
+
+    # Return items
+    return items
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST RANGE FILTERS MATCH A SCAN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    "conditions",
+    [
+        {"value__gte": 3, "value__lt": 10},
+        {"value__gt": 5},
+        {"value__lte": "b"},
+        {"value__lt": None},
+        {"value": Decimal("3.5")},
+        {"value__gte": 1, "value__lt": "z"},
+        {"value": True},
+        {"value__lte": b"z"},
+        {"taken__gte": datetime(2020, 1, 10)},
+        {"taken__lt": datetime(2020, 1, 10, tzinfo=timezone.utc)},
+        {"taken__gt": date(2020, 1, 1)},
+    ],
+)
+def test_range_filters_match_a_scan(conditions: dict[str, Any]) -> None:
+    """Tests that sorted index range filters yield the same items as a full scan"""
+
+    # Get filtered items
+    filtered = get_items().filter(**conditions)
+
+    # Get collection
+    collection = filtered._collection
+
+    # Get the numbers of a full scan
+    expected = [
+        reading.number
+        for reading in collection._filter(
+            collection._items_by_id.values(), filtered._operations[0][1]
+        )
+    ]
+
+    # Assert that the indexed filter matches the scan
+    assert [reading.number for reading in filtered] == expected
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST SORTED INDEX MATCHES A REFERENCE
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_sorted_index_matches_a_reference(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests lookups and estimates against a reference across many small blocks"""
+
+    # Use small blocks so that blocks are split and emptied often
+    monkeypatch.setattr(SortedList, "BLOCK_SIZE", 8)
+
+    # Initialize random number generator
+    generator = random.Random(1)
+
+    # Initialize index and live values by item ID
+    index, values = SortedIndex("value"), {}
+
+    # Iterate over steps
+    for step in range(3000):
+        # Check if an item is removed
+        if values and generator.random() < 0.35:
+            # Remove a random item
+            item_id = generator.choice(list(values))
+            index.remove(item_id)
+            del values[item_id]
+
+        # Otherwise add an item
+        else:
+            values[step] = generator.randint(0, 40)
+            index.add(step, Reading(step, values[step], None))
+
+        # Continue unless step is checked
+        if step % 50:
+            continue
+
+        # Iterate over operators
+        for operator, compare in (
+            ("equals", lambda a, b: a == b),
+            ("lt", lambda a, b: a < b),
+            ("lte", lambda a, b: a <= b),
+            ("gt", lambda a, b: a > b),
+            ("gte", lambda a, b: a >= b),
+        ):
+            # Get expected value
+            expected = generator.randint(-2, 42)
+
+            # Get matching item IDs
+            item_ids = {i for i, value in values.items() if compare(value, expected)}
+
+            # Assert that lookup and estimate match the reference
+            assert index.lookup(operator, expected) == item_ids
+            assert index.estimate(operator, expected) == len(item_ids)
+
+    # Assert that every live item is indexed
+    assert len(index) == len(values)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST RUNS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_runs() -> None:
+    """Tests that runs group equal values in order, with item IDs ascending"""
+
+    # Initialize index
+    index = SortedIndex("value")
+
+    # Iterate over item IDs
+    for item_id in range(1, 200):
+        # Add an item whose value repeats every seven item IDs
+        index.add(item_id, Reading(item_id, item_id % 7, None))
+
+    # Get runs
+    runs = list(index.runs())
+
+    # Assert that runs are ordered by value with ascending item IDs
+    assert [run[0] for run in runs] == [7, 1, 2, 3, 4, 5, 6]
+    assert all(run == sorted(run) for run in runs)
+
+    # Assert that descending runs are reversed runs
+    assert list(index.runs(descending=True)) == runs[::-1]
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST SORTED LIST
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_sorted_list(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that a sorted list matches a sorted Python list under random updates"""
+
+    # Use small blocks so that blocks are split and emptied often
+    monkeypatch.setattr(SortedList, "BLOCK_SIZE", 4)
+
+    # Initialize random number generator
+    generator = random.Random(3)
+
+    # Initialize sorted list and reference
+    keys, reference = SortedList(), []
+
+    # Iterate over steps
+    for _ in range(2000):
+        # Check if a key is removed
+        if reference and generator.random() < 0.4:
+            # Remove a random key
+            key = generator.choice(reference)
+            keys.remove(key)
+            reference.remove(key)
+
+        # Otherwise add a key
+        else:
+            key = generator.randint(0, 100)
+            keys.add(key)
+            reference.append(key)
+            reference.sort()
+
+        # Get a random key and span
+        key = generator.randint(-5, 105)
+        lo, hi = sorted((generator.randint(0, len(reference)),) * 2)
+
+        # Assert that positions and keys match the reference
+        assert len(keys) == len(reference)
+        assert keys.bisect_left(key) == sorted(reference + [key]).index(key)
+        assert list(keys.iterate()) == reference
+        assert list(keys.iterate(lo, hi + 3, descending=True)) == (
+            reference[lo : hi + 3][::-1]
+        )
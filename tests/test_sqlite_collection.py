@@ -0,0 +1,155 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import threading
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import SqliteCollection
+from core.utils.classes.index import Sorted
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+from core.utils.exceptions import DoesNotExistError, DuplicateKeyError
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ LISTING
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Listing(Item):
+    """A test item with a composite key and indexes stored in SQLite"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, sku: Any, category: str, price: float, pair: int) -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.sku = sku
+        self.category = category
+        self.price = price
+        self.pair = pair
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("sku", ("category", "pair"))
+
+        # Define indexes
+        INDEXES = ("category", Sorted("price"), ("category", "price"))
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST KEYS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_keys() -> None:
+    """Tests that keys are unique, follow updates and survive failed updates"""
+
+    # Initialize collection and items
+    collection = SqliteCollection()
+    items = Items(collection=collection)
+
+    # Push listings
+    items.push_many(Listing(i, f"c{i % 5}", i * 1.5, i) for i in range(200))
+
+    # Assert that duplicate keys and composite keys are rejected
+    for listing in (Listing(5, "x", 1.0, -1), Listing(5.0, "x", 1.0, -2)):
+        with pytest.raises(DuplicateKeyError):
+            items.push(listing)
+    with pytest.raises(DuplicateKeyError):
+        items.push(Listing(1000, "c0", 1.0, 0))
+
+    # Change the key of a listing
+    listing = collection.key(7)
+    listing.sku = 7000
+    items.push(listing)
+
+    # Assert that the listing is found under its new key only
+    assert collection.key(7000).sku == 7000
+    with pytest.raises(DoesNotExistError):
+        collection.key(7)
+
+    # Assert that a failed update leaves the previous key
+    listing = collection.key(8)
+    listing.sku = 9
+    with pytest.raises(DuplicateKeyError):
+        items.push(listing)
+    assert collection.key(8).sku == 8
+
+    # Assert that indexed counts are correct
+    assert items.count() == 200
+    assert items.filter(category="c1", price__gte=30).count() == len(
+        [i for i in range(200) if i % 5 == 1 and i * 1.5 >= 30]
+    )
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST PERSISTENCE AND THREADS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_persistence_and_threads(tmp_path: Path) -> None:
+    """Tests that a database file is reopened and pushed to from several threads"""
+
+    # Get database path
+    path = str(tmp_path / "listings.db")
+
+    # Push listings and close collection
+    collection = SqliteCollection(path)
+    Items(collection=collection).push_many(Listing(i, "c", 1.0, i) for i in range(200))
+    collection.close()
+
+    # Reopen collection
+    collection = SqliteCollection(path)
+    items = Items(collection=collection)
+
+    # Assert that listings persisted and that IDs continue
+    assert items.count() == 200
+    items.push(Listing(999, "n", 2.0, 999))
+    assert collection.key(999)._imeta.id == "201"
+
+    # Define work
+    def work(k: int) -> None:
+        """Pushes and counts listings"""
+
+        # Iterate over listings
+        for j in range(50):
+            # Push listing and count
+            items.push(Listing(10000 + k * 100 + j, "t", 1.0, k * 100 + j))
+            items.filter(category="t").count()
+
+    # Run work in threads
+    threads = [threading.Thread(target=work, args=(k,)) for k in range(4)]
+
+    # Iterate over threads
+    for thread in threads:
+        # Start thread
+        thread.start()
+
+    # Iterate over threads
+    for thread in threads:
+        # Wait for thread
+        thread.join()
+
+    # Assert that every listing was pushed
+    assert items.filter(category="t").count() == 200
@@ -0,0 +1,333 @@
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ GENERAL IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from __future__ import annotations
+
+import os
+import time
+
+from pathlib import Path
+
+import pytest
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ PROJECT IMPORTS
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+from core.utils.classes.collection import DictCollection
+from core.utils.classes.item.item import Item
+from core.utils.classes.item.items import Items
+from core.utils.classes.log import WriteAheadLog
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ NUMBER
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+class Number(Item):
+    """A test item with a key, a tag and an index"""
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ __INIT__
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    def __init__(self, n: int, tag: str = "a") -> None:
+        """Init Method"""
+
+        # Set attributes
+        self.n = n
+        self.tag = tag
+        self.m = n % 3
+
+    # ┌─────────────────────────────────────────────────────────────────────────────────
+    # │ META
+    # └─────────────────────────────────────────────────────────────────────────────────
+
+    class Meta(Item.Meta):
+        """Meta Class"""
+
+        # Define keys
+        KEYS = ("n",)
+
+        # Define indexes
+        INDEXES = ("m",)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ REOPEN
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def reopen(path: str, sync: str = "batch") -> tuple[DictCollection, Items]:
+    """Returns a durable collection replayed from a log and its items"""
+
+    # Initialize collection
+    collection = DictCollection(wal=path, sync=sync)
+
+    # Return collection and items
+    return collection, Items(collection=collection)
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST READ
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_read(tmp_path: Path) -> None:
+    """Tests that a log reads back its generation and records in order"""
+
+    # Get log path
+    path = str(tmp_path / "wal")
+
+    # Assert that a missing log has no generation or records
+    assert WriteAheadLog.read(path) == (None, [])
+
+    # Append records and close log
+    wal = WriteAheadLog(path, generation=3, sync="none")
+    wal.append("a")
+    wal.append({"b": [1, 2]})
+    wal.close()
+
+    # Assert that records are read back
+    assert WriteAheadLog.read(path) == (3, ["a", {"b": [1, 2]}])
+
+    # Assert that a reopened log keeps its generation and appends after its records
+    wal = WriteAheadLog(path, generation=9, sync="always")
+    wal.append("c")
+    wal.close()
+    assert WriteAheadLog.read(path) == (3, ["a", {"b": [1, 2]}, "c"])
+
+    # Assert that an invalid sync policy raises ValueError
+    with pytest.raises(ValueError):
+        WriteAheadLog(str(tmp_path / "other"), sync="bad")
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST TORN TAIL
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_torn_tail(tmp_path: Path) -> None:
+    """Tests that a record torn by a crash is discarded and later records are kept"""
+
+    # Get log path
+    path = str(tmp_path / "wal")
+
+    # Append records and close log
+    wal = WriteAheadLog(path, sync="none")
+    wal.append("a")
+    wal.append("b")
+    wal.close()
+
+    # Get the valid size of the log
+    size = os.path.getsize(path)
+
+    # Append a record header whose record is torn
+    with open(path, "ab") as file:
+        file.write(b"\x10\x00\x00\x00garbage")
+
+    # Assert that the torn record is not read
+    assert WriteAheadLog.read(path) == (1, ["a", "b"])
+
+    # Assert that reopening the log truncates the torn record
+    wal = WriteAheadLog(path, sync="none")
+    assert wal.size == size == os.path.getsize(path)
+
+    # Assert that records appended after the truncation are read
+    wal.append("c")
+    wal.close()
+    assert WriteAheadLog.read(path) == (1, ["a", "b", "c"])
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST CORRUPT RECORD
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_corrupt_record(tmp_path: Path) -> None:
+    """Tests that a record failing its checksum ends the log"""
+
+    # Get log path
+    path = str(tmp_path / "wal")
+
+    # Append records and note the size after the first one
+    wal = WriteAheadLog(path, sync="none")
+    wal.append("a")
+    size = wal.size
+    wal.append("b" * 100)
+    wal.append("c")
+    wal.close()
+
+    # Flip a byte inside the second record
+    with open(path, "r+b") as file:
+        file.seek(size + WriteAheadLog.FRAME.size + 50)
+        byte = file.read(1)
+        file.seek(-1, os.SEEK_CUR)
+        file.write(bytes([byte[0] ^ 0xFF]))
+
+    # Assert that records stop before the corrupt record
+    assert WriteAheadLog.read(path) == (1, ["a"])
+
+    # Assert that reopening the log discards the corrupt record and those after it
+    wal = WriteAheadLog(path, sync="none")
+    assert wal.size == size
+    wal.close()
+
+    # Assert that a file that is not a log is started afresh
+    with open(path, "wb") as file:
+        file.write(b"not a log at all")
+    wal = WriteAheadLog(path, generation=5, sync="none")
+    wal.close()
+    assert WriteAheadLog.read(path) == (5, [])
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST REPLAY
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_replay(tmp_path: Path) -> None:
+    """Tests that a durable collection is replayed from its log"""
+
+    # Get log path
+    path = str(tmp_path / "wal")
+
+    # Push numbers in a batch, one by one and as an update
+    collection, items = reopen(path)
+    items.push_many(Number(i) for i in range(100))
+    for i in range(100, 150):
+        items.push(Number(i))
+    number = items.key(5)
+    number.tag = "b"
+    items.push(number)
+    collection.close()
+
+    # Replay collection
+    collection, items = reopen(path)
+
+    # Assert that numbers, updates and indexes are replayed
+    assert items.count() == 150 and items.key(5).tag == "b"
+    assert [n.n for n in items.filter(m=1).head(3)] == [1, 4, 7]
+    assert items.filter(m=1).explain().startswith("INDEX")
+
+    # Assert that item IDs continue after replayed numbers
+    items.push(Number(150))
+    assert items.key(150)._imeta.id == "151"
+    collection.close()
+
+    # Append a torn record to the log
+    with open(path, "ab") as file:
+        file.write(b"\x10\x00\x00\x00garbage")
+
+    # Assert that a torn record is discarded on replay and pushes continue
+    collection, items = reopen(path, sync="always")
+    assert items.count() == 151
+    items.push(Number(151))
+    collection.close()
+    assert reopen(path, sync="none")[1].count() == 152
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST COMPACTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_compaction(tmp_path: Path) -> None:
+    """Tests that a compacted collection is replayed from its snapshot and log"""
+
+    # Get log path
+    path = str(tmp_path / "wal")
+
+    # Push numbers and compact
+    collection, items = reopen(path)
+    items.push_many(Number(i) for i in range(100))
+    collection.compact()
+
+    # Assert that the snapshot replaces the rotated log
+    assert sorted(os.listdir(tmp_path)) == ["wal", "wal.snapshot"]
+    assert WriteAheadLog.read(path) == (2, [])
+
+    # Move a key from one number to another after compaction
+    number = items.key(0)
+    number.n = 10_000
+    items.push(number)
+    items.push(Number(0, "z"))
+    collection.close()
+
+    # Replay collection
+    collection, items = reopen(path)
+
+    # Assert that the snapshot and the log after it are replayed
+    assert items.count() == 101
+    assert items.key(0).tag == "z" and items.key(10_000).tag == "a"
+    assert items.filter(m=1).explain().startswith("INDEX")
+    collection.close()
+
+    # Assert that a collection without a log cannot be compacted
+    with pytest.raises(ValueError):
+        DictCollection().compact()
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST CRASH BETWEEN ROTATION AND SNAPSHOT
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_crash_between_rotation_and_snapshot(tmp_path: Path) -> None:
+    """Tests that a rotated log without a snapshot is still replayed"""
+
+    # Get log path
+    path = str(tmp_path / "wal")
+
+    # Push numbers, rotate the log as a compaction would and push again
+    collection, items = reopen(path)
+    items.push_many(Number(i) for i in range(10))
+    assert collection._wal is not None
+    collection._wal.rotate()
+    items.push(Number(10))
+
+    # Close the log without writing a snapshot, as if the compaction crashed
+    collection._wal.close()
+
+    # Assert that both the rotated and the current log are replayed
+    assert sorted(os.listdir(tmp_path)) == ["wal", "wal.1"]
+    collection, items = reopen(path)
+    assert items.count() == 11 and items.key(10).n == 10
+    collection.close()
+
+
+# ┌─────────────────────────────────────────────────────────────────────────────────────
+# │ TEST BACKGROUND COMPACTION
+# └─────────────────────────────────────────────────────────────────────────────────────
+
+
+def test_background_compaction(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that a large log is compacted in the background"""
+
+    # Get log path
+    path = str(tmp_path / "wal")
+
+    # Lower the size at which logs are compacted
+    monkeypatch.setattr(DictCollection, "WAL_COMPACT_SIZE", 20_000)
+
+    # Push enough numbers to exceed the compaction size
+    collection, items = reopen(path)
+    items.push_many(Number(i) for i in range(1000))
+
+    # Wait for the snapshot to be written
+    deadline = time.monotonic() + 10
+    while not os.path.exists(f"{path}.snapshot") and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # Push another number and close collection, waiting for the compaction
+    items.push(Number(1000))
+    collection.close()
+
+    # Assert that the log was compacted
+    assert os.path.exists(f"{path}.snapshot")
+    assert not os.path.exists(f"{path}.1")
+
+    # Assert that every number is replayed
+    assert reopen(path)[1].count() == 1001